@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Memoized plan generation and compilation."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from time import perf_counter
+from typing import Any
+
+from agentic_proteins.agents.planning.compiler import compile_plan_to_execution
+from agentic_proteins.agents.planning.generation import PlannerProtocol, generate_plan
+from agentic_proteins.agents.planning.schemas import MutationPlan, Plan
+from agentic_proteins.core.decisions import Decision
+from agentic_proteins.core.execution import ExecutionGraph, ExecutionTask
+from agentic_proteins.core.tooling import ToolInvocationSpec
+from agentic_proteins.registry.agents import AgentRegistry
+
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """A validated plan compiled for one tool, independent of its inputs."""
+
+    plan: Plan
+    plan_payload: dict[str, Any]
+    graph: ExecutionGraph
+    graph_payload: dict[str, Any]
+    fingerprint: str
+    origin_task_id: str
+    plan_duration_ms: float
+    mutation_plans: tuple[MutationPlan, ...] = ()
+
+    def bind(self, invocation: ToolInvocationSpec) -> ExecutionTask:
+        """Return the origin task bound to a per-iteration invocation."""
+        task = self.graph.tasks[self.origin_task_id]
+        return task.model_copy(update={"tool_invocation": invocation})
+
+    def bound_graph(self, task: ExecutionTask) -> ExecutionGraph:
+        """Return the graph with ``task`` in place of its template."""
+        return self.graph.model_copy(
+            update={"tasks": {**self.graph.tasks, task.task_id: task}}
+        )
+
+    def bound_graph_payload(self, task: ExecutionTask) -> dict[str, Any]:
+        """Return the graph's JSON form with ``task`` in place of its template."""
+        tasks = dict(self.graph_payload["tasks"])
+        tasks[task.task_id] = task.model_dump(mode="json")
+        return {**self.graph_payload, "tasks": tasks}
+
+
+class PlanCache:
+    """Thread-safe LRU of compiled plans keyed by goal, tool and agent registry.
+
+    Plans are generated, validated and compiled once per key against a template
+    invocation; hits return the stored graph and fingerprint without
+    re-validation, leaving only the invocation to be bound per iteration.
+    Compilation errors are raised to the caller and never cached.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """Create an empty cache holding at most ``max_entries`` plans."""
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, ...], CompiledPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        planner: PlannerProtocol,
+        goal: str,
+        tool_name: str,
+        tool_version: str,
+    ) -> tuple[CompiledPlan, bool]:
+        """Return the compiled plan for the key and whether it was cached."""
+        key = (goal, tool_name, tool_version, AgentRegistry.fingerprint())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry, True
+        entry = self._compile(planner, goal, tool_name, tool_version)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry, False
+
+    def clear(self) -> None:
+        """Drop every cached plan."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _compile(
+        planner: PlannerProtocol, goal: str, tool_name: str, tool_version: str
+    ) -> CompiledPlan:
+        """Generate, validate and compile a plan against a template invocation."""
+        start = perf_counter()
+        output = generate_plan(planner, goal)
+        plan = output.plan
+        origin_task_id = next(iter(plan.tasks), "unknown")
+        template = ToolInvocationSpec(
+            invocation_id=f"template:{tool_name}:0",
+            tool_name=tool_name,
+            tool_version=tool_version,
+            inputs=[],
+            expected_outputs=[],
+            constraints=[],
+            origin_task_id=origin_task_id,
+        )
+        decision = Decision(
+            agent_name="planner",
+            rationale="default_invocation",
+            requested_tools=[template],
+            next_tasks=[],
+            confidence=0.1,
+            input_refs=["sequence"],
+            memory_refs=["memory:session"],
+            rules_triggered=["default_plan"],
+            confidence_impact=["baseline_low_confidence"],
+        )
+        graph = compile_plan_to_execution(plan, [decision])
+        return CompiledPlan(
+            plan=plan,
+            plan_payload=plan.model_dump(mode="json"),
+            graph=graph,
+            graph_payload=graph.model_dump(mode="json"),
+            fingerprint=plan.fingerprint(),
+            origin_task_id=origin_task_id,
+            plan_duration_ms=(perf_counter() - start) * 1000.0,
+            mutation_plans=output.mutation_plans,
+        )
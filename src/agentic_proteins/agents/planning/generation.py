@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from time import perf_counter
 from typing import Protocol
 
-from agentic_proteins.agents.planning.schemas import Plan
+from agentic_proteins.agents.planning.schemas import MutationPlan, Plan
 
 
 @dataclass(frozen=True)
@@ -18,6 +18,7 @@ class PlanOutput:
 
     plan: Plan
     plan_duration_ms: float
+    mutation_plans: tuple[MutationPlan, ...] = ()
 
 
 class PlannerProtocol(Protocol):
@@ -33,4 +34,8 @@ def generate_plan(planner: PlannerProtocol, goal: str) -> PlanOutput:
     plan_start = perf_counter()
     plan_decision = planner.decide({"goal": goal})
     plan_duration = (perf_counter() - plan_start) * 1000.0
-    return PlanOutput(plan=plan_decision.plan, plan_duration_ms=plan_duration)
+    return PlanOutput(
+        plan=plan_decision.plan,
+        plan_duration_ms=plan_duration,
+        mutation_plans=tuple(getattr(plan_decision, "mutation_plans", ())),
+    )
@@ -26,6 +26,7 @@ from agentic_proteins.api.v1.router import router as v1_router
 from agentic_proteins.api.v1.schema import ApiEnvelope
 from agentic_proteins.providers import provider_metadata
 from agentic_proteins.providers.factory import provider_requirements
+from agentic_proteins.runtime.control import RuntimeSession
 
 
 @dataclass(frozen=True)
@@ -56,6 +57,7 @@ def create_app(config: AppConfig) -> FastAPI:
         openapi_url=openapi_url,
     )
     app.state.base_dir = config.base_dir
+    app.state.runtime_session = RuntimeSession()
 
     app.add_middleware(RequestIdMiddleware)
     app.add_middleware(RequestLogMiddleware)
@@ -9,7 +9,14 @@ from pathlib import Path
 
 from fastapi import Request
 
+from agentic_proteins.runtime.control import RuntimeSession
+
 
 def get_base_dir(request: Request) -> Path:
     """get_base_dir."""
     return Path(request.app.state.base_dir)
+
+
+def get_runtime_session(request: Request) -> RuntimeSession:
+    """get_runtime_session."""
+    return request.app.state.runtime_session
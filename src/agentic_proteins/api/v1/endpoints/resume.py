@@ -11,7 +11,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Request, status
 from fastapi.responses import JSONResponse
 
-from agentic_proteins.api.deps import get_base_dir
+from agentic_proteins.api.deps import get_base_dir, get_runtime_session
 from agentic_proteins.api.errors import ok_envelope, raise_http_error
 from agentic_proteins.api.v1.schema import (
     ApiEnvelope,
@@ -21,6 +21,7 @@ from agentic_proteins.api.v1.schema import (
 )
 from agentic_proteins.core.status import WorkflowState
 from agentic_proteins.interfaces.cli import _load_run_summary, _resume_candidate
+from agentic_proteins.runtime.control import RuntimeSession
 
 router = APIRouter()
 
@@ -46,6 +47,7 @@ def resume_endpoint(
     payload: ResumeRequest,
     request: Request,
     base_dir: Annotated[Path, Depends(get_base_dir)],
+    session: Annotated[RuntimeSession, Depends(get_runtime_session)],
 ) -> ApiEnvelope:
     """resume_endpoint."""
     try:
@@ -78,6 +80,7 @@ def resume_endpoint(
             payload.provider,
             artifacts_dir,
             payload.execution_mode,
+            session,
         )
         run_id = result.get("run_id")
         summary = _load_run_summary(base_dir, run_id, artifacts_dir)
@@ -11,7 +11,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Request, status
 from fastapi.responses import JSONResponse
 
-from agentic_proteins.api.deps import get_base_dir
+from agentic_proteins.api.deps import get_base_dir, get_runtime_session
 from agentic_proteins.api.errors import ok_envelope, raise_http_error
 from agentic_proteins.api.v1.schema import (
     ApiEnvelope,
@@ -27,6 +27,7 @@ from agentic_proteins.interfaces.cli import (
     _run_sequence,
     _validate_sequence,
 )
+from agentic_proteins.runtime.control import RuntimeSession
 
 router = APIRouter()
 
@@ -46,6 +47,7 @@ def run_endpoint(
     payload: RunRequest,
     request: Request,
     base_dir: Annotated[Path, Depends(get_base_dir)],
+    session: Annotated[RuntimeSession, Depends(get_runtime_session)],
 ) -> ApiEnvelope:
     """run_endpoint."""
     try:
@@ -69,7 +71,7 @@ def run_endpoint(
             artifacts_dir,
             payload.execution_mode,
         )
-        result = _run_sequence(base_dir, seq, config)
+        result = _run_sequence(base_dir, seq, config, session)
         run_id = result.get("run_id")
         summary = _load_run_summary(base_dir, run_id, artifacts_dir)
         response = RunResponse.model_validate(summary)
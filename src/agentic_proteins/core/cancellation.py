@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Cooperative cancellation tokens for supervised tool execution."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import threading
+
+from loguru import logger
+
+_LOCAL = threading.local()
+
+
+class CancelToken:
+    """Cancellation flag plus cleanup callbacks for one unit of work.
+
+    Work running under ``cancel_scope`` polls ``cancelled`` at safe points and
+    registers callbacks that release what it holds (kill a subprocess, close
+    an HTTP session, free device memory). ``cancel`` runs every callback once,
+    on the cancelling thread.
+    """
+
+    def __init__(self) -> None:
+        """Create an untriggered token."""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: list[Callable[[], None]] = []
+        self.reason: str | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True once ``cancel`` was called."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Trigger the token and run the registered callbacks."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            _run_callback(callback)
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register ``callback``; it runs immediately if already cancelled.
+
+        Returns a function that unregisters ``callback``; call it once the work
+        the callback guards has finished.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        _run_callback(callback)
+        return _noop
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        """Drop ``callback`` if it is still registered."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until cancelled or ``timeout`` elapses; return ``cancelled``."""
+        return self._event.wait(timeout)
+
+
+def _noop() -> None:
+    """Unregister nothing."""
+
+
+def _run_callback(callback: Callable[[], None]) -> None:
+    """Run a cleanup callback, logging rather than raising its errors."""
+    try:
+        callback()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"Cancellation cleanup failed: {exc}")
+
+
+def current_cancel_token() -> CancelToken | None:
+    """Return the token active on the calling thread, if any."""
+    return getattr(_LOCAL, "token", None)
+
+
+def cancel_requested() -> bool:
+    """Return True when the calling thread's work has been cancelled."""
+    token = current_cancel_token()
+    return token is not None and token.cancelled
+
+
+def on_cancel(callback: Callable[[], None]) -> Callable[[], None]:
+    """Register ``callback`` with the calling thread's token; return its remover."""
+    token = current_cancel_token()
+    if token is None:
+        return _noop
+    return token.on_cancel(callback)
+
+
+@contextmanager
+def cancel_scope(token: CancelToken) -> Iterator[CancelToken]:
+    """Make ``token`` the calling thread's cancellation token for the block."""
+    previous = current_cancel_token()
+    _LOCAL.token = token
+    try:
+        yield token
+    finally:
+        _LOCAL.token = previous
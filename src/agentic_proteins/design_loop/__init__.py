@@ -10,6 +10,7 @@ from agentic_proteins.design_loop.loop import (
     LoopAction,
     LoopContext,
     LoopDecision,
+    LoopIteration,
     LoopRunner,
 )
 from agentic_proteins.design_loop.stagnation import update_stagnation_count
@@ -18,6 +19,7 @@ __all__ = [
     "LoopAction",
     "LoopContext",
     "LoopDecision",
+    "LoopIteration",
     "LoopRunner",
     "is_convergence_failure",
     "update_stagnation_count",
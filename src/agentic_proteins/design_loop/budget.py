@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Per-provider cost model and compute budget for the design loop."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import threading
+from typing import Any
+
+import numpy as np
+
+from agentic_proteins.providers.factory import PROVIDER_CAPABILITIES, cuda_available
+
+# Uncalibrated seconds per residue, used until a provider has call history.
+_PRIOR_S_PER_RESIDUE = {
+    "heuristic_proxy": 1e-5,
+    "local_esmfold": 0.02,
+    "local_rosettafold": 0.1,
+    "api_colabfold": 0.5,
+    "api_openprotein_esmfold": 0.05,
+    "api_openprotein_alphafold": 0.5,
+}
+_DEFAULT_S_PER_RESIDUE = 0.05
+_MIN_SAMPLES = 3
+_EXPONENT_BOUNDS = (0.5, 3.0)
+_FLOOR_S = 1e-6
+
+
+@dataclass(frozen=True)
+class BudgetPolicy:
+    """Compute and wall-clock budget of a loop and the providers spending it.
+
+    ``max_compute_s`` caps the provider CPU plus GPU seconds of the loop and
+    ``max_wall_s`` its wall-clock seconds; the loop stops (``budget``) once
+    the cost model predicts the next iteration plus the final confirmation
+    would exceed either. Exploratory iterations run on ``explore`` and the
+    final candidate is confirmed on ``confirm``; both default to the run's
+    own provider and must be listed in ``predictors_enabled``.
+    """
+
+    max_compute_s: float | None = None
+    max_wall_s: float | None = None
+    explore: str | None = None
+    confirm: str | None = None
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> BudgetPolicy:
+        """Build and validate a policy from its ``RunConfig`` form.
+
+        Raises:
+            ValueError: If a limit is not positive or a provider is unknown.
+        """
+        policy = cls(
+            max_compute_s=_optional_float(payload.get("max_compute_s")),
+            max_wall_s=_optional_float(payload.get("max_wall_s")),
+            explore=payload.get("explore"),
+            confirm=payload.get("confirm"),
+        )
+        for name in ("max_compute_s", "max_wall_s"):
+            value = getattr(policy, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"loop_budget.{name} must be positive")
+        for name in ("explore", "confirm"):
+            provider = getattr(policy, name)
+            if provider is not None and provider not in PROVIDER_CAPABILITIES:
+                raise ValueError(f"loop_budget.{name} is not a known provider")
+        return policy
+
+
+def _optional_float(value: Any) -> float | None:  # noqa: ANN401
+    """Return ``value`` as a float, keeping None."""
+    return None if value is None else float(value)
+
+
+def provider_resource(provider: str, execution_mode: str = "auto") -> str:
+    """Return ``"gpu"`` or ``"cpu"``, the resource ``provider`` spends."""
+    capabilities = PROVIDER_CAPABILITIES.get(provider)
+    if capabilities is None or not capabilities.supports_gpu:
+        return "cpu"
+    if not capabilities.supports_cpu or execution_mode == "gpu":
+        return "gpu"
+    if execution_mode == "cpu":
+        return "cpu"
+    return "gpu" if cuda_available() else "cpu"
+
+
+@dataclass(frozen=True)
+class CostCurve:
+    """Provider seconds per call, ``scale * sequence_length ** exponent``."""
+
+    scale: float
+    exponent: float
+    samples: int
+
+    def seconds(self, sequence_length: int) -> float:
+        """Return the expected seconds of one call."""
+        return self.scale * max(sequence_length, 1) ** self.exponent
+
+
+class CostModel:
+    """Calibrated provider seconds as a function of sequence length.
+
+    A provider's curve is a least-squares fit in log-log space over its
+    ``(sequence_length, seconds)`` call history, with the exponent kept
+    within structure predictors' usual range. With fewer than three calls,
+    or all at one length, the curve is linear in length through the mean
+    observed cost per residue, and with no history at all it falls back to
+    an uncalibrated per-provider prior. Safe to share between threads.
+    """
+
+    def __init__(self, execution_mode: str = "auto") -> None:
+        """Create a model with no call history."""
+        self.execution_mode = execution_mode
+        self._samples: dict[str, list[tuple[int, float]]] = {}
+        self._curves: dict[str, CostCurve] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, provider: str, samples: Iterable[tuple[int, float]]) -> None:
+        """Add ``(sequence_length, seconds)`` calls of ``provider``."""
+        with self._lock:
+            self._samples.setdefault(provider, []).extend(
+                (int(length), float(seconds)) for length, seconds in samples
+            )
+            self._curves.pop(provider, None)
+
+    def curve(self, provider: str) -> CostCurve:
+        """Return the fitted cost curve of ``provider``."""
+        with self._lock:
+            curve = self._curves.get(provider)
+            if curve is None:
+                curve = _fit(provider, self._samples.get(provider, []))
+                self._curves[provider] = curve
+            return curve
+
+    def estimate(self, provider: str, sequence_length: int, calls: int = 1) -> float:
+        """Return the expected seconds of ``calls`` calls on one sequence length."""
+        return self.curve(provider).seconds(sequence_length) * max(calls, 0)
+
+    def resource(self, provider: str) -> str:
+        """Return the resource ``provider`` spends under this run's mode."""
+        return provider_resource(provider, self.execution_mode)
+
+    def summary(self) -> dict[str, dict[str, float | int | str]]:
+        """Return every observed provider's curve in JSON form."""
+        with self._lock:
+            providers = sorted(self._samples)
+        return {
+            provider: {
+                "resource": self.resource(provider),
+                "scale": curve.scale,
+                "exponent": round(curve.exponent, 4),
+                "samples": curve.samples,
+            }
+            for provider, curve in ((name, self.curve(name)) for name in providers)
+        }
+
+
+def _fit(provider: str, samples: list[tuple[int, float]]) -> CostCurve:
+    """Fit ``provider``'s cost curve to its call history."""
+    if not samples:
+        return CostCurve(
+            _PRIOR_S_PER_RESIDUE.get(provider, _DEFAULT_S_PER_RESIDUE), 1.0, 0
+        )
+    lengths = np.array([max(length, 1) for length, _ in samples], dtype=np.float64)
+    seconds = np.maximum([item for _, item in samples], _FLOOR_S)
+    if len(samples) < _MIN_SAMPLES or np.unique(lengths).size < 2:
+        return CostCurve(float(np.mean(seconds / lengths)), 1.0, len(samples))
+    log_lengths, log_seconds = np.log(lengths), np.log(seconds)
+    slope, _ = np.polyfit(log_lengths, log_seconds, 1)
+    exponent = float(np.clip(slope, *_EXPONENT_BOUNDS))
+    intercept = float(np.mean(log_seconds - exponent * log_lengths))
+    return CostCurve(float(np.exp(intercept)), exponent, len(samples))
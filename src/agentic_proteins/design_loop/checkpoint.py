@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Loop checkpoints for resuming an interrupted design loop."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from agentic_proteins.core.execution import LoopState
+from agentic_proteins.domain.candidates.schema import Candidate
+
+
+@dataclass(frozen=True)
+class LoopCheckpoint:
+    """Loop progress after a finished iteration, enough to continue the run.
+
+    ``next_iteration`` is the first iteration a resumed loop runs.
+    ``population`` holds ``Population.snapshot`` in population mode.
+    ``elapsed_s`` is the loop's wall-clock time so far, which a resumed loop
+    keeps counting from.
+    """
+
+    next_iteration: int
+    loop_state: LoopState
+    candidate: Candidate
+    prefix: str
+    last_score: float | None
+    stagnation_count: int
+    population: dict[str, Any] | None = None
+    elapsed_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the checkpoint in JSON form."""
+        return {
+            "next_iteration": self.next_iteration,
+            "loop_state": self.loop_state.model_dump(mode="json"),
+            "candidate": self.candidate.model_dump(mode="json"),
+            "prefix": self.prefix,
+            "last_score": self.last_score,
+            "stagnation_count": self.stagnation_count,
+            "population": self.population,
+            "elapsed_s": self.elapsed_s,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> LoopCheckpoint:
+        """Restore a checkpoint saved with ``to_dict``."""
+        return cls(
+            next_iteration=int(payload["next_iteration"]),
+            loop_state=LoopState.model_validate(payload["loop_state"]),
+            candidate=Candidate.model_validate(payload["candidate"]),
+            prefix=str(payload["prefix"]),
+            last_score=payload.get("last_score"),
+            stagnation_count=int(payload["stagnation_count"]),
+            population=payload.get("population"),
+            elapsed_s=float(payload.get("elapsed_s", 0.0)),
+        )
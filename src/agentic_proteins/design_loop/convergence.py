@@ -8,4 +8,6 @@ from __future__ import annotations
 
 def is_convergence_failure(stopping_criteria: list[str]) -> bool:
     """is_convergence_failure."""
-    return any(item in stopping_criteria for item in ("stagnation", "max_cost"))
+    return any(
+        item in stopping_criteria for item in ("stagnation", "max_cost", "budget")
+    )
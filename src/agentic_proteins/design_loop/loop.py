@@ -5,16 +5,31 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
+import sys
+from time import perf_counter
 from typing import Any, Protocol
 
+from agentic_proteins.agents.planning.schemas import MutationPlan
 from agentic_proteins.agents.schemas import CoordinatorDecisionType
+from agentic_proteins.core.cancellation import CancelToken, cancel_scope
 from agentic_proteins.core.execution import LoopState
+from agentic_proteins.design_loop.budget import BudgetPolicy, CostModel
+from agentic_proteins.design_loop.checkpoint import LoopCheckpoint
 from agentic_proteins.design_loop.convergence import is_convergence_failure
+from agentic_proteins.design_loop.mutation import MutationEngine
+from agentic_proteins.design_loop.population import Population, PopulationPolicy
 from agentic_proteins.design_loop.stagnation import update_stagnation_count
+from agentic_proteins.design_loop.surrogate import (
+    SurrogateModel,
+    SurrogatePolicy,
+    screen,
+)
 from agentic_proteins.domain.candidates.schema import Candidate
 from agentic_proteins.domain.metrics.quality import QCStatus
 
@@ -41,6 +56,48 @@ class PipelineRunner(Protocol):
         ...
 
 
+class PopulationPipelineRunner(PipelineRunner, Protocol):
+    """PipelineRunner that can also evaluate a batch of variants."""
+
+    def evaluate_population(
+        self, candidates: list[Candidate], loop_state: LoopState
+    ) -> list[PipelineResultProtocol]:
+        """Evaluate candidates concurrently, one result per candidate."""
+        ...
+
+    def record_population(self, iteration_index: int, payload: dict[str, Any]) -> None:
+        """Persist one iteration's per-variant results."""
+        ...
+
+    def mutation_plans(self) -> list[MutationPlan]:
+        """Return the planner's mutation plans for generating variants."""
+        ...
+
+    def surrogate_model(self) -> SurrogateModel:
+        """Return the surrogate shared with earlier runs of the same tool."""
+        ...
+
+
+class CheckpointingPipelineRunner(PipelineRunner, Protocol):
+    """PipelineRunner that can persist loop checkpoints."""
+
+    def record_checkpoint(self, payload: dict[str, Any]) -> None:
+        """Durably store a loop checkpoint for a later resume."""
+        ...
+
+
+class BudgetedPipelineRunner(PipelineRunner, Protocol):
+    """PipelineRunner that can switch providers and estimate their cost."""
+
+    def select_provider(self, name: str | None) -> str:
+        """Run later iterations on provider ``name`` and return the active one."""
+        ...
+
+    def cost_model(self, wall_clock: bool = False) -> CostModel:
+        """Return a cost model fitted to the run's provider call history."""
+        ...
+
+
 class LoopAction(str, Enum):
     """LoopAction."""
 
@@ -57,6 +114,28 @@ class LoopDecision:
     reason: str
 
 
+@dataclass(frozen=True)
+class LoopIteration:
+    """One finished loop iteration as yielded by ``LoopRunner.iter_run``.
+
+    ``candidate`` is a snapshot taken when the iteration finished, so callers
+    may read it while later iterations mutate the live candidate. ``final`` is
+    True for the last iteration the loop will run.
+    """
+
+    iteration_index: int
+    result: PipelineResultProtocol
+    candidate: Candidate
+    action: LoopAction
+    reason: str
+    stopping_criteria: list[str]
+    improvement_delta: float
+    score: float | None
+    iteration_ms: float
+    timings: dict[str, float] = field(default_factory=dict)
+    final: bool = False
+
+
 class LoggerProtocol(Protocol):
     """LoggerProtocol."""
 
@@ -96,6 +175,10 @@ class AnalysisProtocol(Protocol):
         """Persist analysis summary to disk."""
         ...
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the analysis in JSON form."""
+        ...
+
 
 @dataclass(frozen=True)
 class LoopContext:
@@ -122,14 +205,72 @@ class LoopRunner:
         self._analysis = analysis
         self._logger = loop_context.logger
 
-    def run(self, candidate: Candidate) -> PipelineResultProtocol:
+    def run(
+        self, candidate: Candidate, cancel: CancelToken | None = None
+    ) -> PipelineResultProtocol:
         """run."""
+        result: PipelineResultProtocol | None = None
+        for iteration in self.iter_run(candidate, cancel):
+            result = iteration.result
+        return result  # type: ignore[return-value]
+
+    def iter_run(
+        self,
+        candidate: Candidate,
+        cancel: CancelToken | None = None,
+        resume: LoopCheckpoint | None = None,
+    ) -> Iterator[LoopIteration]:
+        """Run the loop, yielding each iteration as soon as it finishes.
+
+        The next iteration starts only when the caller asks for it. Cancelling
+        ``cancel`` stops the loop before its next iteration (``cancelled`` is
+        added to the stopping criteria) and aborts providers that poll it;
+        closing the generator stops it as well. Loop-end analysis is written
+        either way.
+
+        With ``loop_population`` configured, the first iteration evaluates
+        ``candidate`` through the full pipeline and every later one evaluates
+        a batch of variants of the current elites, generated from the
+        planner's ``mutation_plans``, via ``evaluate_population``,
+        keeping the best by ``rank_candidates``; the top elite then stands in
+        for the loop's candidate. The final elite is confirmed with one more
+        full pipeline iteration so the run's report describes it. With
+        ``loop_surrogate`` configured as well, variants whose predicted upper
+        confidence bound cannot beat the best elite are never sent to the
+        structure provider.
+
+        With ``loop_budget`` configured, iterations run on the budget's
+        ``explore`` provider and the final candidate is confirmed on its
+        ``confirm`` provider. Before each population iteration the variant
+        count is cut to what the remaining compute affords, and the loop
+        stops (``budget``) once the provider cost model predicts that another
+        iteration plus the confirmation would overrun the compute or
+        wall-clock budget. Estimated and spent seconds of every stage are
+        written to the analysis.
+
+        With ``loop_checkpoint_interval`` set, every that many iterations the
+        loop state, elites and mutation engine state are handed to the
+        pipeline's ``record_checkpoint``. Passing such a checkpoint as
+        ``resume`` continues the loop at its next iteration with the same
+        stagnation tracking and random draws; a resumed population run
+        always confirms its final elite.
+        """
         max_iterations = int(self._context.config.get("loop_max_iterations", 1))
         stagnation_window = int(self._context.config.get("loop_stagnation_window", 2))
         improvement_threshold = float(
             self._context.config.get("loop_improvement_threshold", 0.5)
         )
         max_cost = float(self._context.config.get("loop_max_cost", 1.0))
+        budget = self._budget()
+        budgeted: BudgetedPipelineRunner = self._pipeline  # type: ignore[assignment]
+        explorer = budgeted.select_provider(budget.explore) if budget else ""
+        population = self._population()
+        surrogate = self._surrogate() if population is not None else None
+        checkpoint_interval = int(
+            self._context.config.get("loop_checkpoint_interval") or 0
+        )
+        prefix = candidate.candidate_id
+        confirmed_id: str | None = candidate.candidate_id
         loop_state = LoopState(
             replans=0,
             executions=0,
@@ -139,85 +280,443 @@ class LoopRunner:
             improvement_delta=0.0,
         )
         last_score: float | None = None
-        result: PipelineResultProtocol | None = None
         stagnation_count = 0
-        self._analysis.record_candidate_event(
-            candidate.candidate_id,
-            "loop_start",
-            {"sequence_length": len(candidate.sequence)},
-        )
-
-        for idx in range(max_iterations):
-            loop_state.iteration_index = idx
-            result = self._pipeline.run_iteration(candidate, loop_state)
-            candidate = result.candidate
-            loop_state.executions += 1
-
+        first_iteration = 0
+        if resume is None:
             self._analysis.record_candidate_event(
                 candidate.candidate_id,
-                "iteration_complete",
-                {
-                    "iteration_index": idx,
-                    "tool_status": result.tool_status,
-                    "qc_status": result.qc_status,
-                },
+                "loop_start",
+                {"sequence_length": len(candidate.sequence)},
             )
-            if result.timings.get("tool_invocation_ms") is not None:
-                self._analysis.record_tool_result(
-                    getattr(result.tool_result, "tool_name", "unknown"),
-                    result.tool_status,
-                    result.timings.get("tool_invocation_ms", 0.0),
+        else:
+            candidate = resume.candidate.model_copy(deep=True)
+            prefix = resume.prefix
+            confirmed_id = None
+            loop_state = resume.loop_state.model_copy(deep=True)
+            last_score = resume.last_score
+            stagnation_count = resume.stagnation_count
+            first_iteration = resume.next_iteration
+            if population is not None and resume.population is not None:
+                population.restore(resume.population)
+                population.plans = (
+                    self._pipeline.mutation_plans()  # type: ignore[attr-defined]
+                    or population.plans
                 )
-
-            score = candidate.metrics.get("mean_plddt")
-            if score is not None and last_score is not None:
-                loop_state.improvement_delta = float(score) - float(last_score)
-            else:
-                loop_state.improvement_delta = 0.0
-            if score is not None:
-                last_score = float(score)
-            self._analysis.record_iteration_delta(
-                idx, loop_state.improvement_delta, score
+            self._analysis.record_candidate_event(
+                candidate.candidate_id,
+                "loop_resume",
+                {"iteration_index": first_iteration},
             )
-            stagnation_count = update_stagnation_count(
-                stagnation_count, loop_state.improvement_delta, improvement_threshold
+        loop_start = perf_counter() - (resume.elapsed_s if resume else 0.0)
+        try:
+            for idx in range(first_iteration, max_iterations):
+                loop_state.iteration_index = idx
+                iteration_start = perf_counter()
+                usage = self._usage()
+                costs = budgeted.cost_model() if budget is not None else None
+                with cancel_scope(cancel) if cancel is not None else nullcontext():
+                    if population is None or idx == 0:
+                        result = self._pipeline.run_iteration(candidate, loop_state)
+                        confirmed_id = result.candidate.candidate_id
+                        if population is not None:
+                            population.seed(result)
+                            if surrogate is not None:
+                                _train_surrogate(surrogate[1], [result], {})
+                            population.plans = (
+                                self._pipeline.mutation_plans()  # type: ignore[attr-defined]
+                                or population.plans
+                            )
+                    else:
+                        spent = self._context.telemetry.cost.get("tool_units", 0.0)
+                        count = min(population.policy.variants, int(max_cost - spent))
+                        if budget is not None:
+                            count = min(
+                                count,
+                                self._affordable(
+                                    budget,
+                                    costs,  # type: ignore[arg-type]
+                                    explorer,
+                                    len(candidate.sequence),
+                                ),
+                            )
+                        result = self._population_iteration(
+                            population, loop_state, prefix, count, surrogate
+                        )
+                candidate = result.candidate
+                loop_state.executions += 1
+
+                self._analysis.record_candidate_event(
+                    candidate.candidate_id,
+                    "iteration_complete",
+                    {
+                        "iteration_index": idx,
+                        "tool_status": result.tool_status,
+                        "qc_status": result.qc_status,
+                    },
+                )
+                if result.timings.get("tool_invocation_ms") is not None:
+                    self._analysis.record_tool_result(
+                        getattr(result.tool_result, "tool_name", "unknown"),
+                        result.tool_status,
+                        result.timings.get("tool_invocation_ms", 0.0),
+                    )
+
+                score = candidate.metrics.get("mean_plddt")
+                if score is not None and last_score is not None:
+                    loop_state.improvement_delta = float(score) - float(last_score)
+                else:
+                    loop_state.improvement_delta = 0.0
+                if score is not None:
+                    last_score = float(score)
+                self._analysis.record_iteration_delta(
+                    idx, loop_state.improvement_delta, score
+                )
+                stagnation_count = update_stagnation_count(
+                    stagnation_count,
+                    loop_state.improvement_delta,
+                    improvement_threshold,
+                )
+
+                stopping = []
+                if result.tool_status == "dry_run":
+                    stopping.append("dry_run")
+                elif result.tool_status != "success":
+                    stopping.append("tool_failure")
+                if result.qc_status is QCStatus.REJECT:
+                    stopping.append("qc_reject")
+                spent = self._context.telemetry.cost.get("tool_units", 0.0)
+                if spent > max_cost or (
+                    population is not None and spent + 1.0 > max_cost
+                ):
+                    stopping.append("max_cost")
+                if stagnation_count >= stagnation_window:
+                    stopping.append("stagnation")
+                if budget is not None:
+                    self._record_budget(
+                        costs,  # type: ignore[arg-type]
+                        usage,
+                        idx,
+                        "explore",
+                        explorer,
+                        len(candidate.sequence),
+                    )
+                    if self._over_budget(
+                        budget,
+                        budgeted.cost_model(),
+                        explorer,
+                        len(candidate.sequence),
+                        perf_counter() - loop_start,
+                        perf_counter() - iteration_start,
+                        population is not None,
+                    ):
+                        stopping.append("budget")
+                if idx >= max_iterations - 1:
+                    stopping.append("max_iterations")
+                if cancel is not None and cancel.cancelled:
+                    stopping.append("cancelled")
+                loop_state.stopping_criteria = stopping
+
+                decision = self._decide_next(result, stopping)
+                self._log_loop_iteration(
+                    candidate.candidate_id,
+                    idx,
+                    decision.action,
+                    decision.reason,
+                    loop_state.improvement_delta,
+                    stopping,
+                )
+
+                if decision.action is LoopAction.MUTATE:
+                    loop_state.replans += 1
+                    candidate.flags.append("mutate_requested")
+                final = decision.action is LoopAction.STOP
+                reconfirm = (
+                    budget is not None
+                    and budget.confirm not in (None, explorer)
+                    and "cancelled" not in stopping
+                )
+                if final and (
+                    reconfirm
+                    or (
+                        population is not None
+                        and (
+                            confirmed_id is None
+                            or (
+                                candidate.candidate_id != confirmed_id
+                                and "cancelled" not in stopping
+                            )
+                        )
+                    )
+                ):
+                    usage = self._usage()
+                    if budget is not None:
+                        costs = budgeted.cost_model()
+                        budgeted.select_provider(budget.confirm or explorer)
+                    with cancel_scope(cancel) if cancel is not None else nullcontext():
+                        result = self._pipeline.run_iteration(candidate, loop_state)
+                    candidate = result.candidate
+                    if budget is not None:
+                        self._record_budget(
+                            costs,  # type: ignore[arg-type]
+                            usage,
+                            idx,
+                            "confirm",
+                            budget.confirm or explorer,
+                            len(candidate.sequence),
+                        )
+                if final and is_convergence_failure(stopping):
+                    result.failure_type = "convergence_failure"
+                if (
+                    not final
+                    and checkpoint_interval
+                    and (idx + 1) % checkpoint_interval == 0
+                ):
+                    self._checkpoint(
+                        LoopCheckpoint(
+                            next_iteration=idx + 1,
+                            loop_state=loop_state.model_copy(deep=True),
+                            candidate=candidate.model_copy(deep=True),
+                            prefix=prefix,
+                            last_score=last_score,
+                            stagnation_count=stagnation_count,
+                            population=None
+                            if population is None
+                            else population.snapshot(),
+                            elapsed_s=perf_counter() - loop_start,
+                        )
+                    )
+                yield LoopIteration(
+                    iteration_index=idx,
+                    result=result,
+                    candidate=candidate.model_copy(deep=True),
+                    action=decision.action,
+                    reason=decision.reason,
+                    stopping_criteria=list(stopping),
+                    improvement_delta=loop_state.improvement_delta,
+                    score=float(score) if score is not None else None,
+                    iteration_ms=(perf_counter() - iteration_start) * 1000.0,
+                    timings=dict(result.timings),
+                    final=final,
+                )
+                if final:
+                    break
+                if cancel is not None and cancel.cancelled:
+                    break
+        finally:
+            self._analysis.record_candidate_event(
+                candidate.candidate_id, "loop_end", {}
             )
+            if budget is not None:
+                self._analysis.record_budget_model(  # type: ignore[attr-defined]
+                    {
+                        "max_compute_s": budget.max_compute_s,
+                        "max_wall_s": budget.max_wall_s,
+                    },
+                    budgeted.cost_model().summary(),
+                )
+            self._analysis.write(self._context.analysis_path)
+
+    def _population(self) -> Population | None:
+        """Return a fresh population when ``loop_population`` is configured."""
+        payload = self._context.config.get("loop_population")
+        if not payload:
+            return None
+        return Population(
+            policy=PopulationPolicy.from_dict(payload),
+            engine=MutationEngine(int(self._context.config.get("seed") or 0)),
+        )
 
-            stopping = []
-            if result.tool_status != "success":
-                stopping.append("tool_failure")
-            if result.qc_status is QCStatus.REJECT:
-                stopping.append("qc_reject")
-            if self._context.telemetry.cost.get("tool_units", 0.0) > max_cost:
-                stopping.append("max_cost")
-            if stagnation_count >= stagnation_window:
-                stopping.append("stagnation")
-            if idx >= max_iterations - 1:
-                stopping.append("max_iterations")
-            loop_state.stopping_criteria = stopping
-
-            decision = self._decide_next(result, stopping)
-            self._log_loop_iteration(
-                candidate.candidate_id,
-                idx,
-                decision.action,
-                decision.reason,
-                loop_state.improvement_delta,
-                stopping,
+    def _budget(self) -> BudgetPolicy | None:
+        """Return the budget when ``loop_budget`` is configured."""
+        payload = self._context.config.get("loop_budget")
+        return BudgetPolicy.from_dict(payload) if payload else None
+
+    def _usage(self) -> tuple[float, float, float]:
+        """Return the provider seconds and tool calls charged so far, and now."""
+        cost = self._context.telemetry.cost
+        return (
+            cost.get("cpu_seconds", 0.0) + cost.get("gpu_seconds", 0.0),
+            cost.get("tool_units", 0.0),
+            perf_counter(),
+        )
+
+    def _record_budget(
+        self,
+        costs: CostModel,
+        usage: tuple[float, float, float],
+        iteration_index: int,
+        stage: str,
+        provider: str,
+        sequence_length: int,
+    ) -> None:
+        """Record what a stage spent since ``usage`` against its estimate.
+
+        The estimate prices every tool call the stage made with ``costs``,
+        the model as fitted before the stage ran.
+        """
+        compute, calls, start = usage
+        now_compute, now_calls, now = self._usage()
+        self._analysis.record_budget(  # type: ignore[attr-defined]
+            iteration_index,
+            stage,
+            provider,
+            estimated_s=costs.estimate(
+                provider, sequence_length, int(now_calls - calls)
+            ),
+            compute_s=now_compute - compute,
+            wall_s=now - start,
+        )
+
+    def _affordable(
+        self,
+        budget: BudgetPolicy,
+        costs: CostModel,
+        explorer: str,
+        sequence_length: int,
+    ) -> int:
+        """Return how many exploratory calls the compute budget still affords."""
+        if budget.max_compute_s is None:
+            return sys.maxsize
+        left = budget.max_compute_s - self._usage()[0]
+        left -= costs.estimate(budget.confirm or explorer, sequence_length)
+        return max(0, int(left // costs.estimate(explorer, sequence_length)))
+
+    def _over_budget(
+        self,
+        budget: BudgetPolicy,
+        costs: CostModel,
+        explorer: str,
+        sequence_length: int,
+        elapsed_s: float,
+        iteration_s: float,
+        population: bool,
+    ) -> bool:
+        """Return True when another iteration and the confirmation would not fit.
+
+        The next iteration is priced at one exploratory call of compute and
+        at the last iteration's wall-clock time; the confirmation, reserved
+        when the loop will run one, at one call of the confirming provider,
+        in compute and in wall-clock seconds from the run's call history.
+        ``elapsed_s`` is the loop's wall-clock time since it started.
+        """
+        confirmer = budget.confirm or explorer
+        confirms = population or budget.confirm not in (None, explorer)
+        if budget.max_compute_s is not None and (
+            self._usage()[0]
+            + costs.estimate(explorer, sequence_length)
+            + (costs.estimate(confirmer, sequence_length) if confirms else 0.0)
+            > budget.max_compute_s
+        ):
+            return True
+        if budget.max_wall_s is None:
+            return False
+        reserve = 0.0
+        if confirms:
+            budgeted: BudgetedPipelineRunner = self._pipeline  # type: ignore[assignment]
+            reserve = budgeted.cost_model(wall_clock=True).estimate(
+                confirmer, sequence_length
             )
+        return elapsed_s + iteration_s + reserve > budget.max_wall_s
 
-            if decision.action is LoopAction.MUTATE:
-                loop_state.replans += 1
-                candidate.flags.append("mutate_requested")
-                continue
-            if decision.action is LoopAction.STOP:
-                if is_convergence_failure(stopping):
-                    result.failure_type = "convergence_failure"
-                break
+    def _checkpoint(self, checkpoint: LoopCheckpoint) -> None:
+        """Hand a checkpoint and the analysis so far to the pipeline."""
+        pipeline: CheckpointingPipelineRunner = self._pipeline  # type: ignore[assignment]
+        pipeline.record_checkpoint(
+            {"loop": checkpoint.to_dict(), "analysis": self._analysis.to_dict()}
+        )
 
-        self._analysis.record_candidate_event(candidate.candidate_id, "loop_end", {})
-        self._analysis.write(self._context.analysis_path)
-        return result  # type: ignore[return-value]
+    def _surrogate(self) -> tuple[SurrogatePolicy, SurrogateModel] | None:
+        """Return the surrogate gate when ``loop_surrogate`` is configured."""
+        payload = self._context.config.get("loop_surrogate")
+        if not payload:
+            return None
+        pipeline: PopulationPipelineRunner = self._pipeline  # type: ignore[assignment]
+        return SurrogatePolicy.from_dict(payload), pipeline.surrogate_model()
+
+    def _population_iteration(
+        self,
+        population: Population,
+        loop_state: LoopState,
+        prefix: str,
+        count: int,
+        surrogate: tuple[SurrogatePolicy, SurrogateModel] | None = None,
+    ) -> PipelineResultProtocol:
+        """Evaluate ``count`` variants of the elites and return the best result."""
+        pipeline: PopulationPipelineRunner = self._pipeline  # type: ignore[assignment]
+        variants = population.propose(count, loop_state.iteration_index, prefix)
+        skipped: list[Candidate] = []
+        predicted: dict[str, tuple[float, float]] = {}
+        if surrogate is not None and variants:
+            policy, model = surrogate
+            best = population.best.candidate.metrics.get("mean_plddt")
+            screening = screen(
+                model, policy, [item.sequence for item in variants], best
+            )
+            predicted = {
+                item.candidate_id: (float(mean), float(std))
+                for item, mean, std in zip(
+                    variants, screening.mean, screening.std, strict=False
+                )
+            }
+            skipped = [variants[index] for index in screening.skipped]
+            variants = [variants[index] for index in screening.evaluate]
+        results = pipeline.evaluate_population(variants, loop_state) if variants else []
+        if surrogate is not None:
+            self._analysis.record_surrogate(
+                screened=len(variants) + len(skipped),
+                skipped=len(skipped),
+                errors=_train_surrogate(surrogate[1], results, predicted),
+                provider_ms=[item.timings.get("tool_ms", 0.0) for item in results],
+            )
+        ranking = {item.candidate_id: item for item in population.admit(results)}
+        elites = [item.candidate_id for item in population.elites]
+        entries = []
+        for result in results:
+            variant = result.candidate
+            score = ranking.get(variant.candidate_id)
+            tool_ms = result.timings.get("tool_ms", 0.0)
+            self._analysis.record_tool_result(
+                getattr(result.tool_result, "tool_name", "unknown"),
+                result.tool_status,
+                tool_ms,
+            )
+            entries.append(
+                {
+                    "candidate_id": variant.candidate_id,
+                    "parent_id": variant.provenance.get("parent_id"),
+                    "mutations": variant.provenance.get("mutations", []),
+                    "sequence": variant.sequence,
+                    "tool_status": result.tool_status,
+                    "failure_type": result.failure_type,
+                    "qc_status": result.qc_status.value,
+                    "mean_plddt": variant.metrics.get("mean_plddt"),
+                    "score": None if score is None else round(score.score, 4),
+                    "rank": None if score is None else score.rank,
+                    "elite": variant.candidate_id in elites,
+                    "tool_ms": round(tool_ms, 3),
+                    **_prediction(predicted, variant.candidate_id),
+                }
+            )
+        entries.extend(
+            {
+                "candidate_id": variant.candidate_id,
+                "parent_id": variant.provenance.get("parent_id"),
+                "mutations": variant.provenance.get("mutations", []),
+                "sequence": variant.sequence,
+                "tool_status": "surrogate_skipped",
+                **_prediction(predicted, variant.candidate_id),
+            }
+            for variant in skipped
+        )
+        pipeline.record_population(
+            loop_state.iteration_index,
+            {
+                "iteration_index": loop_state.iteration_index,
+                "elites": elites,
+                "variants": entries,
+            },
+        )
+        return population.best
 
     @staticmethod
     def _decide_next(
@@ -254,3 +753,36 @@ class LoopRunner:
             reason=reason,
             timestamp=datetime.now(UTC).isoformat(),
         )
+
+
+def _prediction(
+    predicted: dict[str, tuple[float, float]], candidate_id: str
+) -> dict[str, float]:
+    """Return a variant's surrogate prediction as population entry fields."""
+    if candidate_id not in predicted:
+        return {}
+    mean, std = predicted[candidate_id]
+    return {"surrogate_mean_plddt": round(mean, 3), "surrogate_std": round(std, 3)}
+
+
+def _train_surrogate(
+    model: SurrogateModel,
+    results: list[PipelineResultProtocol],
+    predicted: dict[str, tuple[float, float]],
+) -> list[float]:
+    """Train ``model`` on measured results and return its absolute errors."""
+    measured = [
+        (result.candidate, float(result.candidate.metrics["mean_plddt"]))
+        for result in results
+        if result.tool_status == "success"
+        and result.candidate.metrics.get("mean_plddt") is not None
+    ]
+    model.observe(
+        [candidate.sequence for candidate, _ in measured],
+        [value for _, value in measured],
+    )
+    return [
+        abs(value - predicted[candidate.candidate_id][0])
+        for candidate, value in measured
+        if candidate.candidate_id in predicted
+    ]
@@ -0,0 +1,440 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Vectorized sequence variant generation driven by planner mutation plans."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, replace
+import functools
+from typing import Any
+
+import numpy as np
+
+from agentic_proteins.agents.planning.schemas import MutationPlan
+from agentic_proteins.domain.candidates.schema import Candidate
+from agentic_proteins.domain.confidence.segments import low_confidence_segments
+from agentic_proteins.domain.structure.structure import (
+    load_structure_from_pdb_text,
+    per_residue_plddt_ss,
+)
+
+CANONICAL_RESIDUES = "ACDEFGHIKLMNPQRSTVWY"
+MUTATION_TYPES = ("point_mutation", "insertion", "deletion", "recombination")
+ALPHABET = np.frombuffer(CANONICAL_RESIDUES.encode("ascii"), dtype=np.uint8)
+_INDEX = np.full(256, len(ALPHABET), dtype=np.int64)
+_INDEX[ALPHABET] = np.arange(len(ALPHABET))
+_HASH_BLOCK = 1024
+_LENGTH_KEY = np.array([0x9E3779B97F4A7C15], dtype=np.uint64)
+
+
+def encode(sequence: str) -> np.ndarray:
+    """Return ``sequence`` as a uint8 array of ASCII residue codes."""
+    return np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+
+
+def decode(row: np.ndarray) -> str:
+    """Return the sequence stored in one uint8 row."""
+    return row.tobytes().decode("ascii")
+
+
+def sequence_hashes(rows: np.ndarray) -> np.ndarray:
+    """Return a 64-bit hash per uint8 row.
+
+    The hash is ``len * K + sum(row[j] * m[j])`` modulo 2**64 over fixed odd
+    multipliers ``m``, so the engine can derive a variant's hash from its
+    parent's prefix sums without reading the variant row.
+    """
+    length = rows.shape[1]
+    weighted = rows.astype(np.uint64) * _multipliers(length)
+    return weighted.sum(axis=1, dtype=np.uint64) + _length_term(length)
+
+
+def position_weights(
+    plddt: Sequence[float], threshold: float = 70.0, min_len: int = 8
+) -> np.ndarray:
+    """Return per-position mutation probabilities from per-residue pLDDT.
+
+    Each residue is weighted by its distance below 100 and doubled inside
+    ``low_confidence_segments``, so confident regions are rarely touched.
+    """
+    values = np.asarray(plddt, dtype=np.float64)
+    weights = np.clip(100.0 - values, 1.0, None)
+    for start, end in low_confidence_segments(list(values), threshold, min_len):
+        weights[start:end] *= 2.0
+    return weights / weights.sum()
+
+
+def residue_plddt(candidate: Candidate) -> list[float] | None:
+    """Return per-residue pLDDT of the candidate's latest structure, if any."""
+    for structure in reversed(candidate.structures):
+        if not structure.pdb_text:
+            continue
+        plddt, _ss, _aas = per_residue_plddt_ss(
+            load_structure_from_pdb_text(structure.pdb_text)
+        )
+        if len(plddt) == len(candidate.sequence):
+            return plddt
+    return None
+
+
+@dataclass(frozen=True)
+class VariantBatch:
+    """Variants produced by one operator, one uint8 row per variant.
+
+    ``parents`` indexes the parent sequences the batch was generated from and
+    ``positions`` holds the 0-based mutated, inserted or deleted position (the
+    crossover point for recombinations, whose second parent is in
+    ``partners``). ``hashes`` holds each row's ``sequence_hashes`` value.
+    """
+
+    kind: str
+    sequences: np.ndarray
+    parents: np.ndarray
+    positions: np.ndarray
+    hashes: np.ndarray
+    partners: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        """Return the number of variants."""
+        return int(self.sequences.shape[0])
+
+    def take(self, rows: np.ndarray) -> VariantBatch:
+        """Return the variants at ``rows``."""
+        return VariantBatch(
+            kind=self.kind,
+            sequences=self.sequences[rows],
+            parents=self.parents[rows],
+            positions=self.positions[rows],
+            hashes=self.hashes[rows],
+            partners=None if self.partners is None else self.partners[rows],
+        )
+
+    def decode(self) -> list[str]:
+        """Return the variants as strings."""
+        return [decode(row) for row in self.sequences]
+
+    def label(self, index: int, parents: Sequence[str]) -> str:
+        """Return a mutation label such as ``A12G``, ``ins5K`` or ``del5A``."""
+        parent = parents[int(self.parents[index])]
+        position = int(self.positions[index])
+        row = self.sequences[index]
+        if self.kind == "point_mutation":
+            return f"{parent[position]}{position + 1}{chr(row[position])}"
+        if self.kind == "insertion":
+            return f"ins{position + 1}{chr(row[position])}"
+        if self.kind == "deletion":
+            return f"del{position + 1}{parent[position]}"
+        partner = int(self.partners[index]) if self.partners is not None else -1
+        return f"x{position}:{partner}"
+
+
+class MutationEngine:
+    """Generate batches of sequence variants as uint8 arrays.
+
+    Every operator draws from one seeded ``numpy`` generator, so a run with
+    the same seed proposes the same variants. Positions are drawn from
+    optional per-position ``weights`` (see ``position_weights``). Operators
+    derive each variant's hash from its parent in constant time, and
+    ``unseen`` drops variants already proposed, keeping a run from evaluating
+    a sequence twice. ``seen`` holds the proposed hashes; sequences are only
+    compared when a hash matches, so a collision never drops a new variant.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """Create an engine whose draws are reproducible from ``seed``."""
+        self.rng = np.random.default_rng(seed)
+        self.seen = np.empty(0, dtype=np.uint64)
+        self._seen_rows: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+
+    def point_mutations(
+        self,
+        parent: str,
+        count: int,
+        weights: np.ndarray | None = None,
+        residue: str | None = None,
+    ) -> VariantBatch:
+        """Return ``count`` single substitutions of ``parent``."""
+        base = encode(parent)
+        positions = self.rng.choice(base.size, size=count, p=weights)
+        multipliers = _multipliers(base.size)[positions]
+        original = base[positions]
+        residues = self._residues(original, residue)
+        batch = np.repeat(base[None, :], count, axis=0)
+        batch[np.arange(count), positions] = residues
+        hashes = (
+            sequence_hashes(base[None, :])
+            + residues.astype(np.uint64) * multipliers
+            - original.astype(np.uint64) * multipliers
+        )
+        return VariantBatch(
+            "point_mutation", batch, np.zeros(count, np.int64), positions, hashes
+        )
+
+    def insertions(
+        self,
+        parent: str,
+        count: int,
+        weights: np.ndarray | None = None,
+        residue: str | None = None,
+    ) -> VariantBatch:
+        """Return ``count`` single-residue insertions into ``parent``."""
+        base = encode(parent)
+        positions = np.sort(self.rng.choice(base.size, size=count, p=weights))
+        residues = self._residues(None, residue, count)
+        batch = np.empty((count, base.size + 1), dtype=np.uint8)
+        for position, rows in _position_blocks(positions, base.size):
+            batch[rows, :position] = base[:position]
+            batch[rows, position] = residues[rows]
+            batch[rows, position + 1 :] = base[position:]
+        multipliers = _multipliers(base.size + 1)
+        head = _prefix_sums(base, multipliers[:-1])
+        tail = _prefix_sums(base, multipliers[1:])
+        hashes = (
+            head[positions]
+            + residues.astype(np.uint64) * multipliers[positions]
+            + (tail[-1] - tail[positions])
+            + _length_term(base.size + 1)
+        )
+        return VariantBatch(
+            "insertion", batch, np.zeros(count, np.int64), positions, hashes
+        )
+
+    def deletions(
+        self, parent: str, count: int, weights: np.ndarray | None = None
+    ) -> VariantBatch:
+        """Return ``count`` single-residue deletions from ``parent``.
+
+        Raises:
+            ValueError: If ``parent`` has fewer than two residues.
+        """
+        base = encode(parent)
+        if base.size < 2:
+            raise ValueError("deletions need a parent of at least two residues")
+        positions = np.sort(self.rng.choice(base.size, size=count, p=weights))
+        batch = np.empty((count, base.size - 1), dtype=np.uint8)
+        for position, rows in _position_blocks(positions, base.size):
+            batch[rows, :position] = base[:position]
+            batch[rows, position:] = base[position + 1 :]
+        multipliers = _multipliers(base.size - 1)
+        head = _prefix_sums(base[:-1], multipliers)
+        tail = _prefix_sums(base[1:], multipliers)
+        hashes = (
+            head[positions] + (tail[-1] - tail[positions]) + _length_term(base.size - 1)
+        )
+        return VariantBatch(
+            "deletion", batch, np.zeros(count, np.int64), positions, hashes
+        )
+
+    def recombinations(self, parents: Sequence[str], count: int) -> VariantBatch:
+        """Return ``count`` one-point crossovers between equal-length parents.
+
+        Raises:
+            ValueError: If fewer than two parents are given or their lengths
+                differ.
+        """
+        if len(parents) < 2 or len({len(item) for item in parents}) != 1:
+            raise ValueError("recombination needs two or more equal-length parents")
+        stack = np.stack([encode(item) for item in parents])
+        length = stack.shape[1]
+        first = self.rng.integers(len(parents), size=count)
+        offset = self.rng.integers(1, len(parents), size=count)
+        second = (first + offset) % len(parents)
+        cuts = np.sort(self.rng.integers(1, length, size=count))
+        batch = stack[second]
+        for cut, rows in _position_blocks(cuts, length):
+            batch[rows, :cut] = stack[first[rows], :cut]
+        multipliers = _multipliers(length)
+        prefix = np.stack([_prefix_sums(row, multipliers) for row in stack])
+        hashes = (
+            prefix[first, cuts]
+            + (prefix[second, -1] - prefix[second, cuts])
+            + _length_term(length)
+        )
+        return VariantBatch(
+            "recombination", batch, first, cuts, hashes, partners=second
+        )
+
+    def apply(
+        self,
+        plan: MutationPlan,
+        parents: Sequence[str],
+        count: int,
+        weights: Sequence[np.ndarray | None] | None = None,
+    ) -> list[VariantBatch]:
+        """Run ``plan`` over ``parents``, ``count`` variants in total.
+
+        ``plan.parameters`` may pin ``position`` (1-based) and ``new_residue``;
+        ``auto`` or a missing value lets the engine choose. Point mutations,
+        insertions and deletions split ``count`` across the parents.
+
+        Raises:
+            ValueError: If the mutation type or a pinned parameter is invalid,
+                or a pinned position lies beyond a parent's last residue.
+        """
+        if plan.mutation_type not in MUTATION_TYPES:
+            raise ValueError(f"mutation_type must be one of {MUTATION_TYPES}")
+        if plan.mutation_type == "recombination":
+            return [self.recombinations(parents, count)]
+        residue = _pinned(plan.parameters.get("new_residue"))
+        position = _pinned(plan.parameters.get("position"))
+        if residue is not None and (
+            len(residue) != 1 or residue not in CANONICAL_RESIDUES
+        ):
+            raise ValueError(f"new_residue must be one of {CANONICAL_RESIDUES}")
+        if position is not None and (not position.isdigit() or int(position) < 1):
+            raise ValueError("position must be a 1-based integer or 'auto'")
+        batches = []
+        quotas = np.array_split(np.arange(count), len(parents))
+        for index, (parent, quota) in enumerate(zip(parents, quotas, strict=True)):
+            if not quota.size:
+                continue
+            parent_weights = weights[index] if weights else None
+            if position is not None:
+                if int(position) > len(parent):
+                    raise ValueError(
+                        f"position {position} is beyond the "
+                        f"{len(parent)}-residue parent"
+                    )
+                parent_weights = np.zeros(len(parent))
+                parent_weights[int(position) - 1] = 1.0
+            if plan.mutation_type == "point_mutation":
+                batch = self.point_mutations(
+                    parent, quota.size, parent_weights, residue
+                )
+            elif plan.mutation_type == "insertion":
+                batch = self.insertions(parent, quota.size, parent_weights, residue)
+            else:
+                batch = self.deletions(parent, quota.size, parent_weights)
+            batches.append(replace(batch, parents=np.full(quota.size, index)))
+        return batches
+
+    def unseen(self, batch: VariantBatch, limit: int | None = None) -> VariantBatch:
+        """Return the first ``limit`` variants not proposed before and mark them seen.
+
+        Repeats within ``batch`` keep their first occurrence only. Only
+        variants whose hash matches a seen or another variant's hash are
+        compared by sequence.
+        """
+        hashes = batch.hashes
+        _, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+        leader = first[inverse.ravel()]
+        lead = leader == np.arange(len(batch))
+        known = np.isin(hashes, self.seen)
+        same = lead.copy()
+        repeats = np.flatnonzero(~lead)
+        same[repeats] = (
+            batch.sequences[repeats] == batch.sequences[leader[repeats]]
+        ).all(axis=1)
+        fresh = lead & ~known
+        taken: dict[int, set[bytes]] = {}
+        for index in np.flatnonzero((lead & known) | ~same):
+            key, head = int(hashes[index]), int(leader[index])
+            group = taken.setdefault(
+                key, {batch.sequences[head].tobytes()} if fresh[head] else set()
+            )
+            row = batch.sequences[index]
+            if row.tobytes() in group or self._was_seen(key, row):
+                continue
+            group.add(row.tobytes())
+            fresh[index] = True
+        rows = np.flatnonzero(fresh)[:limit]
+        self._mark(hashes[rows], batch.sequences[rows])
+        return batch.take(rows)
+
+    def mark_seen(self, sequences: Sequence[str]) -> None:
+        """Record ``sequences`` as already proposed."""
+        for length in {len(item) for item in sequences}:
+            rows = np.stack([encode(item) for item in sequences if len(item) == length])
+            self._mark(sequence_hashes(rows), rows)
+
+    def state(self) -> dict[str, Any]:
+        """Return the generator state and seen sequences in JSON form."""
+        return {
+            "bit_generator": self.rng.bit_generator.state,
+            "seen": sorted(
+                decode(row) for _, rows in self._seen_rows.values() for row in rows
+            ),
+        }
+
+    def restore(self, state: Mapping[str, Any]) -> None:
+        """Continue from a ``state`` snapshot, drawing what the original would."""
+        self.rng.bit_generator.state = dict(state["bit_generator"])
+        self.seen = np.empty(0, dtype=np.uint64)
+        self._seen_rows = {}
+        self.mark_seen(state["seen"])
+
+    def _was_seen(self, key: int, row: np.ndarray) -> bool:
+        """Return whether ``row``, hashing to ``key``, was proposed before."""
+        hashes, rows = self._seen_rows.get(row.size, (self.seen[:0], None))
+        matches = hashes == np.uint64(key)
+        return rows is not None and bool((rows[matches] == row).all(axis=1).any())
+
+    def _mark(self, hashes: np.ndarray, rows: np.ndarray) -> None:
+        """Record same-length variant ``rows`` with their ``hashes`` as proposed."""
+        stored = self._seen_rows.get(rows.shape[1])
+        self._seen_rows[rows.shape[1]] = (
+            (hashes, rows)
+            if stored is None
+            else (np.concatenate([stored[0], hashes]), np.vstack([stored[1], rows]))
+        )
+        self.seen = np.union1d(self.seen, hashes)
+
+    def _residues(
+        self, original: np.ndarray | None, residue: str | None, count: int = 0
+    ) -> np.ndarray:
+        """Return replacement residues, never equal to ``original``."""
+        size = count if original is None else original.size
+        if residue is not None:
+            return np.full(size, ord(residue), dtype=np.uint8)
+        if original is None:
+            return ALPHABET[self.rng.integers(len(ALPHABET), size=size)]
+        draws = self.rng.integers(len(ALPHABET) - 1, size=size)
+        draws += draws >= _INDEX[original]
+        return ALPHABET[draws]
+
+
+def _pinned(value: str | None) -> str | None:
+    """Return a plan parameter, or None when the engine should choose."""
+    if value is None or value == "auto":
+        return None
+    return value
+
+
+def _position_blocks(positions: np.ndarray, length: int) -> Iterator[tuple[int, slice]]:
+    """Yield each position present in sorted ``positions`` with its row slice.
+
+    Variants are built one block of rows sharing a position at a time, which
+    turns indel shifts and crossovers into contiguous slice copies.
+    """
+    bounds = np.searchsorted(positions, np.arange(length + 1))
+    for position in np.flatnonzero(np.diff(bounds)):
+        yield int(position), slice(int(bounds[position]), int(bounds[position + 1]))
+
+
+def _prefix_sums(row: np.ndarray, multipliers: np.ndarray) -> np.ndarray:
+    """Return ``[0, *cumsum(row * multipliers)]`` modulo 2**64."""
+    weighted = np.cumsum(row.astype(np.uint64) * multipliers, dtype=np.uint64)
+    return np.concatenate([np.zeros(1, dtype=np.uint64), weighted])
+
+
+def _length_term(length: int) -> np.ndarray:
+    """Return the hash contribution of a sequence length."""
+    return np.array([length], dtype=np.uint64) * _LENGTH_KEY
+
+
+def _multipliers(length: int) -> np.ndarray:
+    """Return the first ``length`` hash multipliers."""
+    blocks = [_multiplier_block(index) for index in range(-(-length // _HASH_BLOCK))]
+    return np.concatenate(blocks)[:length] if blocks else np.empty(0, np.uint64)
+
+
+@functools.cache
+def _multiplier_block(index: int) -> np.ndarray:
+    """Return one fixed block of odd 64-bit hash multipliers."""
+    rng = np.random.default_rng((0x5EED, index))
+    block = rng.integers(0, 2**64, size=_HASH_BLOCK, dtype=np.uint64)
+    block |= np.uint64(1)
+    block.flags.writeable = False
+    return block
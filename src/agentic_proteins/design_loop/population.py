@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Population mode for the design loop: variant proposal and elite selection."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+import numpy as np
+
+from agentic_proteins.agents.planning.schemas import MutationPlan
+from agentic_proteins.agents.schemas import CoordinatorDecisionType
+from agentic_proteins.design_loop.mutation import (
+    MutationEngine,
+    VariantBatch,
+    decode,
+    position_weights,
+    residue_plddt,
+)
+from agentic_proteins.domain.candidates.model import CandidateScore
+from agentic_proteins.domain.candidates.schema import Candidate
+from agentic_proteins.domain.candidates.selection import rank_candidates
+from agentic_proteins.domain.candidates.transform import candidate_to_domain
+from agentic_proteins.domain.metrics.quality import QCStatus
+
+DEFAULT_MUTATION_PLAN = MutationPlan(
+    mutation_id="mut-default",
+    mutation_type="point_mutation",
+    parameters={"position": "auto", "new_residue": "auto"},
+    intent="Explore single substitutions of the elites.",
+)
+_OVERSAMPLE = 4
+
+
+class ScoredResult(Protocol):
+    """Pipeline result fields population selection reads."""
+
+    candidate: Candidate
+    tool_status: str
+    qc_status: QCStatus
+
+
+@dataclass(frozen=True)
+class PopulationPolicy:
+    """Variants evaluated per iteration and elites kept between iterations.
+
+    Each iteration proposes ``variants`` mutants spread over the current
+    elites, evaluates them up to ``workers`` at a time and keeps the best
+    ``elites`` of the previous elites and the new variants.
+    """
+
+    variants: int = 8
+    elites: int = 2
+    workers: int = 4
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> PopulationPolicy:
+        """Build and validate a policy from its ``RunConfig`` form.
+
+        Raises:
+            ValueError: If a size is not a positive integer.
+        """
+        policy = cls(
+            variants=int(payload.get("variants", cls.variants)),
+            elites=int(payload.get("elites", cls.elites)),
+            workers=int(payload.get("workers", cls.workers)),
+        )
+        for name in ("variants", "elites", "workers"):
+            if getattr(policy, name) < 1:
+                raise ValueError(f"loop_population.{name} must be at least 1")
+        return policy
+
+
+@dataclass
+class RestoredResult:
+    """Stand-in pipeline result for an elite restored from a loop checkpoint."""
+
+    candidate: Candidate
+    tool_status: str
+    qc_status: QCStatus
+    timings: dict[str, float] = field(default_factory=dict)
+    tool_result: object | None = None
+    coordinator_decision: CoordinatorDecisionType = CoordinatorDecisionType.CONTINUE
+    failure_type: str = ""
+
+
+def _eligible(result: ScoredResult) -> bool:
+    """Return True when ``result`` may enter the elite set."""
+    return result.tool_status == "success" and result.qc_status is not QCStatus.REJECT
+
+
+@dataclass
+class Population:
+    """Elites carried between population iterations of ``LoopRunner``.
+
+    ``results`` maps every elite's candidate id to the pipeline result that
+    scored it. Variants come from ``engine`` following the planner's
+    ``plans``; the engine remembers every proposed sequence, so a variant is
+    never evaluated twice in one run.
+    """
+
+    policy: PopulationPolicy
+    engine: MutationEngine
+    plans: list[MutationPlan] = field(default_factory=lambda: [DEFAULT_MUTATION_PLAN])
+    elites: list[Candidate] = field(default_factory=list)
+    results: dict[str, ScoredResult] = field(default_factory=dict)
+    weights: dict[str, np.ndarray | None] = field(default_factory=dict)
+
+    @property
+    def best(self) -> ScoredResult:
+        """Return the pipeline result of the top-ranked elite."""
+        return self.results[self.elites[0].candidate_id]
+
+    def seed(self, result: ScoredResult) -> None:
+        """Start the population from the fully evaluated seed candidate."""
+        self.engine.mark_seen([result.candidate.sequence])
+        if _eligible(result):
+            self.elites = [result.candidate]
+            self.results = {result.candidate.candidate_id: result}
+
+    def propose(self, count: int, iteration_index: int, prefix: str) -> list[Candidate]:
+        """Return up to ``count`` unseen variants of the elites.
+
+        ``count`` is split across the mutation plans, and each plan spreads
+        its share over the elites. Positions favour low-confidence residues
+        when an elite's structure carries per-residue pLDDT. Recombination
+        falls back to point mutations until two equal-length elites exist,
+        and so does a plan pinning a position past an elite's last residue.
+        """
+        if not self.elites or count < 1:
+            return []
+        parents = [item.sequence for item in self.elites]
+        weights = [self._position_weights(item) for item in self.elites]
+        variants: list[Candidate] = []
+        quotas = np.array_split(np.arange(count), len(self.plans))
+        for plan, quota in zip(self.plans, quotas, strict=True):
+            if plan.mutation_type == "recombination" and (
+                len(parents) < 2 or len(set(map(len, parents))) != 1
+            ):
+                plan = DEFAULT_MUTATION_PLAN
+            position = str(plan.parameters.get("position") or "auto")
+            if position.isdigit() and int(position) > min(map(len, parents)):
+                plan = DEFAULT_MUTATION_PLAN
+            remaining = quota.size
+            for batch in self.engine.apply(
+                plan, parents, quota.size * _OVERSAMPLE, weights
+            ):
+                share = min(remaining, -(-len(batch) // _OVERSAMPLE))
+                fresh = self.engine.unseen(batch, limit=share)
+                remaining -= len(fresh)
+                for row in range(len(fresh)):
+                    variants.append(
+                        self._candidate(
+                            fresh, row, f"{prefix}-i{iteration_index}v{len(variants)}"
+                        )
+                    )
+        return variants
+
+    def admit(self, results: list[ScoredResult]) -> list[CandidateScore]:
+        """Rank the elites with the eligible ``results`` and keep the best.
+
+        Returns:
+            Scores of every ranked candidate, best first.
+        """
+        pool = {item.candidate_id: item for item in self.elites}
+        scored = dict(self.results)
+        for result in results:
+            if _eligible(result):
+                pool[result.candidate.candidate_id] = result.candidate
+                scored[result.candidate.candidate_id] = result
+        ranking = rank_candidates([candidate_to_domain(item) for item in pool.values()])
+        keep = [item.candidate_id for item in ranking[: self.policy.elites]]
+        self.elites = [pool[candidate_id] for candidate_id in keep]
+        self.results = {candidate_id: scored[candidate_id] for candidate_id in keep}
+        return ranking
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the elites, their scores and the engine state in JSON form."""
+        return {
+            "elites": [item.model_dump(mode="json") for item in self.elites],
+            "results": {
+                candidate_id: {
+                    "tool_status": result.tool_status,
+                    "qc_status": result.qc_status.value,
+                }
+                for candidate_id, result in self.results.items()
+            },
+            "engine": self.engine.state(),
+        }
+
+    def restore(self, payload: Mapping[str, Any]) -> None:
+        """Continue from a ``snapshot``; elite results become ``RestoredResult``."""
+        self.elites = [Candidate.model_validate(item) for item in payload["elites"]]
+        by_id = {item.candidate_id: item for item in self.elites}
+        self.results = {
+            candidate_id: RestoredResult(
+                candidate=by_id[candidate_id],
+                tool_status=entry["tool_status"],
+                qc_status=QCStatus(entry["qc_status"]),
+            )
+            for candidate_id, entry in payload["results"].items()
+        }
+        self.engine.restore(payload["engine"])
+
+    def _position_weights(self, candidate: Candidate) -> np.ndarray | None:
+        """Return (and cache) mutation weights from the candidate's pLDDT."""
+        if candidate.candidate_id not in self.weights:
+            plddt = residue_plddt(candidate)
+            self.weights[candidate.candidate_id] = (
+                None if plddt is None else position_weights(plddt)
+            )
+        return self.weights[candidate.candidate_id]
+
+    def _candidate(self, batch: VariantBatch, row: int, candidate_id: str) -> Candidate:
+        """Return the candidate for one row of ``batch``."""
+        parent = self.elites[int(batch.parents[row])]
+        provenance: dict[str, Any] = {
+            "parent_id": parent.candidate_id,
+            "mutation_type": batch.kind,
+            "mutations": [batch.label(row, [item.sequence for item in self.elites])],
+        }
+        if batch.partners is not None:
+            provenance["partner_id"] = self.elites[
+                int(batch.partners[row])
+            ].candidate_id
+        return Candidate(
+            candidate_id=candidate_id,
+            sequence=decode(batch.sequences[row]),
+            provenance=provenance,
+        )
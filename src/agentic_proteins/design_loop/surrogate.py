@@ -0,0 +1,227 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Surrogate pre-screening of population variants before structure prediction."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import threading
+from typing import Any
+
+import numpy as np
+
+from agentic_proteins.design_loop.mutation import ALPHABET
+
+_HELIX = np.frombuffer(b"AELMQK", dtype=np.uint8)
+_SHEET = np.frombuffer(b"VIFYW", dtype=np.uint8)
+_COLUMNS = np.full(256, -1, dtype=np.int64)
+_COLUMNS[ALPHABET] = np.arange(len(ALPHABET))
+FEATURES = 4 + len(ALPHABET)
+_NOISE_FLOOR = 1.0
+
+
+@dataclass(frozen=True)
+class SurrogatePolicy:
+    """When the surrogate may keep a variant from the structure provider.
+
+    A variant is sent to the provider only when its upper confidence bound,
+    ``mean + kappa * std``, beats the best elite's mean pLDDT. Screening
+    starts once the model has seen ``min_observations`` results; ``ridge`` is
+    the regularization strength of the regressor.
+    """
+
+    kappa: float = 1.0
+    min_observations: int = 8
+    ridge: float = 1.0
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> SurrogatePolicy:
+        """Build and validate a policy from its ``RunConfig`` form.
+
+        Raises:
+            ValueError: If a parameter is negative or ``ridge`` is not positive.
+        """
+        policy = cls(
+            kappa=float(payload.get("kappa", cls.kappa)),
+            min_observations=int(payload.get("min_observations", cls.min_observations)),
+            ridge=float(payload.get("ridge", cls.ridge)),
+        )
+        if policy.kappa < 0 or policy.min_observations < 0:
+            raise ValueError("loop_surrogate.kappa and min_observations must be >= 0")
+        if policy.ridge <= 0:
+            raise ValueError("loop_surrogate.ridge must be positive")
+        return policy
+
+
+def proxy_features(sequences: Sequence[str]) -> np.ndarray:
+    """Return one feature row per sequence.
+
+    Columns are a bias, the helix- and sheet-former fractions used by the
+    heuristic proxy provider, the log length and the residue composition.
+    """
+    rows = np.zeros((len(sequences), FEATURES))
+    for index, sequence in enumerate(sequences):
+        codes = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+        columns = _COLUMNS[codes]
+        rows[index, 4:] = np.bincount(
+            columns[columns >= 0], minlength=len(ALPHABET)
+        ) / max(codes.size, 1)
+        rows[index, 1] = np.isin(codes, _HELIX).mean()
+        rows[index, 2] = np.isin(codes, _SHEET).mean()
+        rows[index, 3] = np.log(max(codes.size, 1))
+    rows[:, 0] = 1.0
+    return rows
+
+
+class SurrogateModel:
+    """Online Bayesian ridge regressor of mean pLDDT on ``proxy_features``.
+
+    Only sufficient statistics are kept, so training is additive and the
+    model's state is a few hundred floats regardless of how many runs
+    trained it. Observations not yet saved are also tracked apart, so
+    ``merge`` can add them to a saved model other runs keep training. The
+    bias column is not regularized. Predictions return a mean and a standard
+    deviation that widens away from the sequences seen so far. Safe to share
+    between threads.
+    """
+
+    def __init__(self, ridge: float = 1.0) -> None:
+        """Create an untrained model."""
+        self.ridge = ridge
+        self.observations = 0
+        self._xtx = np.zeros((FEATURES, FEATURES))
+        self._xty = np.zeros(FEATURES)
+        self._yty = 0.0
+        self._unsaved = 0
+        self._unsaved_xtx = np.zeros((FEATURES, FEATURES))
+        self._unsaved_xty = np.zeros(FEATURES)
+        self._unsaved_yty = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, sequences: Sequence[str], values: Sequence[float]) -> None:
+        """Train on measured mean pLDDT ``values`` of ``sequences``."""
+        if not sequences:
+            return
+        features = proxy_features(sequences)
+        targets = np.asarray(values, dtype=np.float64)
+        xtx, xty = features.T @ features, features.T @ targets
+        yty = float(targets @ targets)
+        with self._lock:
+            self._xtx += xtx
+            self._xty += xty
+            self._yty += yty
+            self.observations += len(targets)
+            self._unsaved_xtx += xtx
+            self._unsaved_xty += xty
+            self._unsaved_yty += yty
+            self._unsaved += len(targets)
+
+    def predict(
+        self, sequences: Sequence[str], ridge: float | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the predicted mean pLDDT and its standard deviation.
+
+        ``ridge`` overrides the model's own regularization strength.
+
+        Raises:
+            ValueError: If the model has no observations yet.
+        """
+        with self._lock:
+            if not self.observations:
+                raise ValueError("surrogate has no observations")
+            xtx, xty, yty = self._xtx.copy(), self._xty.copy(), self._yty
+            observations = self.observations
+        strength = self.ridge if ridge is None else ridge
+        precision = xtx + strength * np.diag([0.0] + [1.0] * (FEATURES - 1))
+        weights = np.linalg.solve(precision, xty)
+        residual = yty - 2.0 * weights @ xty + weights @ xtx @ weights
+        noise = max(residual / max(observations - 1, 1), _NOISE_FLOOR)
+        features = proxy_features(sequences)
+        spread = np.einsum("ij,ji->i", features, np.linalg.solve(precision, features.T))
+        return features @ weights, np.sqrt(noise * (1.0 + spread))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the model's sufficient statistics in JSON form."""
+        with self._lock:
+            return {
+                "ridge": self.ridge,
+                "observations": self.observations,
+                "xtx": self._xtx.tolist(),
+                "xty": self._xty.tolist(),
+                "yty": self._yty,
+            }
+
+    def merge(self, saved: Mapping[str, Any] | None) -> dict[str, Any]:
+        """Add the observations made since the last merge to ``saved``.
+
+        The model adopts the sum, picking up whatever other runs added to
+        ``saved`` meanwhile, and returns it in ``to_dict`` form.
+        """
+        base = SurrogateModel() if saved is None else SurrogateModel.from_dict(saved)
+        with self._lock:
+            self._xtx = base._xtx + self._unsaved_xtx
+            self._xty = base._xty + self._unsaved_xty
+            self._yty = base._yty + self._unsaved_yty
+            self.observations = base.observations + self._unsaved
+            self._unsaved = 0
+            self._unsaved_xtx = np.zeros((FEATURES, FEATURES))
+            self._unsaved_xty = np.zeros(FEATURES)
+            self._unsaved_yty = 0.0
+        return self.to_dict()
+
+    @classmethod
+    def from_dict(
+        cls, payload: Mapping[str, Any], ridge: float | None = None
+    ) -> SurrogateModel:
+        """Restore a model saved with ``to_dict``; ``ridge`` replaces the saved one."""
+        model = cls(float(payload["ridge"]) if ridge is None else ridge)
+        model.observations = int(payload["observations"])
+        model._xtx = np.asarray(payload["xtx"], dtype=np.float64)
+        model._xty = np.asarray(payload["xty"], dtype=np.float64)
+        model._yty = float(payload["yty"])
+        return model
+
+
+@dataclass(frozen=True)
+class Screening:
+    """Surrogate verdict on one batch of variants.
+
+    ``evaluate`` and ``skipped`` index the screened candidates; ``mean`` and
+    ``std`` hold every candidate's prediction (empty while the model is
+    still warming up, when nothing is skipped).
+    """
+
+    evaluate: list[int]
+    skipped: list[int]
+    mean: np.ndarray
+    std: np.ndarray
+
+
+def screen(
+    model: SurrogateModel,
+    policy: SurrogatePolicy,
+    sequences: Sequence[str],
+    best: float | None,
+) -> Screening:
+    """Split ``sequences`` into those worth predicting and those to skip.
+
+    The variant with the highest upper confidence bound is always kept, so
+    every iteration still feeds the model fresh provider results.
+    """
+    everything = list(range(len(sequences)))
+    if not sequences or model.observations < max(policy.min_observations, 1):
+        return Screening(everything, [], np.empty(0), np.empty(0))
+    mean, std = model.predict(sequences, policy.ridge)
+    if best is None:
+        return Screening(everything, [], mean, std)
+    upper = mean + policy.kappa * std
+    keep = upper > best
+    keep[int(np.argmax(upper))] = True
+    return Screening(
+        [int(index) for index in np.flatnonzero(keep)],
+        [int(index) for index in np.flatnonzero(~keep)],
+        mean,
+        std,
+    )
@@ -6,10 +6,16 @@ from agentic_proteins.execution.runtime.executor import (
     LocalExecutor,
     materialize_observation,
 )
+from agentic_proteins.execution.runtime.graph import GraphExecutor, GraphRun
+from agentic_proteins.execution.runtime.retry import RetryAttempt, RetryingExecutor
 from agentic_proteins.execution.schemas import ExecutionTrace
 
 __all__ = [
     "ExecutionTrace",
+    "GraphExecutor",
+    "GraphRun",
     "LocalExecutor",
+    "RetryAttempt",
+    "RetryingExecutor",
     "materialize_observation",
 ]
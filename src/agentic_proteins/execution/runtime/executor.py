@@ -6,9 +6,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from datetime import UTC, datetime
+import threading
 import time
+from typing import Any
 
+from agentic_proteins.core.cancellation import (
+    CancelToken,
+    cancel_scope,
+    current_cancel_token,
+)
 from agentic_proteins.core.hashing import sha256_hex
 from agentic_proteins.core.observations import (
     Observation,
@@ -21,8 +29,16 @@ from agentic_proteins.execution.schemas import (
     ExecutionTask,
     ExecutionTrace,
 )
+from agentic_proteins.providers.events import (
+    capture_provider_events,
+    restore_provider_events,
+)
+from agentic_proteins.providers.scheduler import provider_scheduler
 from agentic_proteins.tools.schemas import ToolError, ToolResult
 
+# How long a timed-out task gets to stop after its token is cancelled.
+_CANCEL_GRACE_S = 0.5
+
 
 def build_trace(
     task: ExecutionTask,
@@ -30,8 +46,10 @@ def build_trace(
     started_at: float,
     finished_at: float,
     observed_cost: float,
+    queued_at: float | None = None,
 ) -> ExecutionTrace:
     """build_trace."""
+    queued_ms = 0 if queued_at is None else int((started_at - queued_at) * 1000)
     return ExecutionTrace(
         task_id=task.task_id,
         tool_name=task.tool_invocation.tool_name,
@@ -40,6 +58,7 @@ def build_trace(
         finished_at=datetime.fromtimestamp(finished_at).isoformat(),
         observed_cost=observed_cost,
         observed_latency_ms=int((finished_at - started_at) * 1000),
+        queued_ms=max(0, queued_ms),
         result=None,
     )
 
@@ -77,30 +96,54 @@ class Executor(ABC):
 
 
 class LocalExecutor(Executor):
-    """LocalExecutor."""
+    """LocalExecutor.
+
+    Tasks with a deadline (``timeout_ms``, else the context's
+    ``max_task_runtime_ms``) run on a supervised worker thread. When the
+    deadline passes the task's ``CancelToken`` is cancelled, which runs the
+    cleanup callbacks the tool registered (killing worker subprocesses,
+    closing HTTP sessions, cancelling remote jobs), and a ``timeout`` result
+    is returned after a short grace period. Its message is
+    ``timeout_preempted`` when the worker stopped within the grace period and
+    ``timeout_abandoned`` when it is still running, e.g. inside a model
+    forward pass that cannot be interrupted. The trace of the last task
+    run on a thread is kept for ``consume_trace``.
+    """
 
     def __init__(self, boundary: ExecutionBoundary | None = None) -> None:
         """Create a local executor with an optional boundary."""
         self._boundary = boundary
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the per-thread trace slot (for process pools)."""
+        return {"_boundary": self._boundary}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled executor with a fresh trace slot."""
+        self._boundary = state["_boundary"]
+        self._local = threading.local()
+
+    def consume_trace(self) -> ExecutionTrace | None:
+        """Pop the trace of the last task run on the calling thread."""
+        trace = getattr(self._local, "trace", None)
+        self._local.trace = None
+        return trace
 
     def run(self, task: ExecutionTask, context: ExecutionContext) -> ToolResult:
-        """Execute a task locally and capture timeout failures."""
+        """Execute a task locally and enforce its timeout preemptively."""
         start = time.time()
-        timeout_s = task.timeout_ms / 1000.0 if task.timeout_ms else None
+        timeout_ms = task.timeout_ms or (
+            context.resource_limits.max_task_runtime_ms if context is not None else 0
+        )
+        timeout_s = timeout_ms / 1000.0 if timeout_ms else None
         if timeout_s is not None:
             elapsed = time.time() - start
             if elapsed > timeout_s:
-                build_trace(task, "failure", start, time.time(), 0.0)
-                return ToolResult(
-                    invocation_id=task.tool_invocation.invocation_id,
-                    tool_name=task.tool_invocation.tool_name,
-                    status="failure",
-                    outputs=[],
-                    metrics=[],
-                    error=ToolError(
-                        error_type="timeout", message="timeout_before_start"
-                    ),
+                self._local.trace = build_trace(
+                    task, "failure", start, time.time(), 0.0
                 )
+                return _timeout_result(task, "timeout_before_start")
         if self._boundary is None:
             result = ToolResult(
                 invocation_id=task.tool_invocation.invocation_id,
@@ -112,17 +155,88 @@ class LocalExecutor(Executor):
                     error_type="no_boundary", message="execution_boundary_missing"
                 ),
             )
+        elif timeout_s is None:
+            result = _execute(self._boundary, task, context)
         else:
-            result = self._boundary.execute(task.tool_invocation)
+            result = _supervise(self._boundary, task, context, timeout_s)
         elapsed = time.time() - start
-        if timeout_s is not None and elapsed > timeout_s:
-            result = ToolResult(
-                invocation_id=task.tool_invocation.invocation_id,
-                tool_name=task.tool_invocation.tool_name,
-                status="failure",
-                outputs=[],
-                metrics=[],
-                error=ToolError(error_type="timeout", message="timeout_exceeded"),
-            )
-        build_trace(task, result.status, start, time.time(), 0.0)
+        timed_out = result.error is not None and result.error.error_type == "timeout"
+        if timeout_s is not None and elapsed > timeout_s and not timed_out:
+            result = _timeout_result(task, "timeout_exceeded")
+        self._local.trace = build_trace(task, result.status, start, time.time(), 0.0)
         return result
+
+
+def _execute(
+    boundary: ExecutionBoundary, task: ExecutionTask, context: ExecutionContext
+) -> ToolResult:
+    """Run the invocation under the execution's scheduler scope."""
+    scope = (
+        provider_scheduler().scope(
+            context.execution_id,
+            context.resource_limits.max_concurrent_tasks,
+        )
+        if context is not None
+        else nullcontext()
+    )
+    with scope:
+        return boundary.execute(task.tool_invocation)
+
+
+def _supervise(
+    boundary: ExecutionBoundary,
+    task: ExecutionTask,
+    context: ExecutionContext,
+    timeout_s: float,
+) -> ToolResult:
+    """Run the invocation on a worker thread and cancel it at the deadline.
+
+    Cancelling the caller's token, if any, cancels the worker's as well.
+    """
+    token = CancelToken()
+    parent = current_cancel_token()
+    detach = (
+        parent.on_cancel(lambda: token.cancel(parent.reason or "cancelled"))
+        if parent is not None
+        else None
+    )
+    done = threading.Event()
+    outcome: dict[str, Any] = {}
+
+    def work() -> None:
+        with cancel_scope(token):
+            try:
+                outcome["result"] = _execute(boundary, task, context)
+            except BaseException as exc:  # noqa: BLE001
+                outcome["error"] = exc
+            finally:
+                outcome["events"] = capture_provider_events()
+                done.set()
+
+    worker = threading.Thread(target=work, name=f"task-{task.task_id}", daemon=True)
+    worker.start()
+    try:
+        if not done.wait(timeout_s):
+            token.cancel("timeout")
+            if done.wait(_CANCEL_GRACE_S):
+                return _timeout_result(task, "timeout_preempted")
+            return _timeout_result(task, "timeout_abandoned")
+    finally:
+        if detach is not None:
+            detach()
+    restore_provider_events(outcome["events"])
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def _timeout_result(task: ExecutionTask, message: str) -> ToolResult:
+    """Return the failure result of a task that ran out of time."""
+    return ToolResult(
+        invocation_id=task.tool_invocation.invocation_id,
+        tool_name=task.tool_invocation.tool_name,
+        status="failure",
+        outputs=[],
+        metrics=[],
+        error=ToolError(error_type="timeout", message=message),
+    )
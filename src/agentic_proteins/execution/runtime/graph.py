@@ -0,0 +1,233 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Dependency-ordered execution of whole execution graphs."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures import (
+    Executor as PoolExecutor,
+)
+from dataclasses import dataclass, field
+from datetime import datetime
+import time
+
+from agentic_proteins.execution.compiler.boundary import evaluate_failure
+from agentic_proteins.execution.runtime.executor import Executor, build_trace
+from agentic_proteins.execution.schemas import (
+    ExecutionContext,
+    ExecutionGraph,
+    ExecutionTask,
+    ExecutionTrace,
+)
+from agentic_proteins.tools.schemas import ToolError, ToolResult
+from agentic_proteins.validation.state import validate_execution_graph
+
+GRAPH_POOLS = ("thread", "process")
+_OUTCOME_RANK = {"continue": 0, "replan": 1, "halt": 2}
+
+
+@dataclass
+class GraphRun:
+    """Outcome of one graph execution."""
+
+    results: dict[str, ToolResult] = field(default_factory=dict)
+    traces: list[ExecutionTrace] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    outcome: str = "continue"
+
+    @property
+    def failed(self) -> list[str]:
+        """Return ids of tasks that ran and failed."""
+        return sorted(
+            task_id
+            for task_id, result in self.results.items()
+            if result.status != "success"
+        )
+
+
+def _timed_run(
+    executor: Executor, task: ExecutionTask, context: ExecutionContext
+) -> tuple[ToolResult, ExecutionTrace]:
+    """Run ``task`` and return its result with the executor's trace."""
+    started = time.time()
+    try:
+        result = executor.run(task, context)
+    except Exception as exc:  # noqa: BLE001
+        result = _crash_result(task, exc)
+    consume = getattr(executor, "consume_trace", None)
+    trace = consume() if consume is not None else None
+    return result, trace or build_trace(task, result.status, started, time.time(), 0.0)
+
+
+def _crash_result(task: ExecutionTask, exc: BaseException) -> ToolResult:
+    """Return a failure result for a task whose executor raised."""
+    return ToolResult(
+        invocation_id=task.tool_invocation.invocation_id,
+        tool_name=task.tool_invocation.tool_name,
+        status="failure",
+        outputs=[],
+        metrics=[],
+        error=ToolError(error_type="executor_error", message=str(exc)),
+    )
+
+
+class GraphExecutor:
+    """Run every task of an ``ExecutionGraph`` in dependency order.
+
+    Tasks become ready once all of their dependencies succeeded and are
+    dispatched from a ready queue, up to ``max_workers`` at a time (default:
+    the context's ``max_concurrent_tasks``). With one worker, or one task, tasks
+    run on the calling thread. Each failure is classified by ``evaluate_failure``:
+    ``halt`` and ``replan`` stop dispatching new tasks, while ``continue``
+    only skips the failed task's dependents.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_workers: int | None = None,
+        pool: str = "thread",
+        fatal_errors: set[str] | None = None,
+        replan_errors: set[str] | None = None,
+    ) -> None:
+        """Create a graph executor dispatching single tasks to ``executor``.
+
+        Raises:
+            ValueError: If ``pool`` or ``max_workers`` is invalid.
+        """
+        if pool not in GRAPH_POOLS:
+            raise ValueError(f"pool must be one of {GRAPH_POOLS}")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._executor = executor
+        self._max_workers = max_workers
+        self._pool = pool
+        self._fatal_errors = set(fatal_errors or ())
+        self._replan_errors = set(replan_errors or ())
+
+    def run(self, graph: ExecutionGraph, context: ExecutionContext) -> GraphRun:
+        """Execute ``graph`` and return per-task results and traces.
+
+        Raises:
+            ValueError: If the graph is empty, references unknown tasks or
+                contains a cycle.
+        """
+        validate_execution_graph(graph)
+        workers = min(
+            self._max_workers or context.resource_limits.max_concurrent_tasks,
+            len(graph.tasks),
+        )
+        waiting = {
+            task_id: set(graph.dependencies.get(task_id, [])) for task_id in graph.tasks
+        }
+        dependents: dict[str, list[str]] = {task_id: [] for task_id in graph.tasks}
+        for task_id, deps in waiting.items():
+            for dep in deps:
+                dependents[dep].append(task_id)
+        entry = [task_id for task_id in graph.entry_tasks if not waiting[task_id]]
+        ready: deque[tuple[str, float]] = deque()
+        now = time.time()
+        for task_id in entry + sorted(set(waiting) - set(entry)):
+            if not waiting[task_id]:
+                ready.append((task_id, now))
+                waiting.pop(task_id)
+        run = GraphRun()
+
+        def settle(
+            task_id: str, result: ToolResult, trace: ExecutionTrace, queued: float
+        ) -> None:
+            started = datetime.fromisoformat(trace.started_at).timestamp()
+            run.results[task_id] = result
+            run.traces.append(
+                trace.model_copy(
+                    update={"queued_ms": max(0, int((started - queued) * 1000))}
+                )
+            )
+            outcome = evaluate_failure(
+                result,
+                fatal_errors=self._fatal_errors,
+                replan_errors=self._replan_errors,
+            )
+            if _OUTCOME_RANK[outcome] > _OUTCOME_RANK[run.outcome]:
+                run.outcome = outcome
+            if outcome != "continue":
+                run.skipped.extend(item for item, _ in ready)
+                run.skipped.extend(waiting)
+                ready.clear()
+                waiting.clear()
+                return
+            if result.status != "success":
+                self._skip_dependents(task_id, dependents, waiting, run)
+                return
+            released = time.time()
+            for child in sorted(dependents[task_id]):
+                deps = waiting.get(child)
+                if deps is None:
+                    continue
+                deps.discard(task_id)
+                if not deps:
+                    waiting.pop(child)
+                    ready.append((child, released))
+
+        if workers <= 1:
+            while ready:
+                task_id, queued = ready.popleft()
+                result, trace = _timed_run(
+                    self._executor, graph.tasks[task_id], context
+                )
+                settle(task_id, result, trace, queued)
+        else:
+            pool_cls: type[PoolExecutor] = (
+                ThreadPoolExecutor if self._pool == "thread" else ProcessPoolExecutor
+            )
+            with pool_cls(max_workers=workers) as pool:
+                running: dict[
+                    Future[tuple[ToolResult, ExecutionTrace]], tuple[str, float]
+                ]
+                running = {}
+                while ready or running:
+                    while ready and len(running) < workers:
+                        task_id, queued = ready.popleft()
+                        future = pool.submit(
+                            _timed_run, self._executor, graph.tasks[task_id], context
+                        )
+                        running[future] = (task_id, queued)
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in sorted(done, key=lambda item: running[item][0]):
+                        task_id, queued = running.pop(future)
+                        task = graph.tasks[task_id]
+                        try:
+                            result, trace = future.result()
+                        except Exception as exc:  # noqa: BLE001
+                            # The task never reached the pool worker.
+                            now = time.time()
+                            result = _crash_result(task, exc)
+                            trace = build_trace(task, "failure", now, now, 0.0)
+                        settle(task_id, result, trace, queued)
+        run.skipped.sort()
+        return run
+
+    @staticmethod
+    def _skip_dependents(
+        task_id: str,
+        dependents: dict[str, list[str]],
+        waiting: dict[str, set[str]],
+        run: GraphRun,
+    ) -> None:
+        """Drop every task downstream of ``task_id`` from the schedule."""
+        stack = list(dependents[task_id])
+        while stack:
+            child = stack.pop()
+            if waiting.pop(child, None) is None:
+                continue
+            run.skipped.append(child)
+            stack.extend(dependents[child])
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Retry execution of tasks according to their RetryPolicy."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import random
+import time
+
+from agentic_proteins.core.cancellation import cancel_requested, current_cancel_token
+from agentic_proteins.core.execution import RetryPolicy
+from agentic_proteins.execution.runtime.executor import Executor
+from agentic_proteins.execution.schemas import (
+    ExecutionContext,
+    ExecutionTask,
+    ExecutionTrace,
+)
+from agentic_proteins.tools.schemas import ToolError, ToolResult
+
+TRANSIENT_ERRORS = frozenset(
+    {"timeout", "remote_error", "rate_limit", "queue_full", "executor_error"}
+)
+MAX_BACKOFF_MS = 30_000
+
+
+@dataclass(frozen=True)
+class RetryAttempt:
+    """One execution attempt of a task."""
+
+    task_id: str
+    attempt: int
+    status: str
+    error_type: str | None
+    latency_ms: float
+    backoff_ms: float
+
+
+def backoff_delay_ms(
+    policy: RetryPolicy, retry_index: int, rng: random.Random
+) -> float:
+    """Return the jittered exponential delay before retry ``retry_index``.
+
+    The delay is drawn uniformly from the upper half of
+    ``backoff_ms * 2**retry_index``, capped at ``MAX_BACKOFF_MS``.
+    """
+    ceiling = min(float(MAX_BACKOFF_MS), policy.backoff_ms * 2.0**retry_index)
+    return ceiling / 2.0 + rng.uniform(0.0, ceiling / 2.0)
+
+
+class RetryingExecutor(Executor):
+    """Re-run failed tasks as their ``RetryPolicy`` allows.
+
+    A failure is retried when its ``ToolError.error_type`` is in the policy's
+    ``retry_on`` (``TRANSIENT_ERRORS`` when empty), retries remain, the task
+    was not cancelled and ``budget`` (if given) still allows another attempt.
+    Every attempt reuses the task's invocation, so its ``invocation_id`` acts
+    as the idempotency key for caches and remote jobs. ``on_attempt`` sees
+    each attempt before the retry decision, so it can charge the attempt's
+    cost ahead of the budget check. The backoff waits on the caller's
+    ``CancelToken``, and a cancellation during it ends the task with a
+    ``cancelled`` failure.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        budget: Callable[[], bool] | None = None,
+        on_attempt: Callable[[RetryAttempt], None] | None = None,
+        rng: random.Random | None = None,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        """Wrap ``executor`` with retries; ``sleep`` replaces the backoff wait."""
+        self._executor = executor
+        self._budget = budget
+        self._on_attempt = on_attempt
+        self._rng = rng or random.Random()  # noqa: S311  # nosec B311
+        self._sleep = sleep
+
+    def consume_trace(self) -> ExecutionTrace | None:
+        """Pop the wrapped executor's trace of the last attempt, if it keeps one."""
+        consume = getattr(self._executor, "consume_trace", None)
+        return consume() if consume is not None else None
+
+    def run(self, task: ExecutionTask, context: ExecutionContext) -> ToolResult:
+        """Run ``task``, retrying retryable failures."""
+        policy = task.retry_policy
+        retry_on = set(policy.retry_on) or TRANSIENT_ERRORS
+        attempt = 0
+        backoff_ms = 0.0
+        while True:
+            start = time.perf_counter()
+            result = self._executor.run(task, context)
+            error_type = result.error.error_type if result.error else None
+            if self._on_attempt is not None:
+                self._on_attempt(
+                    RetryAttempt(
+                        task_id=task.task_id,
+                        attempt=attempt,
+                        status=result.status,
+                        error_type=error_type,
+                        latency_ms=(time.perf_counter() - start) * 1000.0,
+                        backoff_ms=backoff_ms,
+                    )
+                )
+            if (
+                result.status == "success"
+                or error_type not in retry_on
+                or attempt >= policy.max_retries
+                or cancel_requested()
+                or (self._budget is not None and not self._budget())
+            ):
+                return result
+            backoff_ms = backoff_delay_ms(policy, attempt, self._rng)
+            if self._backoff(backoff_ms / 1000.0):
+                return _cancelled_result(task)
+            attempt += 1
+
+    def _backoff(self, delay: float) -> bool:
+        """Wait ``delay`` seconds; return True if the task was cancelled meanwhile."""
+        token = current_cancel_token()
+        if self._sleep is None and token is not None:
+            return token.wait(delay)
+        (self._sleep or time.sleep)(delay)
+        return cancel_requested()
+
+
+def _cancelled_result(task: ExecutionTask) -> ToolResult:
+    """Return the failure result of a task cancelled between attempts."""
+    return ToolResult(
+        invocation_id=task.tool_invocation.invocation_id,
+        tool_name=task.tool_invocation.tool_name,
+        status="failure",
+        outputs=[],
+        metrics=[],
+        error=ToolError(error_type="cancelled", message="cancelled_during_backoff"),
+    )
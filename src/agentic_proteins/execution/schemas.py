@@ -28,6 +28,7 @@ class ExecutionTrace(BaseModel):
     finished_at: str = Field(..., min_length=1, description="End timestamp.")
     observed_cost: float = Field(0.0, ge=0.0, description="Observed cost.")
     observed_latency_ms: int = Field(0, ge=0, description="Observed latency.")
+    queued_ms: int = Field(0, ge=0, description="Time spent waiting to start.")
     result: ToolResult | None = Field(default=None, description="Tool result.")
 
 
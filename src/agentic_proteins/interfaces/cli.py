@@ -19,7 +19,7 @@ from agentic_proteins.domain.candidates import CandidateStore
 from agentic_proteins.domain.candidates.schema import Candidate
 from agentic_proteins.runtime import RunManager
 from agentic_proteins.runtime.context import RunOutput, RunRequest
-from agentic_proteins.runtime.control import compare_runs
+from agentic_proteins.runtime.control import RuntimeSession, compare_runs
 from agentic_proteins.runtime.infra import RunConfig
 from agentic_proteins.runtime.workspace import RunWorkspace
 
@@ -109,9 +109,14 @@ def _validate_sequence(sequence: str) -> None:
     RunRequest.model_validate({"sequence": sequence})
 
 
-def _run_sequence(base_dir: Path, sequence: str, config: RunConfig) -> dict:
+def _run_sequence(
+    base_dir: Path,
+    sequence: str,
+    config: RunConfig,
+    session: RuntimeSession | None = None,
+) -> dict:
     """_run_sequence."""
-    manager = RunManager(base_dir, config)
+    manager = RunManager(base_dir, config, session)
     return manager.run(sequence)
 
 
@@ -122,6 +127,7 @@ def _resume_candidate(
     provider: str | None,
     artifacts_dir: Path | None,
     execution_mode: str,
+    session: RuntimeSession | None = None,
 ) -> dict:
     """_resume_candidate."""
     if rounds < 1:
@@ -136,7 +142,7 @@ def _resume_candidate(
         artifacts_dir=artifacts_dir,
         execution_mode=execution_mode,
     )
-    manager = RunManager(base_dir, config)
+    manager = RunManager(base_dir, config, session)
     return manager.run_candidate(candidate)
 
 
@@ -15,6 +15,8 @@ from agentic_proteins.providers.base import (
 )
 from agentic_proteins.providers.errors import PredictionError
 from agentic_proteins.providers.heuristic import HeuristicStructureProvider
+from agentic_proteins.providers.pool import ProviderPool, provider_pool
+from agentic_proteins.providers.scheduler import ProviderScheduler, provider_scheduler
 
 experimental()
 
@@ -25,8 +27,12 @@ __all__ = [
     "PredictionResult",
     "ProviderCapabilities",
     "ProviderMetadata",
+    "ProviderPool",
+    "ProviderScheduler",
     "_time_left",
     "provider_metadata",
+    "provider_pool",
+    "provider_scheduler",
 ]
 
 
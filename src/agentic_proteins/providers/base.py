@@ -41,6 +41,7 @@ class ProviderCapabilities:
     supports_cpu: bool
     cpu_fallback_allowed: bool
     notes: str = ""
+    max_concurrency: int = 0
 
 
 class BaseProvider:
@@ -76,6 +77,14 @@ class BaseProvider:
         """
         raise NotImplementedError
 
+    def warmup(self) -> None:
+        """Load weights or open sessions ahead of the first prediction."""
+        return None
+
+    def resident_bytes(self) -> int:
+        """Return the approximate memory held by loaded model weights."""
+        return 0
+
     def close(self) -> None:
         """Closes the provider."""
         return None
@@ -0,0 +1,289 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Content-addressed on-disk cache of provider predictions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import contextlib
+from dataclasses import dataclass
+import gzip
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from uuid import uuid4
+
+from loguru import logger
+
+from agentic_proteins.core.hashing import sha256_hex
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+
+try:  # POSIX advisory locks; pruning stays correct without them, just racier.
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+_SUFFIX = ".json.gz"
+_PRUNE_EVERY = 64
+# Bounds of the default cache, used unless PREDICTION_CACHE_MAX_* set their own.
+DEFAULT_MAX_BYTES = 1024**3
+DEFAULT_MAX_ENTRIES = 10_000
+_EVENTS = threading.local()
+
+
+@dataclass(frozen=True)
+class PredictionCacheEvent:
+    """Outcome of a single cached prediction."""
+
+    key: str
+    provider: str
+    hit: bool
+
+
+def consume_prediction_cache_event() -> PredictionCacheEvent | None:
+    """Pop the last cache event recorded on the calling thread."""
+    event = getattr(_EVENTS, "event", None)
+    _EVENTS.event = None
+    return event
+
+
+def restore_prediction_cache_event(event: PredictionCacheEvent | None) -> None:
+    """Record ``event`` on the calling thread, e.g. after a worker ran it."""
+    _EVENTS.event = event
+
+
+def prediction_key(
+    provider: str,
+    sequence: str,
+    seed: int | None = None,
+    tool_version: str = "",
+    revision: str = "",
+) -> str:
+    """Return the content hash identifying one prediction."""
+    return sha256_hex(
+        json.dumps(
+            {
+                "provider": provider,
+                "revision": revision,
+                "seed": seed,
+                "sequence": sequence,
+                "tool_version": tool_version,
+            },
+            sort_keys=True,
+        )
+    )
+
+
+class PredictionCache:
+    """Gzip-compressed prediction store shared by runs and processes.
+
+    Entries live at ``<root>/<key[:2]>/<key>.json.gz`` and are written via
+    rename so concurrent readers never see partial files. An entry's mtime is
+    its write time and its atime, refreshed on every hit, its last use.
+    ``prune`` drops entries written more than ``max_age_seconds`` ago, however
+    often they are hit, then least recently used entries until the rest fit
+    ``max_bytes`` and ``max_entries``. It runs every 64 writes.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Create a cache rooted at ``root`` with optional size and age bounds."""
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._puts = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        """Return the entry path for a key."""
+        return self.root / key[:2] / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> PredictionResult | None:
+        """Return the cached prediction, or None on a miss or unreadable entry."""
+        path = self._path(key)
+        try:
+            payload = json.loads(gzip.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as exc:
+            logger.warning(f"Dropping unreadable prediction cache entry {path}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            written = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        if self.max_age_seconds is not None and now - written > self.max_age_seconds:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path, (now, written))
+        return PredictionResult(
+            pdb_text=payload["pdb_text"],
+            provider=payload["provider"],
+            raw=payload["raw"],
+        )
+
+    def put(self, key: str, result: PredictionResult) -> bool:
+        """Store a prediction; return False when its raw metrics are not JSON."""
+        try:
+            body = json.dumps(
+                {
+                    "key": key,
+                    "pdb_text": result.pdb_text,
+                    "provider": result.provider,
+                    "raw": result.raw,
+                },
+                sort_keys=True,
+            )
+        except (TypeError, ValueError) as exc:
+            logger.debug(f"Prediction not cacheable: {exc}")
+            return False
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        tmp_path.write_bytes(gzip.compress(body.encode("utf-8"), mtime=0))
+        tmp_path.replace(path)
+        with self._lock:
+            self._puts += 1
+            due = self._puts % _PRUNE_EVERY == 0
+        if due:
+            self.prune()
+        return True
+
+    def entries(self) -> list[tuple[Path, int, float, float]]:
+        """Return (path, size, written, last used) for every entry."""
+        found: list[tuple[Path, int, float, float]] = []
+        for path in self.root.glob(f"*/*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((path, stat.st_size, stat.st_mtime, stat.st_atime))
+        return found
+
+    def prune(self) -> int:
+        """Evict expired entries, then LRU entries over the byte or entry budget."""
+        if (
+            self.max_bytes is None
+            and self.max_age_seconds is None
+            and self.max_entries is None
+        ):
+            return 0
+        if not self.root.exists():
+            return 0
+        with open(self.root / ".prune.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                return self._prune_locked()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _prune_locked(self) -> int:
+        """Delete entries while holding the prune lock."""
+        now = time.time()
+        removed = 0
+        kept: list[tuple[Path, int, float]] = []
+        for path, size, written, used in self.entries():
+            if (
+                self.max_age_seconds is not None
+                and now - written > self.max_age_seconds
+            ):
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                kept.append((path, size, used))
+        total = sum(size for _, size, _ in kept)
+        count = len(kept)
+        for path, size, _ in sorted(kept, key=lambda item: item[2]):
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            over_count = self.max_entries is not None and count > self.max_entries
+            if not (over_bytes or over_count):
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            count -= 1
+            removed += 1
+        return removed
+
+
+class CachedProvider(BaseProvider):
+    """Serve predictions from a ``PredictionCache`` before touching the provider.
+
+    The wrapped provider is obtained lazily through ``loader`` so a hit never
+    loads model weights.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[], BaseProvider],
+        cache: PredictionCache,
+        tool_version: str = "",
+        revision: str = "",
+    ) -> None:
+        """Wrap the provider returned by ``loader`` with ``cache``."""
+        self.name = name
+        self._loader = loader
+        self._cache = cache
+        self._tool_version = tool_version
+        self._revision = revision
+
+    def predict(
+        self, sequence: str, timeout: float | None = None, seed: int | None = None
+    ) -> PredictionResult:
+        """Return a cached prediction or compute and store a new one.
+
+        ``timeout`` is forwarded only when given, so the wrapped provider
+        otherwise keeps its own default.
+        """
+        key = prediction_key(
+            self.name,
+            sequence,
+            seed=seed,
+            tool_version=self._tool_version,
+            revision=self._revision,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            _EVENTS.event = PredictionCacheEvent(key=key, provider=self.name, hit=True)
+            return cached
+        provider = self._loader()
+        if timeout is None:
+            result = provider.predict(sequence, seed=seed)
+        else:
+            result = provider.predict(sequence, timeout=timeout, seed=seed)
+        self._cache.put(key, result)
+        _EVENTS.event = PredictionCacheEvent(key=key, provider=self.name, hit=False)
+        return result
+
+
+def prediction_cache_from_env(default_root: Path) -> PredictionCache | None:
+    """Build a cache from ``PREDICTION_CACHE_*`` env vars; None when set to ``off``.
+
+    Size and entry count default to ``DEFAULT_MAX_BYTES`` and
+    ``DEFAULT_MAX_ENTRIES``; ``0`` lifts a bound.
+    """
+    root = os.getenv("PREDICTION_CACHE_DIR") or str(default_root)
+    if root.strip().lower() == "off":
+        return None
+    max_bytes = int(os.getenv("PREDICTION_CACHE_MAX_BYTES") or DEFAULT_MAX_BYTES)
+    max_entries = int(os.getenv("PREDICTION_CACHE_MAX_ENTRIES") or DEFAULT_MAX_ENTRIES)
+    max_age = os.getenv("PREDICTION_CACHE_MAX_AGE_S")
+    return PredictionCache(
+        Path(root),
+        max_bytes=max_bytes or None,
+        max_age_seconds=float(max_age) if max_age else None,
+        max_entries=max_entries or None,
+    )
@@ -0,0 +1,375 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Fallback and hedged provider chains."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+
+from agentic_proteins.core.cancellation import (
+    CancelToken,
+    cancel_scope,
+    current_cancel_token,
+)
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.idempotency import (
+    current_idempotency_key,
+    idempotency_scope,
+)
+from agentic_proteins.providers.scheduler import SchedulerEvent, provider_scheduler
+
+CHAIN_MODES = ("fallback", "hedge")
+_HISTORY_SIZE = 128
+_MIN_HISTORY = 5
+_EVENTS = threading.local()
+_LATENCIES: dict[str, deque[float]] = {}
+_LATENCIES_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ProviderStep:
+    """One provider in a chain with its own time budget."""
+
+    provider: str
+    timeout_s: float = 120.0
+
+
+@dataclass(frozen=True)
+class ProviderChainPolicy:
+    """Ordered providers tried as fallbacks or raced as hedged duplicates.
+
+    In ``fallback`` mode the next step starts only after the current one fails
+    or exceeds its ``timeout_s``. In ``hedge`` mode the next step also starts
+    once the running one is slower than ``hedge_percentile`` of its recent
+    latencies (or ``hedge_after_s`` until enough history exists); the first
+    success wins and the remaining requests are cancelled.
+    """
+
+    steps: tuple[ProviderStep, ...]
+    mode: str = "fallback"
+    hedge_percentile: float | None = 0.95
+    hedge_after_s: float = 10.0
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> ProviderChainPolicy:
+        """Build and validate a policy from its ``RunConfig`` form.
+
+        Raises:
+            ValueError: If the mode, steps or hedge settings are invalid.
+        """
+        mode = str(payload.get("mode", "fallback"))
+        if mode not in CHAIN_MODES:
+            raise ValueError(f"provider_policy.mode must be one of {CHAIN_MODES}")
+        raw_steps = payload.get("steps") or []
+        if not raw_steps:
+            raise ValueError("provider_policy.steps must list at least one provider")
+        steps = []
+        for item in raw_steps:
+            step = (
+                ProviderStep(provider=item)
+                if isinstance(item, str)
+                else ProviderStep(
+                    provider=str(item["provider"]),
+                    timeout_s=float(item.get("timeout_s", 120.0)),
+                )
+            )
+            if step.timeout_s <= 0:
+                raise ValueError("provider_policy step timeout_s must be positive")
+            steps.append(step)
+        percentile = payload.get("hedge_percentile", 0.95)
+        if percentile is not None and not 0.0 < float(percentile) < 1.0:
+            raise ValueError("provider_policy.hedge_percentile must be in (0, 1)")
+        return cls(
+            steps=tuple(steps),
+            mode=mode,
+            hedge_percentile=None if percentile is None else float(percentile),
+            hedge_after_s=float(payload.get("hedge_after_s", 10.0)),
+        )
+
+    @property
+    def providers(self) -> list[str]:
+        """Return provider names in chain order."""
+        return [step.provider for step in self.steps]
+
+    @property
+    def label(self) -> str:
+        """Return a stable identifier for the chain."""
+        return f"{self.mode}:" + ">".join(self.providers)
+
+
+@dataclass(frozen=True)
+class ChainAttempt:
+    """One provider request issued by a chain."""
+
+    provider: str
+    status: str
+    latency_ms: float
+    hedged: bool = False
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ChainEvent:
+    """Outcome of a chained prediction."""
+
+    chain: str
+    winner: str | None
+    latency_ms: float
+    attempts: tuple[ChainAttempt, ...] = field(default_factory=tuple)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-ready record of the selection."""
+        return {
+            "chain": self.chain,
+            "winner": self.winner,
+            "latency_ms": round(self.latency_ms, 3),
+            "attempts": [
+                {
+                    "provider": item.provider,
+                    "status": item.status,
+                    "latency_ms": round(item.latency_ms, 3),
+                    "hedged": item.hedged,
+                    "error": item.error,
+                }
+                for item in self.attempts
+            ],
+        }
+
+
+def consume_chain_event() -> ChainEvent | None:
+    """Pop the last chain event recorded on the calling thread."""
+    event = getattr(_EVENTS, "event", None)
+    _EVENTS.event = None
+    return event
+
+
+def restore_chain_event(event: ChainEvent | None) -> None:
+    """Record ``event`` on the calling thread, e.g. after a worker ran it."""
+    _EVENTS.event = event
+
+
+def record_latency(provider: str, latency_s: float) -> None:
+    """Add a successful prediction latency to the provider's history."""
+    with _LATENCIES_LOCK:
+        _LATENCIES.setdefault(provider, deque(maxlen=_HISTORY_SIZE)).append(latency_s)
+
+
+def latency_percentile(provider: str, quantile: float) -> float | None:
+    """Return the ``quantile`` of recent latencies, or None without enough history."""
+    with _LATENCIES_LOCK:
+        history = sorted(_LATENCIES.get(provider, ()))
+    if len(history) < _MIN_HISTORY:
+        return None
+    index = min(len(history) - 1, int(quantile * len(history)))
+    return history[index]
+
+
+@dataclass
+class _Running:
+    step: ProviderStep
+    started: float
+    hedged: bool
+    token: CancelToken
+
+
+class ProviderChain(BaseProvider):
+    """Run a ``ProviderChainPolicy`` over providers obtained from ``loader``."""
+
+    def __init__(
+        self,
+        policy: ProviderChainPolicy,
+        loader: Callable[[str], BaseProvider],
+    ) -> None:
+        """Create a chain that resolves provider names through ``loader``."""
+        self.name = policy.label
+        self.policy = policy
+        self._loader = loader
+
+    def _hedge_delay(self, provider: str) -> float:
+        """Return how long to wait on ``provider`` before hedging."""
+        if self.policy.hedge_percentile is not None:
+            observed = latency_percentile(provider, self.policy.hedge_percentile)
+            if observed is not None:
+                return observed
+        return self.policy.hedge_after_s
+
+    def _call(
+        self,
+        step: ProviderStep,
+        sequence: str,
+        timeout: float,
+        seed: int | None,
+        token: CancelToken,
+        key: str | None = None,
+    ) -> tuple[PredictionResult, SchedulerEvent | None]:
+        """Run one step; the provider aborts cooperatively at ``timeout``.
+
+        The attempt's cancellation token and the caller's idempotency key are
+        carried onto the step's thread, and its admission event back.
+        """
+        with idempotency_scope(key), cancel_scope(token):
+            result = self._loader(step.provider).predict(
+                sequence, timeout=timeout, seed=seed
+            )
+        return result, provider_scheduler().consume_event()
+
+    def predict(
+        self, sequence: str, timeout: float | None = None, seed: int | None = None
+    ) -> PredictionResult:
+        """Return the first successful prediction from the chain.
+
+        Each step runs within its own ``timeout_s``. The chain as a whole
+        stops at ``timeout`` when given, otherwise once every step could have
+        used its full budget one after another. Every attempt runs under its
+        own ``CancelToken``, a child of the caller's, which is cancelled when
+        the attempt times out, loses to another or outlives the chain.
+
+        Raises:
+            PredictionError: ``CHAIN_EXHAUSTED`` when every step failed or timed out.
+        """
+        start = time.monotonic()
+        if timeout is None:
+            timeout = sum(step.timeout_s for step in self.policy.steps)
+        deadline = start + timeout
+        attempts: list[ChainAttempt] = []
+        running: dict[
+            Future[tuple[PredictionResult, SchedulerEvent | None]], _Running
+        ] = {}
+        steps = list(self.policy.steps)
+        token = current_cancel_token()
+        key = current_idempotency_key()
+        executor = ThreadPoolExecutor(
+            max_workers=len(steps), thread_name_prefix="provider-chain"
+        )
+        detachers: list[Callable[[], None]] = []
+
+        def launch(hedged: bool) -> None:
+            step = steps.pop(0)
+            now = time.monotonic()
+            budget = min(step.timeout_s, deadline - now)
+            attempt = CancelToken()
+            if token is not None:
+                detachers.append(
+                    token.on_cancel(lambda: attempt.cancel(token.reason or "cancelled"))
+                )
+            future = executor.submit(
+                self._call, step, sequence, budget, seed, attempt, key
+            )
+            running[future] = _Running(
+                step=step, started=now, hedged=hedged, token=attempt
+            )
+
+        def finish(winner: str | None) -> ChainEvent:
+            now = time.monotonic()
+            attempts.extend(
+                ChainAttempt(
+                    provider=item.step.provider,
+                    status="cancelled",
+                    latency_ms=(now - item.started) * 1000.0,
+                    hedged=item.hedged,
+                )
+                for item in running.values()
+            )
+            for future, item in running.items():
+                future.cancel()
+                item.token.cancel("hedge_lost" if winner else "chain_deadline")
+            executor.shutdown(wait=False, cancel_futures=True)
+            event = ChainEvent(
+                chain=self.name,
+                winner=winner,
+                latency_ms=(now - start) * 1000.0,
+                attempts=tuple(attempts),
+            )
+            _EVENTS.event = event
+            return event
+
+        try:
+            launch(hedged=False)
+            while running or steps:
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                if not running:
+                    launch(hedged=False)
+                    continue
+                wake = min(
+                    item.started + item.step.timeout_s for item in running.values()
+                )
+                hedge_at = None
+                if self.policy.mode == "hedge" and steps:
+                    latest = max(running.values(), key=lambda item: item.started)
+                    hedge_at = latest.started + self._hedge_delay(latest.step.provider)
+                    wake = min(wake, hedge_at)
+                done, _ = wait(
+                    running,
+                    timeout=max(0.0, min(wake, deadline) - now),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    item = running.pop(future)
+                    latency = time.monotonic() - item.started
+                    try:
+                        result, admission = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        attempts.append(
+                            ChainAttempt(
+                                provider=item.step.provider,
+                                status="failure",
+                                latency_ms=latency * 1000.0,
+                                hedged=item.hedged,
+                                error=getattr(exc, "code", type(exc).__name__),
+                            )
+                        )
+                        continue
+                    record_latency(item.step.provider, latency)
+                    attempts.append(
+                        ChainAttempt(
+                            provider=item.step.provider,
+                            status="success",
+                            latency_ms=latency * 1000.0,
+                            hedged=item.hedged,
+                        )
+                    )
+                    finish(item.step.provider)
+                    provider_scheduler().restore_event(admission)
+                    return result
+                now = time.monotonic()
+                for future, item in list(running.items()):
+                    if now - item.started >= item.step.timeout_s:
+                        running.pop(future)
+                        future.cancel()
+                        item.token.cancel("timeout")
+                        attempts.append(
+                            ChainAttempt(
+                                provider=item.step.provider,
+                                status="timeout",
+                                latency_ms=(now - item.started) * 1000.0,
+                                hedged=item.hedged,
+                            )
+                        )
+                if steps and (
+                    not running
+                    or (hedge_at is not None and time.monotonic() >= hedge_at)
+                ):
+                    if running:
+                        logger.info(f"Hedging {self.name} with {steps[0].provider}")
+                    launch(hedged=bool(running))
+            event = finish(None)
+            raise PredictionError(
+                f"All providers in {self.name} failed: "
+                + ", ".join(f"{a.provider}={a.status}" for a in event.attempts),
+                code="CHAIN_EXHAUSTED",
+            )
+        finally:
+            for detach in detachers:
+                detach()
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Hand thread-local provider events from a worker thread to its caller."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from agentic_proteins.providers.cache import (
+    PredictionCacheEvent,
+    consume_prediction_cache_event,
+    restore_prediction_cache_event,
+)
+from agentic_proteins.providers.chain import (
+    ChainEvent,
+    consume_chain_event,
+    restore_chain_event,
+)
+from agentic_proteins.providers.pool import ProviderCacheEvent, provider_pool
+from agentic_proteins.providers.scheduler import SchedulerEvent, provider_scheduler
+
+
+@dataclass(frozen=True)
+class ProviderEvents:
+    """Every provider event recorded on one thread."""
+
+    pool: ProviderCacheEvent | None = None
+    scheduler: SchedulerEvent | None = None
+    chain: ChainEvent | None = None
+    prediction_cache: PredictionCacheEvent | None = None
+
+
+def capture_provider_events() -> ProviderEvents:
+    """Pop the provider events recorded on the calling thread."""
+    return ProviderEvents(
+        pool=provider_pool().consume_event(),
+        scheduler=provider_scheduler().consume_event(),
+        chain=consume_chain_event(),
+        prediction_cache=consume_prediction_cache_event(),
+    )
+
+
+def restore_provider_events(events: ProviderEvents) -> None:
+    """Record captured events on the calling thread for its consumers."""
+    provider_pool().restore_event(events.pool)
+    provider_scheduler().restore_event(events.scheduler)
+    restore_chain_event(events.chain)
+    restore_prediction_cache_event(events.prediction_cache)
@@ -6,11 +6,22 @@
 from __future__ import annotations
 
 import secrets
+import threading
 import time
 
+from agentic_proteins.core.cancellation import current_cancel_token
 from agentic_proteins.providers.base import _time_left
 
 
+def pause(seconds: float) -> None:
+    """Sleep ``seconds``, waking early when the calling thread's work is cancelled."""
+    token = current_cancel_token()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.wait(seconds)
+
+
 def sleep_with_backoff(
     deadline: float,
     backoff: float,
@@ -23,7 +34,7 @@ def sleep_with_backoff(
     if remaining <= 0:
         return backoff, 0.0
     sleep_for = min(backoff + jitter * secrets.SystemRandom().random(), remaining)
-    time.sleep(sleep_for)
+    pause(sleep_for)
     return min(backoff * 1.5, max_backoff), sleep_for
 
 
@@ -41,5 +52,38 @@ def sleep_with_retry_after(
         return backoff, 0.0
     sleep_for = max(retry_after, backoff + jitter * secrets.SystemRandom().random())
     sleep_for = min(sleep_for, remaining)
-    time.sleep(sleep_for)
+    pause(sleep_for)
     return min(backoff * 1.5, max_backoff), sleep_for
+
+
+class RetryAfterGate:
+    """Process-wide Retry-After barrier shared by every caller of one API.
+
+    A rate-limit reply from any request defers all subsequent requests until
+    the advertised time, instead of only the call that received it.
+    """
+
+    def __init__(self) -> None:
+        """Create an open gate."""
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+    def defer(self, seconds: float) -> None:
+        """Block new requests for ``seconds`` from now (never shortens a block)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.time() + seconds)
+
+    def remaining(self) -> float:
+        """Return seconds until the gate opens."""
+        with self._lock:
+            return max(0.0, self._blocked_until - time.time())
+
+    def wait(self, deadline: float) -> float:
+        """Sleep until the gate opens or the deadline passes; return seconds slept."""
+        sleep_for = min(self.remaining(), _time_left(deadline))
+        if sleep_for <= 0:
+            return 0.0
+        pause(sleep_for)
+        return sleep_for
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import threading
 import time
@@ -16,6 +17,7 @@ from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
 from requests.exceptions import RequestException  # type: ignore[import-untyped]
 from urllib3.util.retry import Retry
 
+from agentic_proteins.core.cancellation import cancel_requested
 from agentic_proteins.providers.base import (
     BaseProvider,
     PredictionResult,
@@ -24,9 +26,16 @@ from agentic_proteins.providers.base import (
 )
 from agentic_proteins.providers.errors import PredictionError
 from agentic_proteins.providers.experimental._async_utils import (
+    RetryAfterGate,
     sleep_with_backoff,
     sleep_with_retry_after,
 )
+from agentic_proteins.providers.idempotency import current_idempotency_key
+
+# Failures that leave the remote job running, so a retry can resume it.
+_RESUMABLE_CODES = frozenset({"TIMEOUT", "CANCELLED"})
+# Status reads stay short so polling notices cancellation between requests.
+_POLL_READ_TIMEOUT = 5.0
 
 
 class APIColabFoldProvider(BaseProvider):
@@ -34,20 +43,30 @@ class APIColabFoldProvider(BaseProvider):
 
     name = "api_colabfold"
     metadata = ProviderMetadata(name=name, experimental=True)
-    _http_lock = threading.Lock()
+    _gates: dict[str, RetryAfterGate] = {}
+    _gates_lock = threading.Lock()
+    # Jobs left running by a timed-out or cancelled attempt, by idempotency key.
+    _jobs: dict[tuple[str, str, str], tuple[str, dict[str, Any]]] = {}
+    _jobs_lock = threading.Lock()
+    _max_jobs = 256
 
     def __init__(
         self,
         api_url: str = "https://api.colabfold.com/prediction/v1",
         token: str | None = None,
+        pool_size: int = 8,
     ) -> None:
         """Initializes the APIColabFoldProvider.
 
         Args:
             api_url: The API URL.
             token: The token.
+            pool_size: Maximum concurrent HTTP connections (and in-flight requests).
         """
         self.api_url = api_url
+        self.pool_size = pool_size
+        with self._gates_lock:
+            self._retry_gate = self._gates.setdefault(api_url, RetryAfterGate())
         self.token = (
             token
             or os.getenv("COLABFOLD_TOKEN")
@@ -62,11 +81,19 @@ class APIColabFoldProvider(BaseProvider):
             read=5,
             status=5,
             backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            respect_retry_after_header=True,
+            # 429/503 and Retry-After are handled by the shared gate.
+            status_forcelist=[500, 502, 504],
+            respect_retry_after_header=False,
             allowed_methods=None,
         )
-        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
                 "User-Agent": "agentic-proteins/0.1 (+https://github.com/example/agentic-proteins)"
@@ -89,79 +116,78 @@ class APIColabFoldProvider(BaseProvider):
         except Exception:
             return False
 
-    def predict(
-        self, sequence: str, timeout: float = 600.0, seed: int | None = None
-    ) -> PredictionResult:
-        """Predicts the protein structure.
-
-        Args:
-            sequence: The amino acid sequence.
-            timeout: The timeout in seconds.
-            seed: The random seed.
-
-        Returns:
-            The prediction result.
+    @staticmethod
+    def _retry_after_seconds(response: Any) -> float:
+        """Return the Retry-After delay of a 429/503 reply, 0 otherwise."""
+        if response is None or response.status_code not in [429, 503]:
+            return 0.0
+        try:
+            return float(response.headers.get("Retry-After", 0))
+        except (TypeError, ValueError):
+            return 0.0
 
-        Raises:
-            PredictionError: On failure.
-        """
-        start_time = time.time()
-        deadline = start_time + timeout
+    def _submit(
+        self, sequence: str, deadline: float
+    ) -> tuple[str, dict[str, Any], float]:
+        """Submit one sequence; return (job_id, raw_data, backoff_total)."""
         payload = {"sequences": [sequence], "use_templates": False, "num_recycles": 3}
-        now = time.time()
-        if now >= deadline:
+        if time.time() >= deadline:
             raise PredictionError("Timeout before start", code="TIMEOUT")
         per_timeout = (3.05, max(1.0, min(10.0, _time_left(deadline) - 0.5)))
         backoff = 1.0
         post_retries = 0
-        backoff_total = 0.0
+        backoff_total = self._retry_gate.wait(deadline)
+        response: Any = None
         while _time_left(deadline) > 0:
-            with self._http_lock:
-                try:
-                    response = self.session.post(
-                        self.api_url,
-                        headers=self.headers,
-                        json=payload,
-                        timeout=per_timeout,
-                    )
-                    if response.status_code == 401:
-                        raise PredictionError(
-                            "Authentication failed; check token/credentials",
-                            code="AUTH_ERROR",
-                        )
-                    if response.status_code == 413:
-                        raise PredictionError(
-                            "Sequence too long for ColabFold; check provider limits",
-                            code="BAD_INPUT",
-                        )
-                    response.raise_for_status()
-                    break
-                except RequestException as e:
-                    post_retries += 1
-                    retry_after = (
-                        int(response.headers.get("Retry-After", 0))
-                        if "response" in locals() and response.status_code in [429, 503]
-                        else 0
+            if cancel_requested():
+                raise PredictionError("ColabFold submit cancelled", code="CANCELLED")
+            response = None
+            try:
+                response = self.session.post(
+                    self.api_url,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=per_timeout,
+                )
+                if response.status_code == 401:
+                    raise PredictionError(
+                        "Authentication failed; check token/credentials",
+                        code="AUTH_ERROR",
                     )
-                    logger.warning(
-                        f"ColabFold post failed (retry {post_retries}): {str(e)}"
+                if response.status_code == 413:
+                    raise PredictionError(
+                        "Sequence too long for ColabFold; check provider limits",
+                        code="BAD_INPUT",
                     )
-                    remaining = _time_left(deadline)
-                    if remaining <= 0 or post_retries >= 5:
-                        code = (
-                            "RATE_LIMIT"
-                            if response.status_code == 429
-                            else "REMOTE_ERROR"
-                            if response.status_code >= 500
-                            else "UNKNOWN"
-                        )
-                        raise PredictionError(
-                            f"ColabFold post failed after retries: {str(e)}", code=code
-                        ) from e
-                    backoff, slept = sleep_with_retry_after(
-                        deadline, backoff, retry_after
+                response.raise_for_status()
+                break
+            except RequestException as e:
+                post_retries += 1
+                retry_after = self._retry_after_seconds(response)
+                self._retry_gate.defer(retry_after)
+                logger.warning(
+                    f"ColabFold post failed (retry {post_retries}): {str(e)}"
+                )
+                remaining = _time_left(deadline)
+                if remaining <= 0 or post_retries >= 5:
+                    status = response.status_code if response is not None else 0
+                    code = (
+                        "RATE_LIMIT"
+                        if status == 429
+                        else "REMOTE_ERROR"
+                        if status >= 500
+                        else "UNKNOWN"
                     )
-                    backoff_total += slept
+                    raise PredictionError(
+                        f"ColabFold post failed after retries: {str(e)}", code=code
+                    ) from e
+                # This caller waits out the global block itself, then retries.
+                backoff, slept = sleep_with_retry_after(
+                    deadline, backoff, max(retry_after, self._retry_gate.remaining())
+                )
+                backoff_total += slept
+        else:
+            raise PredictionError("ColabFold submit timed out", code="TIMEOUT")
         try:
             job_data = response.json()
         except ValueError as err:
@@ -171,7 +197,6 @@ class APIColabFoldProvider(BaseProvider):
         if "job_id" not in job_data:
             raise PredictionError("No job_id in ColabFold response", code="NO_OUTPUT")
         job_id = job_data["job_id"]
-        backoff = 1.0
         raw_data: dict[str, Any] = {
             "job_id": job_id,
             "retries": 0,
@@ -180,84 +205,254 @@ class APIColabFoldProvider(BaseProvider):
         }
         if "x-request-id" in response.headers:
             raw_data["request_id"] = response.headers["x-request-id"]
+        return job_id, raw_data, backoff_total
+
+    def _poll(self, job_id: str, deadline: float) -> Any:
+        """Fetch job status once; return None on transport errors."""
+        try:
+            read_timeout = min(_POLL_READ_TIMEOUT, _time_left(deadline) - 0.5)
+            per_timeout = (3.05, max(1.0, read_timeout))
+            poll_response = self.session.get(
+                f"{self.api_url}/{job_id}",
+                headers=self.headers,
+                timeout=per_timeout,
+            )
+        except RequestException as ex:
+            logger.warning(f"ColabFold poll failed: {str(ex)}")
+            return None
+        self._retry_gate.defer(self._retry_after_seconds(poll_response))
+        return poll_response
+
+    def _interpret_poll(
+        self,
+        poll_response: Any,
+        raw_data: dict[str, Any],
+        start_time: float,
+        seed: int | None,
+    ) -> PredictionResult | None:
+        """Turn a poll reply into a result; None while the job is still running.
+
+        Raises:
+            PredictionError: If the job failed or returned an invalid result.
+        """
+        job_id = raw_data["job_id"]
+        if poll_response.status_code in [500, 502, 503, 504]:
+            raw_data["retries"] += 1
+        if poll_response.status_code != 200:
+            return None
+        try:
+            data = poll_response.json()
+        except ValueError:
+            logger.warning("Invalid JSON from ColabFold poll; retrying")
+            return None
+        if "status" not in data:
+            raise PredictionError(
+                "No status in ColabFold response", code="INVALID_OUTPUT"
+            )
+        status = data["status"].upper()
+        raw_data["last_status"] = status
+        if status in {"SUCCESS", "DONE"}:
+            if (
+                "result" not in data
+                or not isinstance(data["result"], dict)
+                or "models" not in data["result"]
+                or not isinstance(data["result"]["models"], list)
+                or len(data["result"]["models"]) == 0
+            ):
+                raise PredictionError(
+                    "Invalid result structure in ColabFold response: "
+                    + data.get("error", "unknown error"),
+                    code="INVALID_OUTPUT",
+                )
+            model = data["result"]["models"][0]
+            if "pdb" not in model or not isinstance(model["pdb"], str):
+                raise PredictionError(
+                    "No PDB string in ColabFold model", code="NO_OUTPUT"
+                )
+            pdb_text = model["pdb"]
+            if not pdb_text:
+                raise PredictionError("Empty PDB in ColabFold result", code="NO_OUTPUT")
+            if "x-request-id" in poll_response.headers:
+                raw_data["request_id"] = poll_response.headers["x-request-id"]
+            raw_data["latency"] = time.time() - start_time
+            raw_data["seed"] = seed
+            logger.info(
+                f"ColabFold success: job_id={job_id}, retries={raw_data['retries']}, post_retries={raw_data['post_retries']}, backoff_total_sec={raw_data['backoff_total_sec']}"
+            )
+            return PredictionResult(pdb_text, self.name, raw_data)
+        if status in {"ERROR", "FAILED"}:
+            raise PredictionError(
+                data.get("error", "ColabFold job failed"), code="REMOTE_ERROR"
+            )
+        return None
+
+    def predict(
+        self, sequence: str, timeout: float = 600.0, seed: int | None = None
+    ) -> PredictionResult:
+        """Predicts the protein structure.
+
+        Args:
+            sequence: The amino acid sequence.
+            timeout: The timeout in seconds.
+            seed: The random seed.
+
+        Returns:
+            The prediction result.
+
+        Raises:
+            PredictionError: On failure.
+        """
+        start_time = time.time()
+        deadline = start_time + timeout
+        job_key = self._job_key(sequence)
+        job_id, raw_data, backoff_total = self._resume_or_submit(
+            job_key, sequence, deadline
+        )
+        try:
+            result = self._await_job(
+                job_id, raw_data, backoff_total, deadline, start_time, seed
+            )
+        except PredictionError as err:
+            if err.code not in _RESUMABLE_CODES:
+                self._forget_job(job_key)
+            raise
+        self._forget_job(job_key)
+        return result
+
+    def _job_key(self, sequence: str) -> tuple[str, str, str] | None:
+        """Return the key of this request's job, None without an idempotency key."""
+        key = current_idempotency_key()
+        return None if key is None else (self.api_url, key, sequence)
+
+    def _resume_or_submit(
+        self, job_key: tuple[str, str, str] | None, sequence: str, deadline: float
+    ) -> tuple[str, dict[str, Any], float]:
+        """Resume the job an earlier attempt of ``job_key`` left, else submit."""
+        if job_key is not None:
+            with self._jobs_lock:
+                known = self._jobs.get(job_key)
+            if known is not None:
+                job_id, raw_data = known
+                logger.info(f"ColabFold resuming job_id={job_id}")
+                return job_id, {**raw_data, "resumed": True}, 0.0
+        job_id, raw_data, backoff_total = self._submit(sequence, deadline)
+        if job_key is not None:
+            with self._jobs_lock:
+                if len(self._jobs) >= self._max_jobs:
+                    self._jobs.pop(next(iter(self._jobs)))
+                self._jobs[job_key] = (job_id, dict(raw_data))
+        return job_id, raw_data, backoff_total
+
+    def _forget_job(self, job_key: tuple[str, str, str] | None) -> None:
+        """Drop a finished job so later attempts submit afresh."""
+        if job_key is not None:
+            with self._jobs_lock:
+                self._jobs.pop(job_key, None)
+
+    def _await_job(
+        self,
+        job_id: str,
+        raw_data: dict[str, Any],
+        backoff_total: float,
+        deadline: float,
+        start_time: float,
+        seed: int | None,
+    ) -> PredictionResult:
+        """Poll ``job_id`` until it finishes, is cancelled or ``deadline`` passes."""
+        backoff = 1.0
         while _time_left(deadline) > 0:
-            try:
-                now = time.time()
-                if now >= deadline:
-                    raise PredictionError(
-                        f"ColabFold API timed out (job_id={job_id})", code="TIMEOUT"
-                    )
-                per_timeout = (3.05, max(1.0, min(15.0, _time_left(deadline) - 0.5)))
-                with self._http_lock:
-                    poll_response = self.session.get(
-                        f"{self.api_url}/{job_id}",
-                        headers=self.headers,
-                        timeout=per_timeout,
-                    )
-                if poll_response.status_code in [500, 502, 503, 504]:
-                    raw_data["retries"] += 1
-            except RequestException as ex:
-                logger.warning(f"ColabFold poll failed: {str(ex)}")
-                remaining = _time_left(deadline)
-                if remaining <= 0:
-                    raise PredictionError(
-                        f"ColabFold API timed out (job_id={job_id})", code="TIMEOUT"
-                    ) from ex
-                backoff, slept = sleep_with_backoff(deadline, backoff)
-                backoff_total += slept
-                continue
-            if poll_response.status_code == 200:
-                try:
-                    data = poll_response.json()
-                except ValueError:
-                    logger.warning("Invalid JSON from ColabFold poll; retrying")
-                    backoff, slept = sleep_with_backoff(deadline, backoff)
-                    backoff_total += slept
-                    continue
-                if "status" not in data:
-                    raise PredictionError(
-                        "No status in ColabFold response", code="INVALID_OUTPUT"
-                    )
-                status = data["status"].upper()
-                raw_data["last_status"] = status
-                if status in {"SUCCESS", "DONE"}:
-                    if (
-                        "result" not in data
-                        or not isinstance(data["result"], dict)
-                        or "models" not in data["result"]
-                        or not isinstance(data["result"]["models"], list)
-                        or len(data["result"]["models"]) == 0
-                    ):
-                        raise PredictionError(
-                            "Invalid result structure in ColabFold response: "
-                            + data.get("error", "unknown error"),
-                            code="INVALID_OUTPUT",
-                        )
-                    model = data["result"]["models"][0]
-                    if "pdb" not in model or not isinstance(model["pdb"], str):
-                        raise PredictionError(
-                            "No PDB string in ColabFold model", code="NO_OUTPUT"
-                        )
-                    pdb_text = model["pdb"]
-                    if not pdb_text:
-                        raise PredictionError(
-                            "Empty PDB in ColabFold result", code="NO_OUTPUT"
-                        )
-                    if "x-request-id" in poll_response.headers:
-                        raw_data["request_id"] = poll_response.headers["x-request-id"]
-                    raw_data["latency"] = time.time() - start_time
-                    raw_data["backoff_total_sec"] = backoff_total
-                    raw_data["seed"] = seed
-                    logger.info(
-                        f"ColabFold success: job_id={job_id}, retries={raw_data['retries']}, post_retries={post_retries}, backoff_total_sec={backoff_total}"
-                    )
-                    return PredictionResult(pdb_text, self.name, raw_data)
-                if status in {"ERROR", "FAILED"}:
-                    raise PredictionError(
-                        data.get("error", "ColabFold job failed"), code="REMOTE_ERROR"
-                    )
+            if cancel_requested():
+                # Stop polling so the scheduler slot and connection are freed.
+                raise PredictionError(
+                    f"ColabFold job {job_id} cancelled", code="CANCELLED"
+                )
+            backoff_total += self._retry_gate.wait(deadline)
+            poll_response = self._poll(job_id, deadline)
+            if poll_response is not None:
+                raw_data["backoff_total_sec"] = backoff_total
+                result = self._interpret_poll(poll_response, raw_data, start_time, seed)
+                if result is not None:
+                    return result
             backoff, slept = sleep_with_backoff(deadline, backoff)
             backoff_total += slept
         raise PredictionError(
             f"ColabFold API timed out (job_id={job_id})", code="TIMEOUT"
         )
+
+    def predict_many(
+        self, sequences: list[str], timeout: float = 600.0, seed: int | None = None
+    ) -> list[PredictionResult | PredictionError]:
+        """Submit many sequences concurrently and poll all jobs in one loop.
+
+        Submissions and each polling round run on a thread pool bounded by
+        ``pool_size``, sharing the session's connection pool. All requests
+        honor the API-wide Retry-After gate. Polling stops once the call is
+        cancelled, leaving pending sequences with a ``CANCELLED`` error.
+
+        Args:
+            sequences: Amino acid sequences.
+            timeout: Timeout in seconds for the whole set.
+            seed: The random seed recorded on each result.
+
+        Returns:
+            One entry per input, in input order: a ``PredictionResult`` on success or
+            the ``PredictionError`` for that sequence.
+        """
+        start_time = time.time()
+        deadline = start_time + timeout
+        results: list[PredictionResult | PredictionError | None] = [None] * len(
+            sequences
+        )
+        jobs: dict[int, dict[str, Any]] = {}
+
+        def submit(index: int) -> None:
+            try:
+                _, raw_data, _ = self._submit(sequences[index], deadline)
+                jobs[index] = raw_data
+            except PredictionError as e:
+                results[index] = e
+
+        def poll(index: int) -> tuple[int, Any]:
+            return index, self._poll(jobs[index]["job_id"], deadline)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.pool_size)) as pool:
+            list(pool.map(submit, range(len(sequences))))
+            backoff = 1.0
+            while jobs and _time_left(deadline) > 0:
+                if cancel_requested():
+                    break
+                self._retry_gate.wait(deadline)
+                for index, poll_response in pool.map(poll, sorted(jobs)):
+                    if poll_response is None:
+                        continue
+                    try:
+                        result = self._interpret_poll(
+                            poll_response, jobs[index], start_time, seed
+                        )
+                    except PredictionError as e:
+                        results[index] = e
+                        del jobs[index]
+                        continue
+                    if result is not None:
+                        results[index] = result
+                        del jobs[index]
+                if jobs:
+                    backoff, _ = sleep_with_backoff(deadline, backoff)
+        cancelled = cancel_requested()
+        for index, raw_data in jobs.items():
+            results[index] = (
+                PredictionError(
+                    f"ColabFold job {raw_data['job_id']} cancelled", code="CANCELLED"
+                )
+                if cancelled
+                else PredictionError(
+                    f"ColabFold API timed out (job_id={raw_data['job_id']})",
+                    code="TIMEOUT",
+                )
+            )
+        return [
+            item
+            if item is not None
+            else PredictionError("Sequence was not submitted", code="INTERNAL_ERROR")
+            for item in results
+        ]
@@ -5,15 +5,20 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import sys
+import time
+from typing import Any
 
 from loguru import logger
 
+from agentic_proteins.core.cancellation import cancel_requested, on_cancel
 from agentic_proteins.providers.base import (
     BaseProvider,
     PredictionResult,
     ProviderMetadata,
+    _time_left,
 )
 from agentic_proteins.providers.errors import PredictionError
 
@@ -49,6 +54,8 @@ class APIOpenProteinProvider(BaseProvider):
         self.name = f"api_openprotein_{self.model}"
         self.session = None
         self.metadata = ProviderMetadata(name=self.name, experimental=True)
+        # (session, submit_fn, kwargs template) resolved once per session
+        self._submit_cache: tuple[Any, Any, dict[str, Any]] | None = None
 
         u = (user or os.getenv("OPENPROTEIN_USER") or "").strip()
         p = (password or os.getenv("OPENPROTEIN_PASSWORD") or "").strip()
@@ -249,34 +256,13 @@ class APIOpenProteinProvider(BaseProvider):
 
     # ----------------------------- main -------------------------------------
 
-    def predict(
-        self, sequence: str, timeout: float = 300.0, seed: int | None = None
-    ) -> PredictionResult:
-        """Submit a folding job to OpenProtein and return the predicted structure.
-
-        Args:
-          sequence: Amino-acid sequence (single chain) using the 20 standard residues.
-          timeout: Soft deadline in seconds for remote job completion and polling.
-          seed: Optional seed recorded in the result metadata (not all backends use it).
-
-        Returns:
-          PredictionResult: Wrapper containing the PDB text, provider name, and
-          metadata such as job id and latency.
-
-        Raises:
-          PredictionError: If authentication/session is missing, the client API
-            surface is incompatible (no structure/fold namespace or submit
-            function found), submission fails remotely, the job times out, or the
-            job completes without a PDB payload.
-          ValueError: Propagated if critical inputs are invalid (rare; most input
-            issues are normalized before submission).
-        """
+    def _resolve_submit(self) -> tuple[Any, dict[str, Any]]:
+        """Return (submit_fn, kwargs template), probing the client once per session."""
         if not self.session:
             raise PredictionError("OpenProtein session is None", code="AUTH_ERROR")
-
-        import time as _t
-
-        start = _t.time()
+        cached = self._submit_cache
+        if cached is not None and cached[0] is self.session:
+            return cached[1], cached[2]
 
         ns = self._find_structure_namespace(self.session)
         if ns is None:
@@ -300,8 +286,12 @@ class APIOpenProteinProvider(BaseProvider):
                 "Please upgrade `openprotein-python`.\n"
             )
             raise
+        self._submit_cache = (self.session, submit_fn, kw)
+        return submit_fn, kw
 
-        # Fill kwargs
+    def _submit(self, sequence: str, submit_fn: Any, template: dict[str, Any]) -> Any:
+        """Fill a copy of the kwargs template and submit one job."""
+        kw = dict(template)
         if "sequence" in kw:
             kw["sequence"] = sequence
         elif "seq" in kw:
@@ -321,18 +311,20 @@ class APIOpenProteinProvider(BaseProvider):
                 if k in kw:
                     kw[k] = payload
 
-        # Submit
         try:
             try:
-                job = submit_fn(**kw)
+                return submit_fn(**kw)
             except TypeError:
-                job = submit_fn(sequence, resolved)  # positional fallback
+                return submit_fn(sequence, resolved)  # positional fallback
         except Exception as e:
             raise PredictionError(
                 f"OpenProtein submit failed: {e}", code="REMOTE_ERROR"
             ) from e
 
-        # Wait + fetch PDB
+    def _collect(
+        self, job: Any, timeout: float, start: float, seed: int | None
+    ) -> PredictionResult:
+        """Wait for one submitted job and wrap its PDB."""
         pdb_text = self._wait_and_get_pdb(job, timeout=timeout)
         if not pdb_text or not pdb_text.strip():
             raise PredictionError(
@@ -346,7 +338,116 @@ class APIOpenProteinProvider(BaseProvider):
                 "job_id": getattr(job, "job_id", None)
                 or getattr(job, "id", None)
                 or getattr(job, "uuid", None),
-                "latency": _t.time() - start,
+                "latency": time.time() - start,
                 "seed": seed,
             },
         )
+
+    def _cancel_job(self, job: Any) -> None:
+        """Ask the service to stop ``job``, through the job or the session."""
+        cancel = getattr(job, "cancel", None)
+        if callable(cancel):
+            cancel()
+            return
+        job_id = (
+            getattr(job, "job_id", None)
+            or getattr(job, "id", None)
+            or getattr(job, "uuid", None)
+        )
+        cancel = getattr(self.session, "cancel", None)
+        if job_id and callable(cancel):
+            cancel(job_id)
+        else:
+            logger.debug("OpenProtein client has no cancel call; job left running.")
+
+    def predict(
+        self, sequence: str, timeout: float = 300.0, seed: int | None = None
+    ) -> PredictionResult:
+        """Submit a folding job to OpenProtein and return the predicted structure.
+
+        Args:
+          sequence: Amino-acid sequence (single chain) using the 20 standard residues.
+          timeout: Soft deadline in seconds for remote job completion and polling.
+          seed: Optional seed recorded in the result metadata (not all backends use it).
+
+        Returns:
+          PredictionResult: Wrapper containing the PDB text, provider name, and
+          metadata such as job id and latency.
+
+        Raises:
+          PredictionError: If authentication/session is missing, the client API
+            surface is incompatible (no structure/fold namespace or submit
+            function found), submission fails remotely, the job times out, or the
+            job completes without a PDB payload.
+          ValueError: Propagated if critical inputs are invalid (rare; most input
+            issues are normalized before submission).
+        """
+        start = time.time()
+        submit_fn, template = self._resolve_submit()
+        if cancel_requested():
+            raise PredictionError("OpenProtein job cancelled", code="CANCELLED")
+        job = self._submit(sequence, submit_fn, template)
+        # Cancelling the remote job also ends the client's blocking wait on it.
+        detach = on_cancel(lambda: self._cancel_job(job))
+        try:
+            return self._collect(job, timeout, start, seed)
+        except PredictionError as e:
+            if cancel_requested():
+                raise PredictionError(
+                    "OpenProtein job cancelled", code="CANCELLED"
+                ) from e
+            raise
+        finally:
+            detach()
+
+    def predict_many(
+        self,
+        sequences: list[str],
+        timeout: float = 300.0,
+        seed: int | None = None,
+        max_workers: int = 16,
+    ) -> list[PredictionResult | PredictionError]:
+        """Submit all sequences up front, then wait on the jobs concurrently.
+
+        Args:
+          sequences: Amino-acid sequences.
+          timeout: Shared deadline in seconds for submission and completion.
+          seed: Optional seed recorded in each result's metadata.
+          max_workers: Threads used for submitting and waiting.
+
+        Returns:
+          One entry per input, in input order: a ``PredictionResult`` on success
+          or the ``PredictionError`` for that sequence.
+
+        Raises:
+          PredictionError: If the session is missing or the client API surface is
+            incompatible; per-sequence failures are returned instead.
+        """
+        start = time.time()
+        deadline = start + timeout
+        submit_fn, template = self._resolve_submit()
+
+        def submit(sequence: str) -> Any:
+            try:
+                return self._submit(sequence, submit_fn, template)
+            except PredictionError as e:
+                return e
+
+        def collect(job: Any) -> PredictionResult | PredictionError:
+            if isinstance(job, PredictionError):
+                return job
+            remaining = _time_left(deadline)
+            if remaining <= 0:
+                return PredictionError("OpenProtein batch timed out", code="TIMEOUT")
+            try:
+                return self._collect(job, remaining, start, seed)
+            except PredictionError as e:
+                return e
+            except Exception as e:  # noqa: BLE001
+                return PredictionError(
+                    f"OpenProtein wait failed: {e}", code="REMOTE_ERROR"
+                )
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            jobs = list(pool.map(submit, sequences))
+            return list(pool.map(collect, jobs))
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from importlib import util
 import os
 import shutil
+from typing import Any
 
 from agentic_proteins.providers.base import BaseProvider, ProviderCapabilities
 from agentic_proteins.providers.errors import PredictionError
@@ -22,26 +24,75 @@ PROVIDER_CAPABILITIES = {
         supports_cpu=True,
         cpu_fallback_allowed=True,
         notes="CPU fallback is slow and memory intensive.",
+        max_concurrency=1,
     ),
     "local_rosettafold": ProviderCapabilities(
         supports_gpu=True,
         supports_cpu=False,
         cpu_fallback_allowed=False,
         notes="GPU required; CPU execution not supported.",
+        max_concurrency=1,
     ),
     "api_colabfold": ProviderCapabilities(
-        supports_gpu=False, supports_cpu=True, cpu_fallback_allowed=True
+        supports_gpu=False,
+        supports_cpu=True,
+        cpu_fallback_allowed=True,
+        max_concurrency=4,
     ),
     "api_openprotein_esmfold": ProviderCapabilities(
-        supports_gpu=False, supports_cpu=True, cpu_fallback_allowed=True
+        supports_gpu=False,
+        supports_cpu=True,
+        cpu_fallback_allowed=True,
+        max_concurrency=4,
     ),
     "api_openprotein_alphafold": ProviderCapabilities(
-        supports_gpu=False, supports_cpu=True, cpu_fallback_allowed=True
+        supports_gpu=False,
+        supports_cpu=True,
+        cpu_fallback_allowed=True,
+        max_concurrency=4,
     ),
 }
 
 
-def create_provider(name: str) -> BaseProvider:
+@dataclass(frozen=True)
+class ProviderKey:
+    """Identity of a loaded provider instance for warm caching."""
+
+    name: str
+    model_path: str = ""
+    revision: str = ""
+    device: str = ""
+    dtype: str = ""
+    options: tuple[tuple[str, str], ...] = ()
+
+
+def provider_key(name: str, **options: Any) -> ProviderKey:
+    """Resolve the cache identity of a provider and its load options."""
+    if name != "local_esmfold":
+        return ProviderKey(
+            name=name,
+            model_path=str(options.get("model_path", "")),
+            options=tuple(
+                sorted((k, str(v)) for k, v in options.items() if k != "model_path")
+            ),
+        )
+    device = options.get("device") or ("cuda" if cuda_available() else "cpu")
+    dtype = options.get("dtype") or ("float16" if device == "cuda" else "float32")
+    return ProviderKey(
+        name=name,
+        model_path=str(options.get("model_path") or "models/esmfold"),
+        revision=str(
+            options.get("revision") or os.getenv("ESMFOLD_REVISION") or "pinned"
+        ),
+        device=str(device),
+        dtype=str(dtype),
+        options=(("cpu_profile", repr(options["cpu_profile"])),)
+        if options.get("cpu_profile")
+        else (),
+    )
+
+
+def create_provider(name: str, **options: Any) -> BaseProvider:
     """Create a provider instance by name."""
     if name == HeuristicStructureProvider.name:
         return HeuristicStructureProvider()
@@ -50,14 +101,14 @@ def create_provider(name: str) -> BaseProvider:
         _require_module("transformers", "pip install agentic-proteins[local-esmfold]")
         from agentic_proteins.providers.local.esmfold import LocalESMFoldProvider
 
-        return LocalESMFoldProvider()
+        return LocalESMFoldProvider(**options)
     if name == "local_rosettafold":
         _require_module("torch", "pip install agentic-proteins[local-rosettafold]")
         from agentic_proteins.providers.local.rosettafold import (
             LocalRoseTTAFoldProvider,
         )
 
-        return LocalRoseTTAFoldProvider()
+        return LocalRoseTTAFoldProvider(**options)
     if name.startswith("api_openprotein"):
         _require_module("openprotein", "pip install agentic-proteins[api]")
         from agentic_proteins.providers.experimental.openprotein import (
@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Thread-local idempotency keys for provider requests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import threading
+
+_LOCAL = threading.local()
+
+
+def current_idempotency_key() -> str | None:
+    """Return the idempotency key active on the calling thread, if any."""
+    return getattr(_LOCAL, "key", None)
+
+
+@contextmanager
+def idempotency_scope(key: str | None) -> Iterator[str | None]:
+    """Mark provider requests made in the block as attempts of ``key``.
+
+    Providers that submit remote jobs use the key to resume a job an earlier
+    attempt left running instead of submitting it again.
+
+    Args:
+        key: Stable identifier shared by every attempt of one invocation.
+
+    Yields:
+        The active key.
+    """
+    previous = current_idempotency_key()
+    _LOCAL.key = key
+    try:
+        yield key
+    finally:
+        _LOCAL.key = previous
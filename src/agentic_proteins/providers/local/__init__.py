@@ -8,9 +8,16 @@ from __future__ import annotations
 __all__ = []
 
 try:
-    from agentic_proteins.providers.local.esmfold import LocalESMFoldProvider
+    from agentic_proteins.providers.local.esmfold import (
+        ESMFoldCPUProfile,
+        LocalESMFoldProvider,
+    )
     from agentic_proteins.providers.local.rosettafold import LocalRoseTTAFoldProvider
 
-    __all__ = ["LocalESMFoldProvider", "LocalRoseTTAFoldProvider"]
+    __all__ = [
+        "ESMFoldCPUProfile",
+        "LocalESMFoldProvider",
+        "LocalRoseTTAFoldProvider",
+    ]
 except ImportError:
     __all__ = []
@@ -0,0 +1,313 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Long-lived JSON-lines worker process for local providers.
+
+Protocol (one JSON object per line):
+    worker -> provider: ``{"status": "ready"}`` once weights are loaded.
+    provider -> worker: ``{"id": 1, "op": "ping"}`` or
+        ``{"id": 2, "op": "predict", "fasta": ..., "out_dir": ..., "seed": ...}``.
+    worker -> provider: ``{"id": 2, "ok": true}`` or
+        ``{"id": 2, "ok": false, "error": "..."}``.
+Non-JSON stdout lines are treated as log output. Closing stdin asks the worker
+to exit.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import json
+import queue
+import subprocess  # nosec B404, noqa: S603
+import threading
+import time
+from typing import IO, Any
+
+from loguru import logger
+
+from agentic_proteins.core.cancellation import cancel_requested, on_cancel
+from agentic_proteins.providers.base import _time_left
+from agentic_proteins.providers.errors import PredictionError
+
+
+class WorkerDiedError(Exception):
+    """Raised when the worker process exits mid-exchange."""
+
+
+class _Process:
+    """A running worker process and its stdout/stderr pumps."""
+
+    def __init__(self, cmd: list[str], cwd: str | None) -> None:
+        self.proc = subprocess.Popen(  # noqa: S603  # nosec B603
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=cwd,
+            shell=False,
+        )
+        self.messages: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self.stdout_tail: deque[str] = deque(maxlen=50)
+        self.stderr_tail: deque[str] = deque(maxlen=50)
+        threading.Thread(target=self._pump_stdout, daemon=True).start()
+        threading.Thread(
+            target=self._pump_lines,
+            args=(self.proc.stderr, self.stderr_tail),
+            daemon=True,
+        ).start()
+
+    def _pump_stdout(self) -> None:
+        """Forward JSON messages; keep other lines as log tail."""
+        if self.proc.stdout is None:
+            self.messages.put(None)
+            return
+        for line in self.proc.stdout:
+            text = line.strip()
+            if text.startswith("{"):
+                try:
+                    self.messages.put(json.loads(text))
+                    continue
+                except json.JSONDecodeError:
+                    pass
+            self.stdout_tail.append(line)
+        self.messages.put(None)
+
+    @staticmethod
+    def _pump_lines(stream: IO[str] | None, tail: deque[str]) -> None:
+        """Drain a stream into a bounded tail so the pipe never blocks."""
+        if stream is None:
+            return
+        for line in stream:
+            tail.append(line)
+
+    def alive(self) -> bool:
+        """Return True while the process is running."""
+        return self.proc.poll() is None
+
+    def send(self, payload: dict[str, Any]) -> None:
+        """Write one request line."""
+        try:
+            if self.proc.stdin is None:
+                raise WorkerDiedError("stdin is closed")
+            self.proc.stdin.write(json.dumps(payload) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise WorkerDiedError(str(e)) from e
+
+    def receive(self, deadline: float, request_id: int | None) -> dict[str, Any]:
+        """Wait for the reply to ``request_id`` (or the ready banner when None)."""
+        while True:
+            try:
+                message = self.messages.get(timeout=max(0.0, _time_left(deadline)))
+            except queue.Empty as e:
+                raise TimeoutError("worker did not reply in time") from e
+            if message is None:
+                raise WorkerDiedError(f"exit code {self.proc.poll()}")
+            if request_id is None and message.get("status") == "ready":
+                return message
+            if request_id is not None and message.get("id") == request_id:
+                return message
+
+    def stop(self, grace: float = 5.0) -> None:
+        """Close stdin and wait; kill if the worker does not exit."""
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait(timeout=grace)
+
+
+class PersistentWorker:
+    """Serialized request/reply client for a long-lived worker process.
+
+    At most ``max_queue`` jobs may be queued or running; further submissions
+    are rejected with ``QUEUE_FULL``. A worker that exits mid-job is restarted
+    and the job retried once; a worker that misses a deadline is killed so the
+    next job starts from a clean process.
+    """
+
+    def __init__(
+        self,
+        cmd: list[str],
+        cwd: str | None = None,
+        max_queue: int = 8,
+        startup_timeout: float = 600.0,
+        on_kill: Callable[[], None] | None = None,
+    ) -> None:
+        """Configure the worker; the process starts on first use."""
+        self.cmd = cmd
+        self.cwd = cwd
+        self.max_queue = max_queue
+        self.startup_timeout = startup_timeout
+        self.restarts = 0
+        self._on_kill = on_kill
+        self._process: _Process | None = None
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._lock = threading.Lock()
+        self._abort_lock = threading.Lock()
+        self._current: object | None = None
+        self._next_id = 0
+
+    def alive(self) -> bool:
+        """Return True when a worker process is running."""
+        return self._process is not None and self._process.alive()
+
+    def start(self, deadline: float | None = None) -> None:
+        """Start the worker if needed and wait for its ready banner."""
+        with self._lock:
+            self._ensure_started(deadline)
+
+    def probe(self, timeout: float = 5.0) -> bool:
+        """Ping a running worker; never starts one, and a busy worker counts as up."""
+        if not self.alive():
+            return False
+        if not self._lock.acquire(blocking=False):
+            return True  # busy with a job, so it is up
+        try:
+            self._request_locked({"op": "ping"}, deadline=time.time() + timeout)
+        except PredictionError:
+            return False
+        finally:
+            self._lock.release()
+        return True
+
+    def request(self, payload: dict[str, Any], deadline: float) -> dict[str, Any]:
+        """Send one job and return the worker's reply.
+
+        Raises:
+            PredictionError: ``QUEUE_FULL``, ``TIMEOUT`` or ``REMOTE_ERROR``.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise PredictionError(
+                f"Worker queue full ({self.max_queue} jobs)", code="QUEUE_FULL"
+            )
+        try:
+            if not self._lock.acquire(timeout=max(0.0, _time_left(deadline))):
+                raise PredictionError("Timed out waiting for worker", code="TIMEOUT")
+            ticket = object()
+            try:
+                with self._abort_lock:
+                    self._current = ticket
+                detach = on_cancel(lambda: self._abort(ticket))
+                try:
+                    return self._request_locked(payload, deadline)
+                finally:
+                    detach()
+            finally:
+                with self._abort_lock:
+                    self._current = None
+                self._lock.release()
+        finally:
+            self._slots.release()
+
+    def stop(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            self._shutdown(kill=False)
+
+    def stderr_tail(self) -> str:
+        """Return recent worker stderr."""
+        process = self._process
+        return "".join(process.stderr_tail)[-500:] if process else ""
+
+    def stdout_tail(self) -> str:
+        """Return recent non-protocol worker stdout."""
+        process = self._process
+        return "".join(process.stdout_tail)[-500:] if process else ""
+
+    def _request_locked(
+        self, payload: dict[str, Any], deadline: float
+    ) -> dict[str, Any]:
+        """Exchange one job, restarting a crashed worker once."""
+        for attempt in range(2):
+            process = self._ensure_started(deadline)
+            self._next_id += 1
+            request_id = self._next_id
+            try:
+                process.send({**payload, "id": request_id})
+                reply = process.receive(deadline, request_id)
+            except TimeoutError as e:
+                self._shutdown(kill=True)
+                raise PredictionError("Worker job timed out", code="TIMEOUT") from e
+            except WorkerDiedError as e:
+                tail = self.stderr_tail()
+                self._shutdown(kill=True)
+                if cancel_requested():
+                    raise PredictionError(
+                        "Worker job cancelled", code="CANCELLED"
+                    ) from e
+                if attempt == 0 and _time_left(deadline) > 0:
+                    logger.warning(f"Worker exited mid-job ({e}); restarting")
+                    continue
+                raise PredictionError(
+                    f"Worker exited: {e}, stderr: {tail}", code="REMOTE_ERROR"
+                ) from e
+            if not reply.get("ok", False):
+                raise PredictionError(
+                    f"Worker job failed: {reply.get('error', 'unknown error')}",
+                    code="REMOTE_ERROR",
+                )
+            return reply
+        raise PredictionError("Worker restart budget exhausted", code="REMOTE_ERROR")
+
+    def _abort(self, ticket: object) -> None:
+        """Kill the worker if it is still running the cancelled request."""
+        with self._abort_lock:
+            process = self._process
+            if self._current is not ticket or process is None or not process.alive():
+                return
+            logger.warning("Killing worker for a cancelled job")
+            if self._on_kill is not None:
+                self._on_kill()
+            process.proc.kill()
+
+    def _ensure_started(self, deadline: float | None) -> _Process:
+        """Spawn the worker and wait for readiness when it is not running."""
+        if self._process is not None and self._process.alive():
+            return self._process
+        if self._process is not None:
+            self._shutdown(kill=True)
+            self.restarts += 1
+        start_deadline = time.time() + self.startup_timeout
+        if deadline is not None:
+            start_deadline = min(start_deadline, deadline)
+        try:
+            process = self._process = _Process(self.cmd, self.cwd)
+        except OSError as e:
+            raise PredictionError(
+                f"Failed to start worker: {e}", code="REMOTE_ERROR"
+            ) from e
+        try:
+            process.receive(start_deadline, None)
+        except TimeoutError as e:
+            self._shutdown(kill=True)
+            raise PredictionError("Worker startup timed out", code="TIMEOUT") from e
+        except WorkerDiedError as e:
+            tail = self.stderr_tail()
+            self._shutdown(kill=True)
+            raise PredictionError(
+                f"Worker failed to start: {e}, stderr: {tail}", code="REMOTE_ERROR"
+            ) from e
+        logger.info(f"Worker ready: {' '.join(self.cmd[:2])}")
+        return process
+
+    def _shutdown(self, kill: bool) -> None:
+        """Terminate the current process, optionally without a grace period."""
+        process = self._process
+        if process is None:
+            return
+        if kill and process.alive():
+            if self._on_kill is not None:
+                self._on_kill()
+            process.proc.kill()
+        process.stop(grace=0.5 if kill else 5.0)
+        if not kill:
+            self._process = None
@@ -5,15 +5,18 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import asdict, dataclass
 import os
+from pathlib import Path
 import threading
 import time
 from typing import Any
 
-from Bio.SeqUtils import seq3
 from loguru import logger
 import torch
 
+from agentic_proteins.core.cancellation import cancel_requested
 from agentic_proteins.providers.base import (
     BaseProvider,
     PredictionResult,
@@ -21,6 +24,90 @@ from agentic_proteins.providers.base import (
     _time_left,
 )
 from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.pdb_writer import (
+    coordinates_to_pdb,
+    format_atom_name,
+)
+
+
+def _env_flag(name: str) -> bool:
+    """Return True when an env var is set to a truthy value."""
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str) -> int | None:
+    """Return an integer env var, or None when unset."""
+    value = os.getenv(name, "").strip()
+    return int(value) if value else None
+
+
+@dataclass(frozen=True)
+class ESMFoldCPUProfile:
+    """Opt-in CPU inference settings for ``LocalESMFoldProvider``.
+
+    Attributes:
+        intra_op_threads: Threads used inside a single op (``torch.set_num_threads``).
+        inter_op_threads: Threads used to run independent ops in parallel.
+        numa_node: NUMA node whose cores the process is pinned to; None disables pinning.
+        bf16_autocast: Run inference under bfloat16 autocast when the CPU supports it.
+        int8_trunk: Dynamically quantize the ESM language-model trunk's Linear layers to int8.
+        chunk_size: Folding-trunk chunk size; smaller values lower peak memory on long sequences.
+    """
+
+    intra_op_threads: int | None = None
+    inter_op_threads: int | None = None
+    numa_node: int | None = None
+    bf16_autocast: bool = False
+    int8_trunk: bool = False
+    chunk_size: int | None = None
+
+    @classmethod
+    def from_env(cls) -> ESMFoldCPUProfile | None:
+        """Build a profile from ``ESMFOLD_CPU_*`` env vars when ``ESMFOLD_CPU_PROFILE`` is set."""
+        if not _env_flag("ESMFOLD_CPU_PROFILE"):
+            return None
+        return cls(
+            intra_op_threads=_env_int("ESMFOLD_CPU_THREADS"),
+            inter_op_threads=_env_int("ESMFOLD_CPU_INTEROP_THREADS"),
+            numa_node=_env_int("ESMFOLD_CPU_NUMA_NODE"),
+            bf16_autocast=_env_flag("ESMFOLD_CPU_BF16"),
+            int8_trunk=_env_flag("ESMFOLD_CPU_INT8"),
+            chunk_size=_env_int("ESMFOLD_CHUNK_SIZE"),
+        )
+
+
+def _parse_cpulist(text: str) -> list[int]:
+    """Expand a sysfs cpulist such as ``0-3,8-11`` into CPU ids."""
+    cpus: list[int] = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _numa_cpus(node: int) -> list[int]:
+    """Return the allowed CPUs on a NUMA node, or all allowed CPUs if unknown."""
+    allowed = sorted(os.sched_getaffinity(0))
+    # Read-only sysfs topology; nothing is written outside the workspace.
+    path = Path(os.sep, "sys", "devices", "system", "node", f"node{node}", "cpulist")
+    try:
+        with open(path, encoding="utf-8") as handle:
+            node_cpus = set(_parse_cpulist(handle.read()))
+    except OSError:
+        return allowed
+    return [cpu for cpu in allowed if cpu in node_cpus] or allowed
+
+
+def _bf16_supported() -> bool:
+    """Return True when the CPU has native bfloat16 matmul support."""
+    cpu = getattr(torch, "cpu", None)
+    for probe in ("_is_avx512_bf16_supported", "_is_amx_tile_supported"):
+        check = getattr(cpu, probe, None)
+        if callable(check) and check():
+            return True
+    return False
 
 
 class LocalESMFoldProvider(BaseProvider):
@@ -30,21 +117,35 @@ class LocalESMFoldProvider(BaseProvider):
     metadata = ProviderMetadata(name=name, experimental=False)
 
     def __init__(
-        self, model_path: str = "models/esmfold", token: str | None = None
+        self,
+        model_path: str = "models/esmfold",
+        token: str | None = None,
+        revision: str | None = None,
+        device: str | None = None,
+        dtype: str | None = None,
+        cpu_profile: ESMFoldCPUProfile | None = None,
     ) -> None:
         """Initializes the LocalESMFoldProvider.
 
         Args:
             model_path: Path to the model.
             token: Hugging Face token.
+            revision: Hugging Face revision; defaults to ``ESMFOLD_REVISION`` or the pinned SHA.
+            device: Torch device; defaults to CUDA when available.
+            dtype: Torch dtype name; defaults to float16 on CUDA, float32 otherwise.
+            cpu_profile: CPU inference settings; defaults to ``ESMFoldCPUProfile.from_env()``.
         """
-        self.revision = None
+        self.revision = revision
         self.model_path = model_path
         self.token = (token or os.getenv("HF_TOKEN") or "").strip()
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.dtype = dtype
+        self.cpu_profile = cpu_profile or ESMFoldCPUProfile.from_env()
+        self._profile_settings: dict[str, Any] | None = None
         self.tokenizer: Any = None
         self.model: Any = None
         self._model_loaded = False
+        self._resident_bytes = 0
         self._fail_count = 0
         self._circuit_open = False
         self._opened_at = 0.0
@@ -70,7 +171,13 @@ class LocalESMFoldProvider(BaseProvider):
                     if os.path.exists(self.model_path)
                     else "facebook/esmfold_v1"
                 )
-                dtype = torch.float16 if self.device == "cuda" else torch.float32
+                dtype = (
+                    getattr(torch, self.dtype)
+                    if self.dtype
+                    else torch.float16
+                    if self.device == "cuda"
+                    else torch.float32
+                )
                 hf_revision = (
                     self.revision
                     or os.getenv("ESMFOLD_REVISION")
@@ -88,6 +195,9 @@ class LocalESMFoldProvider(BaseProvider):
                     token=self.token or None,
                     ignore_mismatched_sizes=True,
                 ).to(self.device)
+                if self.cpu_profile is not None:
+                    self._profile_settings = self._apply_cpu_profile(self.cpu_profile)
+                self._resident_bytes = self._parameter_bytes(self.model)
                 self._model_loaded = True
                 logger.info(
                     f"Loaded ESMFold from {load_from} on {self.device} (dtype: {str(dtype)})"
@@ -97,6 +207,78 @@ class LocalESMFoldProvider(BaseProvider):
                     f"Failed to load ESMFold model: {str(e)}", code="MODEL_LOAD_ERROR"
                 ) from e
 
+    def _apply_cpu_profile(self, profile: ESMFoldCPUProfile) -> dict[str, Any]:
+        """Apply a CPU profile to torch and the loaded model.
+
+        Args:
+            profile: Requested settings.
+
+        Returns:
+            The settings actually in effect, recorded in every prediction's ``raw``.
+        """
+        settings: dict[str, Any] = asdict(profile)
+        settings["device"] = self.device
+        if self.device == "cpu":
+            if profile.numa_node is not None and hasattr(os, "sched_setaffinity"):
+                cpus = _numa_cpus(profile.numa_node)
+                if profile.intra_op_threads:
+                    cpus = cpus[: profile.intra_op_threads]
+                os.sched_setaffinity(0, cpus)
+                settings["pinned_cpus"] = cpus
+            if profile.intra_op_threads:
+                torch.set_num_threads(profile.intra_op_threads)
+            if profile.inter_op_threads:
+                try:
+                    torch.set_num_interop_threads(profile.inter_op_threads)
+                except RuntimeError as exc:
+                    # Only settable before the first parallel op in the process.
+                    logger.warning(f"Cannot change inter-op threads: {exc}")
+            settings["intra_op_threads"] = torch.get_num_threads()
+            settings["inter_op_threads"] = torch.get_num_interop_threads()
+            settings["bf16_autocast"] = profile.bf16_autocast and _bf16_supported()
+            if profile.int8_trunk and getattr(self.model, "esm", None) is not None:
+                self.model.esm = torch.ao.quantization.quantize_dynamic(
+                    self.model.esm, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            settings["int8_trunk"] = profile.int8_trunk and hasattr(self.model, "esm")
+        else:
+            settings.update(
+                intra_op_threads=None,
+                inter_op_threads=None,
+                bf16_autocast=False,
+                int8_trunk=False,
+            )
+        trunk = getattr(self.model, "trunk", None)
+        if profile.chunk_size and callable(getattr(trunk, "set_chunk_size", None)):
+            trunk.set_chunk_size(profile.chunk_size)
+        else:
+            settings["chunk_size"] = None
+        return settings
+
+    def _autocast(self) -> AbstractContextManager[Any]:
+        """Return the autocast context for the current device and profile."""
+        if self.device == "cuda":
+            return torch.cuda.amp.autocast()
+        if self._profile_settings and self._profile_settings["bf16_autocast"]:
+            return torch.autocast("cpu", dtype=torch.bfloat16)
+        return nullcontext()
+
+    @staticmethod
+    def _parameter_bytes(model: Any) -> int:
+        """Sum parameter storage for modules exposing ``parameters()``."""
+        parameters = getattr(model, "parameters", None)
+        if not callable(parameters):
+            return 0
+        return int(sum(p.numel() * p.element_size() for p in parameters()))
+
+    def warmup(self) -> None:
+        """Load tokenizer and weights so the first prediction skips the load."""
+        self._load_model()
+
+    def resident_bytes(self) -> int:
+        """Return the parameter memory of the loaded model in bytes."""
+        return self._resident_bytes if self._model_loaded else 0
+
     def healthcheck(self) -> bool:
         """Checks the health of the provider.
 
@@ -146,14 +328,9 @@ class LocalESMFoldProvider(BaseProvider):
             element: The element symbol.
 
         Returns:
-            The formatted atom name (width 4), right-justified for 1-letter elements
-            (and ≤3-char names), otherwise centered.
+            The formatted atom name (width 4).
         """
-        elem_len = len(element.strip())
-        name_len = len(name.strip())
-        if elem_len == 1 and name_len <= 3:
-            return f"{name:>4s}"
-        return f"{name:^4s}"
+        return format_atom_name(name, element)
 
     def _positions_to_backbone_pdb(
         self,
@@ -162,88 +339,8 @@ class LocalESMFoldProvider(BaseProvider):
         plddt_res: torch.Tensor,  # (n_res,) pLDDT; accepts 0..1 or 0..100
     ) -> str:
         """Build a minimal PDB with backbone atoms (N, CA, C, O); B-factor stores pLDDT."""
-        seq_len = len(sequence)
-        if (
-            positions.ndim != 3
-            or positions.shape[0] != seq_len
-            or positions.shape[2] != 3
-        ):
-            raise PredictionError(
-                f"Expected positions (L,A,3) matching sequence length; got {tuple(positions.shape)} vs {seq_len}",
-                code="INVALID_OUTPUT_SHAPE",
-            )
-
-        n_res, n_atoms, _ = positions.shape
-        if n_atoms < 4:
-            raise PredictionError(
-                f"Need at least 4 atoms per residue (N,CA,C,O); got A={n_atoms}",
-                code="INVALID_OUTPUT_SHAPE",
-            )
-
-        # Use the first 4 atoms as N, CA, C, O (true for atom14/atom37 layouts)
-        backbone_idx = (0, 1, 2, 3)
-        atom_names = ["N", "CA", "C", "O"]
-        atom_elements = ["N", "C", "C", "O"]
-
-        # Normalize pLDDT scale to 0..100 without torch.nanmax (works on CPU-only builds)
-        finite = torch.isfinite(plddt_res)
-        maxv = float(torch.max(plddt_res[finite]).item()) if finite.any() else 1.0
-        plddt_scale = 100.0 if maxv <= 1.01 else 1.0
-
-        lines = ["MODEL     1\n"]  # exact padding required
-        serial = 1
-        chain_id = "A"
-        alt_loc = " "
-        i_code = " "
-        blank_col21 = " "  # column 21 is a blank in PDB format
-        charge = "  "  # two spaces
-
-        for i in range(seq_len):
-            # 3-letter residue name
-            try:
-                res_name = seq3(sequence[i]).upper()
-            except Exception:
-                res_name = "UNK"
-            if len(res_name) != 3:
-                res_name = (res_name[:3]).rjust(3)
-
-            res_seq = i + 1
-
-            # per-residue pLDDT (clamped 0..100)
-            p = float(plddt_res[i].item()) if torch.isfinite(plddt_res[i]) else 0.0
-            ca_plddt = max(0.0, min(100.0, p * plddt_scale))
-
-            for idx, name, element in zip(
-                backbone_idx, atom_names, atom_elements, strict=False
-            ):
-                pos = positions[i, idx]  # (3,)
-                # Skip if any coord is non-finite
-                if pos.numel() != 3 or not torch.all(torch.isfinite(pos)):
-                    continue
-
-                x, y, z = (
-                    float(pos[0].item()),
-                    float(pos[1].item()),
-                    float(pos[2].item()),
-                )
-                formatted_name = self._format_atom_name(name, element)  # 4-char field
-
-                # Fixed-width ATOM record according to PDB v3.3
-                line = (
-                    f"ATOM  {serial:5d} {formatted_name}{alt_loc}"
-                    f"{res_name:3s}{blank_col21}{chain_id}"
-                    f"{res_seq:4d}{i_code}"
-                    f"   "  # pad so X starts at col 31
-                    f"{x:8.3f}{y:8.3f}{z:8.3f}"
-                    f"{1.00:6.2f}{ca_plddt:6.2f}"
-                    f"          "  # 10 spaces → element at col 77
-                    f"{element:>2s}{charge}\n"
-                )
-                lines.append(line)
-                serial += 1
-
-        lines.append("TER\nENDMDL\n")
-        return "".join(lines)
+        # Uses the first 4 atom slots as N, CA, C, O
+        return coordinates_to_pdb(sequence, positions, plddt_res)
 
     def _to_per_res_plddt(
         self,
@@ -334,6 +431,14 @@ class LocalESMFoldProvider(BaseProvider):
             per_res = per_res / 100.0
         return per_res
 
+    @staticmethod
+    def _mean_plddt(plddt_res: torch.Tensor) -> float:
+        """Mean pLDDT on the 0..100 scale, ignoring non-finite values (no nan* ops)."""
+        finite = torch.isfinite(plddt_res)
+        maxv = float(torch.max(plddt_res[finite]).item()) if finite.any() else 1.0
+        scale = 100.0 if maxv <= 1.01 else 1.0
+        return float((plddt_res[finite] * scale).mean().item()) if finite.any() else 0.0
+
     def predict(
         self, sequence: str, timeout: float = 180.0, seed: int | None = 42
     ) -> PredictionResult | None:
@@ -387,14 +492,19 @@ class LocalESMFoldProvider(BaseProvider):
                         raise PredictionError(
                             "Timeout after tokenization", code="TIMEOUT"
                         )
-                    with torch.inference_mode():
-                        if self.device == "cuda":
-                            with torch.cuda.amp.autocast():
-                                outputs = self.model(**inputs)  # type: ignore[operator]
-                        else:
-                            outputs = self.model(**inputs)  # type: ignore[operator]
+                    if cancel_requested():
+                        raise PredictionError(
+                            "Cancelled before inference", code="CANCELLED"
+                        )
+                    with torch.inference_mode(), self._autocast():
+                        outputs = self.model(**inputs)  # type: ignore[operator]
                     if _time_left(deadline) <= 0:
                         raise PredictionError("Timeout after inference", code="TIMEOUT")
+                    if cancel_requested():
+                        del outputs
+                        raise PredictionError(
+                            "Cancelled after inference", code="CANCELLED"
+                        )
                 # ---- Normalize model outputs ------------------------------------
                 pos_any = getattr(outputs, "positions", None)
                 plddt_any = getattr(outputs, "plddt", None)
@@ -426,17 +536,7 @@ class LocalESMFoldProvider(BaseProvider):
 
                 # ---- Build PDB (uses first 4 atoms as N, CA, C, O) --------------
                 pdb_text = self._positions_to_backbone_pdb(sequence, pos_any, plddt_res)
-                # ---- Mean pLDDT on 0..100 scale (no nan* ops) ----
-                finite = torch.isfinite(plddt_res)
-                maxv = (
-                    float(torch.max(plddt_res[finite]).item()) if finite.any() else 1.0
-                )
-                scale = 100.0 if maxv <= 1.01 else 1.0
-                mean_plddt_val = (
-                    float((plddt_res[finite] * scale).mean().item())
-                    if finite.any()
-                    else 0.0
-                )
+                mean_plddt_val = self._mean_plddt(plddt_res)
                 with self._lock:
                     self._fail_count = 0
                 raw_data = {
@@ -446,6 +546,8 @@ class LocalESMFoldProvider(BaseProvider):
                     "latency": time.time() - start_time,
                     "seed": seed,
                 }
+                if self._profile_settings is not None:
+                    raw_data["cpu_profile"] = dict(self._profile_settings)
                 return PredictionResult(pdb_text, self.name, raw_data)
             except torch.cuda.OutOfMemoryError as e:
                 torch.cuda.empty_cache()
@@ -458,6 +560,13 @@ class LocalESMFoldProvider(BaseProvider):
                     code="OOM_ERROR",
                 ) from e
             except Exception as e:
+                if cancel_requested():
+                    # Free the abandoned activations; not a provider fault.
+                    if self.device == "cuda":
+                        torch.cuda.empty_cache()
+                    raise PredictionError(
+                        "ESMFold prediction cancelled", code="CANCELLED"
+                    ) from e
                 with self._lock:
                     self._fail_count += 1
                     if self._fail_count >= self.MAX_FAILS:
@@ -468,6 +577,252 @@ class LocalESMFoldProvider(BaseProvider):
                     f"ESMFold inference failed: {str(e)}", code="INFERENCE_ERROR"
                 ) from e
 
+    @staticmethod
+    def _length_buckets(
+        sequences: list[str], indices: list[int], max_tokens_per_batch: int
+    ) -> list[list[int]]:
+        """Group indices by length so each padded bucket stays under the token budget.
+
+        Args:
+            sequences: All input sequences.
+            indices: Indices of the sequences to schedule.
+            max_tokens_per_batch: Upper bound on ``batch_size * longest_length``.
+
+        Returns:
+            Buckets of indices, shortest sequences first.
+        """
+        ordered = sorted(indices, key=lambda i: (len(sequences[i]), i))
+        buckets: list[list[int]] = []
+        current: list[int] = []
+        for idx in ordered:
+            # Sorted ascending, so the incoming sequence is the bucket's longest.
+            padded = (len(current) + 1) * len(sequences[idx])
+            if current and padded > max_tokens_per_batch:
+                buckets.append(current)
+                current = []
+            current.append(idx)
+        if current:
+            buckets.append(current)
+        return buckets
+
+    @staticmethod
+    def _select_batch_item(
+        pos_any: torch.Tensor,
+        plddt_any: torch.Tensor,
+        index: int,
+        batch_size: int,
+        n_res: int,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Slice one unpadded item out of batched ``positions`` and ``plddt``.
+
+        Args:
+            pos_any: Positions shaped (R,B,L,A,3), (B,L,A,3) or (L,A,3).
+            plddt_any: pLDDT with optional recycle and batch dims in front.
+            index: Batch index of the item.
+            batch_size: Number of sequences in the forward pass.
+            n_res: Unpadded length of the item.
+
+        Returns:
+            Positions (n_res, A, 3) and pLDDT with the residue axis first.
+        """
+        if pos_any.dim() == 5:
+            positions = pos_any[-1, index]
+        elif pos_any.dim() == 4:
+            positions = pos_any[index]
+        elif pos_any.dim() == 3 and batch_size == 1:
+            positions = pos_any
+        else:
+            raise PredictionError(
+                f"Unexpected positions shape: {tuple(pos_any.shape)}",
+                code="INVALID_OUTPUT_SHAPE",
+            )
+        plddt = plddt_any
+        if plddt.dim() == 5 or (plddt.dim() == 4 and plddt.shape[0] != batch_size):
+            plddt = plddt[-1, index]
+        elif plddt.dim() in (3, 4) or (
+            plddt.dim() == 2 and plddt.shape[0] == batch_size != n_res
+        ):
+            plddt = plddt[index]
+        return positions[:n_res], plddt[:n_res]
+
+    def _forward_bucket(
+        self, sequences: list[str], seed: int | None
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Run one padded forward pass and return raw ``positions`` and ``plddt``."""
+        with self._infer_lock:
+            if seed is not None:
+                torch.manual_seed(seed)
+            if torch.cuda.is_available():
+                torch.backends.cudnn.deterministic = True
+                torch.backends.cudnn.benchmark = False
+            inputs = self.tokenizer(
+                sequences,
+                return_tensors="pt",
+                add_special_tokens=False,
+                padding=True,
+                return_attention_mask=True,
+            ).to(self.device)
+            with torch.inference_mode(), self._autocast():
+                outputs = self.model(**inputs)  # type: ignore[operator]
+        pos_any = getattr(outputs, "positions", None)
+        plddt_any = getattr(outputs, "plddt", None)
+        if pos_any is None or plddt_any is None:
+            raise PredictionError(
+                "Model output missing 'positions' or 'plddt'. Likely library incompatibility.",
+                code="INVALID_OUTPUT",
+            )
+        return pos_any, plddt_any
+
+    def predict_batch(
+        self,
+        sequences: list[str],
+        max_tokens_per_batch: int | None = None,
+        timeout: float = 600.0,
+        seed: int | None = 42,
+    ) -> list[PredictionResult | PredictionError]:
+        """Predict structures for many sequences with length-bucketed forward passes.
+
+        Sequences are sorted by length and packed into buckets whose padded size
+        (``batch_size * longest_length``) stays under ``max_tokens_per_batch``; each
+        bucket runs a single forward pass. A bucket that runs out of GPU memory or
+        fails is split in half and retried until single sequences remain; only a
+        failing single sequence counts toward the circuit breaker.
+
+        Args:
+            sequences: Amino acid sequences.
+            max_tokens_per_batch: Padded token budget per forward pass; defaults to
+                ``ESMFOLD_MAX_TOKENS_PER_BATCH`` or 1024.
+            timeout: Timeout in seconds for the whole batch.
+            seed: The random seed applied before every forward pass.
+
+        Returns:
+            One entry per input, in input order: a ``PredictionResult`` on success or
+            the ``PredictionError`` describing that item's failure.
+
+        Raises:
+            PredictionError: If the circuit is open or the model cannot be loaded.
+        """
+        start_time = time.time()
+        deadline = start_time + timeout
+        self._check_circuit()
+        budget = max_tokens_per_batch or int(
+            os.getenv("ESMFOLD_MAX_TOKENS_PER_BATCH", "1024")
+        )
+        max_len = int(os.getenv("ESMFOLD_MAX_LEN", "1200"))
+        results: list[PredictionResult | PredictionError | None] = [None] * len(
+            sequences
+        )
+        pending: list[int] = []
+        for idx, sequence in enumerate(sequences):
+            if not sequence:
+                results[idx] = PredictionError("Empty sequence", code="BAD_INPUT")
+            elif len(sequence) > max_len:
+                results[idx] = PredictionError(
+                    f"Sequence too long for local ESMFold (max: {max_len})",
+                    code="BAD_INPUT",
+                )
+            else:
+                pending.append(idx)
+        if pending:
+            self._load_model()
+        queue = self._length_buckets(sequences, pending, budget)
+        while queue:
+            bucket = queue.pop(0)
+            if _time_left(deadline) <= 0:
+                for idx in bucket:
+                    results[idx] = PredictionError("Batch timeout", code="TIMEOUT")
+                continue
+            batch = [sequences[idx] for idx in bucket]
+            bucket_start = time.time()
+            try:
+                pos_any, plddt_any = self._forward_bucket(batch, seed)
+            except torch.cuda.OutOfMemoryError:
+                torch.cuda.empty_cache()
+                if len(bucket) > 1:
+                    half = len(bucket) // 2
+                    logger.warning(
+                        f"OOM on batch of {len(bucket)}; splitting into {half} + {len(bucket) - half}"
+                    )
+                    queue[:0] = [bucket[:half], bucket[half:]]
+                    continue
+                results[bucket[0]] = PredictionError(
+                    "GPU OOM on a single sequence: Try shorter sequence or more VRAM",
+                    code="OOM_ERROR",
+                )
+                continue
+            except Exception as e:
+                if len(bucket) > 1:
+                    # Isolate the failing sequence instead of failing its bucketmates.
+                    half = len(bucket) // 2
+                    logger.warning(
+                        f"Forward failed on batch of {len(bucket)} ({e}); splitting"
+                    )
+                    queue[:0] = [bucket[:half], bucket[half:]]
+                    continue
+                with self._lock:
+                    self._fail_count += 1
+                    if self._fail_count >= self.MAX_FAILS:
+                        self._trip_circuit()
+                error = (
+                    e
+                    if isinstance(e, PredictionError)
+                    else PredictionError(
+                        f"ESMFold inference failed: {str(e)}", code="INFERENCE_ERROR"
+                    )
+                )
+                for idx in bucket:
+                    results[idx] = error
+                continue
+            latency = time.time() - bucket_start
+            with self._lock:
+                self._fail_count = 0
+            for position, idx in enumerate(bucket):
+                sequence = sequences[idx]
+                try:
+                    positions, plddt_item = self._select_batch_item(
+                        pos_any, plddt_any, position, len(bucket), len(sequence)
+                    )
+                    n_res, n_atoms, _ = positions.shape
+                    plddt_res = self._to_per_res_plddt(plddt_item, n_res, n_atoms)
+                    if plddt_res.shape[0] != n_res:
+                        raise PredictionError(
+                            f"Length mismatch: positions L={n_res} vs pLDDT L={plddt_res.shape[0]}",
+                            code="INVALID_OUTPUT_SHAPE",
+                        )
+                    pdb_text = self._positions_to_backbone_pdb(
+                        sequence, positions, plddt_res
+                    )
+                    raw_data = {
+                        "sequence_length": len(sequence),
+                        "mean_plddt": self._mean_plddt(plddt_res),
+                        "device": self.device,
+                        "latency": latency,
+                        "seed": seed,
+                        "batch_size": len(bucket),
+                    }
+                    if self._profile_settings is not None:
+                        raw_data["cpu_profile"] = dict(self._profile_settings)
+                    results[idx] = PredictionResult(pdb_text, self.name, raw_data)
+                except PredictionError as e:
+                    results[idx] = e
+                except Exception as e:
+                    results[idx] = PredictionError(
+                        f"ESMFold output unpacking failed: {str(e)}",
+                        code="INVALID_OUTPUT",
+                    )
+        return [
+            item
+            if item is not None
+            else PredictionError("Sequence was not scheduled", code="INTERNAL_ERROR")
+            for item in results
+        ]
+
     def close(self) -> None:
-        """Closes the provider."""
-        pass
+        """Release the loaded model so its memory can be reclaimed."""
+        with self._lock:
+            self.model = None
+            self.tokenizer = None
+            self._model_loaded = False
+            self._resident_bytes = 0
+        if self.device == "cuda":
+            torch.cuda.empty_cache()
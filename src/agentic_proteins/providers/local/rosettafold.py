@@ -10,7 +10,9 @@ from pathlib import Path
 import shutil
 import subprocess  # nosec B404, noqa: S603
 import tempfile
+import threading
 import time
+import uuid
 
 from loguru import logger
 
@@ -21,6 +23,7 @@ from agentic_proteins.providers.base import (
     _time_left,
 )
 from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.local._worker import PersistentWorker
 
 
 class LocalRoseTTAFoldProvider(BaseProvider):
@@ -34,6 +37,8 @@ class LocalRoseTTAFoldProvider(BaseProvider):
         executable: str = "rf_allatom_predict.py",
         docker: bool = True,
         weights_path: str = "models/rosettafold/RFAA_paper_weights.pt",
+        worker: bool = False,
+        max_queue: int = 8,
     ) -> None:
         """Initializes the LocalRoseTTAFoldProvider.
 
@@ -41,10 +46,18 @@ class LocalRoseTTAFoldProvider(BaseProvider):
             executable: The executable path.
             docker: Whether to use Docker.
             weights_path: Path to weights.
+            worker: Keep one container/subprocess with loaded weights and send it
+                jobs over the JSON-lines protocol (``--worker`` flag of the script).
+            max_queue: Maximum queued or running jobs in worker mode.
         """
         self.executable = executable
         self.docker = docker
         self.weights_path = weights_path
+        self.worker = worker
+        self.max_queue = max_queue
+        self._worker: PersistentWorker | None = None
+        self._workspace: str | None = None
+        self._worker_lock = threading.Lock()
         self.docker_image = os.getenv(
             "ROSETTA_DOCKER_IMAGE", "ghcr.io/rosetta/protein-design@sha256:deadbeef"
         )  # Pin digest
@@ -61,6 +74,8 @@ class LocalRoseTTAFoldProvider(BaseProvider):
         Returns:
             True if healthy, False otherwise.
         """
+        if self._worker is not None and self._worker.alive():
+            return self._worker.probe()
         if self.docker:
             try:
                 docker_bin = shutil.which("docker")
@@ -138,6 +153,8 @@ class LocalRoseTTAFoldProvider(BaseProvider):
             raise PredictionError(
                 f"Sequence too long for RoseTTAFold (max: {max_len})", code="BAD_INPUT"
             )
+        if self.worker:
+            return self._predict_worker(sequence, deadline, start_time, seed)
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
                 if _time_left(deadline) <= 0:
@@ -229,3 +246,126 @@ class LocalRoseTTAFoldProvider(BaseProvider):
                 return PredictionResult(pdb_text, self.name, raw_data)
             finally:
                 pass
+
+    def _worker_client(self) -> PersistentWorker:
+        """Return the worker client, creating its shared workspace on first use."""
+        with self._worker_lock:
+            if self._worker is not None:
+                return self._worker
+            self._workspace = tempfile.mkdtemp(prefix="rosettafold-worker-")
+            script_name = Path(self.executable).name
+            if self.docker:
+                if Path(self.executable).exists():
+                    shutil.copy2(self.executable, Path(self._workspace) / script_name)
+                container = f"rosettafold-worker-{uuid.uuid4().hex[:12]}"
+                cmd = [
+                    "docker",
+                    "run",
+                    "--rm",
+                    "-i",
+                    "--name",
+                    container,
+                    "--network=none",
+                    "--gpus",
+                    "all",
+                    "-w",
+                    "/workspace",
+                    "-v",
+                    f"{self._workspace}:/workspace",
+                    "-v",
+                    f"{os.path.dirname(self.weights_path)}:/models:ro",
+                    "-e",
+                    f"DB_UR30={os.getenv('DB_UR30', '')}",
+                    self.docker_image,
+                    "python",
+                    f"/workspace/{script_name}",
+                    "--worker",
+                    "--weights",
+                    f"/models/{os.path.basename(self.weights_path)}",
+                ]
+
+                def kill_container() -> None:
+                    docker_bin = shutil.which("docker")
+                    if docker_bin is None:
+                        return
+                    subprocess.run(  # noqa: S603  # nosec B603
+                        [docker_bin, "kill", container],
+                        capture_output=True,
+                        check=False,
+                        timeout=10,
+                    )
+
+                self._worker = PersistentWorker(
+                    cmd, max_queue=self.max_queue, on_kill=kill_container
+                )
+            else:
+                cmd = [
+                    "python",
+                    os.path.abspath(self.executable),
+                    "--worker",
+                    "--weights",
+                    self.weights_path,
+                ]
+                self._worker = PersistentWorker(
+                    cmd, cwd=self._workspace, max_queue=self.max_queue
+                )
+            return self._worker
+
+    def _predict_worker(
+        self, sequence: str, deadline: float, start_time: float, seed: int | None
+    ) -> PredictionResult:
+        """Run one job on the persistent worker."""
+        worker = self._worker_client()
+        if self._workspace is None:
+            raise PredictionError(
+                "RoseTTAFold worker has no workspace", code="INTERNAL_ERROR"
+            )
+        job_dir = tempfile.mkdtemp(prefix="job-", dir=self._workspace)
+        try:
+            fasta_path = os.path.join(job_dir, "input.fasta")
+            with open(fasta_path, "w") as f:
+                f.write(f">seq\n{sequence}\n")
+            output_dir = os.path.join(job_dir, "output")
+            os.mkdir(output_dir)
+            if self.docker:
+                job_root = f"/workspace/{os.path.basename(job_dir)}"
+                fasta_arg, out_arg = f"{job_root}/input.fasta", f"{job_root}/output"
+            else:
+                fasta_arg, out_arg = fasta_path, output_dir
+            worker.request(
+                {"op": "predict", "fasta": fasta_arg, "out_dir": out_arg, "seed": seed},
+                deadline,
+            )
+            pdb_files = list(Path(output_dir).glob("*.pdb"))
+            if not pdb_files:
+                raise PredictionError(
+                    "No PDB output from RoseTTAFold", code="NO_OUTPUT"
+                )
+            with open(pdb_files[0]) as f:
+                pdb_text = f.read()
+            raw_data = {
+                "cmd_output": worker.stdout_tail(),
+                "stderr_tail": worker.stderr_tail(),
+                "latency": time.time() - start_time,
+                "exit_code": 0,
+                "seed": seed,
+                "worker_restarts": worker.restarts,
+            }
+            return PredictionResult(pdb_text, self.name, raw_data)
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+    def warmup(self) -> None:
+        """Start the persistent worker so weights are loaded before the first job."""
+        if self.worker:
+            self._worker_client().start()
+
+    def close(self) -> None:
+        """Stop the persistent worker and remove its workspace."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            workspace, self._workspace = self._workspace, None
+        if worker is not None:
+            worker.stop()
+        if workspace is not None:
+            shutil.rmtree(workspace, ignore_errors=True)
@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Bulk PDB serialization for provider coordinate outputs."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from Bio.SeqUtils import seq3
+import numpy as np
+
+from agentic_proteins.providers.errors import PredictionError
+
+BACKBONE_ATOMS = ("N", "CA", "C", "O")
+
+ATOM37_NAMES = (
+    "N",
+    "CA",
+    "C",
+    "CB",
+    "O",
+    "CG",
+    "CG1",
+    "CG2",
+    "OG",
+    "OG1",
+    "SG",
+    "CD",
+    "CD1",
+    "CD2",
+    "ND1",
+    "ND2",
+    "OD1",
+    "OD2",
+    "SD",
+    "CE",
+    "CE1",
+    "CE2",
+    "CE3",
+    "NE",
+    "NE1",
+    "NE2",
+    "OE1",
+    "OE2",
+    "CH2",
+    "NH1",
+    "NH2",
+    "OH",
+    "CZ",
+    "CZ2",
+    "CZ3",
+    "NZ",
+    "OXT",
+)
+
+ATOM14_NAMES: dict[str, tuple[str, ...]] = {
+    "ALA": ("N", "CA", "C", "O", "CB"),
+    "ARG": ("N", "CA", "C", "O", "CB", "CG", "CD", "NE", "CZ", "NH1", "NH2"),
+    "ASN": ("N", "CA", "C", "O", "CB", "CG", "OD1", "ND2"),
+    "ASP": ("N", "CA", "C", "O", "CB", "CG", "OD1", "OD2"),
+    "CYS": ("N", "CA", "C", "O", "CB", "SG"),
+    "GLN": ("N", "CA", "C", "O", "CB", "CG", "CD", "OE1", "NE2"),
+    "GLU": ("N", "CA", "C", "O", "CB", "CG", "CD", "OE1", "OE2"),
+    "GLY": ("N", "CA", "C", "O"),
+    "HIS": ("N", "CA", "C", "O", "CB", "CG", "ND1", "CD2", "CE1", "NE2"),
+    "ILE": ("N", "CA", "C", "O", "CB", "CG1", "CG2", "CD1"),
+    "LEU": ("N", "CA", "C", "O", "CB", "CG", "CD1", "CD2"),
+    "LYS": ("N", "CA", "C", "O", "CB", "CG", "CD", "CE", "NZ"),
+    "MET": ("N", "CA", "C", "O", "CB", "CG", "SD", "CE"),
+    "PHE": ("N", "CA", "C", "O", "CB", "CG", "CD1", "CD2", "CE1", "CE2", "CZ"),
+    "PRO": ("N", "CA", "C", "O", "CB", "CG", "CD"),
+    "SER": ("N", "CA", "C", "O", "CB", "OG"),
+    "THR": ("N", "CA", "C", "O", "CB", "OG1", "CG2"),
+    "TRP": (
+        "N",
+        "CA",
+        "C",
+        "O",
+        "CB",
+        "CG",
+        "CD1",
+        "CD2",
+        "NE1",
+        "CE2",
+        "CE3",
+        "CZ2",
+        "CZ3",
+        "CH2",
+    ),
+    "TYR": (
+        "N",
+        "CA",
+        "C",
+        "O",
+        "CB",
+        "CG",
+        "CD1",
+        "CD2",
+        "CE1",
+        "CE2",
+        "CZ",
+        "OH",
+    ),
+    "VAL": ("N", "CA", "C", "O", "CB", "CG1", "CG2"),
+}
+
+ATOM_LAYOUTS = ("backbone", "atom14", "atom37")
+
+# Fixed-width ATOM record according to PDB v3.3: serial, name, resName, resSeq,
+# x, y, z, B-factor, element. Chain "A", occupancy 1.00, blank altLoc/iCode/charge.
+_ATOM_RECORD = "ATOM  %5d %s %-3s A%4d    %8.3f%8.3f%8.3f  1.00%6.2f          %2s  \n"
+
+
+def format_atom_name(name: str, element: str) -> str:
+    """Format a PDB atom name into a 4-char field.
+
+    Args:
+        name: The atom name.
+        element: The element symbol.
+
+    Returns:
+        The formatted atom name (width 4), right-justified for 1-letter elements
+        (and ≤3-char names), otherwise centered.
+    """
+    elem_len = len(element.strip())
+    name_len = len(name.strip())
+    if elem_len == 1 and name_len <= 3:
+        return f"{name:>4s}"
+    return f"{name:^4s}"
+
+
+@lru_cache(maxsize=64)
+def _residue_name(code: str) -> str:
+    """Return the 3-letter PDB residue name for a 1-letter code."""
+    try:
+        res_name = seq3(code).upper()
+    except Exception:
+        res_name = "UNK"
+    if len(res_name) != 3:
+        res_name = (res_name[:3]).rjust(3)
+    return res_name
+
+
+@lru_cache(maxsize=256)
+def _slot_names(res_name: str, atom_layout: str) -> tuple[str, ...]:
+    """Return per-slot atom names for a residue; empty strings mark absent slots."""
+    if atom_layout == "backbone":
+        return BACKBONE_ATOMS
+    present = ATOM14_NAMES.get(res_name, BACKBONE_ATOMS)
+    if atom_layout == "atom14":
+        return present + ("",) * (14 - len(present))
+    return tuple(name if name in present else "" for name in ATOM37_NAMES)
+
+
+def _as_float_array(values: Any) -> np.ndarray:
+    """Move a tensor or array-like to a float64 NumPy array in a single copy."""
+    if hasattr(values, "detach"):
+        values = values.detach().cpu()
+        if values.is_floating_point() and values.element_size() < 4:
+            values = values.float()
+        values = values.numpy()
+    return np.asarray(values, dtype=np.float64)
+
+
+def coordinates_to_pdb(
+    sequence: str,
+    positions: Any,
+    plddt: Any,
+    atom_layout: str = "backbone",
+) -> str:
+    """Serialize per-residue coordinates into a single-model PDB.
+
+    Args:
+        sequence: One-letter amino acid sequence of length L.
+        positions: Coordinates shaped (L, A, 3) as a NumPy array or tensor.
+        plddt: Per-residue pLDDT shaped (L,); accepts 0..1 or 0..100.
+        atom_layout: ``backbone`` writes the first four slots as N, CA, C, O;
+            ``atom14`` and ``atom37`` write every atom present for the residue type.
+
+    Returns:
+        PDB text with one ATOM record per finite atom and pLDDT stored as B-factor.
+
+    Raises:
+        PredictionError: If shapes do not match the sequence or the layout.
+    """
+    seq_len = len(sequence)
+    if positions.ndim != 3 or positions.shape[0] != seq_len or positions.shape[2] != 3:
+        raise PredictionError(
+            f"Expected positions (L,A,3) matching sequence length; got {tuple(positions.shape)} vs {seq_len}",
+            code="INVALID_OUTPUT_SHAPE",
+        )
+    n_atoms = positions.shape[1]
+    if atom_layout not in ATOM_LAYOUTS:
+        raise PredictionError(
+            f"Unknown atom layout '{atom_layout}'", code="INVALID_OUTPUT_SHAPE"
+        )
+    if atom_layout == "backbone" and n_atoms < 4:
+        raise PredictionError(
+            f"Need at least 4 atoms per residue (N,CA,C,O); got A={n_atoms}",
+            code="INVALID_OUTPUT_SHAPE",
+        )
+    width = {"backbone": 4, "atom14": 14, "atom37": 37}[atom_layout]
+    if atom_layout != "backbone" and n_atoms != width:
+        raise PredictionError(
+            f"Layout {atom_layout} needs A={width}; got A={n_atoms}",
+            code="INVALID_OUTPUT_SHAPE",
+        )
+
+    coords = _as_float_array(positions)[:, :width]
+    scores = _as_float_array(plddt)[:seq_len]
+
+    # Normalize pLDDT scale to 0..100, zero non-finite values, clamp; +0.0 drops -0.0
+    finite = np.isfinite(scores)
+    maxv = float(scores[finite].max()) if finite.any() else 1.0
+    scale = 100.0 if maxv <= 1.01 else 1.0
+    b_factors = np.clip(np.where(finite, scores, 0.0) * scale, 0.0, 100.0) + 0.0
+
+    res_names = [_residue_name(code) for code in sequence]
+    names = np.array(
+        [_slot_names(res_name, atom_layout) for res_name in res_names],
+        dtype=object,
+    ).reshape(seq_len, width)
+    keep = (names != "") & np.isfinite(coords).all(axis=2)
+    res_idx, atom_idx = np.nonzero(keep)
+    kept = coords[res_idx, atom_idx]
+    kept_names = names[res_idx, atom_idx].tolist()
+
+    records = zip(
+        range(1, len(kept_names) + 1),
+        [format_atom_name(name, name[0]) for name in kept_names],
+        [res_names[i] for i in res_idx.tolist()],
+        (res_idx + 1).tolist(),
+        kept[:, 0].tolist(),
+        kept[:, 1].tolist(),
+        kept[:, 2].tolist(),
+        b_factors[res_idx].tolist(),
+        [name[0] for name in kept_names],
+        strict=True,
+    )
+    lines = ["MODEL     1\n"]  # exact padding required
+    lines.extend(_ATOM_RECORD % record for record in records)
+    lines.append("TER\nENDMDL\n")
+    return "".join(lines)
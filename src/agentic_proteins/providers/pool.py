@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Process-wide warm provider pool."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Any
+
+from loguru import logger
+
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+from agentic_proteins.providers.factory import (
+    ProviderKey,
+    create_provider,
+    provider_key,
+)
+
+
+@dataclass(frozen=True)
+class ProviderCacheEvent:
+    """Outcome of a single pool acquisition."""
+
+    key: ProviderKey
+    hit: bool
+    load_ms: float
+
+
+@dataclass
+class ProviderCacheStats:
+    """Cumulative pool counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    load_ms_total: float = 0.0
+
+
+class ProviderPool:
+    """LRU cache of warm providers keyed by provider identity.
+
+    Providers are created and warmed once per ``ProviderKey`` and reused across
+    loop iterations, runs and API requests. When ``max_resident_bytes`` is set,
+    least recently used providers are dropped until the resident total fits.
+    A dropped provider is closed at once unless it is leased, in which case
+    it is closed when its last lease is released.
+    """
+
+    def __init__(
+        self,
+        max_resident_bytes: int | None = None,
+        factory: Callable[..., BaseProvider] = create_provider,
+    ) -> None:
+        """Create a pool with an optional resident-memory budget."""
+        self.max_resident_bytes = max_resident_bytes
+        self._factory = factory
+        self._entries: OrderedDict[ProviderKey, BaseProvider] = OrderedDict()
+        self._key_locks: dict[ProviderKey, threading.Lock] = {}
+        self._leases: dict[int, int] = {}
+        self._retired: dict[int, BaseProvider] = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._stats = ProviderCacheStats()
+
+    def get(self, name: str, **options: Any) -> BaseProvider:
+        """Return a warm provider, creating and warming it on a miss."""
+        return self._acquire(name, options, leased=False)
+
+    @contextmanager
+    def lease(self, name: str, **options: Any) -> Iterator[BaseProvider]:
+        """Hold a warm provider; eviction defers its close until released."""
+        provider = self._acquire(name, options, leased=True)
+        try:
+            yield provider
+        finally:
+            self._release(provider)
+
+    def _acquire(
+        self, name: str, options: dict[str, Any], leased: bool
+    ) -> BaseProvider:
+        """Return a warm provider, leasing it when ``leased``."""
+        key = provider_key(name, **options)
+        with self._lock:
+            provider = self._entries.get(key)
+            if provider is not None:
+                return self._hit(key, provider, leased)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                provider = self._entries.get(key)
+                if provider is not None:
+                    return self._hit(key, provider, leased)
+            start = time.perf_counter()
+            provider = self._factory(name, **options)
+            provider.warmup()
+            load_ms = (time.perf_counter() - start) * 1000.0
+            with self._lock:
+                self._entries[key] = provider
+                if leased:
+                    self._lease(provider)
+                self._stats.misses += 1
+                self._stats.load_ms_total += load_ms
+                self._local.event = ProviderCacheEvent(
+                    key=key, hit=False, load_ms=load_ms
+                )
+                self._enforce_budget(keep=key)
+            logger.info(f"Provider {key.name} loaded in {load_ms:.1f} ms")
+            return provider
+
+    def _hit(
+        self, key: ProviderKey, provider: BaseProvider, leased: bool
+    ) -> BaseProvider:
+        """Record a hit on a cached provider; caller holds the lock."""
+        self._entries.move_to_end(key)
+        if leased:
+            self._lease(provider)
+        self._stats.hits += 1
+        self._local.event = ProviderCacheEvent(key=key, hit=True, load_ms=0.0)
+        return provider
+
+    def _lease(self, provider: BaseProvider) -> None:
+        """Count one more lease on ``provider``; caller holds the lock."""
+        self._leases[id(provider)] = self._leases.get(id(provider), 0) + 1
+
+    def _release(self, provider: BaseProvider) -> None:
+        """Drop a lease, closing ``provider`` if it was evicted while leased."""
+        with self._lock:
+            remaining = self._leases[id(provider)] - 1
+            if remaining:
+                self._leases[id(provider)] = remaining
+                return
+            del self._leases[id(provider)]
+            retired = self._retired.pop(id(provider), None)
+        if retired is not None:
+            retired.close()
+            logger.info(f"Closed provider {retired.name} after its last lease")
+
+    def _retire(self, provider: BaseProvider) -> bool:
+        """Return True if ``provider`` can close now, else defer its close.
+
+        The caller holds the lock.
+        """
+        if id(provider) in self._leases:
+            self._retired[id(provider)] = provider
+            return False
+        return True
+
+    def warmup(self, name: str, **options: Any) -> ProviderCacheEvent:
+        """Load a provider ahead of traffic and return the acquisition event."""
+        self.get(name, **options)
+        event = self.consume_event()
+        if event is None:
+            raise RuntimeError("Provider warmup did not record an acquisition.")
+        return event
+
+    def evict(self, name: str | None = None, **options: Any) -> int:
+        """Drop cached providers; all of them when ``name`` is None.
+
+        Idle providers are closed now and leased ones when released.
+        """
+        with self._lock:
+            if name is None:
+                keys = list(self._entries)
+            else:
+                keys = [provider_key(name, **options)]
+            evicted = [self._entries.pop(key) for key in keys if key in self._entries]
+            self._stats.evictions += len(evicted)
+            idle = [provider for provider in evicted if self._retire(provider)]
+        for provider in idle:
+            provider.close()
+        return len(evicted)
+
+    def consume_event(self) -> ProviderCacheEvent | None:
+        """Pop the last acquisition event recorded on the calling thread."""
+        event = getattr(self._local, "event", None)
+        self._local.event = None
+        return event
+
+    def restore_event(self, event: ProviderCacheEvent | None) -> None:
+        """Record ``event`` on the calling thread, e.g. after a worker ran it."""
+        self._local.event = event
+
+    def resident_bytes(self) -> int:
+        """Return total resident bytes reported by cached providers."""
+        with self._lock:
+            return sum(p.resident_bytes() for p in self._entries.values())
+
+    def stats(self) -> dict[str, float]:
+        """Return cumulative hit, miss, eviction and load counters."""
+        with self._lock:
+            return {
+                "entries": float(len(self._entries)),
+                "hits": float(self._stats.hits),
+                "misses": float(self._stats.misses),
+                "evictions": float(self._stats.evictions),
+                "load_ms_total": round(self._stats.load_ms_total, 3),
+                "resident_bytes": float(
+                    sum(p.resident_bytes() for p in self._entries.values())
+                ),
+            }
+
+    def _enforce_budget(self, keep: ProviderKey) -> None:
+        """Drop least recently used providers until the budget fits."""
+        if self.max_resident_bytes is None:
+            return
+        while (
+            len(self._entries) > 1
+            and sum(p.resident_bytes() for p in self._entries.values())
+            > self.max_resident_bytes
+        ):
+            key = next(k for k in self._entries if k != keep)
+            provider = self._entries.pop(key)
+            self._stats.evictions += 1
+            if self._retire(provider):
+                provider.close()
+            logger.info(f"Evicted provider {key.name} from warm pool")
+
+
+class PooledProvider(BaseProvider):
+    """Lease a pooled provider for each prediction.
+
+    The provider stays open for the whole call even if the pool evicts it
+    meanwhile.
+    """
+
+    def __init__(self, pool: ProviderPool, name: str, **options: Any) -> None:
+        """Predict with ``name`` from ``pool``, created with ``options``."""
+        self.name = name
+        self._pool = pool
+        self._options = options
+
+    def predict(
+        self, sequence: str, timeout: float | None = None, seed: int | None = None
+    ) -> PredictionResult:
+        """Predict on a leased provider, keeping its own default timeout."""
+        with self._pool.lease(self.name, **self._options) as provider:
+            if timeout is None:
+                return provider.predict(sequence, seed=seed)
+            return provider.predict(sequence, timeout=timeout, seed=seed)
+
+
+_POOL: ProviderPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def provider_pool() -> ProviderPool:
+    """Return the process-wide provider pool."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            budget = os.getenv("PROVIDER_CACHE_MAX_BYTES")
+            _POOL = ProviderPool(max_resident_bytes=int(budget) if budget else None)
+        return _POOL
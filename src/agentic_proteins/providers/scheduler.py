@@ -0,0 +1,327 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Concurrency- and memory-aware admission for provider predictions."""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+import os
+import threading
+import time
+
+from agentic_proteins.core.cancellation import cancel_requested, on_cancel
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.factory import PROVIDER_CAPABILITIES
+
+# Peak activation bytes as (per residue², per residue). ESMFold's folding trunk
+# keeps an L x L pair representation, so memory grows roughly quadratically.
+MEMORY_MODELS: dict[str, tuple[int, int]] = {
+    "local_esmfold": (4096, 512 * 1024),
+    "local_rosettafold": (8192, 256 * 1024),
+}
+
+_DEFAULT_OWNER = "default"
+
+
+def estimate_prediction_bytes(provider: str, sequence_length: int) -> int:
+    """Estimate peak memory for one prediction of ``sequence_length`` residues."""
+    quadratic, linear = MEMORY_MODELS.get(provider, (0, 0))
+    return quadratic * sequence_length * sequence_length + linear * sequence_length
+
+
+def _default_limit(provider: str) -> int:
+    """Return the concurrency limit implied by provider capabilities."""
+    capabilities = PROVIDER_CAPABILITIES.get(provider)
+    if capabilities is not None and capabilities.max_concurrency > 0:
+        return capabilities.max_concurrency
+    return os.cpu_count() or 1
+
+
+def _limits_from_env() -> dict[str, int]:
+    """Parse ``PROVIDER_MAX_CONCURRENCY`` (``name=N,name=N``)."""
+    limits: dict[str, int] = {}
+    for item in (os.getenv("PROVIDER_MAX_CONCURRENCY") or "").split(","):
+        name, _, value = item.partition("=")
+        if name.strip() and value.strip():
+            limits[name.strip()] = max(1, int(value))
+    return limits
+
+
+@dataclass(frozen=True)
+class SchedulerEvent:
+    """Admission outcome of a single prediction.
+
+    ``run_ms`` is the provider's own time, excluding the queue wait; it is set
+    once the prediction succeeded.
+    """
+
+    provider: str
+    owner: str
+    wait_ms: float
+    queue_depth: int
+    estimated_bytes: int
+    run_ms: float | None = None
+
+
+@dataclass
+class _Ticket:
+    provider: str
+    owner: str
+    owner_limit: int
+    estimated_bytes: int
+    granted: bool = False
+
+
+@dataclass
+class _SchedulerStats:
+    admitted: int = 0
+    timed_out: int = 0
+    wait_ms_total: float = 0.0
+    wait_ms_max: float = 0.0
+    running: dict[str, int] = field(default_factory=dict)
+
+
+class ProviderScheduler:
+    """Admit provider predictions under concurrency and memory limits.
+
+    Each provider has a concurrency limit (``PROVIDER_CAPABILITIES`` by default)
+    and all running predictions share an estimated memory budget. Each owner
+    (usually one run) may additionally cap its own concurrency. Waiting work is
+    queued per owner and granted round-robin across owners, FIFO within one, so
+    a large batch cannot starve other runs. A prediction larger than the whole
+    memory budget is admitted once nothing else is running.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        limits: dict[str, int] | None = None,
+    ) -> None:
+        """Create a scheduler with an optional memory budget and limit overrides."""
+        self.max_bytes = max_bytes
+        self._limits = dict(limits or {})
+        self._cond = threading.Condition()
+        self._queues: OrderedDict[str, deque[_Ticket]] = OrderedDict()
+        self._running_bytes = 0
+        self._running_owner: dict[str, int] = {}
+        self._stats = _SchedulerStats()
+        self._local = threading.local()
+
+    def limit(self, provider: str) -> int:
+        """Return the concurrency limit for ``provider``."""
+        return self._limits.get(provider) or _default_limit(provider)
+
+    @contextmanager
+    def scope(self, owner: str, max_concurrent: int | None = None) -> Iterator[None]:
+        """Attribute predictions on this thread to ``owner`` with a concurrency cap."""
+        previous = getattr(self._local, "scope", None)
+        self._local.scope = (owner, max_concurrent or 0)
+        try:
+            yield
+        finally:
+            self._local.scope = previous
+
+    def current_scope(self) -> tuple[str, int]:
+        """Return the (owner, owner limit) active on the calling thread."""
+        return getattr(self._local, "scope", None) or (_DEFAULT_OWNER, 0)
+
+    @contextmanager
+    def admit(
+        self,
+        provider: str,
+        sequence_length: int,
+        timeout: float | None = None,
+    ) -> Iterator[SchedulerEvent]:
+        """Block until the prediction may run, then hold its slot for the block.
+
+        Raises:
+            PredictionError: ``TIMEOUT`` if the prediction is not admitted within
+                ``timeout``, ``CANCELLED`` if its task is cancelled while queued.
+        """
+        owner, owner_limit = self.current_scope()
+        ticket = _Ticket(
+            provider=provider,
+            owner=owner,
+            owner_limit=owner_limit,
+            estimated_bytes=estimate_prediction_bytes(provider, sequence_length),
+        )
+        start = time.perf_counter()
+        detach = on_cancel(self._wake)
+        try:
+            with self._cond:
+                self._queues.setdefault(owner, deque()).append(ticket)
+                queue_depth = self._queue_depth()
+                self._dispatch()
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not ticket.granted:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    cancelled = cancel_requested()
+                    if cancelled or (remaining is not None and remaining <= 0):
+                        self._queues[owner].remove(ticket)
+                        if not self._queues[owner]:
+                            del self._queues[owner]
+                        self._dispatch()
+                        if cancelled:
+                            raise PredictionError(
+                                f"Cancelled while waiting for a {provider} slot",
+                                code="CANCELLED",
+                            )
+                        self._stats.timed_out += 1
+                        raise PredictionError(
+                            f"Timed out after {timeout:.1f}s waiting for a {provider} slot",
+                            code="TIMEOUT",
+                        )
+                    self._cond.wait(remaining)
+                wait_ms = (time.perf_counter() - start) * 1000.0
+                self._stats.admitted += 1
+                self._stats.wait_ms_total += wait_ms
+                self._stats.wait_ms_max = max(self._stats.wait_ms_max, wait_ms)
+        finally:
+            detach()
+        event = SchedulerEvent(
+            provider=provider,
+            owner=owner,
+            wait_ms=wait_ms,
+            queue_depth=queue_depth,
+            estimated_bytes=ticket.estimated_bytes,
+        )
+        self._local.event = event
+        try:
+            yield event
+        finally:
+            with self._cond:
+                self._release(ticket)
+                self._dispatch()
+                self._cond.notify_all()
+
+    def _wake(self) -> None:
+        """Wake waiting admissions so cancelled ones can leave the queue."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def consume_event(self) -> SchedulerEvent | None:
+        """Pop the last admission event recorded on the calling thread."""
+        event = getattr(self._local, "event", None)
+        self._local.event = None
+        return event
+
+    def restore_event(self, event: SchedulerEvent | None) -> None:
+        """Record ``event`` on the calling thread, e.g. after a worker ran it."""
+        self._local.event = event
+
+    def stats(self) -> dict[str, float]:
+        """Return queue depth, running counts and cumulative wait metrics."""
+        with self._cond:
+            return {
+                "queue_depth": float(self._queue_depth()),
+                "running": float(sum(self._stats.running.values())),
+                "running_bytes": float(self._running_bytes),
+                "admitted": float(self._stats.admitted),
+                "timed_out": float(self._stats.timed_out),
+                "wait_ms_total": round(self._stats.wait_ms_total, 3),
+                "wait_ms_max": round(self._stats.wait_ms_max, 3),
+            }
+
+    def _queue_depth(self) -> int:
+        """Return the number of waiting tickets; caller holds the lock."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _fits(self, ticket: _Ticket) -> bool:
+        """Return whether ``ticket`` can start now; caller holds the lock."""
+        running = self._stats.running
+        if running.get(ticket.provider, 0) >= self.limit(ticket.provider):
+            return False
+        if (
+            ticket.owner_limit
+            and self._running_owner.get(ticket.owner, 0) >= ticket.owner_limit
+        ):
+            return False
+        if self.max_bytes is None or not ticket.estimated_bytes:
+            return True
+        if self._running_bytes == 0:
+            return True
+        return self._running_bytes + ticket.estimated_bytes <= self.max_bytes
+
+    def _dispatch(self) -> None:
+        """Grant queue heads round-robin across owners; caller holds the lock."""
+        progressed = True
+        while progressed:
+            progressed = False
+            for owner in list(self._queues):
+                queue = self._queues[owner]
+                ticket = queue[0]
+                if not self._fits(ticket):
+                    continue
+                queue.popleft()
+                if queue:
+                    self._queues.move_to_end(owner)
+                else:
+                    del self._queues[owner]
+                ticket.granted = True
+                running = self._stats.running
+                running[ticket.provider] = running.get(ticket.provider, 0) + 1
+                self._running_owner[owner] = self._running_owner.get(owner, 0) + 1
+                self._running_bytes += ticket.estimated_bytes
+                progressed = True
+                break
+        self._cond.notify_all()
+
+    def _release(self, ticket: _Ticket) -> None:
+        """Return a granted ticket's slot and memory; caller holds the lock."""
+        self._stats.running[ticket.provider] -= 1
+        self._running_owner[ticket.owner] -= 1
+        if not self._running_owner[ticket.owner]:
+            del self._running_owner[ticket.owner]
+        self._running_bytes -= ticket.estimated_bytes
+
+
+class ScheduledProvider(BaseProvider):
+    """Run a provider's predictions through a ``ProviderScheduler``."""
+
+    def __init__(self, provider: BaseProvider, scheduler: ProviderScheduler) -> None:
+        """Wrap ``provider`` so every prediction waits for admission."""
+        self.name = provider.name
+        self._provider = provider
+        self._scheduler = scheduler
+
+    def predict(
+        self, sequence: str, timeout: float | None = None, seed: int | None = None
+    ) -> PredictionResult:
+        """Wait for a slot, then predict within ``timeout``.
+
+        The queue wait is bounded only by cancellation, so ``timeout`` covers
+        the provider's run alone; when None the provider keeps its default.
+        """
+        with self._scheduler.admit(self.name, len(sequence)) as event:
+            start = time.perf_counter()
+            if timeout is None:
+                result = self._provider.predict(sequence, seed=seed)
+            else:
+                result = self._provider.predict(sequence, timeout=timeout, seed=seed)
+            run_ms = (time.perf_counter() - start) * 1000.0
+        self._scheduler.restore_event(replace(event, run_ms=run_ms))
+        return result
+
+
+_SCHEDULER: ProviderScheduler | None = None
+_SCHEDULER_LOCK = threading.Lock()
+
+
+def provider_scheduler() -> ProviderScheduler:
+    """Return the process-wide provider scheduler."""
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            budget = os.getenv("PROVIDER_SCHEDULER_MAX_BYTES")
+            _SCHEDULER = ProviderScheduler(
+                max_bytes=int(budget) if budget else None,
+                limits=_limits_from_env(),
+            )
+        return _SCHEDULER
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from agentic_proteins.core.hashing import sha256_hex
+
 
 class AgentRegistry:
     """AgentRegistry."""
@@ -27,6 +29,15 @@ class AgentRegistry:
         cls._registry.clear()
         cls._locked = False
 
+    @classmethod
+    def fingerprint(cls) -> str:
+        """Return a digest of the registered agent names and classes."""
+        entries = sorted(
+            f"{name}={agent.__module__}.{agent.__qualname__}"
+            for name, agent in cls._registry.items()
+        )
+        return sha256_hex("|".join(entries))
+
     @classmethod
     def register(cls, agent_class: type[Any]) -> None:
         """register."""
@@ -34,9 +34,16 @@ class RunContext:
 
 
 def create_run_context(
-    base_dir: Path, config: RunConfig | None = None, run_id: str | None = None
+    base_dir: Path,
+    config: RunConfig | None = None,
+    run_id: str | None = None,
+    resume: bool = False,
 ) -> tuple[RunContext, list[str]]:
-    """create_run_context."""
+    """Create the context of a new run, or with ``resume`` reopen ``run_id``.
+
+    A resumed run keeps its existing workspace files instead of laying out
+    placeholders over them.
+    """
     run_id = run_id or uuid4().hex
     start_time = datetime.now(UTC)
     config = config or RunConfig()
@@ -45,9 +52,15 @@ def create_run_context(
         Path(normalized.artifacts_dir) if normalized.artifacts_dir else None
     )
     workspace = RunWorkspace.for_run(
-        base_dir, run_id, artifacts_root_override=artifacts_override
+        base_dir,
+        run_id,
+        artifacts_root_override=artifacts_override,
+        ephemeral=bool(normalized.ephemeral) and not resume,
     )
-    workspace.ensure_layout(normalized.model_dump())
+    if resume:
+        workspace.reopen()
+    else:
+        workspace.ensure_layout(normalized.model_dump())
     logger = (
         StructuredLogger(run_id=run_id, log_path=workspace.logs_dir / "run.jsonl")
         if normalized.logging_enabled
@@ -7,7 +7,7 @@ from agentic_proteins.runtime.control.artifacts import (
     compare_runs,
     require_human_decision,
 )
-from agentic_proteins.runtime.control.execution import run_flow
+from agentic_proteins.runtime.control.execution import RuntimeSession, run_flow
 from agentic_proteins.runtime.control.state_machine import (
     RunStateMachine,
     apply_transition,
@@ -16,6 +16,7 @@ from agentic_proteins.runtime.control.state_machine import (
 __all__ = [
     "ExecutionSnapshots",
     "RunStateMachine",
+    "RuntimeSession",
     "apply_transition",
     "compare_runs",
     "require_human_decision",
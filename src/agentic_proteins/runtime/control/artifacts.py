@@ -21,9 +21,11 @@ from agentic_proteins.domain.candidates.selection import (
 from agentic_proteins.runtime.context import RunContext
 from agentic_proteins.runtime.workspace import (
     RunWorkspace,
+    WriteBehindJournal,
     write_json_atomic,
     write_text_atomic,
 )
+from agentic_proteins.runtime.writer import dump_json
 from agentic_proteins.state.schemas import ArtifactMetadata
 
 
@@ -60,6 +62,7 @@ def write_artifact(
     payload: dict[str, Any],
     description: str = "",
     tags: list[str] | None = None,
+    journal: WriteBehindJournal | None = None,
 ) -> ArtifactMetadata:
     """write_artifact."""
     tags = tags or []
@@ -68,7 +71,10 @@ def write_artifact(
     normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
     artifact_id = sha256_hex(f"{kind}:{normalized}")
     path = workspace.artifact_items_dir / f"{artifact_id}.json"
-    write_json_atomic(path, payload)
+    if journal is not None:
+        journal.write(path, payload)
+    else:
+        write_text_atomic(path, dump_json(payload, compact=True))
     return ArtifactMetadata(
         artifact_id=artifact_id,
         kind=kind,
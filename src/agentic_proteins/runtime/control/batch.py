@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Batch fan-out helpers for RunManager.run_many."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+import threading
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from agentic_proteins.core.hashing import sha256_hex
+from agentic_proteins.providers.pool import provider_pool
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import write_json_atomic
+
+if TYPE_CHECKING:
+    from agentic_proteins.runtime.control.execution import RunManager, RuntimeSession
+
+BATCH_EXECUTORS = ("process", "thread")
+
+_WORKER: dict[str, Any] = {}
+
+
+def iter_fasta(path: Path) -> Iterator[tuple[str, str]]:
+    """Yield (record_id, sequence) from a multi-FASTA file without loading it whole."""
+    record_id: str | None = None
+    chunks: list[str] = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(">"):
+                if record_id is not None:
+                    yield record_id, "".join(chunks)
+                record_id = line[1:].split()[0] if line[1:].strip() else ""
+                chunks = []
+            else:
+                chunks.append(line)
+    if record_id is not None:
+        yield record_id, "".join(chunks)
+
+
+def iter_batch_inputs(
+    inputs: Iterable[str] | Path | str,
+) -> Iterator[tuple[str, str]]:
+    """Yield (record_id, sequence) from sequences or a FASTA path."""
+    if isinstance(inputs, (str, Path)):
+        for index, (record_id, sequence) in enumerate(iter_fasta(Path(inputs))):
+            yield record_id or f"record_{index}", sequence
+        return
+    for index, sequence in enumerate(inputs):
+        yield f"record_{index}", sequence
+
+
+def derive_seed(base_seed: int, index: int) -> int:
+    """Derive a per-run seed that depends only on the batch seed and input index."""
+    return int(sha256_hex(f"{base_seed}:{index}")[:8], 16)
+
+
+def batch_run_id(batch_id: str, index: int) -> str:
+    """Return the stable run id for input ``index`` of a batch."""
+    return f"{batch_id}-{index:06d}"
+
+
+def warm_providers(config: RunConfig) -> None:
+    """Load the enabled providers into this process's warm pool."""
+    normalized, _ = config.with_defaults()
+    for name in normalized.predictors_enabled or []:
+        try:
+            provider_pool().warmup(name)
+        except Exception as exc:  # noqa: BLE001
+            # Runs report unavailable providers through their own failure path.
+            logger.warning(f"Provider {name} warmup failed: {exc}")
+
+
+def init_worker(base_dir: Path, config: RunConfig) -> None:
+    """Process-pool initializer: keep run settings, a session and warm providers."""
+    from agentic_proteins.runtime.control.execution import RuntimeSession
+
+    _WORKER["base_dir"] = base_dir
+    _WORKER["config"] = config
+    _WORKER["session"] = RuntimeSession()
+    warm_providers(config)
+
+
+def run_in_worker(sequence: str, run_id: str, seed: int) -> dict:
+    """Run one batch item in a worker initialized by ``init_worker``."""
+    return run_seeded(
+        _WORKER["base_dir"],
+        _WORKER["config"],
+        sequence,
+        run_id,
+        seed,
+        _WORKER["session"],
+    )
+
+
+def run_seeded(
+    base_dir: Path,
+    config: RunConfig,
+    sequence: str,
+    run_id: str,
+    seed: int,
+    session: RuntimeSession | None = None,
+) -> dict:
+    """Run one sequence with a derived seed under a fixed run id."""
+    from agentic_proteins.runtime.control.execution import RunManager
+
+    manager: RunManager = RunManager(
+        base_dir, config.model_copy(update={"seed": seed}), session
+    )
+    return manager.run(sequence, run_id=run_id)
+
+
+def worker_failure(run_id: str, exc: BaseException) -> dict:
+    """Return a run-output-shaped record for a batch item whose worker raised."""
+    return {
+        "run_id": run_id,
+        "status": "failure",
+        "failure_type": "unknown",
+        "tool_status": "failure",
+        "errors": [{"error_type": "worker_error", "message": str(exc)}],
+    }
+
+
+class BatchIndex:
+    """Append-only index of a batch's runs plus a final summary.
+
+    ``index.jsonl`` gains one line per completed run as results arrive, so an
+    interrupted batch still lists every run that finished.
+    """
+
+    def __init__(
+        self, batch_dir: Path, batch_id: str, executor: str, workers: int
+    ) -> None:
+        """Create the batch directory and open the index."""
+        self.batch_dir = batch_dir
+        self.batch_id = batch_id
+        self.executor = executor
+        self.workers = workers
+        self.started_at = datetime.now(UTC)
+        self.counts: dict[str, int] = {}
+        self.total = 0
+        self._lock = threading.Lock()
+        batch_dir.mkdir(parents=True, exist_ok=True)
+        self._handle = (batch_dir / "index.jsonl").open("a", encoding="utf-8")
+
+    def record(self, index: int, record_id: str, seed: int, output: dict) -> None:
+        """Append one completed run."""
+        status = str(output.get("status", "unknown"))
+        entry = {
+            "index": index,
+            "record_id": record_id,
+            "run_id": output.get("run_id"),
+            "seed": seed,
+            "status": status,
+            "tool_status": output.get("tool_status"),
+            "qc_status": output.get("qc_status"),
+            "failure_type": output.get("failure_type"),
+        }
+        with self._lock:
+            self._handle.write(json.dumps(entry, sort_keys=True) + "\n")
+            self._handle.flush()
+            self.total += 1
+            self.counts[status] = self.counts.get(status, 0) + 1
+
+    def close(self, complete: bool) -> None:
+        """Close the index and write ``summary.json``."""
+        self._handle.close()
+        finished = datetime.now(UTC)
+        write_json_atomic(
+            self.batch_dir / "summary.json",
+            {
+                "batch_id": self.batch_id,
+                "complete": complete,
+                "executor": self.executor,
+                "workers": self.workers,
+                "total": self.total,
+                "status_counts": dict(sorted(self.counts.items())),
+                "started_at": self.started_at.isoformat(),
+                "finished_at": finished.isoformat(),
+                "duration_s": round((finished - self.started_at).total_seconds(), 3),
+                "index": "index.jsonl",
+            },
+        )
@@ -5,19 +5,35 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import UTC, datetime
+import functools
 import importlib.metadata
 import json
+import multiprocessing
+import os
 from pathlib import Path
+import queue
+import threading
 from time import perf_counter
 from typing import Any
+from uuid import uuid4
 
 from agentic_proteins.agents.analysis.failure_analysis import FailureAnalysisAgent
 from agentic_proteins.agents.execution.coordinator import CoordinatorAgent
-from agentic_proteins.agents.planning.compiler import compile_plan_to_execution
-from agentic_proteins.agents.planning.generation import generate_plan
+from agentic_proteins.agents.planning.cache import CompiledPlan, PlanCache
 from agentic_proteins.agents.planning.planner import PlannerAgent
+from agentic_proteins.agents.planning.schemas import MutationPlan
 from agentic_proteins.agents.planning.validation import PlanningValidator
 from agentic_proteins.agents.reporting.reporting import ReportingAgent
 from agentic_proteins.agents.schemas import (
@@ -26,21 +42,33 @@ from agentic_proteins.agents.schemas import (
     CriticAgentInput,
     OutputReference,
     QualityControlAgentInput,
+    QualityControlAgentOutput,
     ReportingAgentInput,
     RequestParameter,
 )
 from agentic_proteins.agents.verification.critic import CriticAgent
 from agentic_proteins.agents.verification.input_validation import InputValidationAgent
 from agentic_proteins.agents.verification.quality_control import QualityControlAgent
+from agentic_proteins.core.cancellation import (
+    CancelToken,
+    cancel_scope,
+    current_cancel_token,
+)
 from agentic_proteins.core.decisions import Decision
 from agentic_proteins.core.execution import (
     ExecutionContext,
+    ExecutionTask,
     LoopLimits,
     LoopState,
     ResourceLimits,
+    RetryPolicy,
 )
 from agentic_proteins.core.failures import FailureType, suggest_next_action
-from agentic_proteins.core.observations import EvaluationInput, PlanMetadata
+from agentic_proteins.core.observations import (
+    EvaluationInput,
+    Observation,
+    PlanMetadata,
+)
 from agentic_proteins.core.status import (
     ExecutionStatus,
     Outcome,
@@ -53,7 +81,11 @@ from agentic_proteins.core.tooling import (
     ToolInvocationSpec,
     ToolResult,
 )
-from agentic_proteins.design_loop.loop import LoopContext, LoopRunner
+from agentic_proteins.design_loop.budget import CostModel, provider_resource
+from agentic_proteins.design_loop.checkpoint import LoopCheckpoint
+from agentic_proteins.design_loop.loop import LoopContext, LoopIteration, LoopRunner
+from agentic_proteins.design_loop.population import PopulationPolicy
+from agentic_proteins.design_loop.surrogate import SurrogateModel, SurrogatePolicy
 from agentic_proteins.domain.candidates import (
     CandidateStore,
     candidate_to_domain,
@@ -66,7 +98,18 @@ from agentic_proteins.execution.runtime.executor import (
     LocalExecutor,
     materialize_observation,
 )
+from agentic_proteins.execution.runtime.graph import GraphExecutor
+from agentic_proteins.execution.runtime.retry import RetryAttempt, RetryingExecutor
 from agentic_proteins.execution.validation import validate_outputs
+from agentic_proteins.providers.cache import (
+    PredictionCacheEvent,
+    prediction_cache_from_env,
+)
+from agentic_proteins.providers.chain import (
+    ChainEvent,
+    ProviderChainPolicy,
+)
+from agentic_proteins.providers.events import ProviderEvents, capture_provider_events
 from agentic_proteins.registry.agents import AgentRegistry
 from agentic_proteins.runtime.context import (
     ErrorDetail,
@@ -86,6 +129,18 @@ from agentic_proteins.runtime.control.artifacts import (
     write_artifact,
     write_failure_artifacts,
 )
+from agentic_proteins.runtime.control.batch import (
+    BATCH_EXECUTORS,
+    BatchIndex,
+    batch_run_id,
+    derive_seed,
+    init_worker,
+    iter_batch_inputs,
+    run_in_worker,
+    run_seeded,
+    warm_providers,
+    worker_failure,
+)
 from agentic_proteins.runtime.control.state_machine import RunStateMachine
 from agentic_proteins.runtime.infra import (
     RunAnalysis,
@@ -93,11 +148,25 @@ from agentic_proteins.runtime.infra import (
     ToolReliabilityTracker,
 )
 from agentic_proteins.runtime.infra.capabilities import validate_runtime_capabilities
-from agentic_proteins.runtime.workspace import write_json_atomic, write_text_atomic
+from agentic_proteins.runtime.workspace import (
+    RunWorkspace,
+    WriteBehindJournal,
+    file_lock,
+    write_json_atomic,
+    write_text_atomic,
+)
+from agentic_proteins.runtime.writer import artifact_writer
 from agentic_proteins.state.schemas import StateSnapshot
 from agentic_proteins.tools.base import Tool
 from agentic_proteins.tools.heuristic import HeuristicStructureTool
 
+_CACHE_ENV = (
+    "PREDICTION_CACHE_DIR",
+    "PREDICTION_CACHE_MAX_BYTES",
+    "PREDICTION_CACHE_MAX_ENTRIES",
+    "PREDICTION_CACHE_MAX_AGE_S",
+)
+
 
 @dataclass
 class PipelineArtifacts:
@@ -138,16 +207,441 @@ class PipelineExecutor:
         self,
         run_context: RunContext,
         tool: Tool,
-        validator: PlanningValidator,
+        session: RuntimeSession,
     ) -> None:
         """__init__."""
         self._run_context = run_context
-        self._tool = tool
-        self._validator = validator
-        self._boundary = ToolBoundary({(tool.name, tool.version): tool})
-        self._executor = LocalExecutor(self._boundary)
-        self._reliability = ToolReliabilityTracker(tool_name=tool.name)
+        self._base_tool = tool
+        self._session = session
+        self._validator = session.validator
+        self._retry_policy = RetryPolicy.model_validate(
+            run_context.config.get("retry_policy") or {}
+        )
+        self._lanes: dict[str, tuple[Tool, GraphExecutor, ToolReliabilityTracker]] = {}
+        self._activate(tool)
+        self._plan_written = False
+        self._execution_written = False
+        self._state: StateSnapshot | None = None
+        self._journal = WriteBehindJournal(
+            run_context.config.get("state_flush") or "iteration",
+            durability=run_context.config.get("artifact_durability") or "none",
+        )
         self._telemetry = TelemetryHooks(run_context)
+        self._attempt_lock = threading.Lock()
+
+    def flush(self) -> None:
+        """Persist every run file still buffered in the journal."""
+        self._journal.flush()
+
+    def _activate(self, tool: Tool) -> None:
+        """Route later tool calls to ``tool``, keeping each tool's own history."""
+        lane = self._lanes.get(tool.name)
+        if lane is None:
+            lane = (
+                tool,
+                GraphExecutor(
+                    RetryingExecutor(
+                        self._session.executor_for(tool),
+                        budget=self._retry_budget_left,
+                        on_attempt=self._record_attempt,
+                    )
+                ),
+                ToolReliabilityTracker(tool_name=tool.name),
+            )
+            self._lanes[tool.name] = lane
+        self._tool, self._graph_executor, self._reliability = lane
+
+    def select_provider(self, name: str | None) -> str:
+        """Run later iterations on provider ``name`` and return the active one.
+
+        ``None`` selects the run's own tool. Other providers get the session's
+        tool for them, sharing the run's prediction cache.
+        """
+        if name is None or name == self._base_tool.name:
+            self._activate(self._base_tool)
+        elif name not in self._lanes:
+            self._activate(
+                self._session.tool_for(
+                    {
+                        **self._run_context.config,
+                        "predictors_enabled": [name],
+                        "provider_policy": None,
+                    },
+                    self._run_context.workspace.prediction_cache_dir,
+                )
+            )
+        else:
+            self._activate(self._lanes[name][0])
+        return self._tool.name
+
+    def cost_model(self, wall_clock: bool = False) -> CostModel:
+        """Return a cost model fitted to the call history of this run's tools.
+
+        With ``wall_clock`` it is fitted to the calls' wall-clock seconds
+        instead of their provider seconds.
+        """
+        model = CostModel(str(self._run_context.config.get("execution_mode", "auto")))
+        for _, _, tracker in self._lanes.values():
+            model.observe(
+                tracker.tool_name,
+                tracker.call_walls if wall_clock else tracker.call_costs,
+            )
+        return model
+
+    def _record_call(
+        self,
+        sequence: str,
+        result: ToolResult,
+        latency_ms: float,
+        events: ProviderEvents,
+    ) -> None:
+        """Charge one tool call's provider seconds and add it to the cost history.
+
+        Only the provider's own time on the successful attempt counts, as
+        reported by its scheduler admission; queue waits, retry backoff and
+        failed attempts are not charged, nor are prediction cache hits. The
+        call's ``latency_ms`` goes to the wall-clock history.
+        """
+        if result.status != "success" or events.scheduler is None:
+            return
+        if events.prediction_cache is not None and events.prediction_cache.hit:
+            return
+        run_ms = events.scheduler.run_ms
+        if run_ms is None:
+            return
+        resource = provider_resource(
+            self._tool.name, str(self._run_context.config.get("execution_mode", "auto"))
+        )
+        with self._attempt_lock:
+            self._run_context.telemetry.add_cost(f"{resource}_seconds", run_ms / 1000.0)
+            self._reliability.record_call(len(sequence), run_ms, latency_ms)
+
+    def _retry_budget_left(self) -> bool:
+        """Return True when one more tool attempt fits within ``loop_max_cost``."""
+        max_cost = self._run_context.config.get("loop_max_cost")
+        if max_cost is None:
+            return True
+        spent = self._run_context.telemetry.cost.get("tool_units", 0.0)
+        return spent + 1.0 <= float(max_cost)
+
+    def _record_attempt(self, attempt: RetryAttempt) -> None:
+        """Charge and record one tool attempt, including retries."""
+        telemetry = self._run_context.telemetry
+        with self._attempt_lock:
+            telemetry.add_cost("tool_units", 1.0)
+            telemetry.observe("tool_attempt_ms", attempt.latency_ms)
+            if attempt.attempt:
+                telemetry.increment("tool_retries", 1.0)
+                telemetry.observe("tool_retry_backoff_ms", attempt.backoff_ms)
+            self._reliability.record(attempt.status, attempt.latency_ms)
+
+    def _record_prediction_cache(
+        self, loop_state: LoopState, event: PredictionCacheEvent
+    ) -> None:
+        """Append a prediction cache lookup to the run's provenance log."""
+        path = self._run_context.workspace.prediction_cache_log_path
+        entries = (self._journal.read(path) or {"lookups": []})["lookups"]
+        entries.append(
+            {
+                "iteration": loop_state.iteration_index,
+                "key": event.key,
+                "provider": event.provider,
+                "hit": event.hit,
+            }
+        )
+        self._journal.write(path, {"lookups": entries})
+
+    def _record_provider_selection(
+        self, loop_state: LoopState, event: ChainEvent
+    ) -> None:
+        """Append a provider chain outcome to the run's selection log."""
+        path = self._run_context.workspace.provider_selection_path
+        entries = (self._journal.read(path) or {"selections": []})["selections"]
+        entries.append({"iteration": loop_state.iteration_index, **event.to_dict()})
+        self._journal.write(path, {"selections": entries})
+
+    def _record_provider_events(
+        self, loop_state: LoopState, events: ProviderEvents
+    ) -> None:
+        """Fold one tool call's provider events into telemetry and run logs."""
+        telemetry = self._run_context.telemetry
+        if events.pool is not None:
+            if events.pool.hit:
+                telemetry.increment("provider_cache_hits", 1.0)
+            else:
+                telemetry.increment("provider_cache_misses", 1.0)
+                telemetry.observe("provider_load_ms", events.pool.load_ms)
+        if events.scheduler is not None:
+            telemetry.observe("provider_queue_wait_ms", events.scheduler.wait_ms)
+            telemetry.set_gauge(
+                "provider_queue_depth", float(events.scheduler.queue_depth)
+            )
+        if events.chain is not None:
+            telemetry.observe("provider_chain_latency_ms", events.chain.latency_ms)
+            telemetry.increment(
+                "provider_hedges",
+                float(sum(item.hedged for item in events.chain.attempts)),
+            )
+            self._record_provider_selection(loop_state, events.chain)
+        if events.prediction_cache is not None:
+            telemetry.increment(
+                "prediction_cache_hits"
+                if events.prediction_cache.hit
+                else "prediction_cache_misses",
+                1.0,
+            )
+            self._record_prediction_cache(loop_state, events.prediction_cache)
+
+    def _initial_state(self) -> StateSnapshot:
+        """Return the latest state snapshot, reading state.json on first use."""
+        if self._state is None:
+            self._state = StateSnapshot.model_validate(
+                json.loads(self._run_context.workspace.state_path.read_text())
+            )
+        return self._state
+
+    def _execution_context(
+        self, plan_fingerprint: str, initial_state: StateSnapshot, workers: int = 1
+    ) -> ExecutionContext:
+        """Return the execution context for one iteration's tool graph.
+
+        ``workers`` raises the run's scheduler concurrency cap so that many
+        tasks of the iteration can hold provider slots at once.
+        """
+        limits = self._run_context.config["resource_limits"]
+        return ExecutionContext(
+            execution_id=f"{self._run_context.run_id}:execution:0",
+            plan_fingerprint=plan_fingerprint,
+            initial_state=initial_state,
+            memory_snapshot=[],
+            resource_limits=ResourceLimits(
+                max_concurrent_tasks=max(
+                    workers, int(limits.get("max_concurrent_tasks", 1))
+                ),
+                max_task_runtime_ms=int(limits.get("max_task_runtime_ms", 0)),
+                cpu_seconds=float(limits["cpu_seconds"]),
+                gpu_seconds=float(limits["gpu_seconds"]),
+                max_total_cost=float(
+                    self._run_context.config.get("loop_max_cost", 0.0)
+                ),
+            ),
+        )
+
+    def _assess(
+        self,
+        candidate: Candidate,
+        result: ToolResult,
+        task: ExecutionTask,
+        compiled: CompiledPlan,
+        initial_state: StateSnapshot,
+        loop_state: LoopState,
+    ) -> tuple[Observation | None, Candidate, QualityControlAgentOutput]:
+        """Apply a tool result to ``candidate`` and run quality control on it."""
+        observation = (
+            materialize_observation(result, task)
+            if result.status == "success"
+            else None
+        )
+        updated_candidate = update_candidate_from_result(
+            candidate,
+            self._tool.name,
+            self._tool.version,
+            result,
+            compiled.fingerprint,
+            loop_state.iteration_index,
+        )
+        evaluation_input = EvaluationInput(
+            observations=[observation] if observation else [],
+            prior_state=initial_state,
+            plan_metadata=PlanMetadata(
+                plan_fingerprint=compiled.fingerprint,
+                plan_id=compiled.origin_task_id,
+            ),
+            constraints=[],
+        )
+        qc_output = self._session.quality_control.decide(
+            QualityControlAgentInput(
+                evaluation=evaluation_input, candidate=updated_candidate
+            )
+        )
+        return observation, updated_candidate, qc_output
+
+    def evaluate_population(
+        self, candidates: list[Candidate], loop_state: LoopState
+    ) -> list[PipelineResult]:
+        """Evaluate a batch of variants concurrently, one result per candidate.
+
+        Every variant is bound to its own task of the cached plan and runs
+        through the graph executor (retries and timeouts included) on up to
+        ``loop_population.workers`` threads, sharing the provider pool,
+        scheduler and prediction cache with the rest of the run; the run's
+        scheduler cap is raised to as many workers. Variants
+        only get quality control; the critic, coordinator and run artifacts
+        stay with ``run_iteration``.
+        """
+        compiled, _ = self._session.plan_cache.get(
+            self._session.planner,
+            "predict_structure",
+            self._tool.name,
+            self._tool.version,
+        )
+        initial_state = self._initial_state()
+        policy = PopulationPolicy.from_dict(
+            self._run_context.config.get("loop_population") or {}
+        )
+        exec_ctx = self._execution_context(
+            compiled.fingerprint, initial_state, policy.workers
+        )
+        token = current_cancel_token()
+        prefix = f"{self._run_context.run_id}:{self._tool.name}"
+
+        def evaluate(
+            index: int, candidate: Candidate
+        ) -> tuple[ExecutionTask, ToolResult, float, ProviderEvents]:
+            task = compiled.bind(
+                ToolInvocationSpec(
+                    invocation_id=(
+                        f"{prefix}:{loop_state.iteration_index}:"
+                        f"{compiled.origin_task_id}:{index}"
+                    ),
+                    tool_name=self._tool.name,
+                    tool_version=self._tool.version,
+                    inputs=[InvocationInput(name="sequence", value=candidate.sequence)],
+                    expected_outputs=[],
+                    constraints=[],
+                    origin_task_id=compiled.origin_task_id,
+                )
+            ).model_copy(update={"retry_policy": self._retry_policy})
+            start = perf_counter()
+            errors = self._validator.validate_candidate(candidate)
+            if errors:
+                result = ToolResult(
+                    invocation_id=task.tool_invocation.invocation_id,
+                    tool_name=self._tool.name,
+                    status="failure",
+                    outputs=[],
+                    metrics=[],
+                    error=ToolError(error_type="input_invalid", message=errors[0]),
+                )
+            else:
+                with cancel_scope(token) if token is not None else nullcontext():
+                    graph_run = self._graph_executor.run(
+                        compiled.bound_graph(task), exec_ctx
+                    )
+                result = graph_run.results.get(task.task_id) or _skipped_result(task)
+            latency = (perf_counter() - start) * 1000.0
+            return task, result, latency, capture_provider_events()
+
+        workers = max(1, min(policy.workers, len(candidates)))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="population"
+        ) as pool:
+            outcomes = list(pool.map(evaluate, range(len(candidates)), candidates))
+
+        results: list[PipelineResult] = []
+        for candidate, (task, result, latency, events) in zip(
+            candidates, outcomes, strict=True
+        ):
+            self._run_context.telemetry.observe("tool_latency_ms", latency)
+            self._record_provider_events(loop_state, events)
+            self._record_call(candidate.sequence, result, latency, events)
+            result, failure_type = _checked_result(result)
+            observation, updated_candidate, qc_output = self._assess(
+                candidate, result, task, compiled, initial_state, loop_state
+            )
+            results.append(
+                PipelineResult(
+                    candidate=updated_candidate,
+                    plan_fingerprint=compiled.fingerprint,
+                    tool_status=result.status,
+                    report={},
+                    qc_status=qc_output.status,
+                    coordinator_decision=CoordinatorDecisionType.CONTINUE,
+                    failure_type=failure_type,
+                    observation=observation,
+                    decision=None,
+                    qc_output=qc_output,
+                    critic_output=None,
+                    coordinator_output=None,
+                    tool_result=result,
+                    timings={"tool_ms": latency},
+                )
+            )
+        self._run_context.telemetry.increment(
+            "population_variants", float(len(candidates))
+        )
+        return results
+
+    def mutation_plans(self) -> list[MutationPlan]:
+        """Return the cached plan's mutation plans."""
+        compiled, _ = self._session.plan_cache.get(
+            self._session.planner,
+            "predict_structure",
+            self._tool.name,
+            self._tool.version,
+        )
+        return list(compiled.mutation_plans)
+
+    def surrogate_model(self) -> SurrogateModel:
+        """Return the session's surrogate for this run's structure tool."""
+        policy = SurrogatePolicy.from_dict(
+            self._run_context.config.get("loop_surrogate") or {}
+        )
+        return self._session.surrogate_for(self._surrogate_path(), policy.ridge)
+
+    def record_population(self, iteration_index: int, payload: dict[str, Any]) -> None:
+        """Buffer one population iteration's per-variant results.
+
+        The surrogate, when configured, is saved alongside so later runs
+        resume training from it.
+        """
+        self._journal.write(
+            self._run_context.workspace.population_dir
+            / f"iteration_{iteration_index:04d}.json",
+            payload,
+        )
+        self._journal.checkpoint()
+        if self._run_context.config.get("loop_surrogate"):
+            self._save_surrogate()
+
+    def record_checkpoint(self, payload: dict[str, Any]) -> None:
+        """Persist a loop checkpoint after every run file it refers to.
+
+        Buffered run files are flushed and written first, so a crash never
+        leaves a checkpoint ahead of the artifacts it resumes from. The run's
+        telemetry counters and costs are stored alongside.
+        """
+        telemetry = self._run_context.telemetry
+        self._journal.flush()
+        artifact_writer().flush(self._run_context.workspace.run_dir)
+        write_json_atomic(
+            self._run_context.workspace.loop_checkpoint_path,
+            {
+                **payload,
+                "telemetry": {
+                    "counters": dict(telemetry.counters),
+                    "cost": dict(telemetry.cost),
+                },
+            },
+        )
+
+    def _save_surrogate(self) -> None:
+        """Add the surrogate's new observations to the one saved on disk.
+
+        The merge runs under a file lock, so runs and batch workers sharing
+        a base dir all keep their observations.
+        """
+        path = self._surrogate_path()
+        with file_lock(path.with_name(f".{path.name}.lock")):
+            saved = json.loads(path.read_text()) if path.exists() else None
+            write_json_atomic(path, self.surrogate_model().merge(saved))
+
+    def _surrogate_path(self) -> Path:
+        """Return where the surrogate for this run's tool is persisted."""
+        return (
+            self._run_context.workspace.surrogate_dir
+            / f"{self._tool.name}-{self._tool.version}.json"
+        )
 
     def run_iteration(
         self, candidate: Candidate, loop_state: LoopState
@@ -265,22 +759,56 @@ class PipelineExecutor:
             )
 
         planning_start = perf_counter()
-        planner = PlannerAgent()
-        plan_output = generate_plan(planner, "predict_structure")
-        plan = plan_output.plan
+        try:
+            compiled, plan_cached = self._session.plan_cache.get(
+                self._session.planner,
+                "predict_structure",
+                self._tool.name,
+                self._tool.version,
+            )
+        except Exception as exc:  # noqa: BLE001
+            write_failure_artifacts(
+                self._run_context,
+                FailureType.INVALID_PLAN,
+                {"errors": [str(exc)]},
+            )
+            return PipelineResult(
+                candidate=candidate,
+                plan_fingerprint="",
+                tool_status="failure",
+                report={},
+                qc_status=QCStatus.REJECT,
+                coordinator_decision=CoordinatorDecisionType.TERMINATE,
+                failure_type=FailureType.INVALID_PLAN.value,
+                observation=None,
+                decision=None,
+                qc_output=None,
+                critic_output=None,
+                coordinator_output=None,
+                tool_result=None,
+                timings={"planning_ms": (perf_counter() - planning_start) * 1000.0},
+            )
         plan_duration_ms = (perf_counter() - planning_start) * 1000.0
-        write_json_atomic(
-            self._run_context.workspace.plan_path, plan.model_dump(mode="json")
+        self._run_context.telemetry.increment(
+            "plan_cache_hits" if plan_cached else "plan_cache_misses", 1.0
         )
+        if not self._plan_written:
+            self._journal.write(
+                self._run_context.workspace.plan_path, compiled.plan_payload
+            )
+            self._plan_written = True
         self._telemetry.record_snapshot(
-            "planner", loop_state.iteration_index, plan.model_dump()
+            "planner", loop_state.iteration_index, compiled.plan_payload
         )
 
-        origin_task_id = "unknown"
-        if plan.tasks:
-            origin_task_id = next(iter(plan.tasks))
+        origin_task_id = compiled.origin_task_id
+        # Retries reuse this id as their idempotency key, so it is unique per
+        # iteration and task and never resumes an earlier iteration's job.
         invocation = ToolInvocationSpec(
-            invocation_id=f"{self._run_context.run_id}:{self._tool.name}:0",
+            invocation_id=(
+                f"{self._run_context.run_id}:{self._tool.name}:"
+                f"{loop_state.iteration_index}:{origin_task_id}"
+            ),
             tool_name=self._tool.name,
             tool_version=self._tool.version,
             inputs=[InvocationInput(name="sequence", value=candidate.sequence)],
@@ -299,14 +827,23 @@ class PipelineExecutor:
             rules_triggered=["default_plan"],
             confidence_impact=["baseline_low_confidence"],
         )
-
-        try:
-            compiled = compile_plan_to_execution(plan, [planning_decision])
-        except Exception as exc:  # noqa: BLE001
+        plan_fingerprint = compiled.fingerprint
+        initial_state = self._initial_state()
+        exec_ctx = self._execution_context(plan_fingerprint, initial_state)
+        template = compiled.graph.tasks.get(origin_task_id)
+        task = (
+            compiled.bind(invocation).model_copy(
+                update={"retry_policy": self._retry_policy}
+            )
+            if template is not None
+            and template.tool_invocation.tool_name == self._tool.name
+            else None
+        )
+        if task is None:
             write_failure_artifacts(
                 self._run_context,
                 FailureType.INVALID_PLAN,
-                {"errors": [str(exc)]},
+                {"errors": [f"missing_task_for_tool:{self._tool.name}"]},
             )
             return PipelineResult(
                 candidate=candidate,
@@ -324,56 +861,27 @@ class PipelineExecutor:
                 tool_result=None,
                 timings={"planning_ms": plan_duration_ms},
             )
-        plan_fingerprint = plan.fingerprint()
-        initial_state = StateSnapshot.model_validate(
-            json.loads(self._run_context.workspace.state_path.read_text())
-        )
-        exec_ctx = ExecutionContext(
-            execution_id=f"{self._run_context.run_id}:execution:0",
-            plan_fingerprint=plan_fingerprint,
-            initial_state=initial_state,
-            memory_snapshot=[],
-            resource_limits=ResourceLimits(
-                cpu_seconds=float(
-                    self._run_context.config["resource_limits"]["cpu_seconds"]
-                ),
-                gpu_seconds=float(
-                    self._run_context.config["resource_limits"]["gpu_seconds"]
-                ),
-                max_total_cost=float(
-                    self._run_context.config.get("loop_max_cost", 0.0)
-                ),
-            ),
-        )
-        task = next(
-            (
-                item
-                for item in compiled.tasks.values()
-                if item.tool_invocation.tool_name == self._tool.name
-            ),
-            None,
-        )
-        if task is None:
-            write_failure_artifacts(
-                self._run_context,
-                FailureType.INVALID_PLAN,
-                {"errors": [f"missing_task_for_tool:{self._tool.name}"]},
-            )
+        if self._run_context.config.get("dry_run"):
+            # The plan is validated and bound; stop before invoking any tool.
+            self._journal.checkpoint()
             return PipelineResult(
                 candidate=candidate,
-                plan_fingerprint="",
-                tool_status="failure",
+                plan_fingerprint=plan_fingerprint,
+                tool_status="dry_run",
                 report={},
-                qc_status=QCStatus.REJECT,
+                qc_status=QCStatus.SKIPPED,
                 coordinator_decision=CoordinatorDecisionType.TERMINATE,
-                failure_type=FailureType.INVALID_PLAN.value,
+                failure_type="",
                 observation=None,
-                decision=None,
+                decision=planning_decision,
                 qc_output=None,
                 critic_output=None,
                 coordinator_output=None,
                 tool_result=None,
-                timings={"planning_ms": plan_duration_ms},
+                timings={
+                    "planning_ms": plan_duration_ms,
+                    "total_ms": (perf_counter() - flow_start) * 1000.0,
+                },
             )
 
         tool_logger.log(
@@ -383,8 +891,11 @@ class PipelineExecutor:
             duration_ms=0.0,
         )
         tool_start = perf_counter()
-        result = self._executor.run(task, exec_ctx)
+        graph_run = self._graph_executor.run(compiled.bound_graph(task), exec_ctx)
         tool_latency = (perf_counter() - tool_start) * 1000.0
+        for trace in graph_run.traces:
+            self._run_context.telemetry.observe("task_queue_ms", float(trace.queued_ms))
+        result = graph_run.results.get(task.task_id) or _skipped_result(task)
         tool_logger.log(
             component=self._tool.name,
             event="invoke",
@@ -392,24 +903,11 @@ class PipelineExecutor:
             duration_ms=tool_latency,
         )
         self._run_context.telemetry.observe("tool_latency_ms", tool_latency)
-        self._run_context.telemetry.add_cost("tool_units", 1.0)
-        self._reliability.record(result.status, tool_latency)
+        events = capture_provider_events()
+        self._record_provider_events(loop_state, events)
+        self._record_call(candidate.sequence, result, tool_latency, events)
+        result, failure_type = _checked_result(result)
         tool_status = result.status
-
-        failure_type = map_failure_type(result.status, result.error)
-        if tool_status == "success" and not validate_outputs(result.outputs):
-            tool_status = "failure"
-            failure_type = FailureType.INVALID_OUTPUT.value
-            result = result.model_copy(
-                update={
-                    "status": "failure",
-                    "error": ToolError(
-                        error_type="invalid_output", message="invalid_output"
-                    ),
-                }
-            )
-        if tool_status != "success" and not failure_type:
-            failure_type = FailureType.TOOL_FAILURE.value
         if failure_type:
             write_failure_artifacts(
                 self._run_context,
@@ -424,36 +922,12 @@ class PipelineExecutor:
                     self._run_context.workspace.run_dir / "predicted.pdb", pdb_text
                 )
 
-        observation = None
-        if tool_status == "success":
-            observation = materialize_observation(result, task)
-
-        updated_candidate = update_candidate_from_result(
-            candidate,
-            self._tool.name,
-            self._tool.version,
-            result,
-            plan_fingerprint,
-            loop_state.iteration_index,
+        observation, updated_candidate, qc_output = self._assess(
+            candidate, result, task, compiled, initial_state, loop_state
         )
-
-        evaluation_input = EvaluationInput(
-            observations=[observation] if observation else [],
-            prior_state=initial_state,
-            plan_metadata=PlanMetadata(
-                plan_fingerprint=plan_fingerprint, plan_id=origin_task_id
-            ),
-            constraints=[],
-        )
-        qc_agent = QualityControlAgent()
-        qc_input = QualityControlAgentInput(
-            evaluation=evaluation_input,
-            candidate=updated_candidate,
-        )
-        qc_output = qc_agent.decide(qc_input)
         qc_status = qc_output.status
 
-        critic_agent = CriticAgent()
+        critic_agent = self._session.critic
         critic_input = CriticAgentInput(
             critic_name=CriticAgent.name,
             target_agent_name=QualityControlAgent.name,
@@ -469,7 +943,7 @@ class PipelineExecutor:
         )
         critic_output = critic_agent.decide(critic_input)
 
-        coordinator = CoordinatorAgent()
+        coordinator = self._session.coordinator
         coordinator_input = CoordinatorAgentInput(
             decisions=[planning_decision],
             observations=[observation] if observation else [],
@@ -487,7 +961,7 @@ class PipelineExecutor:
         )
         coordinator_output = coordinator.decide(coordinator_input)
 
-        reporting = ReportingAgent()
+        reporting = self._session.reporting
         report_input = ReportingAgentInput(
             qc_status=qc_status,
             decision=coordinator_output.decision.value,
@@ -497,7 +971,7 @@ class PipelineExecutor:
             ],
         )
         report = reporting.decide(report_input)
-        write_json_atomic(
+        self._journal.write(
             self._run_context.workspace.report_path, report.model_dump(mode="json")
         )
 
@@ -515,11 +989,12 @@ class PipelineExecutor:
             confidence_impact=coordinator_output.explanation.confidence_impact,
             next_tasks=coordinator_output.thresholds_hit,
         )
-        execution_plan = compiled
-        write_json_atomic(
-            self._run_context.workspace.execution_path,
-            execution_plan.model_dump(mode="json"),
-        )
+        if not self._execution_written:
+            self._journal.write(
+                self._run_context.workspace.execution_path,
+                compiled.bound_graph_payload(task),
+            )
+            self._execution_written = True
 
         decision_artifact = write_artifact(
             self._run_context.workspace,
@@ -527,6 +1002,7 @@ class PipelineExecutor:
             decision.model_dump(mode="json"),
             description="coordinator_decision",
             tags=["decision"],
+            journal=self._journal,
         )
         tool_artifact = write_artifact(
             self._run_context.workspace,
@@ -534,6 +1010,7 @@ class PipelineExecutor:
             result.model_dump(mode="json"),
             description=self._tool.name,
             tags=["tool_output"],
+            journal=self._journal,
         )
         report_artifact = write_artifact(
             self._run_context.workspace,
@@ -541,6 +1018,7 @@ class PipelineExecutor:
             report.model_dump(mode="json"),
             description="run_report",
             tags=["report"],
+            journal=self._journal,
         )
 
         state_snapshot = StateSnapshot(
@@ -553,7 +1031,8 @@ class PipelineExecutor:
             metrics=[],
             confidence_summary=[],
         )
-        write_json_atomic(
+        self._state = state_snapshot
+        self._journal.write(
             self._run_context.workspace.state_path,
             state_snapshot.model_dump(mode="json"),
         )
@@ -571,7 +1050,8 @@ class PipelineExecutor:
             "tool_ms": tool_latency,
             "total_ms": (perf_counter() - flow_start) * 1000.0,
         }
-        write_json_atomic(self._run_context.workspace.timings_path, timings)
+        self._journal.write(self._run_context.workspace.timings_path, timings)
+        self._journal.checkpoint()
 
         return PipelineResult(
             candidate=updated_candidate,
@@ -607,17 +1087,102 @@ def register_runtime_agents() -> None:
     AgentRegistry.lock()
 
 
+class RuntimeSession:
+    """Long-lived runtime components shared by many runs.
+
+    Owns the planning validator, the runtime agents, structure tools and their
+    executors, none of which carry per-run state. A run built on a session
+    only allocates its ``RunContext``, loop state and analysis. Sessions are
+    safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        """Register the runtime agents and build the shared components."""
+        register_runtime_agents()
+        self.validator = PlanningValidator()
+        self.planner = PlannerAgent()
+        self.quality_control = QualityControlAgent()
+        self.critic = CriticAgent()
+        self.coordinator = CoordinatorAgent()
+        self.reporting = ReportingAgent()
+        self.plan_cache = PlanCache()
+        self._surrogates: dict[Path, SurrogateModel] = {}
+        self._executors: dict[int, LocalExecutor] = {}
+        self._tools: dict[tuple, Tool] = {}
+        self._lock = threading.Lock()
+
+    def executor_for(self, tool: Tool) -> LocalExecutor:
+        """Return the executor dispatching to ``tool``.
+
+        Executors for session-owned tools are reused; a caller-supplied tool
+        gets a fresh one so the session never pins it in memory.
+        """
+        with self._lock:
+            executor = self._executors.get(id(tool))
+        if executor is None:
+            executor = LocalExecutor(ToolBoundary({(tool.name, tool.version): tool}))
+        return executor
+
+    def tool_for(self, config: dict, cache_dir: Path | None = None) -> Tool:
+        """Return the structure tool for ``config``, reused across runs."""
+        key = (
+            tuple(config.get("predictors_enabled", []) or [])[:1],
+            str(cache_dir) if cache_dir is not None else None,
+            json.dumps(config.get("provider_policy"), sort_keys=True),
+            tuple(os.getenv(name) for name in _CACHE_ENV),
+        )
+        with self._lock:
+            tool = self._tools.get(key)
+            if tool is None:
+                tool = _select_structure_tool(config, cache_dir)
+                self._tools[key] = tool
+                self._executors[id(tool)] = LocalExecutor(
+                    ToolBoundary({(tool.name, tool.version): tool})
+                )
+            return tool
+
+    def surrogate_for(self, path: Path, ridge: float) -> SurrogateModel:
+        """Return the surrogate persisted at ``path``, shared by runs of a session.
+
+        The model is loaded from ``path`` on first use, so it keeps learning
+        from runs of earlier processes; either way it regularizes with
+        ``ridge``, not the saved strength.
+        """
+        with self._lock:
+            model = self._surrogates.get(path)
+            if model is None:
+                model = (
+                    SurrogateModel.from_dict(json.loads(path.read_text()), ridge)
+                    if path.exists()
+                    else SurrogateModel(ridge)
+                )
+                self._surrogates[path] = model
+            return model
+
+
 class RuntimeStateMachine:
     """RuntimeStateMachine."""
 
-    def __init__(self, run_context: RunContext, tool: Tool | None = None) -> None:
-        """__init__."""
+    def __init__(
+        self,
+        run_context: RunContext,
+        tool: Tool | None = None,
+        session: RuntimeSession | None = None,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> None:
+        """Build the run's components, restored from ``checkpoint`` if given."""
         self._run_context = run_context
         self._tool = tool or HeuristicStructureTool()
-        register_runtime_agents()
-        self._validator = PlanningValidator()
-        self._executor = PipelineExecutor(run_context, self._tool, self._validator)
+        self._session = session or RuntimeSession()
+        self._executor = PipelineExecutor(run_context, self._tool, self._session)
         self._analysis = RunAnalysis()
+        self._resume: LoopCheckpoint | None = None
+        if checkpoint is not None:
+            self._analysis = RunAnalysis.from_dict(checkpoint["analysis"])
+            self._resume = LoopCheckpoint.from_dict(checkpoint["loop"])
+            telemetry = checkpoint.get("telemetry", {})
+            run_context.telemetry.counters.update(telemetry.get("counters", {}))
+            run_context.telemetry.cost.update(telemetry.get("cost", {}))
         self._loop_context = LoopContext(
             config=run_context.config,
             telemetry=run_context.telemetry,
@@ -629,12 +1194,31 @@ class RuntimeStateMachine:
         )
         self._state_machine = RunStateMachine()
 
-    def run(self, candidate: Candidate) -> dict:
-        """run."""
+    def run(
+        self,
+        candidate: Candidate,
+        on_iteration: Callable[[LoopIteration], None] | None = None,
+        cancel: CancelToken | None = None,
+    ) -> dict:
+        """Run the loop, passing each finished iteration to ``on_iteration``."""
         self._state_machine.transition("execute")
-        result = self._loop_runner.run(candidate)
+        result: PipelineResult | None = None
+        last: LoopIteration | None = None
+        try:
+            for last in self._loop_runner.iter_run(candidate, cancel, self._resume):
+                result = last.result  # type: ignore[assignment]
+                if on_iteration is not None:
+                    on_iteration(last)
+        finally:
+            self._executor.flush()
+        if (
+            last is not None
+            and last.final
+            and "cancelled" not in last.stopping_criteria
+        ):
+            self._run_context.workspace.loop_checkpoint_path.unlink(missing_ok=True)
         self._state_machine.transition("evaluate")
-        return self._finalize(result)
+        return self._finalize(result)  # type: ignore[arg-type]
 
     def _finalize(self, result: PipelineResult) -> dict:
         """_finalize."""
@@ -705,41 +1289,260 @@ class RuntimeStateMachine:
 class RunManager:
     """RunManager."""
 
-    def __init__(self, base_dir: Path, config: RunConfig | None = None) -> None:
+    def __init__(
+        self,
+        base_dir: Path,
+        config: RunConfig | None = None,
+        session: RuntimeSession | None = None,
+    ) -> None:
         """__init__."""
         self._base_dir = base_dir
         self._config = config or RunConfig()
+        self._session = session or RuntimeSession()
 
     def run(
-        self, sequence: str, tool: Tool | None = None, run_id: str | None = None
+        self,
+        sequence: str,
+        tool: Tool | None = None,
+        run_id: str | None = None,
+        materialize: bool = False,
     ) -> dict:
-        """run."""
+        """Run ``sequence``; ``materialize`` keeps an ephemeral run's files."""
+        return self._run(sequence, tool, run_id, materialize=materialize)
+
+    def stream(
+        self,
+        sequence: str,
+        tool: Tool | None = None,
+        run_id: str | None = None,
+        cancel: CancelToken | None = None,
+        prefetch: int = 1,
+        materialize: bool = False,
+    ) -> Iterator[dict]:
+        """Run ``sequence`` and yield each loop iteration as it finishes.
+
+        The run executes on a background thread that stays up to ``prefetch``
+        iterations ahead of the caller, so work on iteration ``k`` (analysis,
+        ranking, metrics) overlaps prediction of iteration ``k + 1``. Items
+        are ``{"event": "iteration", ...}`` mappings followed by one
+        ``{"event": "complete", "output": <run output>}``. Cancelling
+        ``cancel`` or closing the iterator stops the loop before its next
+        iteration, aborts in-flight provider work that polls the token and
+        still finalizes the run's artifacts.
+        """
+        run_id = run_id or uuid4().hex
+        token = cancel or CancelToken()
+        events: queue.Queue[dict | None] = queue.Queue(maxsize=max(1, prefetch))
+        closed = threading.Event()
+        outcome: dict[str, Any] = {}
+
+        def publish(item: dict | None) -> None:
+            while not closed.is_set():
+                try:
+                    events.put(item, timeout=0.05)
+                    return
+                except queue.Full:
+                    continue
+
+        def work() -> None:
+            try:
+                outcome["output"] = self._run(
+                    sequence,
+                    tool,
+                    run_id,
+                    on_iteration=lambda item: publish(_iteration_event(run_id, item)),
+                    cancel=token,
+                    materialize=materialize,
+                )
+            except BaseException as exc:  # noqa: BLE001
+                outcome["error"] = exc
+            finally:
+                publish(None)
+
+        worker = threading.Thread(target=work, name=f"stream-{run_id}", daemon=True)
+        worker.start()
         try:
-            RunRequest.model_validate({"sequence": sequence})
-        except Exception as exc:  # noqa: BLE001
-            context, warnings = create_run_context(
-                self._base_dir, self._config, run_id=run_id
-            )
-            selected_tool = tool or _select_structure_tool(context.config)
-            return self._fail_fast(
-                context, [str(exc)], FailureType.INPUT_INVALID.value, selected_tool
-            )
+            while (item := events.get()) is not None:
+                yield item
+            worker.join()
+            if "error" in outcome:
+                raise outcome["error"]
+            yield {"event": "complete", "output": outcome["output"]}
+        finally:
+            closed.set()
+            if worker.is_alive():
+                token.cancel("stream_closed")
+                worker.join()
+
+    def _run(
+        self,
+        sequence: str,
+        tool: Tool | None = None,
+        run_id: str | None = None,
+        on_iteration: Callable[[LoopIteration], None] | None = None,
+        cancel: CancelToken | None = None,
+        materialize: bool = False,
+    ) -> dict:
+        """Validate ``sequence`` and run it, reporting iterations as they end."""
         context, warnings = create_run_context(
             self._base_dir, self._config, run_id=run_id
         )
-        return self._run_with_context(sequence, context, warnings, tool)
+        try:
+            try:
+                RunRequest.model_validate({"sequence": sequence})
+            except Exception as exc:  # noqa: BLE001
+                selected_tool = tool or self._session.tool_for(
+                    context.config, context.workspace.prediction_cache_dir
+                )
+                return self._fail_fast(
+                    context,
+                    [str(exc)],
+                    FailureType.INPUT_INVALID.value,
+                    selected_tool,
+                )
+            return self._run_with_context(
+                sequence, context, warnings, tool, on_iteration, cancel
+            )
+        finally:
+            _release_workspace(context.workspace, materialize)
+
+    def run_many(
+        self,
+        inputs: Iterable[str] | Path | str,
+        workers: int | None = None,
+        executor: str = "process",
+        batch_id: str | None = None,
+    ) -> Iterator[dict]:
+        """Run many sequences in parallel and yield outputs in completion order.
+
+        ``inputs`` is an iterable of sequences or a multi-FASTA path, read
+        lazily with at most ``2 * workers`` runs in flight. Input ``i`` runs as
+        ``<batch_id>-<i:06d>`` with a seed derived from ``RunConfig.seed`` and
+        ``i``, so outputs do not depend on worker count or completion order.
+        Process workers are spawned once and keep their providers and a
+        ``RuntimeSession`` warm; thread workers share this manager's session.
+        ``batches/<batch_id>/`` under the base directory receives
+        ``index.jsonl`` as runs finish and ``summary.json`` at the end.
+        """
+        if executor not in BATCH_EXECUTORS:
+            raise ValueError(f"executor must be one of {BATCH_EXECUTORS}")
+        workers = max(1, workers or os.cpu_count() or 1)
+        batch_id = batch_id or uuid4().hex[:12]
+        base_seed = int(self._config.with_defaults()[0].seed or 0)
+        pool: Executor
+        if executor == "process":
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(self._base_dir, self._config),
+            )
+        else:
+            warm_providers(self._config)
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="run")
+        index = BatchIndex(
+            self._base_dir / "batches" / batch_id, batch_id, executor, workers
+        )
+        items = enumerate(iter_batch_inputs(inputs))
+        pending: dict[Future[dict], tuple[int, str, int, str]] = {}
+        complete = False
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < 2 * workers:
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    position, (record_id, sequence) = item
+                    seed = derive_seed(base_seed, position)
+                    run_id = batch_run_id(batch_id, position)
+                    future = (
+                        pool.submit(run_in_worker, sequence, run_id, seed)
+                        if executor == "process"
+                        else pool.submit(
+                            run_seeded,
+                            self._base_dir,
+                            self._config,
+                            sequence,
+                            run_id,
+                            seed,
+                            self._session,
+                        )
+                    )
+                    pending[future] = (position, record_id, seed, run_id)
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    position, record_id, seed, run_id = pending.pop(future)
+                    try:
+                        output = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        output = worker_failure(run_id, exc)
+                    index.record(position, record_id, seed, output)
+                    yield output
+            complete = True
+        finally:
+            pool.shutdown(wait=complete, cancel_futures=True)
+            index.close(complete)
 
     def run_candidate(
         self,
         candidate: Candidate,
         tool: Tool | None = None,
         run_id: str | None = None,
+        materialize: bool = False,
+        resume: bool = False,
     ) -> dict:
-        """run_candidate."""
+        """Run ``candidate``, or with ``resume`` continue run ``run_id``.
+
+        A resumed run reads the run's latest loop checkpoint (written under
+        ``loop_checkpoint_interval``) and continues the same run id from the
+        iteration after it, restoring loop state, elites, random state,
+        analysis and costs; completed iterations are not redone.
+
+        Raises:
+            ValueError: If ``resume`` is set without ``run_id``.
+            FileNotFoundError: If the run has no loop checkpoint.
+        """
+        checkpoint = self._load_checkpoint(run_id) if resume else None
         context, warnings = create_run_context(
-            self._base_dir, self._config, run_id=run_id
+            self._base_dir, self._config, run_id=run_id, resume=resume
+        )
+        try:
+            return self._resume_candidate(
+                candidate, context, warnings, tool, checkpoint
+            )
+        finally:
+            _release_workspace(context.workspace, materialize)
+
+    def _load_checkpoint(self, run_id: str | None) -> dict[str, Any]:
+        """Return the loop checkpoint of ``run_id``."""
+        if run_id is None:
+            raise ValueError("resume requires the run_id to continue")
+        override = self._config.artifacts_dir
+        path = RunWorkspace.for_run(
+            self._base_dir,
+            run_id,
+            artifacts_root_override=Path(override) if override else None,
+        ).loop_checkpoint_path
+        if not path.exists():
+            raise FileNotFoundError(f"No loop checkpoint for run {run_id}")
+        return json.loads(path.read_text())
+
+    def _resume_candidate(
+        self,
+        candidate: Candidate,
+        context: RunContext,
+        warnings: list[str],
+        tool: Tool | None,
+        checkpoint: dict[str, Any] | None = None,
+    ) -> dict:
+        """Run an existing candidate in ``context``."""
+        selected_tool = tool or self._session.tool_for(
+            context.config, context.workspace.prediction_cache_dir
         )
-        selected_tool = tool or _select_structure_tool(context.config)
         start = perf_counter()
         run_logger = context.logger.scope("run")
         run_logger.log(component=None, event="start", status="ok", duration_ms=0.0)
@@ -751,6 +1554,7 @@ class RunManager:
                 warnings,
                 selected_tool,
                 explicit_tool=tool is not None,
+                checkpoint=checkpoint,
             )
             failure_type = result.get("failure_type") or FailureType.NONE.value
             status = "failure" if failure_type != FailureType.NONE.value else "success"
@@ -786,13 +1590,17 @@ class RunManager:
         context: RunContext,
         warnings: list[str],
         tool: Tool | None,
+        on_iteration: Callable[[LoopIteration], None] | None = None,
+        cancel: CancelToken | None = None,
     ) -> dict:
         """_run_with_context."""
         start = perf_counter()
         run_logger = context.logger.scope("run")
         run_logger.log(component=None, event="start", status="ok", duration_ms=0.0)
         context.telemetry.record_event("run_start")
-        selected_tool = tool or _select_structure_tool(context.config)
+        selected_tool = tool or self._session.tool_for(
+            context.config, context.workspace.prediction_cache_dir
+        )
 
         try:
             candidate = Candidate(
@@ -806,6 +1614,8 @@ class RunManager:
                 warnings,
                 selected_tool,
                 explicit_tool=tool is not None,
+                on_iteration=on_iteration,
+                cancel=cancel,
             )
             failure_type = result.get("failure_type") or FailureType.NONE.value
             status = "failure" if failure_type != FailureType.NONE.value else "success"
@@ -896,7 +1706,9 @@ class RunManager:
             version_info=version_info,
             provider_name=selected_tool.name,
         )
-        write_json_atomic(context.workspace.run_summary_path, summary)
+        writer = artifact_writer()
+        durability = context.config.get("artifact_durability") or "none"
+        writer.write_json(context.workspace.run_summary_path, summary, durability)
         if start is not None:
             context.telemetry.observe("run_total_ms", (perf_counter() - start) * 1000.0)
             _ensure_telemetry_costs(context)
@@ -905,9 +1717,12 @@ class RunManager:
             run_logger.log(
                 component=None, event="complete", status=status, duration_ms=0.0
             )
-        write_json_atomic(
-            context.workspace.run_output_path, output.model_dump(mode="json")
+        writer.write_json(
+            context.workspace.run_output_path,
+            output.model_dump(mode="json"),
+            durability,
         )
+        writer.flush(context.workspace.run_dir)
         return output.model_dump(mode="json")
 
     def _run_with_candidate(
@@ -917,6 +1732,9 @@ class RunManager:
         warnings: list[str],
         tool: Tool | None,
         explicit_tool: bool = False,
+        on_iteration: Callable[[LoopIteration], None] | None = None,
+        cancel: CancelToken | None = None,
+        checkpoint: dict[str, Any] | None = None,
     ) -> dict:
         """_run_with_candidate."""
         if warnings:
@@ -960,9 +1778,19 @@ class RunManager:
                 duration_ms=0.0,
                 warnings=capability_warnings,
             )
-        selected_tool = tool or _select_structure_tool(context.config)
-        result = run_flow(candidate, context, selected_tool)
-        if result.get("candidate"):
+        selected_tool = tool or self._session.tool_for(
+            context.config, context.workspace.prediction_cache_dir
+        )
+        result = run_flow(
+            candidate,
+            context,
+            selected_tool,
+            self._session,
+            on_iteration,
+            cancel,
+            checkpoint,
+        )
+        if result.get("candidate") and not context.workspace.ephemeral:
             store = CandidateStore(context.workspace.candidate_store_dir)
             stored = Candidate.model_validate(result["candidate"])
             store.update_candidate(stored)
@@ -1099,6 +1927,7 @@ def _build_run_summary(
         "artifacts_dir": str(context.workspace.run_dir),
         "warnings": sorted(warnings),
         "failure": failure_value,
+        **_provider_selection(context),
         "version": {
             "app": version_info.app_version,
             "git_commit": version_info.git_commit,
@@ -1107,25 +1936,109 @@ def _build_run_summary(
     }
 
 
+def _provider_selection(context: RunContext) -> dict:
+    """Return chain choices and latencies for the run summary, if any."""
+    path = context.workspace.provider_selection_path
+    artifact_writer().flush(path)
+    if not path.exists():
+        return {}
+    return {"provider_selection": json.loads(path.read_text())["selections"]}
+
+
+def _skipped_result(task: ExecutionTask) -> ToolResult:
+    """Return the failure recorded for a task the graph never ran."""
+    return ToolResult(
+        invocation_id=task.tool_invocation.invocation_id,
+        tool_name=task.tool_invocation.tool_name,
+        status="failure",
+        outputs=[],
+        metrics=[],
+        error=ToolError(error_type="skipped", message="dependency_failed"),
+    )
+
+
+def _checked_result(result: ToolResult) -> tuple[ToolResult, str]:
+    """Return ``result`` with invalid outputs marked failed, and its failure type."""
+    failure_type = map_failure_type(result.status, result.error)
+    if result.status == "success" and not validate_outputs(result.outputs):
+        failure_type = FailureType.INVALID_OUTPUT.value
+        result = result.model_copy(
+            update={
+                "status": "failure",
+                "error": ToolError(
+                    error_type="invalid_output", message="invalid_output"
+                ),
+            }
+        )
+    if result.status != "success" and not failure_type:
+        failure_type = FailureType.TOOL_FAILURE.value
+    return result, failure_type
+
+
+@functools.cache
+def _app_version() -> str:
+    """Return the installed package version, read once per process."""
+    try:
+        return importlib.metadata.version("agentic-proteins")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
 def _version_info(tool: Tool | None) -> VersionInfo:
     """_version_info."""
     tool_versions = {}
     if tool is not None:
         tool_versions[tool.name] = tool.version
-    try:
-        app_version = importlib.metadata.version("agentic-proteins")
-    except importlib.metadata.PackageNotFoundError:
-        app_version = "unknown"
     return VersionInfo(
-        app_version=app_version, git_commit="unknown", tool_versions=tool_versions
+        app_version=_app_version(),
+        git_commit="unknown",
+        tool_versions=tool_versions,
     )
 
 
-def _select_structure_tool(config: dict) -> Tool:
+def _release_workspace(workspace: RunWorkspace, materialize: bool) -> None:
+    """Move an ephemeral run under the artifacts root, or delete it."""
+    if not workspace.ephemeral:
+        return
+    artifact_writer().flush(workspace.run_dir)
+    if materialize:
+        workspace.materialize()
+    else:
+        workspace.discard()
+
+
+def _select_structure_tool(config: dict, cache_dir: Path | None = None) -> Tool:
     """Select a structure tool based on enabled providers."""
     enabled = config.get("predictors_enabled", []) or []
     provider_name = enabled[0] if enabled else HeuristicStructureTool.name
-    return HeuristicStructureTool(provider_name=provider_name)
+    cache = prediction_cache_from_env(cache_dir) if cache_dir is not None else None
+    policy = config.get("provider_policy")
+    return HeuristicStructureTool(
+        provider_name=provider_name,
+        cache=cache,
+        policy=ProviderChainPolicy.from_dict(policy) if policy else None,
+    )
+
+
+def _iteration_event(run_id: str, iteration: LoopIteration) -> dict:
+    """Return the JSON-ready stream event for one loop iteration."""
+    result = iteration.result
+    return {
+        "event": "iteration",
+        "run_id": run_id,
+        "iteration_index": iteration.iteration_index,
+        "candidate": iteration.candidate.model_dump(mode="json"),
+        "tool_status": result.tool_status,
+        "qc_status": result.qc_status.value,
+        "action": iteration.action.value,
+        "reason": iteration.reason,
+        "stopping_criteria": iteration.stopping_criteria,
+        "improvement_delta": iteration.improvement_delta,
+        "score": iteration.score,
+        "iteration_ms": iteration.iteration_ms,
+        "timings": iteration.timings,
+        "final": iteration.final,
+    }
 
 
 def _ensure_telemetry_costs(context: RunContext) -> None:
@@ -1136,8 +2049,16 @@ def _ensure_telemetry_costs(context: RunContext) -> None:
 
 
 def run_flow(
-    candidate: Candidate, run_context: RunContext, tool: Tool | None = None
+    candidate: Candidate,
+    run_context: RunContext,
+    tool: Tool | None = None,
+    session: RuntimeSession | None = None,
+    on_iteration: Callable[[LoopIteration], None] | None = None,
+    cancel: CancelToken | None = None,
+    checkpoint: dict[str, Any] | None = None,
 ) -> dict:
-    """Run the canonical agentic flow end-to-end."""
-    machine = RuntimeStateMachine(run_context, tool)
-    return machine.run(candidate)
+    """Run the canonical agentic flow end-to-end, or resume it from ``checkpoint``."""
+    machine = RuntimeStateMachine(run_context, tool, session, checkpoint)
+    result = machine.run(candidate, on_iteration, cancel)
+    artifact_writer().flush(run_context.workspace.run_dir)
+    return result
@@ -21,6 +21,25 @@ class ToolStats:
     latencies_ms: list[float] = field(default_factory=list)
 
 
+@dataclass
+class SurrogateStats:
+    """SurrogateStats."""
+
+    screened: int = 0
+    skipped: int = 0
+    errors: list[float] = field(default_factory=list)
+    provider_ms: list[float] = field(default_factory=list)
+
+
+@dataclass
+class BudgetStats:
+    """BudgetStats."""
+
+    limits: dict[str, float | None] = field(default_factory=dict)
+    cost_model: dict[str, dict] = field(default_factory=dict)
+    iterations: list[dict] = field(default_factory=list)
+
+
 @dataclass
 class RunAnalysis:
     """RunAnalysis."""
@@ -28,6 +47,8 @@ class RunAnalysis:
     candidate_timeline: dict[str, list[dict]] = field(default_factory=dict)
     tool_stats: dict[str, ToolStats] = field(default_factory=dict)
     iteration_deltas: list[dict] = field(default_factory=list)
+    surrogate: SurrogateStats = field(default_factory=SurrogateStats)
+    budget: BudgetStats = field(default_factory=BudgetStats)
 
     def record_candidate_event(
         self, candidate_id: str, event: str, payload: dict | None = None
@@ -64,8 +85,123 @@ class RunAnalysis:
             }
         )
 
-    def write(self, path: Path) -> None:
-        """write."""
+    def record_surrogate(
+        self,
+        screened: int,
+        skipped: int,
+        errors: list[float],
+        provider_ms: list[float],
+    ) -> None:
+        """Record one surrogate screening: its skips, errors and provider time."""
+        self.surrogate.screened += screened
+        self.surrogate.skipped += skipped
+        self.surrogate.errors.extend(float(item) for item in errors)
+        self.surrogate.provider_ms.extend(float(item) for item in provider_ms)
+
+    def record_budget(
+        self,
+        iteration_index: int,
+        stage: str,
+        provider: str,
+        estimated_s: float,
+        compute_s: float,
+        wall_s: float,
+    ) -> None:
+        """Record the estimated and spent budget of one loop stage."""
+        self.budget.iterations.append(
+            {
+                "iteration_index": iteration_index,
+                "stage": stage,
+                "provider": provider,
+                "estimated_s": float(estimated_s),
+                "compute_s": float(compute_s),
+                "wall_s": float(wall_s),
+            }
+        )
+
+    def record_budget_model(
+        self, limits: dict[str, float | None], cost_model: dict[str, dict]
+    ) -> None:
+        """Record the loop's budget limits and its latest provider cost curves."""
+        self.budget.limits = dict(limits)
+        self.budget.cost_model = dict(cost_model)
+
+    def budget_summary(self) -> dict:
+        """Return budget limits, consumption per provider and estimate error."""
+        entries = self.budget.iterations
+        compute = sum(item["compute_s"] for item in entries)
+        providers: dict[str, dict] = {}
+        for item in entries:
+            stats = providers.setdefault(
+                item["provider"], {"stages": 0, "compute_s": 0.0, "estimated_s": 0.0}
+            )
+            stats["stages"] += 1
+            stats["compute_s"] += item["compute_s"]
+            stats["estimated_s"] += item["estimated_s"]
+        max_compute = self.budget.limits.get("max_compute_s")
+        return {
+            **self.budget.limits,
+            "compute_s": round(compute, 6),
+            "estimated_s": round(sum(item["estimated_s"] for item in entries), 6),
+            "wall_s": round(sum(item["wall_s"] for item in entries), 6),
+            "remaining_compute_s": None
+            if max_compute is None
+            else round(max_compute - compute, 6),
+            "mean_abs_error_s": round(
+                sum(abs(item["estimated_s"] - item["compute_s"]) for item in entries)
+                / len(entries),
+                6,
+            )
+            if entries
+            else None,
+            "providers": {
+                name: {
+                    **stats,
+                    "compute_s": round(stats["compute_s"], 6),
+                    "estimated_s": round(stats["estimated_s"], 6),
+                }
+                for name, stats in providers.items()
+            },
+            "cost_model": self.budget.cost_model,
+            "iterations": [
+                {
+                    **item,
+                    **{
+                        key: round(item[key], 6)
+                        for key in ("estimated_s", "compute_s", "wall_s")
+                    },
+                }
+                for item in entries
+            ],
+        }
+
+    def surrogate_summary(self) -> dict:
+        """Return skip rate, surrogate error and estimated provider-seconds saved.
+
+        Saved time prices every skipped variant at the mean provider time of
+        the variants that were evaluated.
+        """
+        stats = self.surrogate
+        mean_ms = (
+            sum(stats.provider_ms) / len(stats.provider_ms)
+            if stats.provider_ms
+            else 0.0
+        )
+        return {
+            "screened": stats.screened,
+            "skipped": stats.skipped,
+            "skip_rate": round(stats.skipped / stats.screened, 4)
+            if stats.screened
+            else 0.0,
+            "mean_abs_error": round(sum(stats.errors) / len(stats.errors), 3)
+            if stats.errors
+            else None,
+            "errors": [round(item, 3) for item in stats.errors],
+            "saved_provider_s": round(stats.skipped * mean_ms / 1000.0, 3),
+        }
+
+    def to_dict(self) -> dict:
+        """Return the analysis as written to ``analysis.json``."""
         payload = {
             "candidate_timeline": self.candidate_timeline,
             "tool_stats": {
@@ -78,4 +214,51 @@ class RunAnalysis:
             },
             "iteration_deltas": self.iteration_deltas,
         }
-        write_json_atomic(path, payload)
+        if self.surrogate.screened:
+            payload["surrogate"] = {
+                **self.surrogate_summary(),
+                "provider_ms": self.surrogate.provider_ms,
+            }
+        if self.budget.iterations:
+            payload["budget"] = self.budget_summary()
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> RunAnalysis:
+        """Restore an analysis saved with ``to_dict``."""
+        surrogate = payload.get("surrogate") or {}
+        budget = payload.get("budget") or {}
+        return cls(
+            candidate_timeline={
+                key: list(value)
+                for key, value in payload.get("candidate_timeline", {}).items()
+            },
+            tool_stats={
+                name: ToolStats(
+                    success=int(stats["success"]),
+                    failure=int(stats["failure"]),
+                    latencies_ms=list(stats["latencies_ms"]),
+                )
+                for name, stats in payload.get("tool_stats", {}).items()
+            },
+            iteration_deltas=list(payload.get("iteration_deltas", [])),
+            surrogate=SurrogateStats(
+                screened=int(surrogate.get("screened", 0)),
+                skipped=int(surrogate.get("skipped", 0)),
+                errors=list(surrogate.get("errors", [])),
+                provider_ms=list(surrogate.get("provider_ms", [])),
+            ),
+            budget=BudgetStats(
+                limits={
+                    key: budget[key]
+                    for key in ("max_compute_s", "max_wall_s")
+                    if key in budget
+                },
+                cost_model=dict(budget.get("cost_model", {})),
+                iterations=list(budget.get("iterations", [])),
+            ),
+        )
+
+    def write(self, path: Path) -> None:
+        """write."""
+        write_json_atomic(path, self.to_dict())
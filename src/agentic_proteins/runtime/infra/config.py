@@ -5,7 +5,17 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from agentic_proteins.core.execution import RetryPolicy
+from agentic_proteins.design_loop.budget import BudgetPolicy
+from agentic_proteins.design_loop.population import PopulationPolicy
+from agentic_proteins.design_loop.surrogate import SurrogatePolicy
+from agentic_proteins.providers.chain import ProviderChainPolicy
+from agentic_proteins.runtime.workspace import STATE_FLUSH_POLICIES
+from agentic_proteins.runtime.writer import DURABILITY_POLICIES
 
 
 class RunConfig(BaseModel):
@@ -21,9 +31,9 @@ class RunConfig(BaseModel):
         default=None,
         description="Resource limits (cpu_seconds, gpu_seconds).",
     )
-    retry_policy: dict[str, int] | None = Field(
+    retry_policy: dict[str, Any] | None = Field(
         default=None,
-        description="Retry policy (max_retries).",
+        description="Retry policy (max_retries, backoff_ms, retry_on).",
     )
     logging_enabled: bool | None = Field(
         default=None,
@@ -53,6 +63,32 @@ class RunConfig(BaseModel):
         default=None,
         description="Maximum total cost for a loop.",
     )
+    loop_budget: dict[str, Any] | None = Field(
+        default=None,
+        description=(
+            "Compute and wall-clock budget of the loop in provider seconds, and "
+            "the providers for exploration and final confirmation."
+        ),
+    )
+    loop_checkpoint_interval: int | None = Field(
+        default=None,
+        ge=1,
+        description="Iterations between loop checkpoints a run can resume from.",
+    )
+    loop_population: dict[str, Any] | None = Field(
+        default=None,
+        description=(
+            "Population mode for the loop (variants per iteration, elites kept, "
+            "workers evaluating variants concurrently)."
+        ),
+    )
+    loop_surrogate: dict[str, Any] | None = Field(
+        default=None,
+        description=(
+            "Surrogate pre-screening of population variants (UCB kappa, "
+            "observations before screening starts, ridge strength)."
+        ),
+    )
     seed: int | None = Field(
         default=None,
         description="Deterministic seed for tool runs.",
@@ -73,11 +109,108 @@ class RunConfig(BaseModel):
         default=None,
         description="Execution mode for providers: auto, gpu, or cpu.",
     )
+    provider_policy: dict[str, Any] | None = Field(
+        default=None,
+        description=(
+            "Provider chain (mode fallback or hedge, steps with provider and "
+            "timeout_s, hedge_percentile, hedge_after_s)."
+        ),
+    )
+    state_flush: str | None = Field(
+        default=None,
+        description=(
+            "When buffered run files reach disk: iteration (default), end, "
+            "or immediate."
+        ),
+    )
+
+    artifact_durability: str | None = Field(
+        default=None,
+        description="fsync policy for run files: none (default), run, or write.",
+    )
+    ephemeral: bool | None = Field(
+        default=None,
+        description=(
+            "Keep run files in a scratch (tmpfs when available) workspace that "
+            "is discarded unless the run is materialized."
+        ),
+    )
+
+    @field_validator("artifact_durability")
+    @classmethod
+    def _validate_artifact_durability(cls, value: str | None) -> str | None:
+        """Reject unknown fsync policies."""
+        if value is not None and value not in DURABILITY_POLICIES:
+            raise ValueError(
+                f"artifact_durability must be one of {DURABILITY_POLICIES}"
+            )
+        return value
+
+    @field_validator("state_flush")
+    @classmethod
+    def _validate_state_flush(cls, value: str | None) -> str | None:
+        """Reject unknown write-behind flush policies."""
+        if value is not None and value not in STATE_FLUSH_POLICIES:
+            raise ValueError(f"state_flush must be one of {STATE_FLUSH_POLICIES}")
+        return value
+
+    @field_validator("retry_policy")
+    @classmethod
+    def _validate_retry_policy(
+        cls, value: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Reject retry policies the executor cannot apply."""
+        if value is not None:
+            RetryPolicy.model_validate(value)
+        return value
+
+    @field_validator("loop_budget")
+    @classmethod
+    def _validate_loop_budget(
+        cls, value: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Reject budgets and providers the scheduler cannot use."""
+        if value is not None:
+            BudgetPolicy.from_dict(value)
+        return value
+
+    @field_validator("loop_population")
+    @classmethod
+    def _validate_loop_population(
+        cls, value: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Reject population sizes the loop cannot run."""
+        if value is not None:
+            PopulationPolicy.from_dict(value)
+        return value
+
+    @field_validator("loop_surrogate")
+    @classmethod
+    def _validate_loop_surrogate(
+        cls, value: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Reject surrogate settings the screen cannot apply."""
+        if value is not None:
+            SurrogatePolicy.from_dict(value)
+        return value
+
+    @field_validator("provider_policy")
+    @classmethod
+    def _validate_provider_policy(
+        cls, value: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Reject provider policies the chain cannot run."""
+        if value is not None:
+            ProviderChainPolicy.from_dict(value)
+        return value
 
     def with_defaults(self) -> tuple[RunConfig, list[str]]:
         """with_defaults."""
         warnings: list[str] = []
         data = self.model_dump()
+        if data["predictors_enabled"] is None and data["provider_policy"]:
+            policy = ProviderChainPolicy.from_dict(data["provider_policy"])
+            data["predictors_enabled"] = policy.providers
         if data["predictors_enabled"] is None:
             data["predictors_enabled"] = ["heuristic_proxy"]
             warnings.append("default_predictors_enabled")
@@ -121,4 +254,10 @@ class RunConfig(BaseModel):
             data["artifacts_dir"] = None
         if data["execution_mode"] is None:
             data["execution_mode"] = "auto"
+        if data["state_flush"] is None:
+            data["state_flush"] = "iteration"
+        if data["artifact_durability"] is None:
+            data["artifact_durability"] = "none"
+        if data["ephemeral"] is None:
+            data["ephemeral"] = False
         return RunConfig(**data), warnings
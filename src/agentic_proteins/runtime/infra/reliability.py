@@ -13,12 +13,20 @@ from agentic_proteins.domain.metrics.quality import ToolReliability
 
 @dataclass
 class ToolReliabilityTracker:
-    """ToolReliabilityTracker."""
+    """Attempt outcomes and per-call costs of one tool within a run.
+
+    ``call_costs`` holds ``(sequence_length, seconds)`` of every successful
+    provider call (cache hits excluded), the history a ``CostModel`` is
+    fitted to; ``call_walls`` holds the same calls' wall-clock seconds,
+    queue waits and retries included.
+    """
 
     tool_name: str
     latencies_ms: list[float] = field(default_factory=list)
     successes: int = 0
     failures: int = 0
+    call_costs: list[tuple[int, float]] = field(default_factory=list)
+    call_walls: list[tuple[int, float]] = field(default_factory=list)
 
     def record(self, status: str, latency_ms: float) -> None:
         """record."""
@@ -28,6 +36,14 @@ class ToolReliabilityTracker:
         else:
             self.failures += 1
 
+    def record_call(
+        self, sequence_length: int, latency_ms: float, wall_ms: float | None = None
+    ) -> None:
+        """Add one successful call on a ``sequence_length`` residue input."""
+        self.call_costs.append((int(sequence_length), float(latency_ms) / 1000.0))
+        wall_ms = latency_ms if wall_ms is None else wall_ms
+        self.call_walls.append((int(sequence_length), float(wall_ms) / 1000.0))
+
     def summary(self) -> ToolReliability:
         """summary."""
         total = self.successes + self.failures
@@ -5,51 +5,127 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+import contextlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
+import functools
 import json
+import os
 from pathlib import Path
+import shutil
+import tempfile
+import threading
 from typing import Any
 from uuid import uuid4
 
+from agentic_proteins.runtime.writer import artifact_writer
+
+try:  # POSIX advisory locks; without them concurrent writers may race.
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+STATE_FLUSH_POLICIES = ("iteration", "end", "immediate")
+_SHM_DIR = Path("/dev/shm")  # noqa: S108  # nosec B108
+
+
+@functools.cache
+def scratch_root() -> Path:
+    """Return this process's root for ephemeral runs, on tmpfs when available."""
+    base = (
+        _SHM_DIR
+        if _SHM_DIR.is_dir() and os.access(_SHM_DIR, os.W_OK)
+        else Path(tempfile.gettempdir())
+    )
+    return base / f"agentic-proteins-{os.getpid()}"
+
 
 @dataclass(frozen=True)
 class RunWorkspace:
-    """RunWorkspace."""
+    """RunWorkspace.
+
+    An ``ephemeral`` workspace keeps the run directory under ``scratch_root``
+    instead of the artifacts root; ``materialize`` moves it into place and
+    ``discard`` deletes it.
+    """
 
     base_dir: Path
     run_id: str
     artifacts_root_override: Path | None = None
+    ephemeral: bool = False
 
     @classmethod
     def create(
-        cls, base_dir: Path, artifacts_root_override: Path | None = None
+        cls,
+        base_dir: Path,
+        artifacts_root_override: Path | None = None,
+        ephemeral: bool = False,
     ) -> RunWorkspace:
         """create."""
         return cls(
             base_dir=base_dir,
             run_id=uuid4().hex,
             artifacts_root_override=artifacts_root_override,
+            ephemeral=ephemeral,
         )
 
     @classmethod
     def for_run(
-        cls, base_dir: Path, run_id: str, artifacts_root_override: Path | None = None
+        cls,
+        base_dir: Path,
+        run_id: str,
+        artifacts_root_override: Path | None = None,
+        ephemeral: bool = False,
     ) -> RunWorkspace:
         """for_run."""
         return cls(
             base_dir=base_dir,
             run_id=run_id,
             artifacts_root_override=artifacts_root_override,
+            ephemeral=ephemeral,
         )
 
     @property
-    def artifacts_root(self) -> Path:
-        """artifacts_root."""
+    def persistent_root(self) -> Path:
+        """Return the artifacts root runs are materialized into."""
         if self.artifacts_root_override is not None:
             return self.artifacts_root_override
         return self.base_dir / "artifacts"
 
+    @property
+    def artifacts_root(self) -> Path:
+        """artifacts_root."""
+        if self.ephemeral:
+            return scratch_root()
+        return self.persistent_root
+
+    def materialize(self) -> Path:
+        """Move an ephemeral run directory under the artifacts root.
+
+        Returns:
+            The run directory under the artifacts root.
+        """
+        target = self.persistent_root / self.run_id
+        if not self.ephemeral:
+            return target
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            shutil.copytree(self.run_dir, target, dirs_exist_ok=True)
+            self.discard()
+        else:
+            shutil.move(self.run_dir, target)
+            with contextlib.suppress(OSError):
+                scratch_root().rmdir()
+        return target
+
+    def discard(self) -> None:
+        """Delete an ephemeral run directory; persistent runs are kept."""
+        if self.ephemeral:
+            shutil.rmtree(self.run_dir, ignore_errors=True)
+            with contextlib.suppress(OSError):
+                scratch_root().rmdir()
+
     @property
     def run_dir(self) -> Path:
         """run_dir."""
@@ -70,6 +146,36 @@ class RunWorkspace:
         """candidate_store_dir."""
         return self.base_dir / "candidate_store"
 
+    @property
+    def prediction_cache_dir(self) -> Path:
+        """prediction_cache_dir."""
+        return self.base_dir / "prediction_cache"
+
+    @property
+    def prediction_cache_log_path(self) -> Path:
+        """prediction_cache_log_path."""
+        return self.run_dir / "prediction_cache.json"
+
+    @property
+    def provider_selection_path(self) -> Path:
+        """provider_selection_path."""
+        return self.run_dir / "provider_selection.json"
+
+    @property
+    def loop_checkpoint_path(self) -> Path:
+        """loop_checkpoint_path."""
+        return self.run_dir / "loop_checkpoint.json"
+
+    @property
+    def surrogate_dir(self) -> Path:
+        """surrogate_dir."""
+        return self.base_dir / "surrogate"
+
+    @property
+    def population_dir(self) -> Path:
+        """population_dir."""
+        return self.run_dir / "population"
+
     @property
     def config_path(self) -> Path:
         """config_path."""
@@ -172,6 +278,17 @@ class RunWorkspace:
         write_json_atomic(self.report_path, {})
         write_json_atomic(self.telemetry_path, {})
 
+    def reopen(self) -> None:
+        """Reopen an existing run's workspace, keeping every file in it.
+
+        Raises:
+            FileNotFoundError: If the run directory does not exist.
+        """
+        if not self.run_dir.is_dir():
+            raise FileNotFoundError(f"No workspace for run {self.run_id}")
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self.artifact_items_dir.mkdir(parents=True, exist_ok=True)
+
     def validate(self) -> list[str]:
         """validate."""
         errors: list[str] = []
@@ -203,3 +320,87 @@ def write_text_atomic(path: Path, payload: str) -> None:
 def write_json_atomic(path: Path, payload: dict[str, Any]) -> None:
     """write_json_atomic."""
     write_text_atomic(path, json.dumps(payload, indent=2, sort_keys=True))
+
+
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` across processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class WriteBehindJournal:
+    """Buffer a run's JSON files in memory and persist them at checkpoints.
+
+    ``write`` keeps only the latest payload per path; ``checkpoint`` flushes
+    under the ``iteration`` policy and ``flush`` always does. Flushing hands
+    pending files to the background ``ArtifactWriter`` in last-write order,
+    a rewritten file moving behind every file written before it, with
+    ``state.json`` last, so a crash never leaves a state that references files
+    missing from disk. The ``immediate`` policy submits on every write.
+    ``read`` serves the latest payload from memory, so callers never see a
+    file the writer has not reached yet.
+    """
+
+    def __init__(
+        self,
+        policy: str = "iteration",
+        commit_name: str = "state.json",
+        durability: str = "none",
+    ) -> None:
+        """Create a journal with one of ``STATE_FLUSH_POLICIES``."""
+        if policy not in STATE_FLUSH_POLICIES:
+            raise ValueError(f"state_flush must be one of {STATE_FLUSH_POLICIES}")
+        self.policy = policy
+        self.commit_name = commit_name
+        self.durability = durability
+        self.flushes = 0
+        self._pending: dict[Path, dict[str, Any]] = {}
+        self._latest: dict[Path, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def write(self, path: Path, payload: dict[str, Any]) -> None:
+        """Record ``payload`` as the next content of ``path``."""
+        with self._lock:
+            self._latest[path] = payload
+            if self.policy != "immediate":
+                self._pending.pop(path, None)
+                self._pending[path] = payload
+                return
+        artifact_writer().write_json(path, payload, self.durability)
+
+    def read(self, path: Path) -> dict[str, Any] | None:
+        """Return the latest payload for ``path``, else its content on disk."""
+        with self._lock:
+            payload = self._latest.get(path)
+        if payload is not None:
+            return payload
+        if path.exists():
+            return json.loads(path.read_text())
+        return None
+
+    def checkpoint(self) -> None:
+        """Mark an iteration boundary."""
+        if self.policy == "iteration":
+            self.flush()
+
+    def flush(self) -> None:
+        """Submit every pending file, committing ``state.json`` last."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        ordered = sorted(
+            pending.items(), key=lambda item: item[0].name == self.commit_name
+        )
+        writer = artifact_writer()
+        for path, payload in ordered:
+            writer.write_json(path, payload, self.durability)
+        self.flushes += 1
@@ -0,0 +1,194 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+"""Background artifact writer with coalescing and fsync policies."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any
+from uuid import uuid4
+
+DURABILITY_POLICIES = ("none", "run", "write")
+COMPACT_NAMES = frozenset({"prediction_cache.json", "provider_selection.json"})
+COMPACT_DIRS = frozenset({"artifacts"})
+
+
+def is_machine_artifact(path: Path) -> bool:
+    """Return True for files only tools read, which are written compactly."""
+    return path.name in COMPACT_NAMES or path.parent.name in COMPACT_DIRS
+
+
+def dump_json(payload: Any, compact: bool = False) -> str:  # noqa: ANN401
+    """Serialize ``payload`` with sorted keys, pretty unless ``compact``."""
+    if compact:
+        return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return json.dumps(payload, indent=2, sort_keys=True, default=str)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry so a completed rename survives power loss."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@dataclass
+class _Write:
+    text: str
+    durability: str
+
+
+class ArtifactWriter:
+    """Write run files on a background thread.
+
+    Submitted files are queued in order; a newer payload for a path that is
+    still queued replaces it and moves to the back of the queue, so repeated
+    writes of the same file cost one disk write and a file never reaches disk
+    ahead of a write queued before its latest payload. Each file is written to
+    a temporary sibling and renamed, so readers only ever see complete files.
+    ``durability`` is ``none`` (no fsync), ``write`` (fsync every file before
+    its rename) or ``run`` (fsync the run's files and directories at ``flush``).
+    """
+
+    def __init__(self) -> None:
+        """Create an idle writer; the thread starts on first submit."""
+        self._pending: dict[Path, _Write] = {}
+        self._in_flight: Path | None = None
+        self._unsynced: set[Path] = set()
+        self._errors: list[tuple[Path, BaseException]] = []
+        self._dirs: set[Path] = set()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self.writes = 0
+        self.coalesced = 0
+
+    def write_json(
+        self,
+        path: Path,
+        payload: Any,  # noqa: ANN401
+        durability: str = "none",
+        compact: bool | None = None,
+    ) -> None:
+        """Queue ``payload`` for ``path``; compact when it is machine-only."""
+        if compact is None:
+            compact = is_machine_artifact(path)
+        self.write_text(path, dump_json(payload, compact), durability)
+
+    def write_text(self, path: Path, text: str, durability: str = "none") -> None:
+        """Queue ``text`` for ``path``."""
+        if durability not in DURABILITY_POLICIES:
+            raise ValueError(f"durability must be one of {DURABILITY_POLICIES}")
+        with self._cond:
+            if self._pending.pop(path, None) is not None:
+                self.coalesced += 1
+            self._pending[path] = _Write(text=text, durability=durability)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="artifact-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, run_dir: Path | None = None) -> None:
+        """Block until queued files under ``run_dir`` (or all) are on disk.
+
+        Files written under the ``run`` policy are fsynced here, together with
+        their directories.
+
+        Raises:
+            OSError: The first write that failed under ``run_dir`` since the
+                last flush.
+        """
+
+        def _matches(path: Path | None) -> bool:
+            return path is not None and (
+                run_dir is None or path.is_relative_to(run_dir)
+            )
+
+        with self._cond:
+            self._cond.wait_for(
+                lambda: (
+                    not _matches(self._in_flight)
+                    and not any(_matches(path) for path in self._pending)
+                )
+            )
+            unsynced = {path for path in self._unsynced if _matches(path)}
+            self._unsynced -= unsynced
+            errors = [item for item in self._errors if _matches(item[0])]
+            self._errors = [item for item in self._errors if item not in errors]
+            self._dirs = {path for path in self._dirs if not _matches(path)}
+        for directory in sorted({path.parent for path in unsynced}):
+            for path in sorted(unsynced):
+                if path.parent == directory and path.exists():
+                    with path.open("rb") as handle:
+                        os.fsync(handle.fileno())
+            _fsync_dir(directory)
+        if errors:
+            raise errors[0][1]
+
+    def _run(self) -> None:
+        """Drain the queue in submission order."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: bool(self._pending))
+                path = next(iter(self._pending))
+                item = self._pending.pop(path)
+                self._in_flight = path
+            try:
+                self._write(path, item)
+            except OSError as exc:
+                with self._cond:
+                    self._errors.append((path, exc))
+            finally:
+                with self._cond:
+                    self._in_flight = None
+                    self.writes += 1
+                    if item.durability == "run":
+                        self._unsynced.add(path)
+                    self._cond.notify_all()
+
+    def _write(self, path: Path, item: _Write) -> None:
+        """Write one file atomically, creating its directory once."""
+        with self._cond:
+            known = path.parent in self._dirs
+            self._dirs.add(path.parent)
+        if not known:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._replace(path, item)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._replace(path, item)
+
+    @staticmethod
+    def _replace(path: Path, item: _Write) -> None:
+        """Write a temporary sibling and rename it over ``path``."""
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write(item.text)
+            if item.durability == "write":
+                handle.flush()
+                os.fsync(handle.fileno())
+        tmp_path.replace(path)
+        if item.durability == "write":
+            _fsync_dir(path.parent)
+
+
+_WRITER: ArtifactWriter | None = None
+_WRITER_LOCK = threading.Lock()
+
+
+def artifact_writer() -> ArtifactWriter:
+    """Return the process-wide artifact writer."""
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            _WRITER = ArtifactWriter()
+        return _WRITER
@@ -5,10 +5,24 @@
 
 from __future__ import annotations
 
-from agentic_proteins.providers.factory import create_provider
+from agentic_proteins.providers.base import BaseProvider
+from agentic_proteins.providers.cache import CachedProvider, PredictionCache
+from agentic_proteins.providers.chain import ProviderChain, ProviderChainPolicy
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.factory import provider_key
 from agentic_proteins.providers.heuristic import HeuristicStructureProvider
+from agentic_proteins.providers.idempotency import idempotency_scope
+from agentic_proteins.providers.pool import PooledProvider, provider_pool
+from agentic_proteins.providers.scheduler import ScheduledProvider, provider_scheduler
 from agentic_proteins.tools.base import Tool
-from agentic_proteins.tools.schemas import InvocationInput, ToolMetric, ToolResult
+from agentic_proteins.tools.schemas import (
+    InvocationInput,
+    ToolError,
+    ToolMetric,
+    ToolResult,
+)
+
+_ERROR_TYPES = {"OOM_ERROR": "oom"}
 
 
 class HeuristicStructureTool(Tool):
@@ -17,10 +31,44 @@ class HeuristicStructureTool(Tool):
     name = HeuristicStructureProvider.name
     version = "v1"
 
-    def __init__(self, provider_name: str | None = None) -> None:
+    def __init__(
+        self,
+        provider_name: str | None = None,
+        cache: PredictionCache | None = None,
+        policy: ProviderChainPolicy | None = None,
+    ) -> None:
         """__init__."""
+        self._policy = policy
+        if policy is not None:
+            provider_name = policy.providers[0]
         self._provider_name = provider_name or self.name
         self.name = self._provider_name
+        self._cache = cache
+
+    @staticmethod
+    def _load(name: str) -> BaseProvider:
+        """Return a pooled provider behind the process-wide scheduler."""
+        return ScheduledProvider(
+            PooledProvider(provider_pool(), name), provider_scheduler()
+        )
+
+    def _scheduled(self) -> BaseProvider:
+        """Return the scheduled provider, or the provider chain when configured."""
+        if self._policy is not None:
+            return ProviderChain(self._policy, self._load)
+        return self._load(self._provider_name)
+
+    def _provider(self) -> BaseProvider:
+        """Return the scheduled provider, behind the prediction cache when enabled."""
+        if self._cache is None:
+            return self._scheduled()
+        return CachedProvider(
+            self._policy.label if self._policy else self._provider_name,
+            self._scheduled,
+            self._cache,
+            tool_version=self.version,
+            revision=provider_key(self._provider_name).revision,
+        )
 
     def run(self, invocation_id: str, inputs: list[InvocationInput]) -> ToolResult:
         """run."""
@@ -31,8 +79,23 @@ class HeuristicStructureTool(Tool):
         if not sequence:
             return self._error_result(invocation_id, "missing_sequence")
 
-        provider = create_provider(self._provider_name)
-        prediction = provider.predict(sequence, seed=None)
+        provider = self._provider()
+        try:
+            # Retries reuse the invocation id, so remote jobs are resumed.
+            with idempotency_scope(invocation_id):
+                prediction = provider.predict(sequence, seed=None)
+        except PredictionError as exc:
+            return ToolResult(
+                invocation_id=invocation_id,
+                tool_name=self._provider_name,
+                status="failure",
+                outputs=[],
+                metrics=[],
+                error=ToolError(
+                    error_type=_ERROR_TYPES.get(exc.code, exc.code.lower()),
+                    message=str(exc),
+                ),
+            )
         raw = prediction.raw or {}
 
         outputs = [
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from time import perf_counter
+
+import pytest
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.control import RuntimeSession
+from agentic_proteins.runtime.infra import RunConfig
+
+RUNS = 40
+VALID = "ACDEFGHIK"
+INVALID = "AC1!"
+
+
+def _per_second(manager: RunManager, sequence: str) -> float:
+    manager.run(sequence)
+    start = perf_counter()
+    for _ in range(RUNS):
+        manager.run(sequence)
+    return RUNS / (perf_counter() - start)
+
+
+def test_ephemeral_validation_throughput(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    session = RuntimeSession()
+    persistent = RunManager(
+        tmp_path / "persistent",
+        RunConfig(dry_run=True, logging_enabled=False),
+        session,
+    )
+    ephemeral = RunManager(
+        tmp_path / "ephemeral",
+        RunConfig(dry_run=True, ephemeral=True, logging_enabled=False),
+        session,
+    )
+    report = {
+        "persistent_dry_runs_per_s": _per_second(persistent, VALID),
+        "ephemeral_dry_runs_per_s": _per_second(ephemeral, VALID),
+        "persistent_invalid_per_s": _per_second(persistent, INVALID),
+        "ephemeral_invalid_per_s": _per_second(ephemeral, INVALID),
+    }
+    report = {key: round(value, 1) for key, value in report.items()}
+    (tmp_path / "ephemeral_validation.json").write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))
+    assert not (tmp_path / "ephemeral" / "artifacts").exists()
+    assert len(list((tmp_path / "persistent" / "artifacts").iterdir())) == 2 * (
+        RUNS + 1
+    )
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from time import perf_counter
+from types import SimpleNamespace
+
+import pytest
+
+from agentic_proteins.providers.local.esmfold import (
+    ESMFoldCPUProfile,
+    LocalESMFoldProvider,
+)
+from tests.helpers.esmfold import fake_tokenizer
+
+torch = pytest.importorskip("torch")
+
+SETTINGS = {
+    "baseline": None,
+    "threads": ESMFoldCPUProfile(intra_op_threads=max(1, (os.cpu_count() or 2) // 2)),
+    "bf16": ESMFoldCPUProfile(bf16_autocast=True),
+    "int8_trunk": ESMFoldCPUProfile(int8_trunk=True),
+    "chunk_32": ESMFoldCPUProfile(chunk_size=32),
+}
+
+
+class _PairTrunk(torch.nn.Module):
+    """Stand-in for the folding trunk: an L x L pair update, optionally chunked."""
+
+    def __init__(self, width: int) -> None:
+        super().__init__()
+        self.proj = torch.nn.Linear(width, 32)
+        self.chunk_size: int | None = None
+
+    def set_chunk_size(self, chunk_size: int | None) -> None:
+        self.chunk_size = chunk_size
+
+    def forward(self, hidden):
+        left = self.proj(hidden)[0]
+        step = self.chunk_size or left.shape[0]
+        rows = []
+        for start in range(0, left.shape[0], step):
+            pair = left[start : start + step, None, :] * left[None, :, :]
+            rows.append(pair.float().mean(dim=(1, 2)))
+        return torch.cat(rows)
+
+
+class _MiniESMFold(torch.nn.Module):
+    """Small model shaped like ESMFold: a Linear-heavy LM trunk plus a pair trunk."""
+
+    def __init__(self, width: int = 256, layers: int = 6) -> None:
+        super().__init__()
+        self.embed = torch.nn.Embedding(20, width)
+        self.esm = torch.nn.Sequential(
+            *[torch.nn.Linear(width, width) for _ in range(layers)]
+        )
+        self.trunk = _PairTrunk(width)
+
+    def forward(self, input_ids, attention_mask):
+        hidden = self.esm(self.embed(input_ids))
+        score = torch.sigmoid(self.trunk(hidden)).float()
+        length = input_ids.shape[1]
+        positions = torch.zeros((length, 14, 3))
+        positions[:, 1, 0] = torch.arange(length, dtype=torch.float32) * 3.8
+        return SimpleNamespace(positions=positions, plddt=score)
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+def test_esmfold_cpu_profile_latency_and_rss(tmp_path: Path) -> None:
+    torch.manual_seed(0)
+    weights = _MiniESMFold().state_dict()
+    threads = torch.get_num_threads()
+    sequence = "ACDEFGHIKLMNPQRSTVWY" * 20
+    report: dict[str, dict[str, object]] = {}
+    try:
+        for label, profile in SETTINGS.items():
+            provider = LocalESMFoldProvider(device="cpu", cpu_profile=profile)
+            provider.cpu_profile = profile
+            provider.model = _MiniESMFold()
+            provider.model.load_state_dict(weights)
+            provider.model.eval()
+            provider.tokenizer = fake_tokenizer
+            if profile is not None:
+                provider._profile_settings = provider._apply_cpu_profile(profile)
+            provider._model_loaded = True
+            provider.predict(sequence, timeout=30.0)
+            start = perf_counter()
+            result = provider.predict(sequence, timeout=30.0)
+            latency_ms = (perf_counter() - start) * 1000.0
+            report[label] = {
+                "latency_ms": round(latency_ms, 3),
+                "rss_bytes": _rss_bytes(),
+                "mean_plddt": round(result.raw["mean_plddt"], 3),
+                "cpu_profile": result.raw.get("cpu_profile"),
+            }
+            torch.set_num_threads(threads)
+    finally:
+        torch.set_num_threads(threads)
+
+    (tmp_path / "esmfold_cpu_profile.json").write_text(
+        json.dumps(report, indent=2, sort_keys=True)
+    )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    assert set(report) == set(SETTINGS)
+    assert report["baseline"]["cpu_profile"] is None
+    assert report["chunk_32"]["cpu_profile"]["chunk_size"] == 32
+    assert report["int8_trunk"]["cpu_profile"]["int8_trunk"] is True
+    for entry in report.values():
+        assert entry["latency_ms"] > 0.0
+        assert abs(entry["mean_plddt"] - report["baseline"]["mean_plddt"]) < 5.0
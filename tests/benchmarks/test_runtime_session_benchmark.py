@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from time import perf_counter
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.context import create_run_context
+from agentic_proteins.runtime.control import RuntimeSession
+from agentic_proteins.runtime.control.execution import RuntimeStateMachine
+from agentic_proteins.runtime.infra import RunConfig
+
+SETUPS = 200
+RUNS = 5
+
+
+def _setup_seconds(context, session: RuntimeSession | None) -> float:
+    """Average cost of wiring one run's tool, agents and pipeline."""
+    cache_dir = context.workspace.prediction_cache_dir
+    start = perf_counter()
+    for _ in range(SETUPS):
+        active = session or RuntimeSession()
+        RuntimeStateMachine(context, active.tool_for(context.config, cache_dir), active)
+    return (perf_counter() - start) / SETUPS
+
+
+def _run_seconds(managers: list[RunManager]) -> float:
+    managers[0].run("ACDEFGHIK")
+    start = perf_counter()
+    for manager in managers[1:]:
+        manager.run("ACDEFGHIK")
+    return (perf_counter() - start) / (len(managers) - 1)
+
+
+def test_runtime_session_per_run_overhead(tmp_path: Path) -> None:
+    config = RunConfig(seed=11, logging_enabled=False)
+    context, _ = create_run_context(tmp_path / "setup", config)
+    session = RuntimeSession()
+    report = {
+        "fresh_setup_ms": _setup_seconds(context, None) * 1000.0,
+        "shared_setup_ms": _setup_seconds(context, session) * 1000.0,
+        "fresh_run_ms": _run_seconds(
+            [RunManager(tmp_path / "fresh", config) for _ in range(RUNS + 1)]
+        )
+        * 1000.0,
+        "shared_run_ms": _run_seconds(
+            [RunManager(tmp_path / "shared", config, session) for _ in range(RUNS + 1)]
+        )
+        * 1000.0,
+    }
+    report = {key: round(value, 3) for key, value in report.items()}
+    (tmp_path / "runtime_session.json").write_text(json.dumps(report, indent=2))
+    print(json.dumps(report, indent=2))
+    assert report["shared_setup_ms"] < report["fresh_setup_ms"]
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+
+class FakeInputs(dict):
+    """Tokenizer output that ignores device moves."""
+
+    def to(self, _device: str) -> FakeInputs:
+        return self
+
+
+def fake_tokenizer(sequences, **_kwargs) -> FakeInputs:
+    """Right-pad ``sequences`` to the longest one, masking the padding."""
+    width = max(len(seq) for seq in sequences)
+    ids = torch.zeros((len(sequences), width), dtype=torch.long)
+    mask = torch.zeros((len(sequences), width), dtype=torch.long)
+    for row, seq in enumerate(sequences):
+        ids[row, : len(seq)] = torch.tensor([ord(c) % 20 for c in seq])
+        mask[row, : len(seq)] = 1
+    return FakeInputs(input_ids=ids, attention_mask=mask)
+
+
+class FakeTrunk:
+    """Folding trunk stub that records the chunk size it was given."""
+
+    def __init__(self) -> None:
+        self.chunk_size: int | None = None
+
+    def set_chunk_size(self, chunk_size: int | None) -> None:
+        self.chunk_size = chunk_size
+
+
+class FakeESMFold(torch.nn.Module):
+    """ESMFold-shaped model returning deterministic per-position outputs.
+
+    Records each forward's (batch, width) and language-model dtype, and raises
+    CUDA OOM for batches larger than ``oom_above``.
+    """
+
+    def __init__(self, oom_above: int | None = None) -> None:
+        super().__init__()
+        self.esm = torch.nn.Sequential(torch.nn.Linear(8, 8), torch.nn.Linear(8, 8))
+        self.trunk = FakeTrunk()
+        self.oom_above = oom_above
+        self.batch_shapes: list[tuple[int, int]] = []
+        self.dtypes: list[torch.dtype] = []
+
+    def forward(self, input_ids, attention_mask):
+        batch, width = input_ids.shape
+        if self.oom_above is not None and batch > self.oom_above:
+            raise torch.cuda.OutOfMemoryError("out of memory")
+        self.batch_shapes.append((batch, width))
+        self.dtypes.append(self.esm(torch.ones((batch, width, 8))).dtype)
+        positions = torch.arange(batch * width * 14 * 3, dtype=torch.float32)
+        positions = positions.reshape(1, batch, width, 14, 3).repeat(2, 1, 1, 1, 1)
+        plddt = torch.full((batch, width, 37), 0.8)
+        return SimpleNamespace(positions=positions, plddt=plddt)
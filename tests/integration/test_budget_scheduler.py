@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import time
+
+from pydantic import ValidationError
+import pytest
+
+from agentic_proteins.design_loop.loop import LoopRunner
+from agentic_proteins.providers import pool as pool_module
+from agentic_proteins.providers.factory import create_provider
+from agentic_proteins.providers.heuristic import HeuristicStructureProvider
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig, capabilities
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+SEQUENCE = "ACDEFGHIKLMNPQRSTVWY"
+
+
+class _SlowProvider(HeuristicStructureProvider):
+    def __init__(self, name: str, delay_s: float, calls: list[str]) -> None:
+        self.name = name
+        self._delay_s = delay_s
+        self._calls = calls
+
+    def predict(self, sequence: str, *args, **kwargs):
+        self._calls.append(self.name)
+        time.sleep(self._delay_s)
+        return super().predict(sequence, *args, **kwargs)
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    seen: list[str] = []
+
+    def factory(name: str, **options):
+        if name == "api_colabfold":
+            return _SlowProvider(name, 0.02, seen)
+        if name == "heuristic_proxy":
+            return _SlowProvider(name, 0.005, seen)
+        return create_provider(name, **options)
+
+    monkeypatch.setattr(pool_module, "_POOL", pool_module.ProviderPool(factory=factory))
+    monkeypatch.setattr(capabilities, "provider_requirements", lambda name: [])
+    return seen
+
+
+def test_exploration_and_confirmation_use_their_providers(
+    tmp_path: Path, calls: list[str]
+) -> None:
+    config = RunConfig(
+        predictors_enabled=["heuristic_proxy", "api_colabfold"],
+        loop_budget={"explore": "heuristic_proxy", "confirm": "api_colabfold"},
+        loop_max_iterations=3,
+        loop_max_cost=10.0,
+        loop_stagnation_window=10,
+        logging_enabled=False,
+    )
+    RunManager(tmp_path, config).run(SEQUENCE, run_id="staged")
+    assert calls == ["heuristic_proxy"] * 3 + ["api_colabfold"]
+    workspace = RunWorkspace.for_run(tmp_path, "staged")
+    budget = json.loads(workspace.analysis_path.read_text())["budget"]
+    stages = [(item["stage"], item["provider"]) for item in budget["iterations"]]
+    assert stages == [("explore", "heuristic_proxy")] * 3 + [
+        ("confirm", "api_colabfold")
+    ]
+    assert budget["providers"]["api_colabfold"]["compute_s"] >= 0.02
+    assert budget["cost_model"]["heuristic_proxy"]["samples"] == 3
+    telemetry = json.loads(workspace.telemetry_path.read_text())
+    assert telemetry["cost"]["cpu_seconds"] == pytest.approx(
+        budget["compute_s"], abs=1e-5
+    )
+
+
+def test_compute_budget_bounds_population_runs(
+    tmp_path: Path, calls: list[str]
+) -> None:
+    config = RunConfig(
+        loop_population={"variants": 4, "elites": 2, "workers": 1},
+        loop_budget={"max_compute_s": 0.25},
+        loop_max_iterations=50,
+        loop_max_cost=1000.0,
+        loop_stagnation_window=100,
+        logging_enabled=False,
+        seed=2,
+    )
+    events = list(RunManager(tmp_path, config).stream(SEQUENCE, run_id="bounded"))
+    iterations = [event for event in events if event["event"] == "iteration"]
+    assert "budget" in iterations[-1]["stopping_criteria"]
+    assert len(iterations) < 50
+    workspace = RunWorkspace.for_run(tmp_path, "bounded")
+    budget = json.loads(workspace.analysis_path.read_text())["budget"]
+    assert budget["max_compute_s"] == 0.25
+    assert budget["compute_s"] <= 0.25 * 1.5
+    assert budget["iterations"][-1]["stage"] == "confirm"
+    assert budget["mean_abs_error_s"] is not None
+
+
+def test_wall_budget_counts_time_outside_the_stages(
+    tmp_path: Path, calls: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    decide = LoopRunner._decide_next
+
+    def slow_decide(*args, **kwargs):
+        time.sleep(0.1)
+        return decide(*args, **kwargs)
+
+    monkeypatch.setattr(LoopRunner, "_decide_next", staticmethod(slow_decide))
+    config = RunConfig(
+        loop_budget={"max_wall_s": 0.35},
+        loop_max_iterations=50,
+        loop_max_cost=100.0,
+        loop_stagnation_window=100,
+        logging_enabled=False,
+    )
+    events = list(RunManager(tmp_path, config).stream(SEQUENCE, run_id="walled"))
+    iterations = [event for event in events if event["event"] == "iteration"]
+    assert "budget" in iterations[-1]["stopping_criteria"]
+    assert len(iterations) <= 5
+
+
+def test_invalid_budget_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        RunConfig(loop_budget={"max_compute_s": 0})
+    with pytest.raises(ValidationError):
+        RunConfig(loop_budget={"confirm": "no_such_provider"})
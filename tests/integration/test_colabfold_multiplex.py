@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.experimental.colabfold import APIColabFoldProvider
+
+
+class _StubState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.posts = 0
+        self.polls: dict[str, int] = {}
+        self.rate_limited_at: float | None = None
+        self.request_times: list[float] = []
+
+
+def _handler(state: _StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *_args) -> None:
+            return None
+
+        def _reply(self, status: int, body: dict, headers: dict | None = None) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self) -> None:
+            length = int(self.headers["Content-Length"])
+            sequence = json.loads(self.rfile.read(length))["sequences"][0]
+            with state.lock:
+                state.request_times.append(time.time())
+                state.posts += 1
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+                first_post = state.posts == 1
+            if first_post:
+                with state.lock:
+                    state.in_flight -= 1
+                    state.rate_limited_at = time.time()
+                self._reply(429, {}, {"Retry-After": "1"})
+                return
+            time.sleep(0.2)
+            with state.lock:
+                state.in_flight -= 1
+            self._reply(200, {"job_id": sequence})
+
+        def do_GET(self) -> None:
+            job_id = self.path.rsplit("/", 1)[-1]
+            with state.lock:
+                state.request_times.append(time.time())
+                state.polls[job_id] = state.polls.get(job_id, 0) + 1
+                count = state.polls[job_id]
+            if job_id == "FAIL":
+                self._reply(200, {"status": "FAILED", "error": "boom"})
+            elif job_id.startswith("K") and count == 1:
+                self._reply(200, {"status": "RUNNING"})
+            else:
+                pdb = f"MODEL {job_id}"
+                self._reply(
+                    200, {"status": "SUCCESS", "result": {"models": [{"pdb": pdb}]}}
+                )
+
+    return Handler
+
+
+@pytest.fixture()
+def stub():
+    state = _StubState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/prediction", state
+    server.shutdown()
+    server.server_close()
+
+
+def test_predict_many_multiplexes_jobs_and_shares_retry_after(stub) -> None:
+    url, state = stub
+    provider = APIColabFoldProvider(api_url=url, pool_size=4)
+    sequences = ["ACDE", "KLMN", "FAIL", "PQRS", "TVWY"]
+    results = provider.predict_many(sequences, timeout=8.0, seed=3)
+    provider.close()
+
+    assert state.max_in_flight > 1
+    assert state.rate_limited_at is not None
+    # Beyond the first pool-sized wave, no request may start inside Retry-After.
+    later = sorted(state.request_times)[4:]
+    assert later and min(later) >= state.rate_limited_at + 0.9
+    for sequence, result in zip(sequences, results, strict=True):
+        if sequence == "FAIL":
+            assert isinstance(result, PredictionError)
+            assert result.code == "REMOTE_ERROR"
+        else:
+            assert not isinstance(result, PredictionError)
+            assert result.pdb_text == f"MODEL {sequence}"
+            assert result.raw["seed"] == 3
+    assert state.polls["KLMN"] == 2
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace, scratch_root
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> RunManager:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    return RunManager(
+        tmp_path, RunConfig(dry_run=True, ephemeral=True, logging_enabled=False)
+    )
+
+
+def test_ephemeral_runs_leave_nothing_behind(
+    tmp_path: Path, manager: RunManager
+) -> None:
+    valid = manager.run("ACDEFGHIK", run_id="eph-valid")
+    invalid = manager.run("AC1!", run_id="eph-invalid")
+    assert valid["tool_status"] == "dry_run"
+    assert invalid["failure_type"] == "input_invalid"
+    assert not (tmp_path / "artifacts").exists()
+    assert not (tmp_path / "candidate_store").exists()
+    assert not (scratch_root() / "eph-valid").exists()
+    assert not (scratch_root() / "eph-invalid").exists()
+
+
+def test_materialized_run_lands_under_artifacts_root(
+    tmp_path: Path, manager: RunManager
+) -> None:
+    output = manager.run("ACDEFGHIK", run_id="eph-kept", materialize=True)
+    workspace = RunWorkspace.for_run(tmp_path, "eph-kept")
+    assert workspace.validate() == []
+    assert json.loads(workspace.run_output_path.read_text()) == output
+    assert not (scratch_root() / "eph-kept").exists()
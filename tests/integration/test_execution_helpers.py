@@ -8,6 +8,7 @@ import pytest
 from agentic_proteins.runtime.context import create_run_context, VersionInfo, RunLifecycleState
 from agentic_proteins.runtime.control.execution import (
     _build_run_summary,
+    _app_version,
     _ensure_telemetry_costs,
     _select_structure_tool,
     _version_info,
@@ -39,7 +40,9 @@ def test_version_info_handles_missing_package(monkeypatch: pytest.MonkeyPatch) -
         raise importlib.metadata.PackageNotFoundError()
 
     monkeypatch.setattr(importlib.metadata, "version", _missing)
+    _app_version.cache_clear()
     info = _version_info(None)
+    _app_version.cache_clear()
     assert info.app_version == "unknown"
 
 
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import threading
 import time
 from typing import Iterator
 
 import pytest
 
+from agentic_proteins.core.cancellation import on_cancel
 from agentic_proteins.core.tooling import InvocationInput, ToolInvocationSpec, ToolResult
 from agentic_proteins.core.execution import ExecutionTask
 from agentic_proteins.execution.compiler.boundary import ToolBoundary, evaluate_failure
 from agentic_proteins.execution.runtime.executor import LocalExecutor
+from agentic_proteins.providers.chain import (
+    ChainEvent,
+    consume_chain_event,
+    restore_chain_event,
+)
 from agentic_proteins.tools.base import Tool
 
 
@@ -110,3 +117,70 @@ def test_tool_boundary_and_failure_evaluation() -> None:
     assert missing.status == "failure"
     assert missing.error
     assert missing.error.error_type == "missing_tool"
+
+
+class _HangingTool(Tool):
+    name = "dummy"
+    version = "v1"
+
+    def __init__(self) -> None:
+        self.released = threading.Event()
+
+    def run(self, invocation_id: str, inputs: list[InvocationInput]) -> ToolResult:
+        on_cancel(self.released.set)
+        self.released.wait(5.0)
+        return ToolResult(
+            invocation_id=invocation_id,
+            tool_name=self.name,
+            status="success",
+            outputs=[],
+            metrics=[],
+            error=None,
+        )
+
+
+class _EventTool(_DummyTool):
+    def run(self, invocation_id: str, inputs: list[InvocationInput]) -> ToolResult:
+        restore_chain_event(ChainEvent(chain="fallback:a", winner="a", latency_ms=1.0))
+        return super().run(invocation_id, inputs)
+
+
+def test_local_executor_preempts_hung_tool_and_runs_cleanup() -> None:
+    tool = _HangingTool()
+    executor = LocalExecutor(boundary=ToolBoundary({("dummy", "v1"): tool}))
+    start = time.monotonic()
+    result = executor.run(_task(timeout_ms=100), context=None)  # type: ignore[arg-type]
+    assert time.monotonic() - start < 1.0
+    assert result.error
+    assert result.error.error_type == "timeout"
+    assert result.error.message == "timeout_preempted"
+    assert tool.released.is_set()
+    trace = executor.consume_trace()
+    assert trace is not None
+    assert trace.status == "failure"
+    assert executor.consume_trace() is None
+
+
+def test_local_executor_reports_a_task_that_ignores_cancellation() -> None:
+    release = threading.Event()
+
+    class _StubbornTool(_HangingTool):
+        def run(self, invocation_id: str, inputs: list[InvocationInput]) -> ToolResult:
+            release.wait(5.0)
+            return super().run(invocation_id, inputs)
+
+    executor = LocalExecutor(boundary=ToolBoundary({("dummy", "v1"): _StubbornTool()}))
+    result = executor.run(_task(timeout_ms=100), context=None)  # type: ignore[arg-type]
+    release.set()
+    assert result.error
+    assert result.error.error_type == "timeout"
+    assert result.error.message == "timeout_abandoned"
+
+
+def test_supervised_run_hands_provider_events_to_caller() -> None:
+    executor = LocalExecutor(boundary=ToolBoundary({("dummy", "v1"): _EventTool()}))
+    result = executor.run(_task(timeout_ms=5000), context=None)  # type: ignore[arg-type]
+    assert result.status == "success"
+    event = consume_chain_event()
+    assert event is not None
+    assert event.winner == "a"
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from agentic_proteins.core.execution import (
+    ExecutionContext,
+    ExecutionGraph,
+    ExecutionTask,
+    ResourceLimits,
+)
+from agentic_proteins.core.tooling import (
+    InvocationInput,
+    ToolInvocationSpec,
+    ToolResult,
+)
+from agentic_proteins.execution.compiler.boundary import ToolBoundary
+from agentic_proteins.execution.runtime.executor import LocalExecutor
+from agentic_proteins.execution.runtime.graph import GraphExecutor
+from agentic_proteins.state.schemas import StateSnapshot
+from agentic_proteins.tools.base import Tool
+from agentic_proteins.tools.schemas import ToolError
+
+
+class _SleepTool(Tool):
+    name = "sleep"
+    version = "v1"
+
+    def run(self, invocation_id: str, inputs: list[InvocationInput]) -> ToolResult:
+        values = self._inputs_to_dict(inputs)
+        time.sleep(float(values.get("delay", "0")))
+        error_type = values.get("error")
+        return ToolResult(
+            invocation_id=invocation_id,
+            tool_name=self.name,
+            status="failure" if error_type else "success",
+            outputs=[],
+            metrics=[],
+            error=ToolError(error_type=error_type, message="boom")
+            if error_type
+            else None,
+        )
+
+
+def _task(task_id: str, delay: float = 0.0, error: str | None = None) -> ExecutionTask:
+    inputs = [InvocationInput(name="delay", value=str(delay))]
+    if error:
+        inputs.append(InvocationInput(name="error", value=error))
+    return ExecutionTask(
+        task_id=task_id,
+        tool_invocation=ToolInvocationSpec(
+            invocation_id=f"inv-{task_id}",
+            tool_name="sleep",
+            tool_version="v1",
+            inputs=inputs,
+            expected_outputs=[],
+            constraints=[],
+            origin_task_id=task_id,
+        ),
+        input_state_id="state-0",
+        expected_output_schema="tool_output",
+    )
+
+
+def _graph(
+    tasks: list[ExecutionTask], dependencies: dict[str, list[str]]
+) -> ExecutionGraph:
+    return ExecutionGraph(
+        tasks={task.task_id: task for task in tasks},
+        dependencies={
+            task.task_id: dependencies.get(task.task_id, []) for task in tasks
+        },
+        entry_tasks=[
+            task.task_id for task in tasks if not dependencies.get(task.task_id)
+        ],
+    )
+
+
+def _context(max_concurrent_tasks: int) -> ExecutionContext:
+    return ExecutionContext(
+        execution_id="graph-test",
+        plan_fingerprint="fp",
+        initial_state=StateSnapshot(
+            state_id="state-0",
+            parent_state_id=None,
+            plan_fingerprint="fp",
+            timestamp="2025-01-01T00:00:00Z",
+            agent_decisions=[],
+            artifacts=[],
+            metrics=[],
+            confidence_summary=[],
+        ),
+        resource_limits=ResourceLimits(max_concurrent_tasks=max_concurrent_tasks),
+    )
+
+
+def _executor() -> LocalExecutor:
+    return LocalExecutor(ToolBoundary({("sleep", "v1"): _SleepTool()}))
+
+
+def _diamond(error: str | None = None) -> ExecutionGraph:
+    return _graph(
+        [
+            _task("a"),
+            _task("b", delay=0.3, error=error),
+            _task("c", delay=0.3),
+            _task("d"),
+        ],
+        {"b": ["a"], "c": ["a"], "d": ["b", "c"]},
+    )
+
+
+def test_independent_tasks_run_concurrently() -> None:
+    graph = _diamond()
+    start = time.monotonic()
+    serial = GraphExecutor(_executor()).run(graph, _context(1))
+    serial_s = time.monotonic() - start
+    start = time.monotonic()
+    parallel = GraphExecutor(_executor()).run(graph, _context(2))
+    parallel_s = time.monotonic() - start
+    assert parallel_s < serial_s - 0.15
+    for run in (serial, parallel):
+        assert run.outcome == "continue"
+        assert run.failed == []
+        assert run.skipped == []
+        order = [trace.task_id for trace in run.traces]
+        assert order[0] == "a"
+        assert order[-1] == "d"
+    traces = {trace.task_id: trace for trace in serial.traces}
+    assert traces["c"].queued_ms >= 250
+    assert traces["b"].observed_latency_ms >= 250
+
+
+def test_continue_failure_skips_only_dependents() -> None:
+    graph = _graph(
+        [_task("a", error="tool_error"), _task("b"), _task("c")],
+        {"b": ["a"]},
+    )
+    run = GraphExecutor(_executor(), max_workers=2).run(graph, _context(1))
+    assert run.outcome == "continue"
+    assert run.failed == ["a"]
+    assert run.skipped == ["b"]
+    assert run.results["c"].status == "success"
+
+
+@pytest.mark.parametrize(("error", "outcome"), [("fatal", "halt"), ("stale", "replan")])
+def test_fatal_and_replan_failures_stop_dispatch(error: str, outcome: str) -> None:
+    graph = _diamond(error=error)
+    run = GraphExecutor(
+        _executor(), fatal_errors={"fatal"}, replan_errors={"stale"}
+    ).run(graph, _context(1))
+    assert run.outcome == outcome
+    assert run.failed == ["b"]
+    assert run.skipped == ["c", "d"]
+
+
+def test_process_pool_runs_graph() -> None:
+    run = GraphExecutor(_executor(), max_workers=2, pool="process").run(
+        _diamond(), _context(2)
+    )
+    assert sorted(run.results) == ["a", "b", "c", "d"]
+    assert run.failed == []
+
+
+def test_invalid_graphs_and_settings_are_rejected() -> None:
+    with pytest.raises(ValueError, match="cycle"):
+        GraphExecutor(_executor()).run(
+            _graph([_task("a"), _task("b")], {"a": ["b"], "b": ["a"]}), _context(1)
+        )
+    with pytest.raises(ValueError, match="pool"):
+        GraphExecutor(_executor(), pool="gpu")
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agentic_proteins.domain.candidates.schema import Candidate
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.infra.analysis import RunAnalysis
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+SEQUENCE = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def _config(**overrides) -> RunConfig:
+    values = {
+        "loop_max_iterations": 4,
+        "loop_max_cost": 100.0,
+        "loop_stagnation_window": 10,
+        "loop_checkpoint_interval": 1,
+        "logging_enabled": False,
+        "seed": 5,
+    }
+    values.update(overrides)
+    return RunConfig(**values)
+
+
+def _candidate() -> Candidate:
+    return Candidate(candidate_id="seed-c0", sequence=SEQUENCE)
+
+
+def _crash_at(monkeypatch: pytest.MonkeyPatch, index: int) -> None:
+    record = RunAnalysis.record_iteration_delta
+
+    def crashing(self, iteration_index, *args, **kwargs):
+        if iteration_index == index:
+            raise RuntimeError("worker lost")
+        return record(self, iteration_index, *args, **kwargs)
+
+    monkeypatch.setattr(RunAnalysis, "record_iteration_delta", crashing)
+
+
+def _population_sequences(workspace: RunWorkspace) -> list[list[str]]:
+    return [
+        [item["sequence"] for item in json.loads(path.read_text())["variants"]]
+        for path in sorted(workspace.population_dir.iterdir())
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _no_prediction_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+
+
+def test_resume_continues_the_run_without_redoing_iterations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager = RunManager(tmp_path, _config())
+    with monkeypatch.context() as patch:
+        _crash_at(patch, 2)
+        crashed = manager.run_candidate(_candidate(), run_id="crashed")
+    assert crashed["tool_status"] != "success"
+    workspace = RunWorkspace.for_run(tmp_path, "crashed")
+    checkpoint = json.loads(workspace.loop_checkpoint_path.read_text())
+    assert checkpoint["loop"]["next_iteration"] == 2
+    assert checkpoint["telemetry"]["cost"]["tool_units"] == 2.0
+
+    output = manager.run_candidate(_candidate(), run_id="crashed", resume=True)
+    assert output["run_id"] == "crashed"
+    assert output["tool_status"] == "success"
+    assert not workspace.loop_checkpoint_path.exists()
+    analysis = json.loads(workspace.analysis_path.read_text())
+    deltas = analysis["iteration_deltas"]
+    assert [item["iteration_index"] for item in deltas] == [0, 1, 2, 3]
+    events = [item["event"] for item in analysis["candidate_timeline"]["seed-c0"]]
+    assert events.count("loop_resume") == 1
+    telemetry = json.loads(workspace.telemetry_path.read_text())
+    assert telemetry["cost"]["tool_units"] == 4.0
+
+
+def test_resumed_population_run_matches_an_uninterrupted_one(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = _config(loop_population={"variants": 4, "elites": 2, "workers": 2})
+    manager = RunManager(tmp_path, config)
+    whole = manager.run_candidate(_candidate(), run_id="whole")
+    with monkeypatch.context() as patch:
+        _crash_at(patch, 2)
+        manager.run_candidate(_candidate(), run_id="split")
+    split = manager.run_candidate(_candidate(), run_id="split", resume=True)
+    assert split["candidate_id"] == whole["candidate_id"]
+    assert _population_sequences(
+        RunWorkspace.for_run(tmp_path, "split")
+    ) == _population_sequences(RunWorkspace.for_run(tmp_path, "whole"))
+
+
+def test_resume_requires_a_checkpoint(tmp_path: Path) -> None:
+    manager = RunManager(tmp_path, _config(loop_checkpoint_interval=None))
+    manager.run_candidate(_candidate(), run_id="done")
+    with pytest.raises(FileNotFoundError):
+        manager.run_candidate(_candidate(), run_id="done", resume=True)
+    with pytest.raises(ValueError, match="run_id"):
+        manager.run_candidate(_candidate(), resume=True)
+
+
+def test_resume_keeps_the_run_artifacts(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager = RunManager(tmp_path, _config())
+    workspace = RunWorkspace.for_run(tmp_path, "crashed")
+    with monkeypatch.context() as patch:
+        _crash_at(patch, 2)
+        manager.run_candidate(_candidate(), run_id="crashed")
+    plan = workspace.plan_path.read_text()
+    state = workspace.state_path.read_text()
+    assert json.loads(plan)
+    assert json.loads(state)["state_id"] != "state-0"
+
+    def lost(*_args, **_kwargs):
+        raise RuntimeError("worker lost")
+
+    monkeypatch.setattr(RunManager, "_resume_candidate", lost)
+    with pytest.raises(RuntimeError, match="worker lost"):
+        manager.run_candidate(_candidate(), run_id="crashed", resume=True)
+    assert workspace.plan_path.read_text() == plan
+    assert workspace.state_path.read_text() == state
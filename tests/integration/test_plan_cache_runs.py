@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+
+def _counters(base_dir: Path, run_id: str) -> dict:
+    workspace = RunWorkspace.for_run(base_dir, run_id)
+    return json.loads(workspace.telemetry_path.read_text())["counters"]
+
+
+def test_plan_compiled_once_across_iterations_and_runs(tmp_path: Path) -> None:
+    manager = RunManager(
+        tmp_path, RunConfig(loop_max_iterations=3, logging_enabled=False)
+    )
+    first = manager.run("ACDEFGHIK")
+    second = manager.run("ACDEFGHIK")
+
+    counters = _counters(tmp_path, first["run_id"])
+    assert counters["plan_cache_misses"] == 1.0
+    assert counters.get("plan_cache_hits", 0.0) >= 1.0
+    assert "plan_cache_misses" not in _counters(tmp_path, second["run_id"])
+
+    workspace = RunWorkspace.for_run(tmp_path, first["run_id"])
+    execution = json.loads(workspace.execution_path.read_text())
+    (task,) = execution["tasks"].values()
+    assert task["tool_invocation"]["inputs"] == [
+        {"name": "sequence", "value": "ACDEFGHIK"}
+    ]
+    assert json.loads(workspace.plan_path.read_text())["tasks"]
+    assert first["plan_fingerprint"] == second["plan_fingerprint"]
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import threading
+import time
+
+from pydantic import ValidationError
+import pytest
+
+from agentic_proteins.providers import pool as pool_module
+from agentic_proteins.providers import scheduler as scheduler_module
+from agentic_proteins.providers.heuristic import HeuristicStructureProvider
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+SEQUENCE = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def _config(**overrides) -> RunConfig:
+    values = {
+        "loop_population": {"variants": 4, "elites": 2, "workers": 2},
+        "loop_max_iterations": 3,
+        "loop_max_cost": 50.0,
+        "loop_stagnation_window": 10,
+        "logging_enabled": False,
+        "seed": 7,
+    }
+    values.update(overrides)
+    return RunConfig(**values)
+
+
+def test_population_run_writes_one_artifact_per_iteration(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    output = RunManager(tmp_path, _config()).run(SEQUENCE, run_id="pop")
+    workspace = RunWorkspace.for_run(tmp_path, "pop")
+    files = sorted(path.name for path in workspace.population_dir.iterdir())
+    assert files == ["iteration_0001.json", "iteration_0002.json"]
+    payload = json.loads((workspace.population_dir / files[0]).read_text())
+    assert len(payload["variants"]) == 4
+    assert len(payload["elites"]) == 2
+    variant = payload["variants"][0]
+    assert variant["parent_id"] == "pop-c0"
+    assert len(variant["mutations"]) == 1
+    assert variant["tool_status"] == "success"
+    final = json.loads((workspace.population_dir / files[-1]).read_text())["elites"][0]
+    assert output["candidate_id"] == final
+    assert output["tool_status"] == "success"
+    telemetry = json.loads(workspace.telemetry_path.read_text())
+    assert telemetry["counters"]["population_variants"] == 8.0
+    assert telemetry["cost"]["tool_units"] == 10.0
+
+
+def test_population_run_is_reproducible_from_seed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    runs = []
+    for run_id in ("a", "b"):
+        RunManager(tmp_path, _config()).run(SEQUENCE, run_id=run_id)
+        path = RunWorkspace.for_run(tmp_path, run_id).population_dir
+        payload = json.loads((path / "iteration_0002.json").read_text())
+        runs.append([item["sequence"] for item in payload["variants"]])
+    assert runs[0] == runs[1]
+
+
+def test_population_respects_loop_max_cost(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    RunManager(tmp_path, _config(loop_max_cost=3.0)).run(SEQUENCE, run_id="capped")
+    workspace = RunWorkspace.for_run(tmp_path, "capped")
+    payload = json.loads((workspace.population_dir / "iteration_0001.json").read_text())
+    assert len(payload["variants"]) == 2
+    assert not (workspace.population_dir / "iteration_0002.json").exists()
+
+
+class _SlowProvider(HeuristicStructureProvider):
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def predict(self, sequence: str, *args, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return super().predict(sequence, *args, **kwargs)
+
+
+def test_population_variants_hold_provider_slots_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    provider = _SlowProvider()
+    monkeypatch.setattr(
+        pool_module, "_POOL", pool_module.ProviderPool(factory=lambda *_, **__: provider)
+    )
+    monkeypatch.setattr(
+        scheduler_module,
+        "_SCHEDULER",
+        scheduler_module.ProviderScheduler(limits={"heuristic_proxy": 8}),
+    )
+    config = _config(
+        loop_population={"variants": 4, "elites": 2, "workers": 4},
+        loop_max_iterations=2,
+    )
+    RunManager(tmp_path, config).run(SEQUENCE, run_id="parallel")
+    assert provider.peak == 4
+
+
+def test_invalid_population_policy_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        RunConfig(loop_population={"variants": 0})
@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+
+def test_second_run_hits_shared_prediction_cache(tmp_path: Path) -> None:
+    manager = RunManager(tmp_path)
+    first = manager.run("ACDEFGHIK")
+    second = manager.run("ACDEFGHIK")
+
+    lookups = []
+    for result in (first, second):
+        workspace = RunWorkspace.for_run(tmp_path, result["run_id"])
+        log = json.loads(workspace.prediction_cache_log_path.read_text())
+        lookups.append(log["lookups"])
+        assert not list((workspace.run_dir / "artifacts").glob("prediction_cache*"))
+    assert [item["hit"] for item in lookups[0]] == [False]
+    assert [item["hit"] for item in lookups[1]] == [True]
+    assert lookups[0][0]["key"] == lookups[1][0]["key"]
+
+    telemetry = json.loads(
+        RunWorkspace.for_run(tmp_path, second["run_id"]).telemetry_path.read_text()
+    )
+    assert telemetry["counters"]["prediction_cache_hits"] == 1.0
@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pydantic import ValidationError
+import pytest
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+
+def test_provider_policy_selection_is_in_run_summary(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    config = RunConfig(
+        provider_policy={
+            "mode": "hedge",
+            "steps": [{"provider": "heuristic_proxy", "timeout_s": 5}],
+        }
+    )
+    result = RunManager(tmp_path, config).run("ACDEFGHIK")
+    workspace = RunWorkspace.for_run(tmp_path, result["run_id"])
+    summary = json.loads(workspace.run_summary_path.read_text())
+    selection = summary["provider_selection"]
+    assert [item["winner"] for item in selection] == ["heuristic_proxy"]
+    assert selection[0]["chain"] == "hedge:heuristic_proxy"
+    assert selection[0]["attempts"][0]["status"] == "success"
+    assert summary["provider"] == "heuristic_proxy"
+
+
+def test_invalid_provider_policy_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        RunConfig(provider_policy={"mode": "race", "steps": ["heuristic_proxy"]})
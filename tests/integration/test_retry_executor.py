@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import random
+import threading
+import time
+
+from pydantic import ValidationError
+import pytest
+
+from agentic_proteins.core.cancellation import CancelToken, cancel_scope
+from agentic_proteins.core.execution import (
+    ExecutionContext,
+    ExecutionTask,
+    ResourceLimits,
+    RetryPolicy,
+)
+from agentic_proteins.core.tooling import (
+    InvocationInput,
+    ToolInvocationSpec,
+    ToolResult,
+)
+from agentic_proteins.execution.compiler.boundary import ToolBoundary
+from agentic_proteins.execution.runtime.executor import LocalExecutor
+from agentic_proteins.execution.runtime.retry import (
+    MAX_BACKOFF_MS,
+    RetryAttempt,
+    RetryingExecutor,
+    backoff_delay_ms,
+)
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.heuristic import HeuristicStructureProvider
+from agentic_proteins.providers.idempotency import current_idempotency_key
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+from agentic_proteins.state.schemas import StateSnapshot
+from agentic_proteins.tools.base import Tool
+from agentic_proteins.tools.heuristic import HeuristicStructureTool
+from agentic_proteins.tools.schemas import ToolError
+
+
+class _FlakyTool(Tool):
+    name = "flaky"
+    version = "v1"
+
+    def __init__(self, failures: int, error_type: str) -> None:
+        self.failures = failures
+        self.error_type = error_type
+        self.invocations: list[str] = []
+
+    def run(self, invocation_id: str, inputs: list[InvocationInput]) -> ToolResult:
+        self.invocations.append(invocation_id)
+        failed = len(self.invocations) <= self.failures
+        return ToolResult(
+            invocation_id=invocation_id,
+            tool_name=self.name,
+            status="failure" if failed else "success",
+            outputs=[],
+            metrics=[],
+            error=ToolError(error_type=self.error_type, message="flaky")
+            if failed
+            else None,
+        )
+
+
+def _task(policy: RetryPolicy) -> ExecutionTask:
+    return ExecutionTask(
+        task_id="t1",
+        tool_invocation=ToolInvocationSpec(
+            invocation_id="run:flaky:0",
+            tool_name="flaky",
+            tool_version="v1",
+            inputs=[],
+            expected_outputs=[],
+            constraints=[],
+            origin_task_id="t1",
+        ),
+        input_state_id="state-0",
+        expected_output_schema="tool_output",
+        retry_policy=policy,
+    )
+
+
+def _context() -> ExecutionContext:
+    return ExecutionContext(
+        execution_id="retry-test",
+        plan_fingerprint="fp",
+        initial_state=StateSnapshot(
+            state_id="state-0",
+            parent_state_id=None,
+            plan_fingerprint="fp",
+            timestamp="2025-01-01T00:00:00Z",
+            agent_decisions=[],
+            artifacts=[],
+            metrics=[],
+            confidence_summary=[],
+        ),
+        resource_limits=ResourceLimits(),
+    )
+
+
+def _retrying(
+    tool: _FlakyTool, **kwargs
+) -> tuple[RetryingExecutor, list[RetryAttempt], list[float]]:
+    attempts: list[RetryAttempt] = []
+    sleeps: list[float] = []
+    executor = RetryingExecutor(
+        LocalExecutor(ToolBoundary({("flaky", "v1"): tool})),
+        on_attempt=attempts.append,
+        rng=random.Random(0),
+        sleep=sleeps.append,
+        **kwargs,
+    )
+    return executor, attempts, sleeps
+
+
+def test_transient_failures_are_retried_with_the_same_invocation() -> None:
+    tool = _FlakyTool(failures=2, error_type="remote_error")
+    executor, attempts, sleeps = _retrying(tool)
+    result = executor.run(_task(RetryPolicy(max_retries=3, backoff_ms=100)), _context())
+    assert result.status == "success"
+    assert tool.invocations == ["run:flaky:0"] * 3
+    assert [item.attempt for item in attempts] == [0, 1, 2]
+    assert [item.status for item in attempts] == ["failure", "failure", "success"]
+    assert len(sleeps) == 2
+    assert 0.05 <= sleeps[0] <= 0.1
+    assert 0.1 <= sleeps[1] <= 0.2
+    assert attempts[1].backoff_ms == pytest.approx(sleeps[0] * 1000.0)
+    assert executor.consume_trace().status == "success"
+
+
+def test_errors_outside_retry_on_are_not_retried() -> None:
+    tool = _FlakyTool(failures=1, error_type="remote_error")
+    executor, attempts, _ = _retrying(tool)
+    policy = RetryPolicy(max_retries=3, retry_on=["timeout"])
+    result = executor.run(_task(policy), _context())
+    assert result.error.error_type == "remote_error"
+    assert len(attempts) == 1
+    result = executor.run(_task(RetryPolicy(max_retries=3)), _context())
+    assert result.status == "success"
+
+
+def test_retries_stop_at_max_retries_and_budget() -> None:
+    tool = _FlakyTool(failures=10, error_type="timeout")
+    executor, attempts, _ = _retrying(tool)
+    result = executor.run(_task(RetryPolicy(max_retries=2)), _context())
+    assert result.status == "failure"
+    assert len(attempts) == 3
+
+    spent: list[RetryAttempt] = []
+    budgeted = RetryingExecutor(
+        LocalExecutor(ToolBoundary({("flaky", "v1"): tool})),
+        budget=lambda: len(spent) < 2,
+        on_attempt=spent.append,
+        sleep=lambda _s: None,
+    )
+    budgeted.run(_task(RetryPolicy(max_retries=5)), _context())
+    assert len(spent) == 2
+
+
+def test_cancellation_interrupts_the_backoff() -> None:
+    tool = _FlakyTool(failures=10, error_type="remote_error")
+    executor = RetryingExecutor(LocalExecutor(ToolBoundary({("flaky", "v1"): tool})))
+    token = CancelToken()
+    timer = threading.Timer(0.1, token.cancel)
+    timer.start()
+    start = time.monotonic()
+    with cancel_scope(token):
+        result = executor.run(
+            _task(RetryPolicy(max_retries=3, backoff_ms=20_000)), _context()
+        )
+    timer.join()
+    assert time.monotonic() - start < 5.0
+    assert result.error.error_type == "cancelled"
+    assert len(tool.invocations) == 1
+
+
+def test_backoff_is_exponential_jittered_and_capped() -> None:
+    policy = RetryPolicy(backoff_ms=1000)
+    rng = random.Random(7)
+    for retry_index in range(4):
+        ceiling = 1000 * 2**retry_index
+        delay = backoff_delay_ms(policy, retry_index, rng)
+        assert ceiling / 2 <= delay <= ceiling
+    assert backoff_delay_ms(policy, 20, rng) <= MAX_BACKOFF_MS
+
+
+def test_prediction_errors_become_typed_tool_errors() -> None:
+    class _Failing:
+        def predict(self, *_args, **_kwargs):
+            raise PredictionError("quota", code="RATE_LIMIT")
+
+    tool = HeuristicStructureTool()
+    tool._provider = lambda: _Failing()  # type: ignore[method-assign]
+    result = tool.run("inv-1", [InvocationInput(name="sequence", value="ACDEFGHIK")])
+    assert result.status == "failure"
+    assert result.error.error_type == "rate_limit"
+
+
+def test_run_retries_transient_provider_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    calls: list[str] = []
+    predict = HeuristicStructureProvider.predict
+
+    def flaky_predict(self, sequence: str, *args, **kwargs):
+        calls.append(sequence)
+        if len(calls) == 1:
+            raise PredictionError("busy", code="REMOTE_ERROR")
+        return predict(self, sequence, *args, **kwargs)
+
+    monkeypatch.setattr(HeuristicStructureProvider, "predict", flaky_predict)
+    config = RunConfig(
+        retry_policy={"max_retries": 2, "backoff_ms": 1}, loop_max_cost=2.0
+    )
+    result = RunManager(tmp_path, config).run("ACDEFGHIK")
+    assert result["tool_status"] == "success"
+    workspace = RunWorkspace.for_run(tmp_path, result["run_id"])
+    metrics = json.loads(workspace.telemetry_path.read_text())
+    assert metrics["counters"]["tool_retries"] == 1.0
+    assert metrics["cost"]["tool_units"] == 2.0
+    assert len(calls) == 2
+
+
+def test_compute_cost_counts_only_the_successful_provider_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    calls: list[str] = []
+    predict = HeuristicStructureProvider.predict
+
+    def slow_flaky_predict(self, sequence: str, *args, **kwargs):
+        calls.append(sequence)
+        if len(calls) == 1:
+            time.sleep(0.2)
+            raise PredictionError("busy", code="REMOTE_ERROR")
+        return predict(self, sequence, *args, **kwargs)
+
+    monkeypatch.setattr(HeuristicStructureProvider, "predict", slow_flaky_predict)
+    config = RunConfig(
+        retry_policy={"max_retries": 2, "backoff_ms": 200}, loop_max_cost=2.0
+    )
+    result = RunManager(tmp_path, config).run("ACDEFGHIK")
+    assert result["tool_status"] == "success"
+    workspace = RunWorkspace.for_run(tmp_path, result["run_id"])
+    cost = json.loads(workspace.telemetry_path.read_text())["cost"]
+    assert 0.0 < cost["cpu_seconds"] < 0.1
+    assert len(calls) == 2
+
+
+def test_invalid_retry_policy_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        RunConfig(retry_policy={"max_retries": -1})
+
+
+def test_idempotency_keys_differ_between_iterations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    keys: list[str | None] = []
+    predict = HeuristicStructureProvider.predict
+
+    def keyed_predict(self, sequence: str, *args, **kwargs):
+        keys.append(current_idempotency_key())
+        return predict(self, sequence, *args, **kwargs)
+
+    monkeypatch.setattr(HeuristicStructureProvider, "predict", keyed_predict)
+    config = RunConfig(
+        loop_max_iterations=3, loop_max_cost=100.0, loop_stagnation_window=10
+    )
+    result = RunManager(tmp_path, config).run("ACDEFGHIK")
+    run_id = result["run_id"]
+    assert len(keys) == 3
+    assert len(set(keys)) == 3
+    assert [key.split(":")[:3] for key in keys] == [
+        [run_id, "heuristic_proxy", str(index)] for index in range(3)
+    ]
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from pathlib import Path
+import textwrap
+
+import pytest
+
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.local.rosettafold import LocalRoseTTAFoldProvider
+
+STUB = textwrap.dedent(
+    """
+    import json, os, sys, time
+
+    print("loading weights", flush=True)
+    print(json.dumps({"status": "ready", "pid": os.getpid()}), flush=True)
+    for line in sys.stdin:
+        job = json.loads(line)
+        if job["op"] == "ping":
+            print(json.dumps({"id": job["id"], "ok": True}), flush=True)
+            continue
+        with open(job["fasta"]) as handle:
+            sequence = handle.read().split()[-1]
+        marker = os.path.join(os.path.dirname(sys.argv[0]), "crashed")
+        if sequence.startswith("W") and not os.path.exists(marker):
+            open(marker, "w").close()
+            os._exit(3)
+        if sequence.startswith("S"):
+            time.sleep(5)
+        if sequence.startswith("E"):
+            print(json.dumps({"id": job["id"], "ok": False, "error": "bad"}), flush=True)
+            continue
+        with open(os.path.join(job["out_dir"], "model.pdb"), "w") as out:
+            out.write(f"REMARK {os.getpid()} {sequence}\\nEND\\n")
+        print(json.dumps({"id": job["id"], "ok": True}), flush=True)
+    """
+)
+
+
+@pytest.fixture()
+def provider(tmp_path: Path):
+    script = tmp_path / "rf_stub.py"
+    script.write_text(STUB)
+    prov = LocalRoseTTAFoldProvider(
+        executable=str(script),
+        docker=False,
+        weights_path=str(tmp_path / "w.pt"),
+        worker=True,
+        max_queue=2,
+    )
+    yield prov
+    prov.close()
+
+
+def _pid(pdb_text: str) -> str:
+    return pdb_text.split()[1]
+
+
+def test_worker_reuses_one_process_across_jobs(provider) -> None:
+    provider.warmup()
+    assert provider.healthcheck() is True
+    first = provider.predict("ACDE", timeout=5.0)
+    second = provider.predict("KLMN", timeout=5.0)
+    assert first.pdb_text.split()[2] == "ACDE"
+    assert _pid(first.pdb_text) == _pid(second.pdb_text)
+    assert second.raw["worker_restarts"] == 0
+    assert "loading weights" in second.raw["cmd_output"]
+
+
+def test_worker_restarts_after_crash_and_retries(provider) -> None:
+    before = provider.predict("ACDE", timeout=5.0)
+    after = provider.predict("WWWW", timeout=5.0)
+    assert after.pdb_text.split()[2] == "WWWW"
+    assert _pid(before.pdb_text) != _pid(after.pdb_text)
+    assert after.raw["worker_restarts"] == 1
+
+
+def test_worker_job_error_and_timeout(provider) -> None:
+    with pytest.raises(PredictionError) as failed:
+        provider.predict("EEEE", timeout=5.0)
+    assert failed.value.code == "REMOTE_ERROR"
+    with pytest.raises(PredictionError) as slow:
+        provider.predict("SSSS", timeout=1.0)
+    assert slow.value.code == "TIMEOUT"
+    assert provider.healthcheck() is False
+    assert provider.predict("ACDE", timeout=5.0).pdb_text.startswith("REMARK")
+
+
+def test_worker_queue_is_bounded(provider) -> None:
+    worker = provider._worker_client()
+    for _ in range(worker.max_queue):
+        worker._slots.acquire()
+    with pytest.raises(PredictionError) as full:
+        provider.predict("ACDE", timeout=5.0)
+    assert full.value.code == "QUEUE_FULL"
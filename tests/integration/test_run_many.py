@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.control.batch import derive_seed, iter_fasta
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+
+def _index(tmp_path: Path, batch_id: str) -> list[dict]:
+    lines = (tmp_path / "batches" / batch_id / "index.jsonl").read_text().splitlines()
+    return sorted((json.loads(line) for line in lines), key=lambda e: e["index"])
+
+
+def test_iter_fasta_streams_multi_records(tmp_path: Path) -> None:
+    fasta = tmp_path / "in.fasta"
+    fasta.write_text(">a desc\nACDE\nFGH\n\n>b\nKLMN\n")
+    assert list(iter_fasta(fasta)) == [("a", "ACDEFGH"), ("b", "KLMN")]
+
+
+def test_run_many_threads_indexes_every_run(tmp_path: Path) -> None:
+    manager = RunManager(tmp_path, RunConfig(seed=7, logging_enabled=False))
+    outputs = list(
+        manager.run_many(
+            ["ACDEFGHIK", "ZZZ", "ACDE"], workers=2, executor="thread", batch_id="b1"
+        )
+    )
+    assert sorted(item["run_id"] for item in outputs) == [
+        "b1-000000",
+        "b1-000001",
+        "b1-000002",
+    ]
+    entries = _index(tmp_path, "b1")
+    assert [entry["seed"] for entry in entries] == [derive_seed(7, i) for i in range(3)]
+    assert [entry["record_id"] for entry in entries] == [
+        "record_0",
+        "record_1",
+        "record_2",
+    ]
+    config = json.loads(
+        RunWorkspace.for_run(tmp_path, "b1-000002").config_path.read_text()
+    )
+    assert config["seed"] == derive_seed(7, 2)
+    summary = json.loads((tmp_path / "batches" / "b1" / "summary.json").read_text())
+    assert summary["complete"] is True
+    assert summary["total"] == 3
+    assert "failure" in {item["tool_status"] for item in outputs}
+
+
+def test_run_many_process_pool_over_fasta(tmp_path: Path) -> None:
+    fasta = tmp_path / "screen.fasta"
+    fasta.write_text(">p1\nACDEFGHIK\n>p2\nACDE\n")
+    manager = RunManager(tmp_path, RunConfig(logging_enabled=False))
+    outputs = list(manager.run_many(fasta, workers=1, batch_id="b2"))
+    assert len(outputs) == 2
+    entries = _index(tmp_path, "b2")
+    assert [entry["record_id"] for entry in entries] == ["p1", "p2"]
+    assert all(entry["status"] != "unknown" for entry in entries)
+    for entry in entries:
+        assert (tmp_path / "artifacts" / entry["run_id"] / "run_summary.json").exists()
+
+
+def test_run_many_rejects_unknown_executor(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="executor"):
+        next(RunManager(tmp_path).run_many(["ACDE"], executor="gpu"))
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+
+def _manager(tmp_path: Path, iterations: int) -> RunManager:
+    return RunManager(
+        tmp_path,
+        RunConfig(
+            loop_max_iterations=iterations,
+            loop_max_cost=float(iterations),
+            loop_stagnation_window=iterations + 1,
+            logging_enabled=False,
+        ),
+    )
+
+
+def test_stream_yields_iterations_then_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    events = list(
+        _manager(tmp_path, 3).stream("ACDEFGHIKLMNPQRSTVWY", run_id="stream-run")
+    )
+    iterations = [event for event in events if event["event"] == "iteration"]
+    assert [event["iteration_index"] for event in iterations] == [0, 1, 2]
+    assert [event["final"] for event in iterations] == [False, False, True]
+    assert "max_iterations" in iterations[-1]["stopping_criteria"]
+    assert all(event["run_id"] == "stream-run" for event in iterations)
+    assert "tool_ms" in iterations[0]["timings"]
+    assert events[-1]["event"] == "complete"
+    workspace = RunWorkspace.for_run(tmp_path, "stream-run")
+    assert events[-1]["output"] == json.loads(workspace.run_output_path.read_text())
+
+
+def test_closing_the_stream_cancels_remaining_iterations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    stream = _manager(tmp_path, 10).stream("ACDEFGHIKLMNPQRSTVWY", run_id="closed")
+    first = next(stream)
+    assert first["iteration_index"] == 0
+    stream.close()
+    workspace = RunWorkspace.for_run(tmp_path, "closed")
+    telemetry = json.loads(workspace.telemetry_path.read_text())
+    assert telemetry["cost"]["tool_units"] <= 3.0
+    assert json.loads(workspace.run_output_path.read_text())["run_id"] == "closed"
@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from agentic_proteins.api import AppConfig, create_app
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.control import RuntimeSession
+from agentic_proteins.runtime.infra import RunConfig
+
+
+def _stable(result: dict) -> dict:
+    return {
+        key: result[key]
+        for key in ("status", "tool_status", "qc_status", "plan_fingerprint")
+    }
+
+
+def test_shared_session_matches_fresh_runs(tmp_path: Path) -> None:
+    session = RuntimeSession()
+    config = RunConfig(seed=5, logging_enabled=False)
+    shared = RunManager(tmp_path / "shared", config, session)
+    first = shared.run("ACDEFGHIK")
+    second = shared.run("ACDEFGHIK")
+    fresh = RunManager(tmp_path / "fresh", config).run("ACDEFGHIK")
+
+    assert first["run_id"] != second["run_id"]
+    assert _stable(first) == _stable(second) == _stable(fresh)
+    assert len(session._tools) == 1
+
+
+def test_session_reuses_tool_per_config(tmp_path: Path) -> None:
+    session = RuntimeSession()
+    config = {"predictors_enabled": ["heuristic_proxy"]}
+    tool = session.tool_for(config, tmp_path)
+    assert session.tool_for(dict(config), tmp_path) is tool
+    assert session.executor_for(tool) is session.executor_for(tool)
+    assert session.tool_for(config, tmp_path / "other") is not tool
+
+
+def test_api_app_owns_one_session(tmp_path: Path) -> None:
+    app = create_app(AppConfig(base_dir=tmp_path))
+    session = app.state.runtime_session
+    client = TestClient(app)
+    for _ in range(2):
+        response = client.post("/api/v1/run", json={"sequence": "ACDEFGHIK"})
+        assert response.status_code == 200
+    assert app.state.runtime_session is session
+    assert len(session._tools) == 1
@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from pydantic import ValidationError
+import pytest
+
+from agentic_proteins.providers.heuristic import HeuristicStructureProvider
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+SEQUENCE = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def _config() -> RunConfig:
+    return RunConfig(
+        loop_population={"variants": 8, "elites": 2, "workers": 2},
+        loop_surrogate={"kappa": 0.5, "min_observations": 4},
+        loop_max_iterations=4,
+        loop_max_cost=100.0,
+        loop_stagnation_window=10,
+        logging_enabled=False,
+        seed=3,
+    )
+
+
+@pytest.fixture
+def learnable_provider(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    predicted: list[str] = []
+    predict = HeuristicStructureProvider.predict
+
+    def composition_predict(self, sequence: str, *args, **kwargs):
+        predicted.append(sequence)
+        result = predict(self, sequence, *args, **kwargs)
+        helix = sum(aa in "AELMQK" for aa in sequence) / len(sequence)
+        result.raw["mean_plddt"] = 40.0 + 100.0 * helix
+        return result
+
+    monkeypatch.setattr(HeuristicStructureProvider, "predict", composition_predict)
+    return predicted
+
+
+def test_surrogate_skips_variants_and_reports_savings(
+    tmp_path: Path, learnable_provider: list[str]
+) -> None:
+    RunManager(tmp_path, _config()).run(SEQUENCE, run_id="screened")
+    workspace = RunWorkspace.for_run(tmp_path, "screened")
+    analysis = json.loads(workspace.analysis_path.read_text())["surrogate"]
+    variants = [
+        variant
+        for path in sorted(workspace.population_dir.iterdir())
+        for variant in json.loads(path.read_text())["variants"]
+    ]
+    skipped = [item for item in variants if item["tool_status"] == "surrogate_skipped"]
+    assert analysis["screened"] == len(variants)
+    assert analysis["skipped"] == len(skipped) > 0
+    assert 0.0 < analysis["skip_rate"] < 1.0
+    assert analysis["mean_abs_error"] is not None
+    assert analysis["saved_provider_s"] >= 0.0
+    assert all("surrogate_mean_plddt" in item for item in skipped)
+    assert not {item["sequence"] for item in skipped} & set(learnable_provider)
+
+
+def test_surrogate_persists_across_runs(
+    tmp_path: Path, learnable_provider: list[str]
+) -> None:
+    RunManager(tmp_path, _config()).run(SEQUENCE, run_id="first")
+    (path,) = (tmp_path / "surrogate").glob("*.json")
+    first = json.loads(path.read_text())["observations"]
+    assert first == len(learnable_provider) - 1
+    RunManager(tmp_path, _config()).run(SEQUENCE, run_id="second")
+    assert json.loads(path.read_text())["observations"] > first
+
+
+def test_invalid_surrogate_policy_is_rejected() -> None:
+    with pytest.raises(ValidationError):
+        RunConfig(loop_surrogate={"ridge": -1})
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from agentic_proteins.runtime import RunManager
+from agentic_proteins.runtime.infra import RunConfig
+from agentic_proteins.runtime.workspace import RunWorkspace
+
+STABLE_FILES = ("plan.json", "execution.json", "report.json", "prediction_cache.json")
+
+
+def _run(base_dir: Path, policy: str) -> RunWorkspace:
+    config = RunConfig(
+        seed=4, loop_max_iterations=3, logging_enabled=False, state_flush=policy
+    )
+    RunManager(base_dir, config).run("ACDEFGHIK", run_id="journal-run")
+    return RunWorkspace.for_run(base_dir, "journal-run")
+
+
+def test_flush_policies_produce_identical_artifacts(tmp_path: Path) -> None:
+    outputs = {
+        policy: _run(tmp_path / policy, policy)
+        for policy in ("iteration", "end", "immediate")
+    }
+    reference = outputs["immediate"]
+    expected = {
+        path.name: path.read_bytes()
+        for path in sorted(reference.artifact_items_dir.glob("*.json"))
+    }
+    assert expected
+    for workspace in outputs.values():
+        artifacts = {
+            path.name: path.read_bytes()
+            for path in sorted(workspace.artifact_items_dir.glob("*.json"))
+        }
+        assert artifacts == expected
+        for name in STABLE_FILES:
+            assert (workspace.run_dir / name).read_bytes() == (
+                reference.run_dir / name
+            ).read_bytes()
+        assert workspace.state_path.exists()
+        assert workspace.timings_path.exists()
+
+
+def test_unknown_flush_policy_rejected() -> None:
+    with pytest.raises(ValueError, match="state_flush"):
+        RunConfig(state_flush="sometimes")
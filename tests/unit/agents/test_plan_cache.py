@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import pytest
+
+from agentic_proteins.agents.planning.cache import PlanCache
+from agentic_proteins.agents.planning.planner import PlannerAgent
+from agentic_proteins.agents.verification.critic import CriticAgent
+from agentic_proteins.core.tooling import InvocationInput, ToolInvocationSpec
+from agentic_proteins.registry.agents import AgentRegistry
+
+
+@pytest.fixture(autouse=True)
+def _registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(AgentRegistry, "_registry", {"planner": PlannerAgent})
+
+
+class _CountingPlanner(PlannerAgent):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def decide(self, payload):
+        self.calls += 1
+        return super().decide(payload)
+
+
+def test_plan_cache_compiles_once_per_key() -> None:
+    cache = PlanCache()
+    planner = _CountingPlanner()
+    first, first_hit = cache.get(planner, "predict_structure", "tool", "v1")
+    second, second_hit = cache.get(planner, "predict_structure", "tool", "v1")
+    other, other_hit = cache.get(planner, "predict_structure", "tool", "v2")
+    assert (first_hit, second_hit, other_hit) == (False, True, False)
+    assert second is first
+    assert other is not first
+    assert planner.calls == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert first.fingerprint == first.plan.fingerprint()
+
+
+def test_plan_cache_key_includes_registry() -> None:
+    cache = PlanCache()
+    planner = PlannerAgent()
+    cache.get(planner, "goal", "tool", "v1")
+    AgentRegistry._registry["critic"] = CriticAgent
+    _, hit = cache.get(planner, "goal", "tool", "v1")
+    assert hit is False
+
+
+def test_plan_cache_evicts_least_recent() -> None:
+    cache = PlanCache(max_entries=1)
+    planner = PlannerAgent()
+    cache.get(planner, "goal", "a", "v1")
+    cache.get(planner, "goal", "b", "v1")
+    _, hit = cache.get(planner, "goal", "a", "v1")
+    assert hit is False
+
+
+def test_bind_replaces_only_the_invocation() -> None:
+    compiled, _ = PlanCache().get(PlannerAgent(), "goal", "tool", "v1")
+    invocation = ToolInvocationSpec(
+        invocation_id="run-1:tool:0",
+        tool_name="tool",
+        tool_version="v1",
+        inputs=[InvocationInput(name="sequence", value="ACDE")],
+        expected_outputs=[],
+        constraints=[],
+        origin_task_id=compiled.origin_task_id,
+    )
+    task = compiled.bind(invocation)
+    template = compiled.graph.tasks[compiled.origin_task_id]
+    assert task.tool_invocation == invocation
+    assert template.tool_invocation.inputs == []
+    payload = compiled.bound_graph_payload(task)
+    bound = payload["tasks"][compiled.origin_task_id]["tool_invocation"]
+    assert bound["inputs"] == [{"name": "sequence", "value": "ACDE"}]
+    assert (
+        compiled.graph_payload["tasks"][task.task_id]["tool_invocation"]["inputs"] == []
+    )
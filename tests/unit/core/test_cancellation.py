@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import threading
+
+from agentic_proteins.core.cancellation import (
+    CancelToken,
+    cancel_requested,
+    cancel_scope,
+    current_cancel_token,
+    on_cancel,
+)
+
+
+def test_cancel_runs_callbacks_once_and_late_callbacks_immediately() -> None:
+    token = CancelToken()
+    calls: list[str] = []
+    token.on_cancel(lambda: calls.append("early"))
+    token.on_cancel(lambda: (_ for _ in ()).throw(RuntimeError("cleanup failed")))
+    token.cancel("timeout")
+    token.cancel("again")
+    assert calls == ["early"]
+    assert token.cancelled
+    assert token.reason == "timeout"
+    token.on_cancel(lambda: calls.append("late"))
+    assert calls == ["early", "late"]
+
+
+def test_scope_is_thread_local_and_nests() -> None:
+    outer, inner = CancelToken(), CancelToken()
+    seen: list[CancelToken | None] = []
+    assert current_cancel_token() is None
+    with cancel_scope(outer):
+        with cancel_scope(inner):
+            assert current_cancel_token() is inner
+        assert current_cancel_token() is outer
+        thread = threading.Thread(target=lambda: seen.append(current_cancel_token()))
+        thread.start()
+        thread.join()
+        outer.cancel()
+        assert cancel_requested()
+    assert seen == [None]
+    assert current_cancel_token() is None
+    assert not cancel_requested()
+
+
+def test_on_cancel_without_scope_is_a_no_op() -> None:
+    on_cancel(lambda: (_ for _ in ()).throw(AssertionError("must not run")))
+
+
+def test_unregistered_callbacks_do_not_run_or_accumulate() -> None:
+    token = CancelToken()
+    calls: list[str] = []
+    detach = token.on_cancel(lambda: calls.append("removed"))
+    token.on_cancel(lambda: calls.append("kept"))
+    detach()
+    detach()
+    token.cancel()
+    assert calls == ["kept"]
+
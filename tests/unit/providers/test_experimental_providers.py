@@ -11,10 +11,12 @@ from typing import Any
 import pytest
 from requests.exceptions import RequestException
 
+from agentic_proteins.core.cancellation import CancelToken, cancel_scope
 from agentic_proteins.providers.errors import PredictionError
 from agentic_proteins.providers.experimental import _async_utils
 from agentic_proteins.providers.experimental import colabfold
 from agentic_proteins.providers.experimental.openprotein import APIOpenProteinProvider
+from agentic_proteins.providers.idempotency import idempotency_scope
 
 
 def test_sleep_with_backoff_deadline_passed(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -98,6 +100,42 @@ def test_colabfold_predict_success(monkeypatch: pytest.MonkeyPatch) -> None:
     assert result.pdb_text == "PDB"
 
 
+def test_colabfold_retry_resumes_job_with_same_idempotency_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _CountingSession(_FakeSession):
+        posts = 0
+
+        def post(self, *_args, **_kwargs) -> _FakeResponse:
+            _CountingSession.posts += 1
+            return super().post()
+
+    post = _FakeResponse(status_code=200, payload={"job_id": "job-1"})
+    session = _CountingSession(
+        post, _FakeResponse(status_code=200, payload={"status": "RUNNING"})
+    )
+    monkeypatch.setattr(colabfold.requests, "Session", lambda: session)
+    monkeypatch.setattr(
+        colabfold, "sleep_with_backoff", lambda *args, **kwargs: (1.0, 0.0)
+    )
+    provider = colabfold.APIColabFoldProvider(api_url="http://resume.example")
+    with idempotency_scope("run:tool:0"):
+        with pytest.raises(PredictionError) as timed_out:
+            provider.predict("ACD", timeout=0.1)
+        assert timed_out.value.code == "TIMEOUT"
+        session._get_response = _FakeResponse(
+            status_code=200,
+            payload={"status": "SUCCESS", "result": {"models": [{"pdb": "PDB"}]}},
+        )
+        result = provider.predict("ACD", timeout=5.0)
+    assert _CountingSession.posts == 1
+    assert result.raw["job_id"] == "job-1"
+    assert result.raw["resumed"] is True
+    with idempotency_scope("run:tool:0"):
+        provider.predict("ACD", timeout=5.0)
+    assert _CountingSession.posts == 2
+
+
 def test_colabfold_healthcheck_ok(monkeypatch: pytest.MonkeyPatch) -> None:
     post = _FakeResponse(status_code=200, payload={})
     poll = _FakeResponse(status_code=200, payload={})
@@ -563,3 +601,151 @@ def test_colabfold_poll_invalid_result(monkeypatch: pytest.MonkeyPatch) -> None:
     provider = colabfold.APIColabFoldProvider(api_url="http://example")
     with pytest.raises(PredictionError, match="Invalid result structure"):
         provider.predict("ACD", timeout=5.0)
+
+
+def test_colabfold_cancel_stops_polling_on_the_shared_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+    import time
+
+    sessions: list[_FakeSession] = []
+
+    def _session() -> _FakeSession:
+        sessions.append(
+            _FakeSession(
+                _FakeResponse(status_code=200, payload={"job_id": "job-9"}),
+                _FakeResponse(status_code=200, payload={"status": "RUNNING"}),
+            )
+        )
+        return sessions[-1]
+
+    monkeypatch.setattr(colabfold.requests, "Session", _session)
+    provider = colabfold.APIColabFoldProvider(api_url="http://cancel.example")
+    token = CancelToken()
+    timer = threading.Timer(0.1, token.cancel)
+    timer.start()
+    start = time.monotonic()
+    with cancel_scope(token), pytest.raises(PredictionError) as exc:
+        provider.predict("ACD", timeout=30.0)
+    timer.join()
+    assert exc.value.code == "CANCELLED"
+    assert time.monotonic() - start < 5.0
+    assert len(sessions) == 1
+
+
+def test_colabfold_predict_many_stops_polling_on_cancel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+    import time
+
+    session = _FakeSession(
+        _FakeResponse(status_code=200, payload={"job_id": "job-1"}),
+        _FakeResponse(status_code=200, payload={"status": "RUNNING"}),
+    )
+    monkeypatch.setattr(colabfold.requests, "Session", lambda: session)
+    provider = colabfold.APIColabFoldProvider(api_url="http://cancel-many.example")
+    token = CancelToken()
+    timer = threading.Timer(0.1, token.cancel)
+    timer.start()
+    start = time.monotonic()
+    with cancel_scope(token):
+        results = provider.predict_many(["ACD"], timeout=30.0)
+    timer.join()
+    assert time.monotonic() - start < 5.0
+    assert isinstance(results[0], PredictionError)
+    assert results[0].code == "CANCELLED"
+
+
+def test_openprotein_cancel_cancels_the_remote_job(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+
+    class _Job:
+        def __init__(self) -> None:
+            self.cancelled = threading.Event()
+
+        def wait_for_pdb(self, timeout: float = 0.0) -> str:
+            self.cancelled.wait(5.0)
+            return ""
+
+        def cancel(self) -> None:
+            self.cancelled.set()
+
+    job = _Job()
+
+    class _FoldNamespace:
+        def esmfold(self, sequence: str) -> _Job:
+            return job
+
+    class _Session:
+        fold = _FoldNamespace()
+
+    fake_module = SimpleNamespace(connect=lambda username, password: _Session())
+    monkeypatch.setitem(sys.modules, "openprotein", fake_module)
+    provider = APIOpenProteinProvider(user="user", password="pw", model="esmfold")
+    token = CancelToken()
+    timer = threading.Timer(0.1, token.cancel)
+    timer.start()
+    with cancel_scope(token), pytest.raises(PredictionError) as exc:
+        provider.predict("ACDE", timeout=30.0)
+    timer.join()
+    assert exc.value.code == "CANCELLED"
+    assert job.cancelled.is_set()
+
+
+def test_openprotein_predict_many_waits_concurrently_and_caches_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+    import time
+
+    state = {"active": 0, "peak": 0, "probes": 0}
+    lock = threading.Lock()
+
+    class _Job:
+        def __init__(self, sequence: str) -> None:
+            self.job_id = f"job-{sequence}"
+            self.sequence = sequence
+
+        def wait_for_pdb(self, timeout: float = 0.0) -> str:
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return "" if self.sequence == "EMPTY" else f"PDB {self.sequence}"
+
+    class _FoldNamespace:
+        def __getattribute__(self, name: str):
+            if name == "esmfold":
+                state["probes"] += 1
+            return object.__getattribute__(self, name)
+
+        def esmfold(self, sequence: str) -> _Job:
+            if sequence == "BAD":
+                raise RuntimeError("rejected")
+            return _Job(sequence)
+
+    class _Session:
+        fold = _FoldNamespace()
+
+    fake_module = SimpleNamespace(connect=lambda username, password: _Session())
+    monkeypatch.setitem(sys.modules, "openprotein", fake_module)
+
+    provider = APIOpenProteinProvider(user="user", password="pw", model="esmfold")
+    sequences = ["ACDE", "BAD", "KLMN", "EMPTY", "PQRS", "TVWY"]
+    results = provider.predict_many(sequences, timeout=5.0, seed=1)
+    probes_after_first = state["probes"]
+    provider.predict_many(["ACDE"], timeout=5.0)
+
+    assert state["peak"] > 1
+    assert results[0].pdb_text == "PDB ACDE"
+    assert results[0].raw["job_id"] == "job-ACDE"
+    assert isinstance(results[1], PredictionError) and results[1].code == "REMOTE_ERROR"
+    assert isinstance(results[3], PredictionError) and results[3].code == "NO_OUTPUT"
+    assert results[5].pdb_text == "PDB TVWY"
+    assert state["probes"] == probes_after_first
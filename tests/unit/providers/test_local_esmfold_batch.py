@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import pytest
+
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.local.esmfold import LocalESMFoldProvider
+from tests.helpers.esmfold import FakeESMFold, fake_tokenizer
+
+
+def _provider(model: FakeESMFold) -> LocalESMFoldProvider:
+    provider = LocalESMFoldProvider(device="cpu")
+    provider.model = model
+    provider.tokenizer = fake_tokenizer
+    provider._model_loaded = True
+    return provider
+
+
+def test_length_buckets_respect_token_budget() -> None:
+    sequences = ["A" * 10, "A" * 3, "A" * 9, "A" * 4]
+    buckets = LocalESMFoldProvider._length_buckets(sequences, [0, 1, 2, 3], 20)
+    assert buckets == [[1, 3], [2, 0]]
+
+
+def test_predict_batch_returns_results_in_input_order() -> None:
+    model = FakeESMFold()
+    provider = _provider(model)
+    sequences = ["ACDE", "AC", "ACDEFG"]
+    results = provider.predict_batch(sequences, max_tokens_per_batch=1000)
+    assert model.batch_shapes == [(3, 6)]
+    for sequence, result in zip(sequences, results, strict=True):
+        assert not isinstance(result, PredictionError)
+        assert result.raw["sequence_length"] == len(sequence)
+        assert result.raw["batch_size"] == 3
+        assert result.pdb_text.count(" CA ") == len(sequence)
+        assert result.raw["mean_plddt"] == pytest.approx(80.0)
+
+
+def test_predict_batch_item_matches_single_unpadded_item() -> None:
+    provider = _provider(FakeESMFold())
+    batched = provider.predict_batch(["AC", "ACD"], max_tokens_per_batch=1000)
+    single = provider.predict_batch(["AC"], max_tokens_per_batch=1000)
+    assert batched[0].pdb_text.splitlines()[1] == single[0].pdb_text.splitlines()[1]
+
+
+def test_predict_batch_splits_on_oom_and_reports_bad_items(monkeypatch) -> None:
+    monkeypatch.setenv("ESMFOLD_MAX_LEN", "8")
+    model = FakeESMFold(oom_above=1)
+    provider = _provider(model)
+    results = provider.predict_batch(["AC", "", "ACD", "A" * 9])
+    assert [shape[0] for shape in model.batch_shapes] == [1, 1]
+    assert not isinstance(results[0], PredictionError)
+    assert not isinstance(results[2], PredictionError)
+    assert isinstance(results[1], PredictionError) and results[1].code == "BAD_INPUT"
+    assert isinstance(results[3], PredictionError) and results[3].code == "BAD_INPUT"
+
+
+def test_predict_batch_reports_forward_failures_per_bucket() -> None:
+    provider = _provider(FakeESMFold())
+
+    def broken(**_kwargs):
+        raise RuntimeError("boom")
+
+    provider.model = broken
+    results = provider.predict_batch(["AC", "ACD"])
+    assert all(isinstance(item, PredictionError) for item in results)
+    assert {item.code for item in results} == {"INFERENCE_ERROR"}
+
+
+def test_predict_batch_isolates_a_failing_sequence_from_its_bucket() -> None:
+    class _PoisonModel(FakeESMFold):
+        def forward(self, input_ids, attention_mask):
+            if input_ids.shape[1] == 5:
+                raise RuntimeError("boom")
+            return super().forward(input_ids, attention_mask)
+
+    model = _PoisonModel()
+    provider = _provider(model)
+    results = provider.predict_batch(["AC", "ACD", "ACDEF"], max_tokens_per_batch=1000)
+    assert model.batch_shapes == [(1, 2), (1, 3)]
+    assert not isinstance(results[0], PredictionError)
+    assert not isinstance(results[1], PredictionError)
+    assert isinstance(results[2], PredictionError)
+    assert results[2].code == "INFERENCE_ERROR"
+    assert provider._fail_count == 1
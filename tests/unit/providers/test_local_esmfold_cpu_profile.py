@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import pytest
+
+from agentic_proteins.providers.factory import provider_key
+from agentic_proteins.providers.local.esmfold import (
+    ESMFoldCPUProfile,
+    LocalESMFoldProvider,
+    _parse_cpulist,
+)
+from tests.helpers.esmfold import FakeESMFold, fake_tokenizer
+
+torch = pytest.importorskip("torch")
+
+
+def _provider(profile: ESMFoldCPUProfile) -> LocalESMFoldProvider:
+    provider = LocalESMFoldProvider(device="cpu", cpu_profile=profile)
+    provider.model = FakeESMFold()
+    provider.tokenizer = fake_tokenizer
+    provider._profile_settings = provider._apply_cpu_profile(profile)
+    provider._model_loaded = True
+    return provider
+
+
+def test_profile_from_env(monkeypatch) -> None:
+    assert ESMFoldCPUProfile.from_env() is None
+    monkeypatch.setenv("ESMFOLD_CPU_PROFILE", "1")
+    monkeypatch.setenv("ESMFOLD_CPU_THREADS", "4")
+    monkeypatch.setenv("ESMFOLD_CPU_INT8", "true")
+    monkeypatch.setenv("ESMFOLD_CHUNK_SIZE", "64")
+    profile = ESMFoldCPUProfile.from_env()
+    assert profile == ESMFoldCPUProfile(
+        intra_op_threads=4, int8_trunk=True, chunk_size=64
+    )
+    assert LocalESMFoldProvider(device="cpu").cpu_profile == profile
+
+
+def test_parse_cpulist() -> None:
+    assert _parse_cpulist("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+
+
+def test_profile_quantizes_trunk_and_sets_chunking() -> None:
+    threads = torch.get_num_threads()
+    provider = _provider(
+        ESMFoldCPUProfile(intra_op_threads=threads, int8_trunk=True, chunk_size=32)
+    )
+    settings = provider._profile_settings
+    assert settings is not None
+    assert settings["intra_op_threads"] == threads
+    assert settings["int8_trunk"] is True
+    assert settings["chunk_size"] == 32
+    assert provider.model.trunk.chunk_size == 32
+    assert not any(
+        isinstance(module, torch.nn.Linear) and type(module) is torch.nn.Linear
+        for module in provider.model.esm.modules()
+    )
+
+    result = provider.predict("ACDE", timeout=10.0)
+    assert result.raw["cpu_profile"] == settings
+    batched = provider.predict_batch(["AC", "ACD"])
+    assert all(item.raw["cpu_profile"] == settings for item in batched)
+
+
+def test_bf16_autocast_only_when_supported(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "agentic_proteins.providers.local.esmfold._bf16_supported", lambda: True
+    )
+    provider = _provider(ESMFoldCPUProfile(bf16_autocast=True))
+    provider.predict("ACDE", timeout=10.0)
+    assert provider.model.dtypes[-1] == torch.bfloat16
+
+    monkeypatch.setattr(
+        "agentic_proteins.providers.local.esmfold._bf16_supported", lambda: False
+    )
+    provider = _provider(ESMFoldCPUProfile(bf16_autocast=True))
+    provider.predict("ACDE", timeout=10.0)
+    assert provider._profile_settings["bf16_autocast"] is False
+    assert provider.model.dtypes[-1] == torch.float32
+
+
+def test_profile_is_part_of_provider_key() -> None:
+    profile = ESMFoldCPUProfile(chunk_size=64)
+    plain = provider_key("local_esmfold", device="cpu")
+    profiled = provider_key("local_esmfold", device="cpu", cpu_profile=profile)
+    assert plain != profiled
+    assert profiled == provider_key("local_esmfold", device="cpu", cpu_profile=profile)
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.pdb_writer import (
+    ATOM14_NAMES,
+    coordinates_to_pdb,
+)
+
+
+def test_backbone_records_are_fixed_width() -> None:
+    positions = np.zeros((2, 4, 3))
+    positions[0, 1] = [1.5, -2.25, 10.0]
+    positions[1, 3, 0] = np.nan
+    pdb = coordinates_to_pdb("GW", positions, np.array([0.5, 0.91]))
+    lines = pdb.splitlines()
+    assert lines[0] == "MODEL     1"
+    assert lines[2] == (
+        "ATOM      2   CA GLY A   1       1.500  -2.250  10.000  1.00 50.00           C  "
+    )
+    assert lines[7] == (
+        "ATOM      7    C TRP A   2       0.000   0.000   0.000  1.00 91.00           C  "
+    )
+    assert lines[-2:] == ["TER", "ENDMDL"]
+    assert len(lines) == 10
+
+
+def test_plddt_is_clamped_and_non_finite_zeroed() -> None:
+    positions = np.zeros((3, 4, 3))
+    pdb = coordinates_to_pdb("AAA", positions, np.array([np.nan, 120.0, -0.0]))
+    b_factors = {line[60:66] for line in pdb.splitlines() if line.startswith("ATOM")}
+    assert b_factors == {"  0.00", "100.00"}
+
+
+def test_atom14_layout_writes_residue_specific_atoms() -> None:
+    positions = np.ones((2, 14, 3))
+    pdb = coordinates_to_pdb("GY", positions, np.array([0.7, 0.8]), "atom14")
+    atoms = [line for line in pdb.splitlines() if line.startswith("ATOM")]
+    assert len(atoms) == len(ATOM14_NAMES["GLY"]) + len(ATOM14_NAMES["TYR"])
+    assert atoms[-1][12:16] == "  OH"
+
+
+def test_atom37_layout_uses_atom37_slots() -> None:
+    positions = np.zeros((1, 37, 3))
+    positions[0, 3] = [1.0, 1.0, 1.0]  # CB slot
+    pdb = coordinates_to_pdb("A", positions, np.array([0.5]), "atom37")
+    atoms = [line for line in pdb.splitlines() if line.startswith("ATOM")]
+    assert [line[12:16].strip() for line in atoms] == ["N", "CA", "C", "CB", "O"]
+    assert atoms[3][30:38] == "   1.000"
+
+
+def test_layout_shape_mismatch_raises() -> None:
+    with pytest.raises(PredictionError, match="Layout atom37 needs A=37"):
+        coordinates_to_pdb("A", np.zeros((1, 14, 3)), np.array([0.5]), "atom37")
+    with pytest.raises(PredictionError, match="Unknown atom layout"):
+        coordinates_to_pdb("A", np.zeros((1, 14, 3)), np.array([0.5]), "atom99")
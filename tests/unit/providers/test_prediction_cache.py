@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+from agentic_proteins.providers.cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    CachedProvider,
+    PredictionCache,
+    consume_prediction_cache_event,
+    prediction_cache_from_env,
+    prediction_key,
+)
+
+
+class _CountingProvider(BaseProvider):
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.timeouts: list[float] = []
+
+    def predict(
+        self, sequence: str, timeout: float = 600.0, seed: int | None = None
+    ) -> PredictionResult:
+        self.calls += 1
+        self.timeouts.append(timeout)
+        return PredictionResult(
+            pdb_text=f"REMARK {sequence}\nEND\n",
+            provider=self.name,
+            raw={"mean_plddt": 70.0},
+        )
+
+
+def _result(text: str = "END\n") -> PredictionResult:
+    return PredictionResult(pdb_text=text, provider="p", raw={"x": 1})
+
+
+def test_key_covers_every_identity_field() -> None:
+    base = prediction_key("p", "ACDE", seed=1, tool_version="v1", revision="r")
+    assert base == prediction_key("p", "ACDE", seed=1, tool_version="v1", revision="r")
+    assert base != prediction_key("p", "ACDE", seed=2, tool_version="v1", revision="r")
+    assert base != prediction_key("p", "ACDE", seed=1, tool_version="v2", revision="r")
+    assert base != prediction_key("q", "ACDE", seed=1, tool_version="v1", revision="r")
+
+
+def test_roundtrip_and_corrupt_entry_is_dropped(tmp_path: Path) -> None:
+    cache = PredictionCache(tmp_path)
+    key = prediction_key("p", "ACDE")
+    assert cache.get(key) is None
+    assert cache.put(key, _result("MODEL\nEND\n")) is True
+    stored = cache.get(key)
+    assert stored is not None
+    assert stored.pdb_text == "MODEL\nEND\n"
+    assert stored.raw == {"x": 1}
+
+    path = cache._path(key)
+    path.write_bytes(b"not gzip")
+    assert cache.get(key) is None
+    assert not path.exists()
+
+
+def test_non_json_raw_is_not_cached(tmp_path: Path) -> None:
+    cache = PredictionCache(tmp_path)
+    result = PredictionResult(pdb_text="END\n", provider="p", raw={"x": object()})
+    assert cache.put("ab" * 32, result) is False
+    assert cache.entries() == []
+
+
+def test_prune_by_age_then_lru_bytes(tmp_path: Path) -> None:
+    cache = PredictionCache(tmp_path)
+    keys = [prediction_key("p", seq) for seq in ("A", "C", "D")]
+    for key in keys:
+        cache.put(key, _result("ATOM\n" * 50))
+    now = os.path.getmtime(cache._path(keys[0]))
+    os.utime(cache._path(keys[0]), (now - 1000, now - 1000))
+    os.utime(cache._path(keys[1]), (now - 10, now - 10))
+
+    cache.max_age_seconds = 500
+    assert cache.prune() == 1
+    assert cache.get(keys[0]) is None
+
+    cache.max_age_seconds = None
+    cache.max_bytes = cache._path(keys[2]).stat().st_size
+    assert cache.prune() == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_hits_do_not_extend_an_entry_age(tmp_path: Path) -> None:
+    cache = PredictionCache(tmp_path, max_age_seconds=500)
+    key = prediction_key("p", "ACDE")
+    cache.put(key, _result())
+    written = os.path.getmtime(cache._path(key)) - 400
+    os.utime(cache._path(key), (written, written))
+    assert cache.get(key) is not None
+    assert os.path.getmtime(cache._path(key)) == written
+
+    os.utime(cache._path(key), (written + 400, written - 200))
+    assert cache.get(key) is None
+    assert cache.prune() == 1
+
+
+def test_entry_cap_evicts_least_recently_hit(tmp_path: Path) -> None:
+    cache = PredictionCache(tmp_path, max_entries=2)
+    keys = [prediction_key("p", seq) for seq in ("A", "C", "D")]
+    for offset, key in enumerate(keys):
+        cache.put(key, _result())
+        stamp = os.path.getmtime(cache._path(key)) - 100 + offset
+        os.utime(cache._path(key), (stamp, stamp))
+    assert cache.get(keys[0]) is not None
+
+    assert cache.prune() == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_cached_provider_hit_skips_loader(tmp_path: Path) -> None:
+    inner = _CountingProvider()
+    loads: list[int] = []
+
+    def loader() -> BaseProvider:
+        loads.append(1)
+        return inner
+
+    cache = PredictionCache(tmp_path)
+    first = CachedProvider("counting", loader, cache, tool_version="v1")
+    miss = first.predict("ACDE")
+    event = consume_prediction_cache_event()
+    assert event is not None
+    assert event.hit is False
+    assert consume_prediction_cache_event() is None
+
+    second = CachedProvider("counting", loader, cache, tool_version="v1")
+    hit = second.predict("ACDE")
+    event = consume_prediction_cache_event()
+    assert event is not None
+    assert event.hit is True
+    assert hit.pdb_text == miss.pdb_text
+    assert inner.calls == 1
+    assert len(loads) == 1
+
+
+def test_cached_provider_keeps_the_provider_timeout(tmp_path: Path) -> None:
+    inner = _CountingProvider()
+    cached = CachedProvider("counting", lambda: inner, PredictionCache(tmp_path))
+    cached.predict("ACDE")
+    cached.predict("ACDEF", timeout=5.0)
+    assert inner.timeouts == [600.0, 5.0]
+
+
+def test_cache_from_env(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", "off")
+    assert prediction_cache_from_env(tmp_path) is None
+    monkeypatch.setenv("PREDICTION_CACHE_DIR", str(tmp_path / "shared"))
+    monkeypatch.setenv("PREDICTION_CACHE_MAX_BYTES", "2048")
+    cache = prediction_cache_from_env(tmp_path)
+    assert cache is not None
+    assert cache.root == tmp_path / "shared"
+    assert cache.max_bytes == 2048
+    assert cache.max_entries == DEFAULT_MAX_ENTRIES
+
+    monkeypatch.delenv("PREDICTION_CACHE_MAX_BYTES")
+    monkeypatch.setenv("PREDICTION_CACHE_MAX_ENTRIES", "0")
+    cache = prediction_cache_from_env(tmp_path)
+    assert cache is not None
+    assert cache.max_bytes == DEFAULT_MAX_BYTES
+    assert cache.max_entries is None
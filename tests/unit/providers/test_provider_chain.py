@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from agentic_proteins.core.cancellation import (
+    CancelToken,
+    cancel_scope,
+    current_cancel_token,
+)
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+from agentic_proteins.providers.chain import (
+    ProviderChain,
+    ProviderChainPolicy,
+    consume_chain_event,
+    latency_percentile,
+    record_latency,
+)
+from agentic_proteins.providers.errors import PredictionError
+
+
+class _Stub(BaseProvider):
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False) -> None:
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.timeouts: list[float] = []
+
+    def predict(
+        self, sequence: str, timeout: float = 120.0, seed: int | None = None
+    ) -> PredictionResult:
+        self.calls += 1
+        self.timeouts.append(timeout)
+        time.sleep(self.delay)
+        if self.fail:
+            raise PredictionError("boom", code="REMOTE_ERROR")
+        return PredictionResult(pdb_text=self.name, provider=self.name, raw={})
+
+
+def _chain(payload: dict, *stubs: _Stub) -> ProviderChain:
+    by_name = {stub.name: stub for stub in stubs}
+    return ProviderChain(ProviderChainPolicy.from_dict(payload), by_name.__getitem__)
+
+
+def test_policy_validation() -> None:
+    policy = ProviderChainPolicy.from_dict(
+        {"steps": ["a", {"provider": "b", "timeout_s": 3}]}
+    )
+    assert policy.providers == ["a", "b"]
+    assert policy.steps[1].timeout_s == 3.0
+    assert policy.label == "fallback:a>b"
+    for bad in (
+        {"steps": []},
+        {"mode": "race", "steps": ["a"]},
+        {"steps": [{"provider": "a", "timeout_s": 0}]},
+        {"steps": ["a"], "hedge_percentile": 1.5},
+    ):
+        with pytest.raises(ValueError, match="provider_policy"):
+            ProviderChainPolicy.from_dict(bad)
+
+
+def test_fallback_after_failure_and_step_timeout() -> None:
+    failing = _Stub("a", fail=True)
+    slow = _Stub("b", delay=2.0)
+    backup = _Stub("c")
+    chain = _chain(
+        {"steps": ["a", {"provider": "b", "timeout_s": 0.1}, "c"]},
+        failing,
+        slow,
+        backup,
+    )
+    result = chain.predict("ACDE", timeout=5.0)
+    assert result.provider == "c"
+    event = consume_chain_event()
+    assert event is not None
+    assert event.winner == "c"
+    assert [(a.provider, a.status) for a in event.attempts] == [
+        ("a", "failure"),
+        ("b", "timeout"),
+        ("c", "success"),
+    ]
+    assert event.attempts[0].error == "REMOTE_ERROR"
+
+
+def test_step_budgets_are_not_capped_without_a_caller_timeout() -> None:
+    slow = _Stub("colabfold")
+    chain = _chain(
+        {"steps": ["esmfold", {"provider": "colabfold", "timeout_s": 600}]},
+        _Stub("esmfold", fail=True),
+        slow,
+    )
+    assert chain.predict("ACDE").provider == "colabfold"
+    assert slow.timeouts[0] > 599.0
+    chain.predict("ACDE", timeout=30.0)
+    assert slow.timeouts[1] <= 30.0
+
+
+def test_hedge_takes_first_success_and_cancels_loser() -> None:
+    primary = _Stub("a", delay=1.0)
+    secondary = _Stub("b", delay=0.01)
+    chain = _chain(
+        {"mode": "hedge", "steps": ["a", "b"], "hedge_after_s": 0.05},
+        primary,
+        secondary,
+    )
+    start = time.monotonic()
+    result = chain.predict("ACDE", timeout=5.0)
+    assert time.monotonic() - start < 0.5
+    assert result.provider == "b"
+    event = consume_chain_event()
+    assert event is not None
+    statuses = {a.provider: (a.status, a.hedged) for a in event.attempts}
+    assert statuses == {"a": ("cancelled", False), "b": ("success", True)}
+
+
+def test_losing_attempts_are_cancelled_through_their_own_token() -> None:
+    reasons: list[str | None] = []
+
+    class _Blocking(_Stub):
+        def predict(
+            self, sequence: str, timeout: float = 120.0, seed: int | None = None
+        ) -> PredictionResult:
+            token = current_cancel_token()
+            assert token is not None
+            token.wait(5.0)
+            reasons.append(token.reason)
+            raise PredictionError("stopped", code="CANCELLED")
+
+    caller = CancelToken()
+    chain = _chain(
+        {"mode": "hedge", "steps": ["slow", "fast"], "hedge_after_s": 0.05},
+        _Blocking("slow"),
+        _Stub("fast", delay=0.01),
+    )
+    with cancel_scope(caller):
+        assert chain.predict("ACDE", timeout=5.0).provider == "fast"
+    deadline = time.monotonic() + 2.0
+    while not reasons and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert reasons == ["hedge_lost"]
+    assert caller.cancelled is False
+
+    timed = _chain(
+        {"steps": [{"provider": "slow", "timeout_s": 0.05}, "fast"]},
+        _Blocking("slow"),
+        _Stub("fast"),
+    )
+    assert timed.predict("ACDE").provider == "fast"
+    deadline = time.monotonic() + 2.0
+    while len(reasons) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert reasons[1] == "timeout"
+
+
+def test_hedge_delay_uses_latency_percentile() -> None:
+    for value in (0.1, 0.2, 0.3, 0.4, 2.0):
+        record_latency("percentile-probe", value)
+    assert latency_percentile("percentile-probe", 0.5) == 0.3
+    assert latency_percentile("unseen-provider", 0.5) is None
+    chain = _chain(
+        {"mode": "hedge", "steps": ["percentile-probe"], "hedge_percentile": 0.5}
+    )
+    assert chain._hedge_delay("percentile-probe") == 0.3
+    assert chain._hedge_delay("unseen-provider") == 10.0
+
+
+def test_exhausted_chain_raises() -> None:
+    chain = _chain({"steps": ["a", "b"]}, _Stub("a", fail=True), _Stub("b", fail=True))
+    with pytest.raises(PredictionError) as exc:
+        chain.predict("ACDE", timeout=5.0)
+    assert exc.value.code == "CHAIN_EXHAUSTED"
+    event = consume_chain_event()
+    assert event is not None
+    assert event.winner is None
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+from agentic_proteins.providers.factory import provider_key
+from agentic_proteins.providers.pool import PooledProvider, ProviderPool
+
+
+class _SizedProvider(BaseProvider):
+    def __init__(self, name: str, size: int) -> None:
+        self.name = name
+        self.size = size
+        self.warmed = 0
+        self.closed = False
+
+    def warmup(self) -> None:
+        self.warmed += 1
+
+    def resident_bytes(self) -> int:
+        return 0 if self.closed else self.size
+
+    def predict(
+        self, sequence: str, timeout: float = 1.0, seed: int | None = None
+    ) -> PredictionResult:
+        return PredictionResult("", self.name, {})
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _factory(sizes: dict[str, int], created: list[str]):
+    def _create(name: str, **_options: object) -> BaseProvider:
+        created.append(name)
+        return _SizedProvider(name, sizes.get(name, 0))
+
+    return _create
+
+
+def test_pool_reuses_warm_provider_and_records_events() -> None:
+    created: list[str] = []
+    pool = ProviderPool(factory=_factory({}, created))
+    first = pool.get("heuristic_proxy")
+    miss = pool.consume_event()
+    second = pool.get("heuristic_proxy")
+    hit = pool.consume_event()
+    assert first is second
+    assert created == ["heuristic_proxy"]
+    assert first.warmed == 1
+    assert miss is not None and miss.hit is False and miss.load_ms >= 0.0
+    assert hit is not None and hit.hit is True
+    assert pool.consume_event() is None
+    stats = pool.stats()
+    assert stats["hits"] == 1.0
+    assert stats["misses"] == 1.0
+
+
+def test_pool_evicts_least_recently_used_by_resident_bytes() -> None:
+    created: list[str] = []
+    pool = ProviderPool(
+        max_resident_bytes=150, factory=_factory({"a": 100, "b": 100}, created)
+    )
+    a = pool.get("a")
+    pool.get("b")
+    assert a.closed is True
+    assert pool.stats()["evictions"] == 1.0
+    assert pool.resident_bytes() == 100
+    pool.get("a")
+    assert created == ["a", "b", "a"]
+
+
+def test_pool_warmup_and_explicit_evict() -> None:
+    pool = ProviderPool(factory=_factory({}, []))
+    event = pool.warmup("a")
+    assert event.hit is False
+    assert pool.warmup("a").hit is True
+    assert pool.evict("missing") == 0
+    assert pool.evict("a") == 1
+    pool.get("b")
+    pool.get("c")
+    assert pool.evict() == 2
+    assert pool.stats()["entries"] == 0.0
+
+
+def test_provider_key_resolves_esmfold_defaults(monkeypatch) -> None:
+    monkeypatch.delenv("ESMFOLD_REVISION", raising=False)
+    key = provider_key("local_esmfold", device="cpu")
+    assert key.model_path == "models/esmfold"
+    assert key.dtype == "float32"
+    assert key.revision == "pinned"
+    assert provider_key("local_esmfold", device="cpu", dtype="bfloat16") != key
+    assert provider_key("heuristic_proxy").name == "heuristic_proxy"
+
+
+def test_evicting_a_leased_provider_defers_its_close() -> None:
+    pool = ProviderPool(
+        max_resident_bytes=150, factory=_factory({"a": 100, "b": 100}, [])
+    )
+    with pool.lease("a") as a, pool.lease("a"):
+        pool.get("b")
+        assert pool.evict("a") == 0
+        assert a.closed is False
+    assert a.closed is True
+    with pool.lease("b") as b:
+        assert pool.evict() == 1
+        assert b.closed is False
+        assert b.predict("ACDE").provider == "b"
+    assert b.closed is True
+
+
+def test_pooled_provider_leases_per_prediction() -> None:
+    pool = ProviderPool(factory=_factory({}, []))
+    provider = PooledProvider(pool, "a")
+    assert provider.predict("ACDE").provider == "a"
+    inner = pool.get("a")
+    assert pool.evict("a") == 1
+    assert inner.closed is True
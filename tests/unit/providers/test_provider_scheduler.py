@@ -0,0 +1,199 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from agentic_proteins.core.cancellation import CancelToken, cancel_scope
+from agentic_proteins.providers.base import BaseProvider, PredictionResult
+from agentic_proteins.providers.errors import PredictionError
+from agentic_proteins.providers.scheduler import (
+    ProviderScheduler,
+    ScheduledProvider,
+    estimate_prediction_bytes,
+)
+
+
+class _SlowProvider(BaseProvider):
+    name = "local_esmfold"
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.timeouts: list[float] = []
+        self._lock = threading.Lock()
+
+    def predict(
+        self, sequence: str, timeout: float = 600.0, seed: int | None = None
+    ) -> PredictionResult:
+        with self._lock:
+            self.timeouts.append(timeout)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return PredictionResult(pdb_text="", provider=self.name, raw={})
+
+
+def _run_all(targets) -> None:
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+def test_memory_estimate_is_quadratic_for_esmfold() -> None:
+    short = estimate_prediction_bytes("local_esmfold", 1000)
+    long = estimate_prediction_bytes("local_esmfold", 2000)
+    assert long > 3.5 * short
+    assert estimate_prediction_bytes("heuristic_proxy", 1000) == 0
+
+
+def test_per_provider_concurrency_limit() -> None:
+    scheduler = ProviderScheduler(limits={"local_esmfold": 2})
+    inner = _SlowProvider()
+    provider = ScheduledProvider(inner, scheduler)
+    _run_all([lambda: provider.predict("ACDE")] * 6)
+    assert inner.peak == 2
+    stats = scheduler.stats()
+    assert stats["admitted"] == 6.0
+    assert stats["running"] == 0.0
+    assert stats["wait_ms_max"] > 0.0
+
+
+def test_memory_budget_serializes_large_jobs() -> None:
+    budget = estimate_prediction_bytes("local_esmfold", 400)
+    scheduler = ProviderScheduler(max_bytes=budget, limits={"local_esmfold": 8})
+    inner = _SlowProvider()
+    provider = ScheduledProvider(inner, scheduler)
+    _run_all([lambda: provider.predict("A" * 300)] * 3)
+    assert inner.peak == 1
+    _run_all([lambda: provider.predict("A" * 1000)])
+    assert scheduler.stats()["admitted"] == 4.0
+
+
+def test_owner_limit_and_round_robin_fairness() -> None:
+    scheduler = ProviderScheduler(limits={"local_esmfold": 1})
+    order: list[str] = []
+    blocker = threading.Event()
+
+    def job(owner: str, cap: int | None = None) -> None:
+        with scheduler.scope(owner, cap), scheduler.admit("local_esmfold", 10):
+            order.append(owner)
+            blocker.wait(timeout=2)
+
+    first = threading.Thread(target=job, args=("run-a",))
+    first.start()
+    while not order:
+        time.sleep(0.005)
+    waiting = [threading.Thread(target=job, args=("run-a",)) for _ in range(3)]
+    waiting.append(threading.Thread(target=job, args=("run-b",)))
+    for thread in waiting:
+        thread.start()
+        time.sleep(0.01)
+    assert scheduler.stats()["queue_depth"] == 4.0
+    blocker.set()
+    for thread in [first, *waiting]:
+        thread.join(timeout=5)
+    assert order[:3] == ["run-a", "run-a", "run-b"]
+
+    capped = ProviderScheduler(limits={"local_esmfold": 4})
+    inner = _SlowProvider()
+    provider = ScheduledProvider(inner, capped)
+
+    def capped_job() -> None:
+        with capped.scope("run-c", 1):
+            provider.predict("ACDE")
+
+    _run_all([capped_job] * 3)
+    assert inner.peak == 1
+
+
+def test_admission_timeout_raises_and_frees_queue() -> None:
+    scheduler = ProviderScheduler(limits={"local_esmfold": 1})
+    with (
+        scheduler.admit("local_esmfold", 10),
+        pytest.raises(PredictionError) as exc,
+        scheduler.admit("local_esmfold", 10, timeout=0.05),
+    ):
+        pass
+    assert exc.value.code == "TIMEOUT"
+    assert scheduler.stats()["queue_depth"] == 0.0
+    with scheduler.admit("local_esmfold", 10) as event:
+        assert event.wait_ms >= 0.0
+    assert scheduler.consume_event() == event
+    assert scheduler.consume_event() is None
+
+
+def test_cancelled_admission_leaves_the_queue() -> None:
+    scheduler = ProviderScheduler(limits={"local_esmfold": 1})
+    token = CancelToken()
+    errors: list[str] = []
+
+    def queued() -> None:
+        with cancel_scope(token):
+            try:
+                with scheduler.admit("local_esmfold", 10, timeout=5.0):
+                    pass
+            except PredictionError as exc:
+                errors.append(exc.code)
+
+    with scheduler.admit("local_esmfold", 10):
+        thread = threading.Thread(target=queued)
+        thread.start()
+        time.sleep(0.05)
+        start = time.monotonic()
+        token.cancel()
+        thread.join(timeout=2)
+        assert time.monotonic() - start < 1.0
+    assert errors == ["CANCELLED"]
+    assert scheduler.stats()["queue_depth"] == 0.0
+
+
+def test_queue_wait_does_not_shorten_the_run_timeout() -> None:
+    scheduler = ProviderScheduler(limits={"local_esmfold": 1})
+    inner = _SlowProvider()
+    provider = ScheduledProvider(inner, scheduler)
+    with scheduler.admit("local_esmfold", 10):
+        thread = threading.Thread(target=lambda: provider.predict("ACDE", timeout=0.1))
+        thread.start()
+        time.sleep(0.2)
+    thread.join(timeout=5)
+    provider.predict("ACDE")
+    assert inner.timeouts == [0.1, 600.0]
+    assert scheduler.stats()["timed_out"] == 0.0
+
+
+def test_event_reports_the_provider_run_apart_from_the_wait() -> None:
+    scheduler = ProviderScheduler(limits={"local_esmfold": 1})
+    provider = ScheduledProvider(_SlowProvider(), scheduler)
+    events = []
+
+    def predict() -> None:
+        provider.predict("ACDE")
+        events.append(scheduler.consume_event())
+
+    with scheduler.admit("local_esmfold", 10):
+        thread = threading.Thread(target=predict)
+        thread.start()
+        time.sleep(0.2)
+    thread.join(timeout=5)
+    (event,) = events
+    assert event.wait_ms >= 150.0
+    assert 40.0 <= event.run_ms < 150.0
+
+
+def test_admission_leaves_no_callback_on_the_task_token() -> None:
+    scheduler = ProviderScheduler(limits={"heuristic_proxy": 1})
+    token = CancelToken()
+    with cancel_scope(token):
+        for _ in range(3):
+            with scheduler.admit("heuristic_proxy", 10):
+                pass
+    assert token._callbacks == []
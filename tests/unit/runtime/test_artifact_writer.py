@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import threading
+
+import pytest
+
+from agentic_proteins.runtime import writer as writer_module
+from agentic_proteins.runtime.writer import ArtifactWriter, dump_json
+
+
+def test_writer_coalesces_and_flushes_per_run(tmp_path: Path) -> None:
+    writer = ArtifactWriter()
+    run_a = tmp_path / "run_a"
+    run_b = tmp_path / "run_b"
+    for value in range(20):
+        writer.write_json(run_a / "report.json", {"value": value})
+    writer.write_json(run_b / "report.json", {"value": "b"})
+    writer.flush(run_a)
+    assert json.loads((run_a / "report.json").read_text()) == {"value": 19}
+    assert writer.writes + writer.coalesced >= 20
+    writer.flush()
+    assert (run_b / "report.json").exists()
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_coalesced_write_lands_after_earlier_writes(tmp_path: Path) -> None:
+    order: list[str] = []
+    release = threading.Event()
+
+    class _Recording(ArtifactWriter):
+        @staticmethod
+        def _replace(path: Path, item: writer_module._Write) -> None:
+            if path.name == "blocker.json":
+                release.wait(timeout=5)
+            order.append(f"{path.name}:{item.text}")
+            ArtifactWriter._replace(path, item)
+
+    writer = _Recording()
+    writer.write_text(tmp_path / "blocker.json", "0")
+    writer.write_text(tmp_path / "a1.json", "1")
+    writer.write_text(tmp_path / "state.json", "v1")
+    writer.write_text(tmp_path / "a2.json", "2")
+    writer.write_text(tmp_path / "state.json", "v2")
+    release.set()
+    writer.flush(tmp_path)
+    assert order == ["blocker.json:0", "a1.json:1", "a2.json:2", "state.json:v2"]
+
+
+def test_machine_artifacts_are_compact(tmp_path: Path) -> None:
+    writer = ArtifactWriter()
+    payload = {"b": 1, "a": [1, 2]}
+    writer.write_json(tmp_path / "artifacts" / "abc.json", payload)
+    writer.write_json(tmp_path / "prediction_cache.json", payload)
+    writer.write_json(tmp_path / "run_summary.json", payload)
+    writer.flush(tmp_path)
+    assert (tmp_path / "artifacts" / "abc.json").read_text() == dump_json(
+        payload, compact=True
+    )
+    assert (tmp_path / "prediction_cache.json").read_text() == '{"a":[1,2],"b":1}'
+    assert (tmp_path / "run_summary.json").read_text() == dump_json(payload)
+
+
+@pytest.mark.parametrize(("durability", "expected"), [("write", 2), ("run", 2)])
+def test_durability_policies_fsync(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    durability: str,
+    expected: int,
+) -> None:
+    calls: list[int] = []
+    real_fsync = os.fsync
+
+    def _fsync(fd: int) -> None:
+        calls.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(writer_module.os, "fsync", _fsync)
+    writer = ArtifactWriter()
+    writer.write_json(tmp_path / "state.json", {"state_id": "s"}, durability)
+    writer.flush(tmp_path)
+    assert len(calls) == expected
+
+
+def test_write_errors_surface_at_flush(tmp_path: Path) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    writer = ArtifactWriter()
+    writer.write_json(blocker / "report.json", {})
+    with pytest.raises(OSError, match="blocker"):
+        writer.flush(tmp_path)
+    with pytest.raises(ValueError, match="durability"):
+        writer.write_json(tmp_path / "x.json", {}, "sometimes")
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from agentic_proteins.design_loop.budget import (
+    BudgetPolicy,
+    CostModel,
+    provider_resource,
+)
+from agentic_proteins.runtime.infra.analysis import RunAnalysis
+from agentic_proteins.runtime.infra.reliability import ToolReliabilityTracker
+
+
+def test_policy_from_dict_validates_limits_and_providers() -> None:
+    policy = BudgetPolicy.from_dict({"max_compute_s": 30, "confirm": "local_esmfold"})
+    assert (policy.max_compute_s, policy.max_wall_s) == (30.0, None)
+    assert (policy.explore, policy.confirm) == (None, "local_esmfold")
+    with pytest.raises(ValueError, match="max_wall_s"):
+        BudgetPolicy.from_dict({"max_wall_s": -1})
+    with pytest.raises(ValueError, match="explore"):
+        BudgetPolicy.from_dict({"explore": "unknown"})
+
+
+def test_model_falls_back_to_priors_then_linear_cost() -> None:
+    model = CostModel()
+    cheap = model.estimate("heuristic_proxy", 100)
+    assert cheap < model.estimate("local_esmfold", 100)
+    assert model.estimate("local_esmfold", 200) == pytest.approx(
+        2 * model.estimate("local_esmfold", 100)
+    )
+    model.observe("local_esmfold", [(100, 3.0), (100, 5.0)])
+    assert model.estimate("local_esmfold", 50, calls=4) == pytest.approx(8.0)
+
+
+def test_model_fits_power_law_and_bounds_exponent() -> None:
+    model = CostModel()
+    model.observe("api_colabfold", [(n, 1e-4 * n**2) for n in (50, 100, 200, 400)])
+    curve = model.curve("api_colabfold")
+    assert curve.exponent == pytest.approx(2.0)
+    assert model.estimate("api_colabfold", 300) == pytest.approx(9.0)
+    model.observe("local_esmfold", [(n, 1e-9 * n**5) for n in (50, 100, 200)])
+    assert model.curve("local_esmfold").exponent == 3.0
+    summary = model.summary()
+    assert summary["api_colabfold"]["samples"] == 4
+    assert summary["api_colabfold"]["resource"] == "cpu"
+
+
+def test_provider_resource_follows_capabilities_and_mode() -> None:
+    assert provider_resource("heuristic_proxy", "gpu") == "cpu"
+    assert provider_resource("local_rosettafold") == "gpu"
+    assert provider_resource("local_esmfold", "cpu") == "cpu"
+    assert provider_resource("local_esmfold", "gpu") == "gpu"
+
+
+def test_tracker_keeps_call_costs_for_the_model() -> None:
+    tracker = ToolReliabilityTracker(tool_name="heuristic_proxy")
+    tracker.record_call(120, 250.0, 400.0)
+    model = CostModel()
+    model.observe(tracker.tool_name, tracker.call_costs)
+    assert model.estimate("heuristic_proxy", 120) == pytest.approx(0.25)
+    assert tracker.call_walls == [(120, 0.4)]
+
+
+def test_budget_summary_round_trips_through_json() -> None:
+    analysis = RunAnalysis()
+    analysis.record_budget(0, "explore", "heuristic_proxy", 0.5, 0.4, 0.6)
+    analysis.record_budget(1, "confirm", "local_esmfold", 2.0, 3.0, 3.1)
+    analysis.record_budget_model({"max_compute_s": 10.0, "max_wall_s": None}, {})
+    summary = analysis.budget_summary()
+    assert summary["compute_s"] == pytest.approx(3.4)
+    assert summary["remaining_compute_s"] == pytest.approx(6.6)
+    assert summary["mean_abs_error_s"] == pytest.approx(0.55)
+    assert summary["providers"]["local_esmfold"]["stages"] == 1
+    restored = RunAnalysis.from_dict(json.loads(json.dumps(analysis.to_dict())))
+    assert restored.budget_summary() == summary
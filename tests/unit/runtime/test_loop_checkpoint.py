@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+
+from agentic_proteins.core.execution import LoopState
+from agentic_proteins.design_loop.checkpoint import LoopCheckpoint
+from agentic_proteins.design_loop.mutation import MutationEngine
+from agentic_proteins.design_loop.population import (
+    Population,
+    PopulationPolicy,
+    RestoredResult,
+)
+from agentic_proteins.domain.candidates.schema import Candidate
+from agentic_proteins.domain.metrics.quality import QCStatus
+from agentic_proteins.runtime.infra.analysis import RunAnalysis
+
+
+def _round_trip(payload: dict) -> dict:
+    return json.loads(json.dumps(payload))
+
+
+def _seeded_population(seed: int) -> Population:
+    population = Population(PopulationPolicy(), MutationEngine(seed))
+    candidate = Candidate(
+        candidate_id="p", sequence="ACDEFGHIK", metrics={"mean_plddt": 60.0}
+    )
+    population.seed(
+        RestoredResult(
+            candidate=candidate, tool_status="success", qc_status=QCStatus.ACCEPTABLE
+        )
+    )
+    return population
+
+
+def test_checkpoint_round_trips_through_json() -> None:
+    checkpoint = LoopCheckpoint(
+        next_iteration=3,
+        loop_state=LoopState(iteration_index=2, executions=3, stopping_criteria=[]),
+        candidate=Candidate(candidate_id="c", sequence="ACDE", flags=["x"]),
+        prefix="c",
+        last_score=71.5,
+        stagnation_count=1,
+        population={"elites": []},
+        elapsed_s=12.5,
+    )
+    restored = LoopCheckpoint.from_dict(_round_trip(checkpoint.to_dict()))
+    assert restored == checkpoint
+
+
+def test_restored_engine_repeats_the_original_draws() -> None:
+    engine = MutationEngine(11)
+    engine.mark_seen(["ACDEFGHIK"])
+    state = _round_trip(engine.state())
+    expected = engine.point_mutations("ACDEFGHIK", 6)
+    restored = MutationEngine(0)
+    restored.restore(state)
+    replay = restored.point_mutations("ACDEFGHIK", 6)
+    assert (replay.sequences == expected.sequences).all()
+    assert (restored.seen == engine.seen).all()
+
+
+def test_population_snapshot_restores_elites_and_proposals() -> None:
+    population = _seeded_population(4)
+    population.propose(3, 1, "p")
+    snapshot = _round_trip(population.snapshot())
+    expected = [item.sequence for item in population.propose(3, 2, "p")]
+    restored = Population(PopulationPolicy(), MutationEngine(0))
+    restored.restore(snapshot)
+    assert [item.candidate_id for item in restored.elites] == ["p"]
+    assert restored.best.qc_status is QCStatus.ACCEPTABLE
+    assert [item.sequence for item in restored.propose(3, 2, "p")] == expected
+
+
+def test_run_analysis_round_trips_through_json() -> None:
+    analysis = RunAnalysis()
+    analysis.record_candidate_event("c", "loop_start", {"sequence_length": 4})
+    analysis.record_tool_result("heuristic", "success", 3.0)
+    analysis.record_iteration_delta(0, 0.0, 50.0)
+    analysis.record_surrogate(4, 1, [2.0], [3.0])
+    restored = RunAnalysis.from_dict(_round_trip(analysis.to_dict()))
+    assert restored.to_dict() == analysis.to_dict()
@@ -0,0 +1,144 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from agentic_proteins.agents.schemas import CoordinatorDecisionType
+from agentic_proteins.core.cancellation import CancelToken, cancel_requested
+from agentic_proteins.core.execution import LoopState
+from agentic_proteins.design_loop.loop import LoopAction, LoopContext, LoopRunner
+from agentic_proteins.domain.candidates.schema import Candidate
+from agentic_proteins.domain.metrics.quality import QCStatus
+
+
+@dataclass
+class _Result:
+    candidate: Candidate
+    tool_status: str = "success"
+    qc_status: QCStatus = QCStatus.ACCEPTABLE
+    timings: dict[str, float] = field(default_factory=dict)
+    tool_result: object | None = None
+    coordinator_decision: CoordinatorDecisionType = CoordinatorDecisionType.CONTINUE
+    failure_type: str = ""
+
+
+class _Pipeline:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.cancel_seen: list[bool] = []
+
+    def run_iteration(self, candidate: Candidate, loop_state: LoopState) -> _Result:
+        self.calls.append(loop_state.iteration_index)
+        self.cancel_seen.append(cancel_requested())
+        candidate.metrics["mean_plddt"] = 50.0 + 10.0 * loop_state.iteration_index
+        return _Result(candidate=candidate, timings={"tool_invocation_ms": 1.0})
+
+
+class _Analysis:
+    def __init__(self) -> None:
+        self.events: list[str] = []
+        self.writes = 0
+
+    def record_candidate_event(
+        self, candidate_id: str, event: str, payload: dict[str, Any]
+    ) -> None:
+        self.events.append(event)
+
+    def record_tool_result(
+        self, tool_name: str, status: str, duration_ms: float
+    ) -> None:
+        return None
+
+    def record_iteration_delta(
+        self, iteration_index: int, improvement_delta: float, score: float | None
+    ) -> None:
+        return None
+
+    def write(self, path: Path) -> None:
+        self.writes += 1
+
+
+class _Telemetry:
+    cost: dict[str, float] = {}
+
+
+class _Logger:
+    def log(self, **_kwargs: Any) -> None:
+        return None
+
+
+def _runner(tmp_path: Path, iterations: int) -> tuple[LoopRunner, _Pipeline, _Analysis]:
+    pipeline = _Pipeline()
+    analysis = _Analysis()
+    context = LoopContext(
+        config={"loop_max_iterations": iterations, "loop_stagnation_window": 10},
+        telemetry=_Telemetry(),
+        logger=_Logger(),
+        analysis_path=tmp_path / "analysis.json",
+    )
+    return LoopRunner(context, pipeline, analysis), pipeline, analysis
+
+
+def _candidate() -> Candidate:
+    return Candidate(candidate_id="c0", sequence="ACDEFGHIK")
+
+
+def test_iter_run_yields_each_iteration_lazily(tmp_path: Path) -> None:
+    runner, pipeline, analysis = _runner(tmp_path, iterations=3)
+    iterations = runner.iter_run(_candidate())
+    first = next(iterations)
+    assert pipeline.calls == [0]
+    assert first.action is LoopAction.CONTINUE
+    assert first.final is False
+    assert first.timings == {"tool_invocation_ms": 1.0}
+    rest = list(iterations)
+    assert pipeline.calls == [0, 1, 2]
+    assert [item.iteration_index for item in rest] == [1, 2]
+    assert rest[-1].final is True
+    assert rest[-1].stopping_criteria == ["max_iterations"]
+    assert rest[0].improvement_delta == 10.0
+    assert first.candidate.metrics["mean_plddt"] == 50.0
+    assert analysis.events[-1] == "loop_end"
+    assert analysis.writes == 1
+
+
+def test_run_returns_last_iteration_result(tmp_path: Path) -> None:
+    runner, pipeline, _ = _runner(tmp_path, iterations=2)
+    result = runner.run(_candidate())
+    assert pipeline.calls == [0, 1]
+    assert result.candidate.metrics["mean_plddt"] == 60.0
+
+
+def test_cancel_stops_before_next_iteration(tmp_path: Path) -> None:
+    runner, pipeline, analysis = _runner(tmp_path, iterations=5)
+    token = CancelToken()
+    seen = []
+    for item in runner.iter_run(_candidate(), token):
+        seen.append(item.iteration_index)
+        token.cancel("caller")
+    assert seen == [0]
+    assert pipeline.calls == [0]
+    assert pipeline.cancel_seen == [False]
+    assert analysis.writes == 1
+
+    runner, pipeline, analysis = _runner(tmp_path, iterations=5)
+    token = CancelToken()
+    token.cancel("before_start")
+    (only,) = list(runner.iter_run(_candidate(), token))
+    assert pipeline.cancel_seen == [True]
+    assert only.final is True
+    assert "cancelled" in only.stopping_criteria
+
+
+def test_closing_the_generator_writes_analysis(tmp_path: Path) -> None:
+    runner, pipeline, analysis = _runner(tmp_path, iterations=5)
+    iterations = runner.iter_run(_candidate())
+    next(iterations)
+    iterations.close()
+    assert pipeline.calls == [0]
+    assert analysis.events[-1] == "loop_end"
+    assert analysis.writes == 1
@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from agentic_proteins.agents.planning.schemas import MutationPlan
+from agentic_proteins.design_loop.mutation import (
+    MutationEngine,
+    encode,
+    position_weights,
+    sequence_hashes,
+)
+
+PARENT = "ACDEFGHIKLMNPQRSTVWY"
+OTHER = PARENT[::-1]
+
+
+def _plan(mutation_type: str, **parameters: str) -> MutationPlan:
+    return MutationPlan(
+        mutation_id="m1",
+        mutation_type=mutation_type,
+        parameters=parameters,
+        intent="test",
+    )
+
+
+def test_operators_produce_single_edits_with_matching_hashes() -> None:
+    engine = MutationEngine(0)
+    point = engine.point_mutations(PARENT, 200)
+    insertion = engine.insertions(PARENT, 200)
+    deletion = engine.deletions(PARENT, 200)
+    crossover = engine.recombinations([PARENT, OTHER], 200)
+    for batch in (point, insertion, deletion, crossover):
+        assert batch.sequences.dtype == np.uint8
+        assert np.array_equal(batch.hashes, sequence_hashes(batch.sequences))
+    for index, variant in enumerate(point.decode()):
+        position = int(point.positions[index])
+        assert variant[position] != PARENT[position]
+        assert variant[:position] + variant[position + 1 :] == (
+            PARENT[:position] + PARENT[position + 1 :]
+        )
+    for index, variant in enumerate(insertion.decode()):
+        position = int(insertion.positions[index])
+        assert variant[:position] + variant[position + 1 :] == PARENT
+    for index, variant in enumerate(deletion.decode()):
+        position = int(deletion.positions[index])
+        assert variant == PARENT[:position] + PARENT[position + 1 :]
+    parents = [PARENT, OTHER]
+    for index, variant in enumerate(crossover.decode()):
+        cut = int(crossover.positions[index])
+        first = parents[int(crossover.parents[index])]
+        second = parents[int(crossover.partners[index])]
+        assert variant == first[:cut] + second[cut:]
+
+
+def test_labels_describe_each_edit() -> None:
+    engine = MutationEngine(1)
+    batches = engine.apply(
+        _plan("point_mutation", position="3", new_residue="W"), [PARENT], 1
+    )
+    assert batches[0].label(0, [PARENT]) == "D3W"
+    insertion = engine.apply(
+        _plan("insertion", position="5", new_residue="K"), [PARENT], 1
+    )
+    assert insertion[0].label(0, [PARENT]) == "ins5K"
+    deletion = engine.apply(_plan("deletion", position="5"), [PARENT], 1)
+    assert deletion[0].label(0, [PARENT]) == "del5F"
+
+
+def test_unseen_drops_repeats_and_earlier_proposals() -> None:
+    engine = MutationEngine(2)
+    engine.mark_seen([PARENT])
+    pinned = engine.apply(
+        _plan("point_mutation", position="1", new_residue="A"), [PARENT], 5
+    )
+    assert len(engine.unseen(pinned[0])) == 0
+    batch = engine.point_mutations(PARENT, 20_000)
+    fresh = engine.unseen(batch)
+    assert len(fresh) == len(set(fresh.decode())) == 19 * len(PARENT)
+    assert len(engine.unseen(batch)) == 0
+    limited = engine.unseen(engine.insertions(PARENT, 50), limit=3)
+    assert len(limited) == 3
+
+
+def test_hash_collisions_keep_distinct_variants() -> None:
+    engine = MutationEngine(4)
+    engine.mark_seen([PARENT])
+    batch = engine.point_mutations(PARENT, 3)
+    rows = np.stack([encode(PARENT), encode(OTHER), encode(OTHER), encode(PARENT)])
+    colliding = replace(
+        batch.take(np.array([0, 1, 2, 0])),
+        sequences=rows,
+        hashes=np.full(4, sequence_hashes(rows[:1])[0]),
+    )
+    fresh = engine.unseen(colliding)
+    assert fresh.decode() == [OTHER]
+    assert len(engine.unseen(colliding)) == 0
+
+
+def test_draws_are_reproducible_and_follow_weights() -> None:
+    plddt = [95.0] * 10 + [20.0] * 10
+    weights = position_weights(plddt)
+    assert weights[10:].sum() > 0.9
+    first = MutationEngine(7).point_mutations(PARENT, 500, weights)
+    second = MutationEngine(7).point_mutations(PARENT, 500, weights)
+    assert np.array_equal(first.sequences, second.sequences)
+    assert (first.positions >= 10).mean() > 0.9
+
+
+def test_apply_splits_count_across_parents_and_validates_plans() -> None:
+    engine = MutationEngine(3)
+    batches = engine.apply(_plan("deletion"), [PARENT, OTHER], 5)
+    assert [len(batch) for batch in batches] == [3, 2]
+    assert [int(batch.parents[0]) for batch in batches] == [0, 1]
+    with pytest.raises(ValueError, match="mutation_type"):
+        engine.apply(_plan("inversion"), [PARENT], 1)
+    with pytest.raises(ValueError, match="new_residue"):
+        engine.apply(_plan("point_mutation", new_residue="B"), [PARENT], 1)
+    with pytest.raises(ValueError, match="position"):
+        engine.apply(_plan("insertion", position="0"), [PARENT], 1)
+    with pytest.raises(ValueError, match="equal-length"):
+        engine.apply(_plan("recombination"), [PARENT, PARENT[:-1]], 1)
+    with pytest.raises(ValueError, match="beyond the 20-residue parent"):
+        engine.apply(_plan("point_mutation", position="21"), [PARENT], 1)
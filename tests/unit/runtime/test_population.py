@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from agentic_proteins.agents.planning.schemas import MutationPlan
+from agentic_proteins.design_loop.mutation import MutationEngine
+from agentic_proteins.design_loop.population import Population, PopulationPolicy
+from agentic_proteins.domain.candidates.schema import Candidate
+from agentic_proteins.domain.metrics.quality import QCStatus
+
+
+@dataclass
+class _Result:
+    candidate: Candidate
+    tool_status: str = "success"
+    qc_status: QCStatus = QCStatus.ACCEPTABLE
+
+
+def _scored(candidate_id: str, plddt: float, **kwargs) -> _Result:
+    candidate = Candidate(
+        candidate_id=candidate_id,
+        sequence="ACDEFGHIK",
+        metrics={"mean_plddt": plddt},
+    )
+    return _Result(candidate=candidate, **kwargs)
+
+
+def test_policy_from_dict_validates_sizes() -> None:
+    policy = PopulationPolicy.from_dict({"variants": 16, "elites": 3})
+    assert (policy.variants, policy.elites, policy.workers) == (16, 3, 4)
+    with pytest.raises(ValueError, match="elites"):
+        PopulationPolicy.from_dict({"elites": 0})
+
+
+def test_propose_labels_point_mutants_with_provenance() -> None:
+    population = Population(PopulationPolicy(), MutationEngine(1))
+    population.seed(_scored("p", 50.0))
+    (variant,) = population.propose(1, 1, "p")
+    parent = population.elites[0].sequence
+    diffs = [
+        idx
+        for idx, (old, new) in enumerate(zip(parent, variant.sequence, strict=True))
+        if old != new
+    ]
+    assert len(diffs) == 1
+    (mutation,) = variant.provenance["mutations"]
+    assert mutation == f"{parent[diffs[0]]}{diffs[0] + 1}{variant.sequence[diffs[0]]}"
+    assert variant.provenance["parent_id"] == "p"
+    assert variant.provenance["mutation_type"] == "point_mutation"
+    assert variant.candidate_id == "p-i1v0"
+
+
+def test_propose_splits_count_across_mutation_plans() -> None:
+    population = Population(PopulationPolicy(), MutationEngine(3))
+    population.plans = [
+        MutationPlan(mutation_id="ins", mutation_type="insertion", intent="grow"),
+        MutationPlan(mutation_id="rec", mutation_type="recombination", intent="mix"),
+    ]
+    population.seed(_scored("c0", 50.0))
+    variants = population.propose(6, 1, "c0")
+    kinds = [item.provenance["mutation_type"] for item in variants]
+    assert kinds == ["insertion"] * 3 + ["point_mutation"] * 3
+    assert all(len(item.sequence) == 10 for item in variants[:3])
+
+
+def test_plan_pinned_past_an_elite_falls_back_to_point_mutations() -> None:
+    population = Population(PopulationPolicy(), MutationEngine(5))
+    population.plans = [
+        MutationPlan(
+            mutation_id="del",
+            mutation_type="deletion",
+            parameters={"position": "12"},
+            intent="trim",
+        )
+    ]
+    population.seed(_scored("c0", 50.0))
+    variants = population.propose(3, 1, "c0")
+    assert [item.provenance["mutation_type"] for item in variants] == [
+        "point_mutation"
+    ] * 3
+
+
+def test_propose_is_seeded_and_never_repeats() -> None:
+    def proposals(seed: int) -> list[str]:
+        population = Population(PopulationPolicy(), MutationEngine(seed))
+        population.seed(_scored("c0", 50.0))
+        return [
+            item.sequence
+            for idx in (1, 2)
+            for item in population.propose(20, idx, "c0")
+        ]
+
+    first = proposals(5)
+    assert first == proposals(5)
+    assert len(first) == len(set(first)) == 40
+    assert "ACDEFGHIK" not in first
+
+
+def test_admit_keeps_top_elites_and_skips_failures() -> None:
+    population = Population(PopulationPolicy(elites=2), MutationEngine(0))
+    population.seed(_scored("c0", 50.0))
+    ranking = population.admit(
+        [
+            _scored("v0", 90.0),
+            _scored("v1", 70.0),
+            _scored("v2", 99.0, tool_status="failure"),
+            _scored("v3", 95.0, qc_status=QCStatus.REJECT),
+        ]
+    )
+    assert [item.candidate_id for item in ranking] == ["v0", "v1", "c0"]
+    assert [item.candidate_id for item in population.elites] == ["v0", "v1"]
+    assert population.best.candidate.candidate_id == "v0"
+    assert set(population.results) == {"v0", "v1"}
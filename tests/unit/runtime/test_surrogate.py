@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from agentic_proteins.design_loop.surrogate import (
+    SurrogateModel,
+    SurrogatePolicy,
+    proxy_features,
+    screen,
+)
+
+BASE = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def _sequences(count: int, seed: int) -> list[str]:
+    rng = np.random.default_rng(seed)
+    return ["".join(rng.choice(list(BASE), size=30)) for _ in range(count)]
+
+
+def _plddt(sequence: str) -> float:
+    return 40.0 + 150.0 * sum(aa in "AELMQK" for aa in sequence) / len(sequence)
+
+
+def test_proxy_features_match_the_heuristic_provider() -> None:
+    (row,) = proxy_features(["AAVW"])
+    assert row[0] == 1.0
+    assert row[1] == pytest.approx(0.5)
+    assert row[2] == pytest.approx(0.5)
+    assert row[3] == pytest.approx(np.log(4))
+    assert row[4:].sum() == pytest.approx(1.0)
+
+
+def test_model_learns_online_and_round_trips() -> None:
+    model = SurrogateModel(ridge=0.1)
+    with pytest.raises(ValueError, match="no observations"):
+        model.predict(BASE)
+    for batch in range(4):
+        sequences = _sequences(20, batch)
+        model.observe(sequences, [_plddt(item) for item in sequences])
+    held_out = _sequences(20, 99)
+    mean, std = model.predict(held_out)
+    truth = np.array([_plddt(item) for item in held_out])
+    assert np.abs(mean - truth).mean() < 3.0
+    assert (std > 0).all()
+    restored = SurrogateModel.from_dict(model.to_dict())
+    assert restored.observations == 80
+    assert np.allclose(restored.predict(held_out)[0], mean)
+
+
+def test_merge_keeps_every_writer_observations() -> None:
+    saved = SurrogateModel(ridge=0.1)
+    saved.observe(_sequences(10, 0), [50.0] * 10)
+    payload = saved.merge(None)
+    first = SurrogateModel.from_dict(payload)
+    second = SurrogateModel.from_dict(payload)
+    first.observe(_sequences(5, 1), [60.0] * 5)
+    second.observe(_sequences(7, 2), [70.0] * 7)
+    payload = first.merge(payload)
+    payload = second.merge(payload)
+    assert payload["observations"] == 22
+    assert second.observations == 22
+    assert first.merge(payload)["observations"] == 22
+    everything = SurrogateModel(ridge=0.1)
+    for seed, value, count in ((0, 50.0, 10), (1, 60.0, 5), (2, 70.0, 7)):
+        everything.observe(_sequences(count, seed), [value] * count)
+    assert np.allclose(payload["xtx"], everything.to_dict()["xtx"])
+
+
+def test_restored_model_uses_the_given_ridge() -> None:
+    model = SurrogateModel(ridge=0.1)
+    sequences = _sequences(20, 3)
+    model.observe(sequences, [_plddt(item) for item in sequences])
+    restored = SurrogateModel.from_dict(model.to_dict(), ridge=50.0)
+    assert restored.ridge == 50.0
+    assert np.allclose(restored.predict([BASE])[0], model.predict([BASE], 50.0)[0])
+    assert not np.allclose(restored.predict([BASE])[0], model.predict([BASE])[0])
+
+
+def test_screen_skips_only_hopeless_variants_once_warm() -> None:
+    model = SurrogateModel(ridge=0.1)
+    policy = SurrogatePolicy(kappa=1.0, min_observations=80)
+    pool = sorted(_sequences(200, 7), key=_plddt)
+    candidates = [pool[-1], pool[0], pool[1]]
+    assert screen(model, policy, candidates, 90.0).skipped == []
+    for batch in range(4):
+        sequences = _sequences(20, batch)
+        model.observe(sequences, [_plddt(item) for item in sequences])
+    screening = screen(model, policy, candidates, 90.0)
+    assert screening.evaluate == [0]
+    assert screening.skipped == [1, 2]
+    assert screening.mean[0] > screening.mean[1]
+    assert screen(model, policy, candidates, 200.0).evaluate == [0]
+    assert screen(model, policy, candidates, None).skipped == []
+
+
+def test_policy_from_dict_validates() -> None:
+    assert SurrogatePolicy.from_dict({"kappa": 2}).kappa == 2.0
+    with pytest.raises(ValueError, match="ridge"):
+        SurrogatePolicy.from_dict({"ridge": 0})
+    with pytest.raises(ValueError, match="kappa"):
+        SurrogatePolicy.from_dict({"kappa": -1})
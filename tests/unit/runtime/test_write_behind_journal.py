@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Bijan Mousavi
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agentic_proteins.runtime import workspace as workspace_module
+from agentic_proteins.runtime.workspace import WriteBehindJournal, write_json_atomic
+from agentic_proteins.runtime.writer import ArtifactWriter, artifact_writer
+
+
+class _RecordingWriter(ArtifactWriter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.order: list[str] = []
+
+    def write_json(self, path, payload, durability="none", compact=None) -> None:
+        self.order.append(path.name)
+        super().write_json(path, payload, durability, compact)
+
+
+def test_journal_coalesces_and_reads_pending(tmp_path: Path) -> None:
+    journal = WriteBehindJournal("end")
+    path = tmp_path / "report.json"
+    journal.write(path, {"round": 1})
+    journal.write(path, {"round": 2})
+    journal.checkpoint()
+    assert not path.exists()
+    assert journal.read(path) == {"round": 2}
+    journal.flush()
+    assert journal.read(path) == {"round": 2}
+    artifact_writer().flush(tmp_path)
+    assert json.loads(path.read_text()) == {"round": 2}
+    assert journal.flushes == 1
+
+
+def test_flush_matches_direct_writes_and_commits_state_last(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    payload = {"b": [1, 2], "a": {"z": None}}
+    write_json_atomic(tmp_path / "direct.json", payload)
+    writer = _RecordingWriter()
+    monkeypatch.setattr(workspace_module, "artifact_writer", lambda: writer)
+    journal = WriteBehindJournal()
+    journal.write(tmp_path / "state.json", {"state_id": "state-1"})
+    journal.write(tmp_path / "buffered.json", payload)
+    journal.write(tmp_path / "timings.json", {})
+    journal.checkpoint()
+    writer.flush(tmp_path)
+    assert writer.order == ["buffered.json", "timings.json", "state.json"]
+    assert (tmp_path / "buffered.json").read_bytes() == (
+        tmp_path / "direct.json"
+    ).read_bytes()
+
+
+def test_immediate_policy_and_validation(tmp_path: Path) -> None:
+    journal = WriteBehindJournal("immediate")
+    journal.write(tmp_path / "plan.json", {"tasks": {}})
+    artifact_writer().flush(tmp_path)
+    assert (tmp_path / "plan.json").exists()
+    assert journal.read(tmp_path / "missing.json") is None
+    with pytest.raises(ValueError, match="state_flush"):
+        WriteBehindJournal("never")